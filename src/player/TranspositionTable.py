@@ -0,0 +1,136 @@
+"""
+전치표 (Transposition Table)
+
+서로 다른 행동 순서 / 롤아웃으로 같은 배틀 상태에 도달했을 때 이전 결과를 재사용하기 위한 표.
+키는 배틀의 Zobrist 해시 (SimplifiedBattle.zobrist_hash() / ArrayBattle.zobrist_hash())이며
+미니맥스(탐색 깊이 + 알파-베타 경계)와 MCTS(롤아웃 보상 평균)가 같은 표 구현을 쓴다.
+두 탐색의 값 척도가 다르므로 표 인스턴스는 플레이어마다 따로 둔다.
+
+교체 정책
+- 크기 제한을 넘으면 가장 오래 조회되지 않은 항목부터 제거 (LRU)
+- 같은 탐색(generation) 안에서는 더 깊이 탐색한 결과를 얕은 결과로 덮어쓰지 않음
+"""
+from collections import OrderedDict
+from typing import Optional
+
+# 미니맥스 값 종류
+EXACT = 0   # 정확한 값
+LOWER = 1   # 하한 (beta 컷오프로 끝난 노드)
+UPPER = 2   # 상한 (alpha를 넘지 못한 노드)
+
+
+class TTEntry:
+    """
+    전치표 항목
+    Args:
+        value: 미니맥스 값 또는 롤아웃 보상 평균
+        depth: 남은 탐색 깊이 (롤아웃 결과는 0)
+        flag: EXACT / LOWER / UPPER
+        action: 최선 행동 (없으면 None)
+        count: 값에 반영된 샘플 수 (롤아웃 평균용)
+        generation: 저장한 탐색 번호
+    """
+
+    __slots__ = ('value', 'depth', 'flag', 'action', 'count', 'generation')
+
+    def __init__(self, value: float, depth: int, flag: int, action, count: int, generation: int):
+        self.value = value
+        self.depth = depth
+        self.flag = flag
+        self.action = action
+        self.count = count
+        self.generation = generation
+
+
+class TranspositionTable:
+    """
+    크기 제한이 있는 전치표
+    Args:
+        max_entries: 최대 항목 수 (넘으면 LRU 제거)
+    """
+
+    def __init__(self, max_entries: int = 200_000):
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: 'OrderedDict[int, TTEntry]' = OrderedDict()
+        self.reset_stats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._entries
+
+    def new_search(self):
+        """새 탐색 시작 (이전 탐색의 항목은 깊이와 관계없이 교체 가능해짐)"""
+        self.generation += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """조회 / 저장 통계 (reset_stats() 이후 누적)"""
+        probes = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / probes if probes else 0.0,
+            'stores': self.stores,
+            'evictions': self.evictions,
+        }
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        """항목 조회 (없으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: int, value: float, depth: int = 0, flag: int = EXACT, action=None):
+        """미니맥스 결과 저장 (같은 탐색의 더 깊은 결과는 유지)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.generation == self.generation and entry.depth > depth:
+                return
+            entry.value = value
+            entry.depth = depth
+            entry.flag = flag
+            entry.count = 1
+            entry.generation = self.generation
+            if action is not None:
+                entry.action = action
+            self._entries.move_to_end(key)
+        else:
+            self._insert(key, TTEntry(value, depth, flag, action, 1, self.generation))
+        self.stores += 1
+
+    def add_sample(self, key: int, reward: float) -> TTEntry:
+        """롤아웃 보상을 누적 평균에 반영 (MCTS용)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = TTEntry(reward, 0, EXACT, None, 1, self.generation)
+            self._insert(key, entry)
+        else:
+            entry.count += 1
+            entry.value += (reward - entry.value) / entry.count
+            entry.generation = self.generation
+            self._entries.move_to_end(key)
+        self.stores += 1
+        return entry
+
+    def _insert(self, key: int, entry: TTEntry):
+        entries = self._entries
+        if len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = entry
@@ -0,0 +1,340 @@
+"""
+배열(arena) 기반 MCTS 트리
+
+MCTSNode는 노드마다 파이썬 객체 + __dict__ + children / untried_actions 리스트 + 상태를 들고 있고,
+best_child는 자식마다 math.log / math.sqrt를 호출해 UCT 점수 리스트를 만든다.
+ArenaMCTSSearcher는 노드를 정수 인덱스로 다룬다.
+    - 통계 (방문 수, 보상 합)는 미리 할당한 numpy 배열 - 자식 구간 슬라이스에서 UCT를 한 번에 계산
+    - 구조 (부모, 부모 행동 번호, 첫 자식, 확장한 자식 수)는 array.array - 노드당 12바이트, 스칼라 접근이 빠름
+    - 자식은 연속 구간: 노드를 처음 확장할 때 가능한 행동 수만큼 자리를 예약
+    - 행동 목록은 확장을 시작한 노드만 가지고, 자식을 모두 확장한 내부 노드는 상태를 버림
+      (루트 자식 상태는 서브트리 재사용 관측 비교용으로 유지)
+같은 난수 시드면 MCTSSearcher와 같은 트리 / 같은 행동을 만든다 (확장 순서, UCT 동점 처리 동일).
+"""
+import math
+import os
+import sys
+import time
+from array import array
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import MCTSSearcher, MCTSNode, observation_distance, REUSE_MAX_DISTANCE
+from player.mcts.llm_pruner import LLMPruner
+from sim.BattleClass.ArrayBattle import ArrayBattle
+from sim.Supporting.GcPause import gc_paused
+
+# UCT 탐험 상수 (MCTSNode.best_child 기본값과 동일)
+UCT_C = 1.4
+NO_NODE = -1
+
+
+class MCTSArena:
+    """
+    배열 기반 MCTS 노드 저장소 (노드 = 정수 인덱스, 0번이 루트)
+    Args:
+        capacity: 처음 할당할 노드 수 (다 차면 두 배로 늘림)
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.size = 0
+        self.visits = np.zeros(capacity, dtype=np.float64)  # UCT 나눗셈에 바로 쓰도록 실수로 저장
+        self.value = np.zeros(capacity, dtype=np.float64)
+        self.parent = array('i', [NO_NODE]) * capacity
+        self.action_index = array('h', [0]) * capacity  # 부모 행동 목록에서의 위치
+        self.first_child = array('i', [NO_NODE]) * capacity
+        self.num_children = array('h', [0]) * capacity
+        self.terminal = bytearray(capacity)
+        self.states: List = [None] * capacity
+        self.actions: List[Optional[list]] = [None] * capacity  # 확장을 시작한 노드의 행동 목록 (앞쪽이 확장한 것)
+
+    def allocate(self, count: int) -> int:
+        """연속된 노드 count개를 예약하고 첫 인덱스 반환"""
+        start = self.size
+        if start + count > self.capacity:
+            self._grow(max(self.capacity * 2, start + count))
+        self.size = start + count
+        return start
+
+    def _grow(self, capacity: int):
+        extra = capacity - self.capacity
+        self.visits = np.concatenate([self.visits, np.zeros(extra)])
+        self.value = np.concatenate([self.value, np.zeros(extra)])
+        self.parent.extend(array('i', [NO_NODE]) * extra)
+        self.action_index.extend(array('h', [0]) * extra)
+        self.first_child.extend(array('i', [NO_NODE]) * extra)
+        self.num_children.extend(array('h', [0]) * extra)
+        self.terminal.extend(bytes(extra))
+        self.states.extend([None] * extra)
+        self.actions.extend([None] * extra)
+        self.capacity = capacity
+
+    def nbytes(self) -> int:
+        """사용 중인 노드의 구조 / 통계 저장 크기 (상태, 행동 객체 제외)"""
+        per_node = (self.visits.itemsize + self.value.itemsize + self.parent.itemsize + self.action_index.itemsize
+                    + self.first_child.itemsize + self.num_children.itemsize + 1 + 2 * 8)  # 상태 / 행동 목록 포인터
+        action_lists = sum(sys.getsizeof(a) for a in self.actions[:self.size] if a is not None)
+        return self.size * per_node + action_lists
+
+
+class ArenaMCTSSearcher(MCTSSearcher):
+    """
+    배열 기반 트리를 쓰는 MCTSSearcher (옵션은 MCTSSearcher와 동일)
+    Args:
+        capacity: 처음 할당할 노드 수
+    """
+
+    def __init__(self, root_battle, capacity: int = 1024, **kwargs):
+        super().__init__(root_battle, **kwargs)
+        self.arena = MCTSArena(capacity)
+        # 루트 프루닝까지 끝난 MCTSNode 루트에서 행동 목록만 가져오고 객체 트리는 쓰지 않음
+        self._init_root(self.root_state, list(self.root.untried_actions))
+        self.root = None
+
+    def _init_root(self, state, actions: list):
+        arena = self.arena
+        root = arena.allocate(1)
+        arena.states[root] = state
+        arena.actions[root] = actions
+        arena.terminal[root] = state.finished
+
+    # =================================================================
+    # 탐색
+    # =================================================================
+    def search(self, iterations, deadline: Optional[float] = None):
+        arena = self.arena
+        # Fast Fail - 가능한 행동이 없으면 None 혹은 가능한 행동 하나 반환
+        all_actions = arena.actions[0]
+        expanded = arena.num_children[0]
+        if not all_actions: return None
+        if len(all_actions) == 1 and not expanded: return all_actions[0]
+
+        with gc_paused(deadline is not None):
+            if self.batched_policy is not None:
+                self._search_leaf_parallel(iterations, deadline)
+            else:
+                states = arena.states
+                for _ in range(iterations):
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+                    self.iterations_run += 1
+                    node = self._select_and_expand()
+
+                    # Simulation & Backpropagation
+                    state = states[node]
+                    reward = self._cached_reward(state)
+                    if reward is None:
+                        reward = self._record_reward(state, self.policy.run(state, self.engine))
+                    self._backpropagate(node, reward)
+
+        expanded = arena.num_children[0]
+        if not expanded:
+            return self.rng.choice(all_actions)
+        first = arena.first_child[0]
+        return all_actions[int(arena.visits[first:first + expanded].argmax())]
+
+    def _select_and_expand(self) -> int:
+        node = self._select()
+
+        # Expansion
+        arena = self.arena
+        node_actions = arena.actions[node]
+        expanded = arena.num_children[node]
+        if not arena.terminal[node] and expanded < len(node_actions):
+            node = self._expand(node, node_actions, expanded)
+        return node
+
+    def _select(self) -> int:
+        """Selection - 확장할 행동이 남은 노드 / 리프까지 자식 구간 UCT로 내려감"""
+        arena = self.arena
+        visits, value = arena.visits, arena.value
+        actions, num_children, first_child, terminal = (arena.actions, arena.num_children, arena.first_child,
+                                                         arena.terminal)
+        node = 0
+        while not terminal[node]:
+            node_actions = actions[node]
+            if node_actions is None:
+                node_actions = actions[node] = MCTSNode.available_actions(arena.states[node])
+            expanded = num_children[node]
+            if expanded < len(node_actions) or not expanded:
+                break
+
+            # 자식 구간 [first, first + expanded)에서 UCT 최댓값 (동점이면 앞쪽 - best_child와 동일)
+            first = first_child[node]
+            child_visits = visits[first:first + expanded]
+            scores = np.sqrt(math.log(visits[node]) / child_visits)
+            scores *= UCT_C
+            scores += value[first:first + expanded] / child_visits
+            node = first + int(scores.argmax())
+        return node
+
+    def _expand(self, node: int, node_actions: list, expanded: int) -> int:
+        arena = self.arena
+        # MCTSSearcher._expand와 같은 난수 소비 - 남은 행동 중 하나를 골라 확장한 구간 끝으로 옮김 (나머지 순서 유지)
+        action = self.rng.choice(node_actions[expanded:])
+        index = node_actions.index(action, expanded)
+        if index != expanded:
+            node_actions.insert(expanded, node_actions.pop(index))
+
+        first = arena.first_child[node]
+        if first == NO_NODE:
+            first = arena.first_child[node] = arena.allocate(len(node_actions))
+        child = first + expanded
+        state = arena.states[node]
+        child_state = self._simulate_action(state, action)
+        arena.parent[child] = node
+        arena.action_index[child] = expanded
+        arena.states[child] = child_state
+        arena.terminal[child] = child_state.finished
+        arena.num_children[node] = expanded + 1
+        # 자식을 모두 확장한 노드는 상태가 더 필요 없음 (루트 / 루트 자식은 관측 비교용으로 유지)
+        if expanded + 1 == len(node_actions) and node != 0 and arena.parent[node] != 0:
+            arena.states[node] = None
+        return child
+
+    def _search_leaf_parallel(self, iterations, deadline: Optional[float] = None):
+        """리프를 leaf_batch_size개씩 모아 한 번의 배치 롤아웃으로 평가 (MCTSSearcher와 같은 가상 손실)"""
+        states = self.arena.states
+        remaining = iterations
+        while remaining > 0:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            batch_size = min(self.leaf_batch_size, remaining)
+            remaining -= batch_size
+            self.iterations_run += batch_size
+
+            leaves = []
+            for _ in range(batch_size):
+                node = self._select_and_expand()
+                reward = self._cached_reward(states[node])
+                if reward is not None:
+                    self._backpropagate(node, reward)
+                    continue
+                self._backpropagate(node, 0.0)
+                leaves.append(node)
+
+            if not leaves: continue
+            rewards = self.batched_policy.run_many([states[leaf] for leaf in leaves])
+            for leaf, reward in zip(leaves, rewards):
+                self._backpropagate_reward(leaf, self._record_reward(states[leaf], reward))
+
+    def _backpropagate(self, node: int, reward: float):
+        visits, value, parent = self.arena.visits, self.arena.value, self.arena.parent
+        while node != NO_NODE:
+            visits[node] += 1.0
+            value[node] += reward
+            node = parent[node]
+
+    def _backpropagate_reward(self, node: int, reward: float):
+        """방문 수는 이미 반영된 경로에 보상만 더함 (leaf-parallel용)"""
+        value, parent = self.arena.value, self.arena.parent
+        while node != NO_NODE:
+            value[node] += reward
+            node = parent[node]
+
+    # =================================================================
+    # 루트 / 서브트리 재사용
+    # =================================================================
+    @property
+    def root_visits(self) -> int:
+        return int(self.arena.visits[0])
+
+    def root_statistics(self) -> List[Tuple[object, int, float]]:
+        arena = self.arena
+        first, expanded = arena.first_child[0], arena.num_children[0]
+        return [(arena.actions[0][i], int(arena.visits[first + i]), float(arena.value[first + i]))
+                for i in range(expanded)]
+
+    def release(self):
+        """배열 / 상태 참조 해제"""
+        self.arena = MCTSArena(1)
+
+    def advance(self, action, observed_state) -> bool:
+        """
+        지난 턴에 둔 행동의 자식 서브트리를 새 배열로 옮겨 루트로 승격 (MCTSSearcher.advance와 같은 조건)
+        옮긴 서브트리는 너비 우선으로 다시 번호를 매기므로 자식 구간은 계속 연속이다.
+        """
+        arena = self.arena
+        action_id = LLMPruner.action_identifier(action)
+        root_actions = arena.actions[0] or []
+        first, expanded = arena.first_child[0], arena.num_children[0]
+        child = next((first + i for i in range(expanded)
+                      if LLMPruner.action_identifier(root_actions[i]) == action_id), None)
+        # 옮겨 온 서브트리에서는 루트 자식 상태를 이미 버렸을 수 있음 - 그 경우 관측과 비교할 수 없으므로 재사용 안 함
+        if child is None or arena.states[child] is None or \
+                observation_distance(arena.states[child], observed_state) > REUSE_MAX_DISTANCE:
+            return False
+
+        self.engine._sync_references(observed_state)
+        if self.use_array_state and not isinstance(observed_state, ArrayBattle):
+            observed_state = ArrayBattle.from_battle(observed_state)
+
+        # 관측 상태에서 가능한 행동 기준으로 루트 자식 정리 (둘 수 없게 된 행동의 서브트리는 버림)
+        available = {LLMPruner.action_identifier(a): a for a in MCTSNode.available_actions(observed_state)}
+        kept_actions, kept_children = [], []
+        child_first = arena.first_child[child]
+        for i in range(arena.num_children[child]):
+            key = LLMPruner.action_identifier(arena.actions[child][i])
+            if key in available:
+                kept_actions.append(available.pop(key))
+                kept_children.append(child_first + i)
+
+        new = MCTSArena(max(1024, arena.size))
+        self.arena = new
+        self._init_root(observed_state, kept_actions + list(available.values()))
+        if kept_children:
+            self._copy_children(arena, kept_children, 0)
+        new.visits[0] = new.visits[1:1 + len(kept_children)].sum()
+        new.value[0] = new.value[1:1 + len(kept_children)].sum()
+
+        self.root_state = observed_state
+        self._reset_rollout_template()
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+            observed_state.zobrist_hash()
+        if self.llm_pruner is not None:
+            self._apply_root_pruning()
+        return True
+
+    def _copy_children(self, old: MCTSArena, children: List[int], new_parent: int):
+        """old의 자식들(children)을 new_parent의 연속 구간으로 복사하고 그 아래를 너비 우선으로 복사"""
+        new = self.arena
+        queue = [(children, new_parent)]
+        while queue:
+            old_children, parent = queue.pop(0)
+            first = new.first_child[parent] = new.allocate(len(new.actions[parent]))
+            new.num_children[parent] = len(old_children)
+            for i, old_node in enumerate(old_children):
+                node = first + i
+                new.parent[node] = parent
+                new.action_index[node] = i
+                new.visits[node] = old.visits[old_node]
+                new.value[node] = old.value[old_node]
+                new.terminal[node] = old.terminal[old_node]
+                new.states[node] = old.states[old_node]
+                if old.actions[old_node] is not None:
+                    new.actions[node] = old.actions[old_node]
+                    expanded = old.num_children[old_node]
+                    if expanded:
+                        old_first = old.first_child[old_node]
+                        queue.append((list(range(old_first, old_first + expanded)), node))
+
+    def _apply_root_pruning(self):
+        """루트 노드에서만 LLM 기반 프루닝 수행 (아직 확장하지 않은 행동만 제거)"""
+        if self.root is not None:
+            # MCTSSearcher.__init__ 중 (배열 트리를 만들기 전) - MCTSNode 루트에서 프루닝
+            return super()._apply_root_pruning()
+        if not self.llm_pruner or not self.llm_pruner.is_available:
+            return
+        arena = self.arena
+        root_actions = arena.actions[0]
+        expanded = arena.num_children[0]
+        pruned_ids = self.llm_pruner.prune_actions(self.root_state, root_actions[expanded:])
+        if not pruned_ids:
+            return
+        arena.actions[0] = root_actions[:expanded] + [a for a in root_actions[expanded:]
+                                                      if self.llm_pruner.action_identifier(a) not in pruned_ids]
@@ -0,0 +1,236 @@
+"""
+동시 행동 MCTS (Decoupled UCT)
+
+MCTSSearcher는 확장할 때 상대 행동을 select_best_attack_idx 하나로 고정하고 내 행동만 나열하므로
+트리가 상대의 선택(다른 기술 / 교체)을 전혀 모델링하지 못하고, 같은 결정적 응수만 반복해서 시뮬레이션한다.
+DUCTSearcher의 노드는 내 행동 / 상대 행동(교체 포함) 통계를 따로 가지고 양쪽을 각자 UCT로 독립 선택한다.
+    - 노드를 확장할 때 가능한 모든 행동 조합(내 행동 K개 x 상대 행동 L개)을 BatchedBattleEngine 한 번으로 진행하고,
+      자식 K*L개를 정적 평가(BatchedRolloutPolicy.evaluate)로 채점해 양쪽 통계의 초기값으로 사용 (반복당 엔진 호출 1회)
+      배치 엔진 호출은 행 수와 거의 무관하게 약 2 ms가 고정으로 들므로 반복 1회 비용은 MCTSSearcher 반복의 약 7배
+      (rollout_turns > 0이면 자식마다 배치 롤아웃을 더 돌려 반복당 엔진 호출이 1 + rollout_turns회, 1이면 약 11배)
+    - 게임 상태는 노드마다 복제하지 않고 확장한 노드의 BatchState 한 행(row)으로 가리킴
+      (불변 배열은 BatchState.broadcast로 루트 배열을 공유)
+    - 보상은 내 기준 (0~1), 상대 쪽 UCT는 1 - 평균 보상을 최대화
+    - 상대 행동을 알 수 없어 서브트리 재사용(advance)과 전치표는 지원하지 않음
+"""
+import math
+import os
+import sys
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import MCTSSearcher, BatchedRolloutPolicy
+from sim.BattleEngine.BatchedBattleEngine import BatchState
+from sim.Supporting.GcPause import gc_paused
+
+# UCT 탐험 상수 (MCTSNode.best_child 기본값과 동일)
+UCT_C = 1.4
+
+
+class DUCTNode:
+    """
+    DUCT 노드 - 부모가 확장하며 만든 BatchState의 한 행을 상태로 가리킴
+    Args:
+        source: 이 노드 상태가 들어 있는 BatchState
+        row: source 안의 행 인덱스
+        reward: 부모 확장 때 평가한 이 상태의 보상 (루트는 None)
+    """
+
+    __slots__ = ('source', 'row', 'reward', 'visits', 'batch', 'rewards', 'children',
+                 'my_actions', 'my_visits', 'my_wins', 'opp_actions', 'opp_visits', 'opp_wins')
+
+    def __init__(self, source: BatchState, row: int, reward: Optional[float] = None):
+        self.source = source
+        self.row = row
+        self.reward = reward
+        self.visits = 0
+        self.batch: Optional[BatchState] = None   # 확장 후 자식 K*L개 상태 (행 = 내 행동 i * L + 상대 행동 j)
+        self.rewards: Optional[np.ndarray] = None  # 자식 K*L개의 롤아웃 보상
+        self.children: Optional[List[Optional['DUCTNode']]] = None
+        self.my_actions: List[int] = []
+        self.my_visits: List[int] = []
+        self.my_wins: List[float] = []
+        self.opp_actions: List[int] = []
+        self.opp_visits: List[int] = []
+        self.opp_wins: List[float] = []
+
+    @property
+    def finished(self) -> bool:
+        return bool(self.source.finished[self.row])
+
+
+def side_actions(batch: BatchState, row: int, side: int) -> List[int]:
+    """
+    batch의 row번 배틀에서 side 쪽이 둘 수 있는 행동 코드 (BatchedBattleEngine 행동 코드 기준)
+    - PP가 남은 기술 (없으면 랜덤 기술 -1), 살아 있는 대기 포켓몬으로 교체
+    - 반동 턴이면 아무 기술 하나 (엔진이 행동하지 않음)
+    """
+    slot = int(batch.active[row, side])
+    if slot < 0:
+        return [-1]
+    if batch.must_recharge[row, side, slot]:
+        return [0]
+    moves = np.flatnonzero(batch.move_exists[row, side, slot] & (batch.pp[row, side, slot] > 0)).tolist() or [-1]
+    bench = np.flatnonzero(batch.exists[row, side] & (batch.hp[row, side] > 0)).tolist()
+    return moves + [batch.num_moves + s for s in bench if s != slot]
+
+
+class DUCTSearcher(MCTSSearcher):
+    """
+    Decoupled UCT 검색기 (루트 상태 생성 / LLM 프루닝 옵션은 MCTSSearcher와 동일)
+    루트의 내 행동은 MCTSSearcher 루트 행동(프루닝 반영)을 그대로 쓰고, 그 밖의 행동은 BatchState에서 나열한다.
+    use_array_state / leaf_batch_size / transposition_table / use_undo는 사용하지 않음 (확장 자체가 배치 처리)
+    Args:
+        rollout_turns: 확장한 자식을 평가하기 전 배치 롤아웃 턴 수 (0이면 행동 조합 진행 직후 상태를 바로 평가)
+    """
+
+    def __init__(self, root_battle, rollout_turns: int = 0, **kwargs):
+        super().__init__(root_battle, **kwargs)
+        self.rollout_turns = rollout_turns
+        self.policy = BatchedRolloutPolicy(max_turns=rollout_turns, rng=kwargs.get('rng'))
+        self.batched_policy = None
+        self.joint_expansions = 0  # 확장 횟수 (평가한 행동 조합 수 = joint_evaluations)
+        self.joint_evaluations = 0
+        self._set_root(self.root.untried_actions)
+
+    def _set_root(self, actions: list):
+        """루트 BatchState와 루트 행동 (행동 객체 ↔ 배치 행동 코드) 준비"""
+        root_batch = BatchState.from_battles([self.root_state])
+        self.root_actions = []
+        codes = []
+        team = list(self.root_state.team.values())
+        for action in actions:
+            move_idx, switch_name = self._parse_action(self.root_state, action)
+            if switch_name is not None:
+                slot = next((i for i, p in enumerate(team[:root_batch.num_slots]) if p.species == switch_name), None)
+                if slot is None: continue
+                code = root_batch.num_moves + slot
+            else:
+                code = -1 if move_idx is None or move_idx >= root_batch.num_moves else move_idx
+            if code in codes: continue
+            codes.append(code)
+            self.root_actions.append(action)
+        self.root_codes = codes
+        self.root = DUCTNode(root_batch, 0)
+
+    # =================================================================
+    # 탐색
+    # =================================================================
+    def search(self, iterations, deadline: Optional[float] = None):
+        # Fast Fail - 가능한 행동이 없으면 None 혹은 가능한 행동 하나 반환
+        if not self.root_actions: return None
+        if len(self.root_actions) == 1: return self.root_actions[0]
+
+        with gc_paused(deadline is not None):
+            for _ in range(iterations):
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                self.iterations_run += 1
+                path, reward = self._descend()
+                self._backpropagate(path, reward)
+
+        if not self.root.my_visits:
+            return self.rng.choice(self.root_actions)
+        visits = self.root.my_visits
+        return self.root_actions[visits.index(max(visits))]
+
+    def _descend(self) -> Tuple[List[Tuple[DUCTNode, int, int]], float]:
+        """
+        루트부터 양쪽 행동을 독립 UCT로 골라 내려가다 확장하지 않은 노드를 만나면 확장 (Selection & Expansion)
+        Returns:
+            ([(노드, 내 행동 인덱스, 상대 행동 인덱스), ...], 역전파할 보상)
+        """
+        node = self.root
+        path = []
+        while node.batch is not None:
+            i = self._uct_index(node.my_visits, node.my_wins, node.visits, maximize=True)
+            j = self._uct_index(node.opp_visits, node.opp_wins, node.visits, maximize=False)
+            path.append((node, i, j))
+
+            row = i * len(node.opp_actions) + j
+            child = node.children[row]
+            if child is None:
+                child = node.children[row] = DUCTNode(node.batch, row, float(node.rewards[row]))
+            node = child
+
+        if node.finished:
+            return path, node.reward
+        return path, self._expand(node)
+
+    @staticmethod
+    def _uct_index(visits: List[int], wins: List[float], total: int, maximize: bool) -> int:
+        """한쪽 행동 통계에서 UCT 최댓값 인덱스 (상대 쪽은 1 - 평균 보상 기준)"""
+        log_n = math.log(max(total, 1))
+        best_index, best_score = 0, -math.inf
+        for k, (n, w) in enumerate(zip(visits, wins)):
+            mean = w / n if maximize else 1.0 - w / n
+            score = mean + UCT_C * math.sqrt(log_n / n)
+            if score > best_score:
+                best_index, best_score = k, score
+        return best_index
+
+    def _expand(self, node: DUCTNode) -> float:
+        """
+        node의 모든 행동 조합을 배치 엔진 한 번으로 진행하고 정적 평가 (rollout_turns > 0이면 배치 롤아웃 후 평가)
+        양쪽 행동 통계는 조합 보상의 행동별 평균으로 초기화 (행동마다 방문 1회)
+        Returns:
+            node의 값 (모든 조합 보상 평균)
+        """
+        source, row = node.source, node.row
+        if node is self.root:
+            mine = self.root_codes
+        else:
+            mine = side_actions(source, row, 0)
+        theirs = side_actions(source, row, 1)
+        k, l = len(mine), len(theirs)
+
+        batch = source.broadcast(row, k * l)
+        self.policy.engine.simulate_turn(batch, np.repeat(mine, l), np.tile(theirs, k), rng=self.policy.rng, copy=False)
+        rewards = self.policy.run_batch(batch.copy()) if self.rollout_turns else self.policy.evaluate(batch)
+        self.joint_expansions += 1
+        self.joint_evaluations += k * l
+
+        grid = rewards.reshape(k, l)
+        node.batch = batch
+        node.rewards = rewards
+        node.children = [None] * (k * l)
+        node.my_actions, node.opp_actions = list(mine), list(theirs)
+        node.my_visits, node.my_wins = [1] * k, grid.mean(axis=1).tolist()
+        node.opp_visits, node.opp_wins = [1] * l, grid.mean(axis=0).tolist()
+        node.visits = 1
+        # 확장한 노드 자체의 값은 부모 경로로 역전파
+        return float(rewards.mean())
+
+    def _backpropagate(self, path: List[Tuple[DUCTNode, int, int]], reward: float):
+        for node, i, j in path:
+            node.visits += 1
+            node.my_visits[i] += 1
+            node.my_wins[i] += reward
+            node.opp_visits[j] += 1
+            node.opp_wins[j] += reward
+
+    # =================================================================
+    # 루트
+    # =================================================================
+    @property
+    def root_visits(self) -> int:
+        return self.root.visits
+
+    def root_statistics(self) -> List[Tuple[object, int, float]]:
+        return list(zip(self.root_actions, self.root.my_visits, self.root.my_wins))
+
+    def opponent_statistics(self) -> List[Tuple[int, int, float]]:
+        """루트 상대 행동별 (배치 행동 코드, 방문 수, 내 기준 보상 합)"""
+        return list(zip(self.root.opp_actions, self.root.opp_visits, self.root.opp_wins))
+
+    def release(self):
+        """트리 해제 (부모 참조가 없어 순환 없이 해제됨)"""
+        self.root = DUCTNode(self.root.source, self.root.row)
+
+    def advance(self, action, observed_state) -> bool:
+        """상대가 실제로 둔 행동을 알 수 없어 조합 자식을 고를 수 없으므로 재사용하지 않음 (호출 측에서 새 탐색기 생성)"""
+        return False
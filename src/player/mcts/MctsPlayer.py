@@ -5,12 +5,27 @@ import os
 import time
 from typing import List, Optional, Tuple, Dict, Set
 
+import numpy as np
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleClass.ArrayBattle import ArrayBattle
 from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
+from sim.BattleEngine.BatchedBattleEngine import BatchState, BatchedBattleEngine, STATUS
+from sim.BattleClass.ArrayBattle import BOOST_INDEX
+from sim.Supporting.BattleRandom import numpy_generator
+from sim.Supporting.GcPause import gc_paused, collect_idle
+from sim.Supporting.TypeChart import TYPELESS, NUM_TYPES, DUAL_STRIDE
 from sim.BattleClass.SimplifiedPokemon import SimplifiedPokemon
 from sim.BattleClass.SimplifiedMove import SimplifiedMove
 from player.mcts.llm_pruner import LLMPruner
+from player.TranspositionTable import TranspositionTable
+from sim.BattleClass.BattleTracker import BattleTrackers
+
+# 서브트리 재사용 허용 거리 (양쪽 활성 포켓몬 HP 비율 차이 합)
+REUSE_MAX_DISTANCE = 0.35
+# 시간 예산만 줄 때 반복 수 상한
+UNBOUNDED_ITERATIONS = 10 ** 9
 
 
 class BattleHeuristics:
@@ -33,9 +48,9 @@ class BattleHeuristics:
         if move.type in attacker.types:
             score *= 1.5
             
-        # 3. 상성 계산 (가장 중요!)
+        # 3. 상성 계산 (가장 중요!) - 정수 타입 코드로 상성표 조회
         if defender:
-            mult = defender.damage_multiplier(move.type)
+            mult = defender.damage_multiplier(move.type_code)
             score *= mult
             
         # 4. 명중률 기댓값 반영
@@ -45,9 +60,9 @@ class BattleHeuristics:
         return score
 
     @staticmethod
-    def select_best_attack_idx(attacker: SimplifiedPokemon, defender: Optional[SimplifiedPokemon]) -> int:
+    def select_best_attack_idx(attacker: SimplifiedPokemon, defender: Optional[SimplifiedPokemon], rng=random) -> int:
         """
-        가장 기대 딜량이 높은 기술의 인덱스를 반환
+        가장 기대 딜량이 높은 기술의 인덱스를 반환 (rng: 공격 기술이 없을 때의 랜덤 선택용)
         """
         # 예외 처리
         if not attacker or not attacker.moves: return None
@@ -55,7 +70,7 @@ class BattleHeuristics:
         best_idx = 0
         max_score = -1.0
         
-        random_fallback = random.randint(0, len(attacker.moves) - 1)
+        random_fallback = rng.randint(0, len(attacker.moves) - 1)
         has_valid_attack = False
 
         for i, move in enumerate(attacker.moves):
@@ -128,15 +143,18 @@ class SmartRolloutPolicy:
     - 상대: 가장 강한 기술 선택 - 게임 이론 적용
     - 턴: 1턴 시뮬레이션 - 확률적인 요소로 인함
     - TODO : 더 정교한 정책 구현
+    - use_undo: True면 상태를 복제하지 않고 그 자리에서 진행한 뒤 undo_turn으로 되돌림
     """
-    def __init__(self, max_turns=1):
+    def __init__(self, max_turns=1, use_undo: bool = False):
         self.max_turns = max_turns
+        self.use_undo = use_undo
 
     def run(self, state: SimplifiedBattle, engine: SimplifiedBattleEngine) -> float:
         if state.finished:
             return BattleHeuristics.evaluate_state(state)
 
-        rollout_state = state.clone()
+        rollout_state = state if self.use_undo else state.clone()
+        played = 0
         
         # 1턴 시뮬레이션
         for _ in range(self.max_turns):
@@ -146,19 +164,105 @@ class SmartRolloutPolicy:
             opp = rollout_state.opponent_active_pokemon
             
             # 최선의 공격 찾기
-            my_move_idx = BattleHeuristics.select_best_attack_idx(me, opp)
+            my_move_idx = BattleHeuristics.select_best_attack_idx(me, opp, engine.rng)
 
             # 최선의 공격 찾기 (상대)
-            opp_move_idx = BattleHeuristics.select_best_attack_idx(opp, me)
+            opp_move_idx = BattleHeuristics.select_best_attack_idx(opp, me, engine.rng)
             
             # 시뮬레이션 실행
             engine.simulate_turn(
                 rollout_state,
                 player_move_idx=my_move_idx,
-                opponent_move_idx=opp_move_idx
+                opponent_move_idx=opp_move_idx,
+                record_undo=self.use_undo
             )
+            played += 1
+
+        reward = BattleHeuristics.evaluate_state(rollout_state)
+        if self.use_undo:
+            for _ in range(played):
+                engine.undo_turn(rollout_state)
+        return reward
+
+class BatchedRolloutPolicy:
+    """
+    SmartRolloutPolicy의 배치 버전
+    - 리프 상태 N개를 BatchState로 묶어 BatchedBattleEngine으로 동시에 롤아웃
+    - 행동 선택(select_best_attack_idx)과 보상(evaluate_state)도 같은 기준으로 벡터화
+    """
+    def __init__(self, max_turns=1, gen: int = 9, rng=None):
+        self.max_turns = max_turns
+        self.engine = BatchedBattleEngine(gen=gen)
+        self.rng = numpy_generator(rng)
+        self.template: Optional[BatchState] = None
+
+    def run_many(self, states: List[SimplifiedBattle]) -> List[float]:
+        # 같은 탐색 트리의 상태들은 팀 구성이 같으므로 불변 배열은 첫 호출 때 한 번만 읽음
+        if self.template is None:
+            self.template = BatchState.from_battles(states[:1])
+        batch = BatchState.from_battles(states, template=self.template)
+        return self.run_batch(batch).tolist()
+
+    def run_batch(self, batch: BatchState) -> np.ndarray:
+        """이미 만든 BatchState를 그 자리에서 롤아웃하고 배틀별 보상 반환 (batch가 수정됨)"""
+        for _ in range(self.max_turns):
+            if batch.finished.all(): break
+
+            # 양쪽 모두 가장 강한 공격 선택 (종료된 배틀은 엔진에서 진행되지 않음)
+            player_actions = self.best_attack_actions(batch, side=0)
+            opponent_actions = self.best_attack_actions(batch, side=1)
+            batch, _, _ = self.engine.simulate_turn(batch, player_actions, opponent_actions, rng=self.rng, copy=False)
+
+        return self.evaluate(batch)
+
+    def best_attack_actions(self, batch: BatchState, side: int) -> np.ndarray:
+        """BattleHeuristics.select_best_attack_idx의 벡터 버전 (배틀마다 기술 인덱스 반환)"""
+        rows = np.arange(batch.size)
+        attacker = (rows, side, np.maximum(batch.active[:, side], 0))
+        defender = (rows, 1 - side, np.maximum(batch.active[:, 1 - side], 0))
+
+        move_type = batch.move_type[attacker]
+        attacker_types = batch.types[attacker]
+        defender_types = batch.types[defender]
+        stab = (move_type == attacker_types[:, :1]) | ((move_type == attacker_types[:, 1:]) & (attacker_types[:, 1:] != TYPELESS))
+        defense_key = (defender_types[:, 0] * NUM_TYPES + defender_types[:, 1])[:, None]
+
+        # 위력 * 자속보정 * 상성 * 명중률 (변화기는 0.1)
+        score = batch.move_power[attacker] * np.where(stab, 1.5, 1.0)
+        score = score * self.engine.dual[move_type * DUAL_STRIDE + defense_key] * batch.move_accuracy[attacker]
+        is_status = batch.move_category[attacker] == STATUS
+        score = np.where(is_status, 0.1, score)
+
+        usable = batch.move_exists[attacker] & (batch.pp[attacker] > 0)
+        score = np.where(usable, score, -np.inf)
+        best_idx = score.argmax(axis=1)
+
+        # 공격 기술이 아예 없으면 랜덤
+        has_valid_attack = (usable & ~is_status).any(axis=1)
+        exists = batch.move_exists[attacker]
+        random_fallback = np.where(exists, self.rng.random(exists.shape), -1.0).argmax(axis=1)
+        return np.where(~has_valid_attack & (score.max(axis=1) <= 0.1), random_fallback, best_idx)
+
+    @staticmethod
+    def evaluate(batch: BatchState) -> np.ndarray:
+        """BattleHeuristics.evaluate_state의 벡터 버전"""
+        alive = (batch.hp > 0) & (batch.max_hp > 0)
+        hp_ratio = np.where(alive, batch.hp / batch.max_hp, 0.0)
+
+        # 패배 시 상대 팀 평균 체력 기반 보상
+        opp_count = alive[:, 1].sum(axis=1)
+        opp_health = np.divide(hp_ratio[:, 1].sum(axis=1), opp_count, out=np.zeros(batch.size), where=opp_count > 0)
+        lost_reward = (1.0 - opp_health) * 0.2
+
+        # 체력 및 상태 (랭크) 기반 점수
+        boosts = batch.boosts[..., [BOOST_INDEX['atk'], BOOST_INDEX['spa'], BOOST_INDEX['spe']]].sum(axis=-1)
+        p_score = 1.0 + hp_ratio - np.where(batch.status != 0, 0.5, 0.0) + np.where(boosts > 0, boosts * 0.1, 0.0)
+        side_score = np.where(alive, np.maximum(0.1, p_score), 0.0).sum(axis=2)
+        total = side_score.sum(axis=1)
+        balance = np.divide(side_score[:, 0], total, out=np.full(batch.size, 0.5), where=total != 0)
+
+        return np.where(batch.won, 1.0, np.where(batch.lost, lost_reward, balance))
 
-        return BattleHeuristics.evaluate_state(rollout_state)
 
 class MCTSNode:
     """MCTS 트리의 노드 클래스"""
@@ -172,12 +276,16 @@ class MCTSNode:
         self.untried_actions : List = self._get_available_actions()
 
     def _get_available_actions(self):
+        return MCTSNode.available_actions(self.state)
+
+    @staticmethod
+    def available_actions(state) -> list:
         actions = []
         # 가능한 모든 행동 (기술 사용 및 교체) 수집
-        if hasattr(self.state, 'available_moves'):
-            actions.extend(list(self.state.available_moves))
-        if hasattr(self.state, 'available_switches'):
-            actions.extend(list(self.state.available_switches))
+        if hasattr(state, 'available_moves'):
+            actions.extend(list(state.available_moves))
+        if hasattr(state, 'available_switches'):
+            actions.extend(list(state.available_switches))
         return actions
 
     # 선택 단계 - UCT 기준으로 최적 자식 노드 선택 (테스트 결과 1.4가 가장 적합)
@@ -193,82 +301,271 @@ class MCTSNode:
         return self.children[choices_weights.index(max(choices_weights))]
 
 class MCTSSearcher:
-    """MCTS 검색기 클래스"""
-    def __init__(self, root_battle):
-        self.engine = SimplifiedBattleEngine()
-        if isinstance(root_battle, SimplifiedBattle):
+    """MCTS 검색기 클래스
+        Args:
+            root_battle: 루트 배틀 (poke-env Battle / SimplifiedBattle / ArrayBattle)
+            use_array_state: True면 루트를 ArrayBattle로 변환해 버퍼 복사 기반 clone 사용
+            leaf_batch_size: 1보다 크면 리프를 여러 개 모아 BatchedRolloutPolicy로 한 번에 롤아웃 (leaf-parallel)
+            transposition_table: 전치표 (None이면 사용 안 함). 리프 상태 해시별 롤아웃 보상 평균을 저장해
+                                 다른 경로로 같은 상태에 도달하면 평균을 재사용
+            tt_max_samples: 상태별 보상 평균이 이 샘플 수에 도달하면 더 롤아웃하지 않고 평균만 사용
+            use_undo: True면 롤아웃을 복제 대신 리프 상태에서 진행한 뒤 되돌림 (make / unmake)
+            rng: 난수 생성기 (BattleRandom 등, None이면 전역 random 모듈). 배틀 생성 / 확장 / 롤아웃 / 엔진이 모두 사용
+            opponent_belief: 상대 세트 추론기 (OpponentBelief). poke-env Battle로 루트를 만들 때 미공개 상대를
+                             factory 세트 분포로 채움
+            use_llm_pruner: False면 루트 LLM 프루닝을 하지 않음 (루트 병렬 워커처럼 프루닝을 한 곳에서만 할 때)
+            tracker: 배틀 상태 추적기 (BattleTracker / BattleTrackers). 주어지면 poke-env Battle로 루트를 새로 만들지 않고
+                     턴 사이에 유지 중인 상태에 바뀐 부분만 반영한 복제본을 루트로 사용
+        """
+    def __init__(self, root_battle, use_array_state: bool = False, leaf_batch_size: int = 1,
+                 transposition_table: Optional[TranspositionTable] = None, tt_max_samples: int = 4,
+                 use_undo: bool = False, rng=None, opponent_belief=None, tracker=None, use_llm_pruner: bool = True):
+        self.rng = rng if rng is not None else random
+        self.engine = SimplifiedBattleEngine(rng=rng)
+        self.use_array_state = use_array_state
+        if isinstance(root_battle, (SimplifiedBattle, ArrayBattle)):
             self.root_state = root_battle
+        elif tracker is not None:
+            self.root_state = tracker.update(root_battle)
         else:
-            self.root_state = SimplifiedBattle(root_battle, fill_unknown_data=True)
+            self.root_state = SimplifiedBattle(root_battle, fill_unknown_data=True, rng=rng,
+                                              opponent_belief=opponent_belief)
             
         self.engine._sync_references(self.root_state)
+        if use_array_state and not isinstance(self.root_state, ArrayBattle):
+            self.root_state = ArrayBattle.from_battle(self.root_state)
         self.root = MCTSNode(self.root_state)
         
-        self.policy = SmartRolloutPolicy(max_turns=1)
-        self.llm_pruner = LLMPruner()
-
-        self._apply_root_pruning()
-
-    def search(self, iterations):
+        self.policy = SmartRolloutPolicy(max_turns=1, use_undo=use_undo)
+        self.leaf_batch_size = leaf_batch_size
+        self.batched_policy = BatchedRolloutPolicy(max_turns=1, rng=rng) if leaf_batch_size > 1 else None
+        self.llm_pruner = LLMPruner() if use_llm_pruner else None
+
+        self.transposition_table = transposition_table
+        self.tt_max_samples = tt_max_samples
+        if transposition_table is not None:
+            transposition_table.new_search()
+            # 루트에서 한 번 계산해 두면 이후 clone된 자식 상태는 증분 갱신된 해시를 물려받음
+            self.root_state.zobrist_hash()
+
+        self.iterations_run = 0  # search()로 실행한 누적 반복 수
+        if use_llm_pruner:
+            self._apply_root_pruning()
+
+    def search(self, iterations, deadline: Optional[float] = None):
+        """
+        MCTS 반복 실행 후 방문 수가 가장 많은 루트 행동 반환
+        Args:
+            iterations: 최대 반복 수
+            deadline: time.perf_counter() 기준 마감 시각 (None이면 반복 수만 사용). 지나면 남은 반복을 건너뜀
+        """
         # Fast Fail - 가능한 행동이 없으면 None 혹은 가능한 행동 하나 반환
         all_actions = self.root.untried_actions
-        if not all_actions: return None
-        if len(all_actions) == 1: return all_actions[0]
+        if not all_actions and not self.root.children: return None
+        if len(all_actions) == 1 and not self.root.children: return all_actions[0]
+
+        # 마감 시각이 있으면 GC 멈춤이 결정 지연에 끼지 않도록 탐색 동안 자동 GC 정지
+        with gc_paused(deadline is not None):
+            if self.batched_policy is not None:
+                self._search_leaf_parallel(iterations, deadline)
+            else:
+                for _ in range(iterations):
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+                    self.iterations_run += 1
+                    node = self._select_and_expand()
 
-        for _ in range(iterations):
-            node = self.root
-            
-            # Selection
-            while not node.state.finished and not node.untried_actions and node.children:
-                node = node.best_child()
-                if node is None: break 
-            
-            # Expansion
-            if not node.state.finished and node.untried_actions:
-                node = self._expand(node)
-            
-            # Simulation & Backpropagation
-            if node:
-                reward = self.policy.run(node.state, self.engine)
-                self._backpropagate(node, reward)
+                    # Simulation & Backpropagation
+                    if node:
+                        reward = self._cached_reward(node.state)
+                        if reward is None:
+                            reward = self._record_reward(node.state, self.policy.run(node.state, self.engine))
+                        self._backpropagate(node, reward)
 
         if not self.root.children:
-            return random.choice(all_actions)
+            return self.rng.choice(all_actions) if all_actions else None
 
         best_child = max(self.root.children, key=lambda c: c.visits)
         return best_child.action
 
+    def _reset_rollout_template(self):
+        """
+        배치 롤아웃의 불변 배열 캐시(template)를 버림 - 관측 상태는 공개된 대기 포켓몬 / 추론한 기술 / 추론 세트가
+        바뀌었을 수 있으므로 재사용한 트리의 다음 배치 롤아웃에서 새 루트 기준으로 다시 만든다
+        """
+        if self.batched_policy is not None:
+            self.batched_policy.template = None
+
+    def advance(self, action, observed_state) -> bool:
+        """
+        지난 턴에 둔 행동의 자식을 새 루트로 승격 (서브트리 재사용)
+        자식이 시뮬레이션한 결과가 관측과 가까울 때만 재사용하고, 루트 상태는 관측 상태로 바꾼다.
+        버린 형제 서브트리는 참조를 끊어 바로 해제한다.
+        Args:
+            action: 지난 턴에 고른 루트 행동
+            observed_state: 이번 턴에 관측한 상태 (SimplifiedBattle)
+        Returns:
+            재사용했으면 True (맞는 자식이 없거나 관측과 너무 다르면 False → 호출 측에서 새 탐색기 생성)
+        """
+        action_id = LLMPruner.action_identifier(action)
+        child = next((c for c in self.root.children if LLMPruner.action_identifier(c.action) == action_id), None)
+        if child is None or observation_distance(child.state, observed_state) > REUSE_MAX_DISTANCE:
+            return False
+
+        for sibling in self.root.children:
+            if sibling is not child:
+                _release_subtree(sibling)
+        self.root.children = []
+
+        self.engine._sync_references(observed_state)
+        if self.use_array_state and not isinstance(observed_state, ArrayBattle):
+            observed_state = ArrayBattle.from_battle(observed_state)
+        child.parent = None
+        child.action = None
+        child.state = observed_state
+
+        # 관측 상태에서 가능한 행동 기준으로 자식 정리 (더 이상 둘 수 없는 행동의 서브트리는 해제)
+        available = {LLMPruner.action_identifier(a): a for a in child._get_available_actions()}
+        kept = []
+        for grandchild in child.children:
+            key = LLMPruner.action_identifier(grandchild.action)
+            if key in available:
+                grandchild.action = available.pop(key)
+                kept.append(grandchild)
+            else:
+                _release_subtree(grandchild)
+        child.children = kept
+        child.untried_actions = list(available.values())
+        child.visits = sum(c.visits for c in kept)
+        child.wins = sum(c.wins for c in kept)
+
+        self.root = child
+        self.root_state = observed_state
+        self._reset_rollout_template()
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+            observed_state.zobrist_hash()
+        if self.llm_pruner is not None:
+            self._apply_root_pruning()
+        return True
+
+    def release(self):
+        """트리 전체 해제 (탐색기를 버릴 때)"""
+        _release_subtree(self.root)
+
+    @property
+    def root_visits(self) -> int:
+        return self.root.visits
+
+    def root_statistics(self) -> List[Tuple[object, int, float]]:
+        """확장된 루트 자식별 (행동, 방문 수, 보상 합)"""
+        return [(child.action, child.visits, child.wins) for child in self.root.children]
+
+    def _select_and_expand(self) -> Optional[MCTSNode]:
+        node = self._select()
+
+        # Expansion
+        if node and not node.state.finished and node.untried_actions:
+            node = self._expand(node)
+        return node
+
+    def _select(self) -> Optional[MCTSNode]:
+        """Selection - 확장할 행동이 남은 노드 / 리프까지 UCT로 내려감"""
+        node = self.root
+        while not node.state.finished and not node.untried_actions and node.children:
+            node = node.best_child()
+            if node is None: break
+        return node
+
+    def _search_leaf_parallel(self, iterations, deadline: Optional[float] = None):
+        """리프를 leaf_batch_size개씩 모아 한 번의 배치 롤아웃으로 평가"""
+        remaining = iterations
+        while remaining > 0:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            batch_size = min(self.leaf_batch_size, remaining)
+            remaining -= batch_size
+            self.iterations_run += batch_size
+
+            leaves = []
+            for _ in range(batch_size):
+                node = self._select_and_expand()
+                if node is None: continue
+                reward = self._cached_reward(node.state)
+                if reward is not None:
+                    self._backpropagate(node, reward)
+                    continue
+                # 가상 손실 - 보상이 나오기 전에 방문 수만 먼저 반영해 같은 경로가 반복 선택되지 않게 함
+                self._backpropagate(node, 0.0)
+                leaves.append(node)
+
+            if not leaves: continue
+            rewards = self.batched_policy.run_many([leaf.state for leaf in leaves])
+            for leaf, reward in zip(leaves, rewards):
+                self._backpropagate_reward(leaf, self._record_reward(leaf.state, reward))
+
+    def _cached_reward(self, state) -> Optional[float]:
+        """전치표에 충분히 쌓인 보상 평균이 있으면 반환 (없으면 None → 롤아웃 필요)"""
+        tt = self.transposition_table
+        if tt is None:
+            return None
+        entry = tt.probe(state.zobrist_hash())
+        if entry is None or entry.count < self.tt_max_samples:
+            return None
+        return entry.value
+
+    def _record_reward(self, state, reward: float) -> float:
+        """롤아웃 보상을 전치표 평균에 반영하고, 역전파할 값(평균)을 반환"""
+        tt = self.transposition_table
+        if tt is None:
+            return reward
+        return tt.add_sample(state.zobrist_hash(), float(reward)).value
+
     def _expand(self, node : MCTSNode) -> MCTSNode:
-        action = random.choice(node.untried_actions)
+        action = self.rng.choice(node.untried_actions)
         node.untried_actions.remove(action)
 
-        new_state = node.state.clone()
-        
-        p_move_idx, p_switch = self._parse_action(new_state, action)
+        child_node = MCTSNode(self._simulate_action(node.state, action), parent=node, action=action)
+        node.children.append(child_node)
+        return child_node
+
+    def _simulate_action(self, state, action):
+        """상태를 복제해 내 행동 + 상대 휴리스틱 응수로 1턴 진행한 자식 상태 반환"""
+        new_state = state.clone()
+        self._play_turn(new_state, action)
+        return new_state
+
+    def _play_turn(self, state, action, record_undo: bool = False):
+        """state를 그 자리에서 내 행동 + 상대 휴리스틱 응수로 1턴 진행 (record_undo면 undo_turn으로 되돌릴 수 있음)"""
+        p_move_idx, p_switch = self._parse_action(state, action)
         
         # 확장 단계에서의 상대 행동도 휴리스틱으로 결정 - 최선의 선택을 한다고 가정
         o_move_idx = BattleHeuristics.select_best_attack_idx(
-            new_state.opponent_active_pokemon, 
-            new_state.active_pokemon
+            state.opponent_active_pokemon, 
+            state.active_pokemon,
+            self.rng
         )
 
         self.engine.simulate_turn(
-            new_state,
+            state,
             player_move_idx=p_move_idx,
             player_switch_to=p_switch,
-            opponent_move_idx=o_move_idx
+            opponent_move_idx=o_move_idx,
+            record_undo=record_undo
         )
 
-        child_node = MCTSNode(new_state, parent=node, action=action)
-        node.children.append(child_node)
-        return child_node
-
     def _backpropagate(self, node : MCTSNode, reward: float):
         while node:
             node.visits += 1
             node.wins += reward
             node = node.parent
 
+    def _backpropagate_reward(self, node : MCTSNode, reward: float):
+        """방문 수는 이미 반영된 경로에 보상만 더함 (leaf-parallel용)"""
+        while node:
+            node.wins += reward
+            node = node.parent
+
     def _parse_action(self, state: SimplifiedBattle, action) -> Tuple[Optional[int], Optional[str]]:
         move_idx = None
         switch_name = None
@@ -297,21 +594,145 @@ class MCTSSearcher:
             if self.llm_pruner.action_identifier(action) not in pruned_ids
         ]
     
-def mcts_search(root_battle: SimplifiedBattle, iterations: int = 100, verbose: bool = False):
-    
-    searcher = MCTSSearcher(root_battle)
-    best_action = searcher.search(iterations)
+def observation_distance(simulated, observed) -> float:
+    """시뮬레이션 상태와 관측 상태의 차이 (활성 포켓몬 종 / 종료 여부가 다르면 inf, 같으면 양쪽 활성 HP 비율 차이 합)"""
+    if simulated.finished != observed.finished:
+        return float('inf')
+    distance = 0.0
+    for side in ('active_pokemon', 'opponent_active_pokemon'):
+        a, b = getattr(simulated, side), getattr(observed, side)
+        if a is None or b is None:
+            if a is not b:
+                return float('inf')
+            continue
+        if a.species != b.species:
+            return float('inf')
+        distance += abs(a.current_hp / max(a.max_hp, 1) - b.current_hp / max(b.max_hp, 1))
+    return distance
+
+
+def _release_subtree(node: MCTSNode):
+    """부모 / 자식 순환 참조와 상태를 끊어 서브트리를 GC 없이 바로 해제"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        stack.extend(current.children)
+        current.children = []
+        current.parent = None
+        current.state = None
+        current.untried_actions = []
+
+
+class PersistentMCTS:
+    """
+    battle_tag별 MCTSSearcher를 턴 사이에 유지 (서브트리 재사용)
+    다음 턴 관측이 들어오면 지난 턴에 고른 행동의 자식을 새 루트로 승격하고,
+    이미 쌓인 루트 방문 수를 이번 턴 반복 예산에 포함한다.
+    Args:
+        rng: 난수 생성기 (BattleRandom 등, None이면 전역 random 모듈)
+        opponent_belief: 상대 세트 추론기 (상태 추적기에 전달)
+        searcher_class: 탐색기 클래스 (MCTSSearcher / ArenaMCTSSearcher)
+        searcher_kwargs: MCTSSearcher 옵션 (use_array_state, leaf_batch_size, transposition_table ...)
+    """
+
+    def __init__(self, rng=None, opponent_belief=None, searcher_class=None, **searcher_kwargs):
+        self.rng = rng
+        self.trackers = BattleTrackers(rng=rng, opponent_belief=opponent_belief)
+        self.searcher_class = searcher_class or MCTSSearcher
+        self.searcher_kwargs = searcher_kwargs
+        self._searchers: Dict[str, MCTSSearcher] = {}
+        self._last_actions: Dict[str, object] = {}
+        self.reused = False  # 마지막 search에서 서브트리를 재사용했는지
+        self.retained_visits = 0  # 마지막 search에서 재사용한 루트 방문 수
+
+    def search(self, battle, iterations: Optional[int] = 100, deadline: Optional[float] = None,
+               time_budget: Optional[float] = None):
+        """
+        이번 턴 행동 선택
+        Args:
+            battle: 현재 턴의 poke-env Battle
+            iterations: 루트 방문 수 목표 (재사용한 방문 수만큼 새 반복을 줄임, None이면 마감 시각까지)
+            deadline: time.perf_counter() 기준 마감 시각
+            time_budget: 시간 예산 (초, 상태 반영 포함). deadline과 함께 주면 더 이른 쪽 사용
+        """
+        if time_budget is not None:
+            budget_deadline = time.perf_counter() + time_budget
+            deadline = budget_deadline if deadline is None else min(deadline, budget_deadline)
+        if iterations is None:
+            iterations = UNBOUNDED_ITERATIONS
+        tag = battle.battle_tag
+        root_state = self.trackers.update(battle)
+        searcher = self._searchers.get(tag)
+        last_action = self._last_actions.get(tag)
+
+        self.reused = searcher is not None and last_action is not None and searcher.advance(last_action, root_state)
+        if not self.reused:
+            if searcher is not None:
+                searcher.release()
+            searcher = self._searchers[tag] = self.searcher_class(root_state, rng=self.rng, **self.searcher_kwargs)
+
+        self.retained_visits = searcher.root_visits
+        action = searcher.search(max(0, iterations - searcher.root_visits), deadline)
+        self._last_actions[tag] = action
+        return action
+
+    def searcher(self, battle_tag: str) -> Optional[MCTSSearcher]:
+        return self._searchers.get(battle_tag)
+
+    def discard(self, battle_tag: str):
+        """끝난 배틀의 트리 / 추적기 해제 (남은 순환 참조 쓰레기도 이때 수집)"""
+        searcher = self._searchers.pop(battle_tag, None)
+        if searcher is not None:
+            searcher.release()
+        self._last_actions.pop(battle_tag, None)
+        self.trackers.discard(battle_tag)
+        collect_idle()
+
+
+def mcts_search(root_battle: SimplifiedBattle, iterations: Optional[int] = 100, verbose: bool = False,
+                use_array_state: bool = False, leaf_batch_size: int = 1,
+                transposition_table: Optional[TranspositionTable] = None, rng=None,
+                opponent_belief=None, tracker=None, time_budget: Optional[float] = None,
+                report: Optional[dict] = None, searcher_class=None):
+    """
+    MCTS로 루트 행동 1개 선택
+    Args:
+        iterations: 최대 반복 수 (None이면 time_budget까지 계속 반복)
+        time_budget: 시간 예산 (초, 루트 변환 포함, None이면 iterations만 사용). 다 되면 그때까지의 최선 행동 반환
+        report: 주어지면 실행 결과 기록 {'iterations', 'elapsed', 'root_visits'} (지연 시간 튜닝용)
+        searcher_class: 탐색기 클래스 (None이면 MCTSSearcher, 배열 트리는 ArenaMCTSSearcher)
+    """
+    if iterations is None and time_budget is None:
+        raise ValueError("iterations와 time_budget 중 하나는 지정해야 합니다")
+    start = time.perf_counter()
+    deadline = None if time_budget is None else start + time_budget
+
+    searcher = (searcher_class or MCTSSearcher)(root_battle, use_array_state=use_array_state,
+                                                leaf_batch_size=leaf_batch_size,
+                                                transposition_table=transposition_table, rng=rng,
+                                                opponent_belief=opponent_belief, tracker=tracker)
+    SimplifiedPokemon.reset_stat_cache_info()
+    best_action = searcher.search(iterations if iterations is not None else UNBOUNDED_ITERATIONS, deadline)
+    elapsed = time.perf_counter() - start
+    if report is not None:
+        report.update(iterations=searcher.iterations_run, elapsed=elapsed, root_visits=searcher.root_visits)
     
     if verbose:
-        print(f"\n[MCTS 분석 결과] (총 반복: {iterations}회)")
+        print(f"\n[MCTS 분석 결과] (총 반복: {searcher.iterations_run}회, {elapsed * 1000:.0f}ms)")
+        cache_info = SimplifiedPokemon.stat_cache_info()
+        print(f"스탯 캐시 적중률: {cache_info['hit_rate'] * 100:.1f}% "
+              f"(적중 {cache_info['hits']} / 미적중 {cache_info['misses']})")
+        if transposition_table is not None:
+            tt_info = transposition_table.stats()
+            print(f"전치표 적중률: {tt_info['hit_rate'] * 100:.1f}% "
+                  f"(항목 {tt_info['entries']} / 제거 {tt_info['evictions']})")
         print("-" * 60)
         
         # 1. 자식 노드들을 '방문 횟수' 기준으로 정렬
-        sorted_children = sorted(searcher.root.children, key=lambda c: c.visits, reverse=True)
+        sorted_children = sorted(searcher.root_statistics(), key=lambda c: c[1], reverse=True)
         
-        for i, child in enumerate(sorted_children):
+        for i, (action, visits, wins) in enumerate(sorted_children):
             # 액션 이름 추출
-            action = child.action
             if hasattr(action, 'id'):  # 기술
                 action_type = "Move"
                 name = action.id
@@ -320,11 +741,11 @@ def mcts_search(root_battle: SimplifiedBattle, iterations: int = 100, verbose: b
                 name = action.species
 
             # 승률 계산
-            win_rate = (child.wins / child.visits * 100) if child.visits > 0 else 0.0   
+            win_rate = (wins / visits * 100) if visits > 0 else 0.0   
             
             print(f"[{i+1}] {action_type}: {name:<15} "
-                  f"| 방문: {child.visits:3d}회 "
-                  f"| 승률: {win_rate:5.1f}% ({child.wins:.1f}/{child.visits})")
+                  f"| 방문: {visits:3d}회 "
+                  f"| 승률: {win_rate:5.1f}% ({wins:.1f}/{visits})")
         
         print("-" * 60)
         
@@ -332,4 +753,6 @@ def mcts_search(root_battle: SimplifiedBattle, iterations: int = 100, verbose: b
             final_name = best_action.id if hasattr(best_action, 'id') else best_action.species
             print(f"최종 선택: {final_name}")
 
+    # 부모 / 자식 순환을 끊어 트리를 GC 없이 바로 해제
+    searcher.release()
     return best_action
\ No newline at end of file
@@ -0,0 +1,222 @@
+"""
+Open-loop MCTS (노드에 상태 대신 행동 통계만 저장)
+
+엔진이 확률적(명중, 급소, 스피드 동률)이라 MCTSNode가 들고 있는 복제 상태는 결과 하나의 샘플일 뿐인데,
+노드마다 SimplifiedBattle 전체를 저장하므로 메모리가 반복 수에 비례해 커진다.
+OpenLoopMCTSSearcher의 노드는 방문 수 / 보상 합 / 행동 id별 자식만 가지고,
+매 반복마다 루트 작업 상태에서 선택한 경로의 행동을 다시 시뮬레이션한다.
+    - 경로 / 롤아웃은 작업 상태 하나에서 record_undo로 진행하고 반복이 끝나면 되돌림 (반복마다 복제 없음)
+    - 같은 노드라도 샘플마다 가능한 행동이 다를 수 있으므로 (기절 → 교체 후보 변화) 이번 샘플에서 가능한 자식만 UCT 비교
+    - 통계는 행동 순서에 대한 기대값이므로 서브트리 재사용 시 관측 상태와의 거리 비교가 필요 없음
+"""
+import math
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import MCTSSearcher, MCTSNode, SmartRolloutPolicy
+from player.mcts.llm_pruner import LLMPruner
+from sim.BattleClass.ArrayBattle import ArrayBattle
+from sim.Supporting.GcPause import gc_paused
+
+# UCT 탐험 상수 (MCTSNode.best_child 기본값과 동일)
+UCT_C = 1.4
+
+
+class OpenLoopNode:
+    """Open-loop 노드 - 행동 id별 자식과 통계만 저장 (상태 없음)"""
+
+    __slots__ = ('visits', 'wins', 'children')
+
+    def __init__(self):
+        self.visits = 0
+        self.wins = 0.0
+        self.children: Optional[Dict[str, 'OpenLoopNode']] = None  # 처음 확장할 때 생성
+
+
+class OpenLoopMCTSSearcher(MCTSSearcher):
+    """
+    Open-loop MCTS 검색기 (옵션은 MCTSSearcher와 동일, use_undo는 항상 사용)
+    루트 행동은 루트 상태 기준으로 고정하고 (LLM 프루닝 반영), 그 아래 깊이는 반복마다 샘플 상태에서 다시 구한다.
+    """
+
+    def __init__(self, root_battle, **kwargs):
+        super().__init__(root_battle, **kwargs)
+        self.policy = SmartRolloutPolicy(max_turns=1, use_undo=True)
+        self._set_root(self.root_state, self.root.untried_actions, OpenLoopNode())
+
+    def _set_root(self, root_state, actions: list, root: OpenLoopNode):
+        self.root_actions = {LLMPruner.action_identifier(a): a for a in actions}
+        self.root = root
+        # 반복마다 진행 후 되돌릴 작업 상태 (호출 측 루트 상태에는 되돌리기 기록을 붙이지 않음)
+        self.work_state = root_state.clone()
+        self.engine._sync_references(self.work_state)
+
+    # =================================================================
+    # 탐색
+    # =================================================================
+    def search(self, iterations, deadline: Optional[float] = None):
+        # Fast Fail - 가능한 행동이 없으면 None 혹은 가능한 행동 하나 반환
+        actions = self.root_actions
+        if not actions: return None
+        if len(actions) == 1 and not self.root.children: return next(iter(actions.values()))
+
+        with gc_paused(deadline is not None):
+            if self.batched_policy is not None:
+                self._search_leaf_parallel(iterations, deadline)
+            else:
+                state = self.work_state
+                for _ in range(iterations):
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+                    self.iterations_run += 1
+                    path = self._descend()
+
+                    # Simulation & Backpropagation
+                    reward = self._cached_reward(state)
+                    if reward is None:
+                        reward = self._record_reward(state, self.policy.run(state, self.engine))
+                    self._unwind(len(path) - 1)
+                    self._backpropagate(path, reward)
+
+        if not self.root.children:
+            return self.rng.choice(list(actions.values()))
+        best_id = max(self.root.children, key=lambda key: self.root.children[key].visits)
+        return actions[best_id]
+
+    def _descend(self) -> List[OpenLoopNode]:
+        """
+        루트부터 작업 상태를 진행하며 내려가고 (Selection), 이번 샘플에서 처음 두는 행동이 있으면 하나 확장
+        Returns:
+            루트부터 리프까지의 노드 경로 (len - 1 = 진행한 턴 수)
+        """
+        state = self.work_state
+        node = self.root
+        path = [node]
+        available = self.root_actions
+        while not state.finished and available:
+            children = node.children
+            if children is None:
+                children = node.children = {}
+
+            # Expansion - 이번 샘플에서 가능하지만 아직 없는 행동
+            untried = [key for key in available if key not in children]
+            if untried:
+                key = self.rng.choice(untried)
+                child = children[key] = OpenLoopNode()
+                self._play_turn(state, available[key], record_undo=True)
+                path.append(child)
+                break
+
+            # Selection - 이번 샘플에서 가능한 자식 중 UCT 최댓값
+            log_n = math.log(node.visits)
+            best_key, best_score = None, -math.inf
+            for key in available:
+                child = children[key]
+                score = (child.wins / child.visits) + UCT_C * math.sqrt(log_n / child.visits)
+                if score > best_score:
+                    best_key, best_score = key, score
+            self._play_turn(state, available[best_key], record_undo=True)
+            node = children[best_key]
+            path.append(node)
+            available = {LLMPruner.action_identifier(a): a for a in MCTSNode.available_actions(state)}
+        return path
+
+    def _unwind(self, turns: int):
+        for _ in range(turns):
+            self.engine.undo_turn(self.work_state)
+
+    def _search_leaf_parallel(self, iterations, deadline: Optional[float] = None):
+        """리프 상태를 복제해 leaf_batch_size개씩 모아 배치 롤아웃 (MCTSSearcher와 같은 가상 손실)"""
+        state = self.work_state
+        remaining = iterations
+        while remaining > 0:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            batch_size = min(self.leaf_batch_size, remaining)
+            remaining -= batch_size
+            self.iterations_run += batch_size
+
+            leaves = []
+            for _ in range(batch_size):
+                path = self._descend()
+                reward = self._cached_reward(state)
+                if reward is None:
+                    leaves.append((path, state.clone()))
+                    reward = 0.0  # 가상 손실 - 보상이 나오기 전에 방문 수만 먼저 반영
+                self._unwind(len(path) - 1)
+                self._backpropagate(path, reward)
+
+            if not leaves: continue
+            rewards = self.batched_policy.run_many([leaf_state for _, leaf_state in leaves])
+            for (path, leaf_state), reward in zip(leaves, rewards):
+                reward = self._record_reward(leaf_state, reward)
+                for node in path:
+                    node.wins += reward
+
+    def _backpropagate(self, path: List[OpenLoopNode], reward: float):
+        for node in path:
+            node.visits += 1
+            node.wins += reward
+
+    # =================================================================
+    # 루트 / 서브트리 재사용
+    # =================================================================
+    @property
+    def root_visits(self) -> int:
+        return self.root.visits
+
+    def root_statistics(self) -> List[Tuple[object, int, float]]:
+        children = self.root.children or {}
+        return [(self.root_actions[key], child.visits, child.wins) for key, child in children.items()]
+
+    def release(self):
+        """트리 해제 (부모 참조가 없어 순환 없이 해제됨)"""
+        self.root = OpenLoopNode()
+
+    def advance(self, action, observed_state) -> bool:
+        """
+        지난 턴에 둔 행동의 자식을 새 루트로 승격 (관측 상태에서 둘 수 없는 행동의 자식은 버림)
+        open-loop 통계는 결과 샘플이 아닌 행동 순서의 기대값이므로 관측 상태와의 거리는 보지 않는다.
+        """
+        children = self.root.children or {}
+        child = children.get(LLMPruner.action_identifier(action))
+        if child is None:
+            return False
+
+        self.engine._sync_references(observed_state)
+        if self.use_array_state and not isinstance(observed_state, ArrayBattle):
+            observed_state = ArrayBattle.from_battle(observed_state)
+        actions = MCTSNode.available_actions(observed_state)
+        available = {LLMPruner.action_identifier(a) for a in actions}
+        kept = {key: grandchild for key, grandchild in (child.children or {}).items() if key in available}
+        child.children = kept
+        child.visits = sum(c.visits for c in kept.values())
+        child.wins = sum(c.wins for c in kept.values())
+
+        self.root_state = observed_state
+        self._set_root(observed_state, actions, child)
+        self._reset_rollout_template()
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+            observed_state.zobrist_hash()
+        if self.llm_pruner is not None:
+            self._apply_root_pruning()
+        return True
+
+    def _apply_root_pruning(self):
+        """루트 노드에서만 LLM 기반 프루닝 수행 (아직 확장하지 않은 행동만 제거)"""
+        if isinstance(self.root, MCTSNode):
+            # MCTSSearcher.__init__ 중 - MCTSNode 루트에서 프루닝
+            return super()._apply_root_pruning()
+        if not self.llm_pruner or not self.llm_pruner.is_available:
+            return
+        expanded = self.root.children or {}
+        candidates = [a for key, a in self.root_actions.items() if key not in expanded]
+        pruned_ids = self.llm_pruner.prune_actions(self.root_state, candidates)
+        if pruned_ids:
+            self.root_actions = {key: a for key, a in self.root_actions.items()
+                                 if key in expanded or key not in pruned_ids}
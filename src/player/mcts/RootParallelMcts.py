@@ -0,0 +1,206 @@
+"""
+루트 병렬 MCTS (프로세스 풀)
+
+MCTSSearcher.search는 단일 스레드 반복이고, 테스트 플레이어는 이를 run_in_executor(None, ...)로 넘기지만
+기본 executor는 스레드라 GIL 때문에 코어를 하나만 쓴다.
+RootParallelSearcher는 엔진 / 게임 데이터를 미리 올려 둔 워커 프로세스 K개에서
+같은 루트로 서로 다른 난수 스트림의 독립 탐색을 돌리고, 루트 자식의 방문 수 / 보상 합을 더해 하나의 결정을 내린다.
+    - 워커 수, 워커당 반복 수, 시간 예산(마감 시각)을 설정 가능
+    - LLM 루트 프루닝은 메인 프로세스에서 한 번만 하고 허용된 행동 id만 워커에 전달
+    - 워커 난수는 메인 rng에서 spawn한 독립 스트림 (같은 시드면 같은 결과)
+"""
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import MCTSSearcher, MCTSNode, UNBOUNDED_ITERATIONS
+from player.mcts.llm_pruner import LLMPruner
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleClass.ArrayBattle import ArrayBattle
+from sim.Supporting.BattleRandom import BattleRandom
+
+
+def _warm_worker(gen: int):
+    """워커 초기화 - 게임 데이터 / 상성표 / 기술 색인 / 엔진을 미리 로드"""
+    from sim.Supporting.DataPack import DataPack
+    from sim.Supporting.TypeChart import TypeChart
+    from sim.BattleClass.LearnsetIndex import LearnsetIndex
+    from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
+    DataPack.from_gen(gen)
+    TypeChart.from_gen(gen)
+    LearnsetIndex.from_gen(gen)
+    SimplifiedBattleEngine()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _worker_search(root_state, iterations: int, deadline_wall: Optional[float], rng,
+                   allowed_ids: Optional[List[str]], leaf_batch_size: int, use_array_state: bool):
+    """
+    워커 1개의 독립 탐색
+    Returns:
+        (행동 id → (방문 수, 보상 합), 실행한 반복 수)
+    """
+    # 프로세스마다 perf_counter 기준점이 다를 수 있으므로 벽시계 마감 시각을 로컬 기준으로 변환
+    deadline = None if deadline_wall is None else time.perf_counter() + (deadline_wall - time.time())
+    searcher = MCTSSearcher(root_state, use_array_state=use_array_state, leaf_batch_size=leaf_batch_size,
+                            rng=rng, use_llm_pruner=False)
+    if allowed_ids is not None:
+        allowed = set(allowed_ids)
+        searcher.root.untried_actions = [a for a in searcher.root.untried_actions
+                                         if LLMPruner.action_identifier(a) in allowed]
+    searcher.search(iterations, deadline)
+    stats = {LLMPruner.action_identifier(action): (visits, wins)
+             for action, visits, wins in searcher.root_statistics()}
+    searcher.release()
+    return stats, searcher.iterations_run
+
+
+class RootParallelResult:
+    """
+    루트 병렬 탐색 결과
+    Args:
+        action: 선택한 행동 (SimplifiedMove / SimplifiedPokemon, 가능한 행동이 없으면 None)
+        stats: 행동 id → (합산 방문 수, 합산 보상)
+        worker_iterations: 워커별 실행 반복 수
+        elapsed: 탐색 시간 (초, 워커 전달 / 결과 수집 포함)
+    """
+
+    def __init__(self, action, stats: Dict[str, Tuple[int, float]], worker_iterations: List[int], elapsed: float):
+        self.action = action
+        self.stats = stats
+        self.worker_iterations = worker_iterations
+        self.elapsed = elapsed
+
+    @property
+    def iterations(self) -> int:
+        return sum(self.worker_iterations)
+
+    @property
+    def iterations_per_second(self) -> float:
+        return self.iterations / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class RootParallelSearcher:
+    """
+    프로세스 풀 루트 병렬 MCTS
+    Args:
+        workers: 워커 프로세스 수 (None이면 os.cpu_count())
+        gen: 포켓몬 세대 (워커 미리 로드용)
+        leaf_batch_size / use_array_state: 워커 MCTSSearcher 옵션
+        rng: 난수 생성기 (BattleRandom, None이면 새 시드). 워커별 스트림을 spawn하는 데 사용
+    """
+
+    def __init__(self, workers: Optional[int] = None, gen: int = 9, leaf_batch_size: int = 1,
+                 use_array_state: bool = False, rng: Optional[BattleRandom] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.gen = gen
+        self.leaf_batch_size = leaf_batch_size
+        self.use_array_state = use_array_state
+        self.rng = rng if rng is not None else BattleRandom()
+        self.llm_pruner = LLMPruner()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    # =================================================================
+    # 풀 관리
+    # =================================================================
+    def start(self) -> 'RootParallelSearcher':
+        """워커 프로세스를 띄우고 초기화가 끝날 때까지 대기 (첫 결정에서 로드 시간이 드러나지 않도록)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker,
+                                                 initargs=(self.gen,))
+            for future in [self._executor.submit(_ping) for _ in range(self.workers)]:
+                future.result()
+        return self
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> 'RootParallelSearcher':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # =================================================================
+    # 탐색
+    # =================================================================
+    def search(self, root_battle, iterations: Optional[int] = None, time_budget: Optional[float] = None,
+               tracker=None, opponent_belief=None) -> RootParallelResult:
+        """
+        워커마다 같은 루트로 독립 탐색 후 루트 통계를 합산해 행동 선택
+        Args:
+            root_battle: 루트 배틀 (poke-env Battle / SimplifiedBattle / ArrayBattle)
+            iterations: 워커당 최대 반복 수 (None이면 time_budget까지)
+            time_budget: 시간 예산 (초, None이면 iterations만 사용)
+            tracker: 배틀 상태 추적기 (poke-env Battle을 루트로 변환할 때 사용)
+            opponent_belief: 상대 세트 추론기 (tracker 없이 poke-env Battle을 변환할 때 사용)
+        """
+        if iterations is None and time_budget is None:
+            raise ValueError("iterations와 time_budget 중 하나는 지정해야 합니다")
+        start = time.perf_counter()
+        deadline_wall = None if time_budget is None else time.time() + time_budget
+        self.start()
+
+        root_state = self._root_state(root_battle, tracker, opponent_belief)
+        actions = MCTSNode(root_state).untried_actions
+        allowed_ids = self._allowed_ids(root_state, actions)
+        if allowed_ids is not None:
+            actions = [a for a in actions if LLMPruner.action_identifier(a) in allowed_ids]
+        if len(actions) <= 1:
+            return RootParallelResult(actions[0] if actions else None, {}, [], time.perf_counter() - start)
+
+        futures = [
+            self._executor.submit(_worker_search, root_state, iterations or UNBOUNDED_ITERATIONS, deadline_wall,
+                                  worker_rng, allowed_ids, self.leaf_batch_size, self.use_array_state)
+            for worker_rng in self.rng.spawn(self.workers)
+        ]
+
+        stats: Dict[str, List[float]] = {}
+        worker_iterations = []
+        for future in futures:
+            worker_stats, run = future.result()
+            worker_iterations.append(run)
+            for action_id, (visits, wins) in worker_stats.items():
+                total = stats.setdefault(action_id, [0, 0.0])
+                total[0] += visits
+                total[1] += wins
+
+        action = self._select(actions, stats)
+        merged = {action_id: (int(v), w) for action_id, (v, w) in stats.items()}
+        return RootParallelResult(action, merged, worker_iterations, time.perf_counter() - start)
+
+    def _root_state(self, root_battle, tracker, opponent_belief):
+        """루트를 SimplifiedBattle로 변환 (clone으로 인스턴스 rng / 추론기 참조를 떼어 내 워커 전달 크기를 줄임)"""
+        if isinstance(root_battle, SimplifiedBattle):
+            return root_battle.clone()
+        if isinstance(root_battle, ArrayBattle):
+            return root_battle
+        if tracker is not None:
+            return tracker.update(root_battle)
+        return SimplifiedBattle(root_battle, fill_unknown_data=True, rng=self.rng,
+                                opponent_belief=opponent_belief).clone()
+
+    def _allowed_ids(self, root_state, actions) -> Optional[List[str]]:
+        """LLM 루트 프루닝을 한 번만 수행 (사용 불가 / 제거 없음이면 None)"""
+        if not self.llm_pruner.is_available:
+            return None
+        pruned_ids = self.llm_pruner.prune_actions(root_state, actions)
+        if not pruned_ids:
+            return None
+        return [LLMPruner.action_identifier(a) for a in actions if LLMPruner.action_identifier(a) not in pruned_ids]
+
+    def _select(self, actions, stats: Dict[str, List[float]]):
+        """합산 방문 수가 가장 많은 행동 (같으면 평균 보상이 높은 쪽, 통계가 없으면 무작위)"""
+        if not stats:
+            return self.rng.choice(actions)
+        best_id = max(stats, key=lambda a: (stats[a][0], stats[a][1] / stats[a][0] if stats[a][0] else 0.0))
+        return next((a for a in actions if LLMPruner.action_identifier(a) == best_id), self.rng.choice(actions))
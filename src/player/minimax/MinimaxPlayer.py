@@ -10,51 +10,328 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
 from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleClass.ArrayBattle import ArrayBattle
+from sim.BattleClass.BattleTracker import BattleTrackers
 from sim.BattleClass.SimplifiedPokemon import SimplifiedPokemon
+from sim.Supporting.GcPause import gc_paused, collect_idle
+from player.TranspositionTable import TranspositionTable, EXACT, LOWER, UPPER
 from poke_env.player import Player
 from poke_env.battle import Battle
 
 
+# 평가값 범위 (승리 / 패배), expectiminimax 기대값 경계 계산에 사용
+WIN_SCORE = 10000.0
+
+
+class SearchTimeout(Exception):
+    """시간 예산 초과 - 진행 중인 반복 심화 단계를 중단"""
+
+
 class MinimaxPlayer(Player):
     """
     2턴 뒤의 미래까지 내다보고 최적의 수를 찾기
+    - use_array_state: True면 탐색 상태를 ArrayBattle로 변환 (버퍼 복사 기반 clone)
+    - transposition_table: 전치표 (None이면 사용 안 함). 턴이 바뀌어도 유지되어 이전 탐색 결과를 재사용
+    - use_undo: True면 자식 노드마다 복제하지 않고 그 자리에서 턴을 진행한 뒤 undo_turn으로 되돌림 (make / unmake)
+    - rng: 난수 생성기 (BattleRandom 등, None이면 전역 random 모듈). 상대 팀 채우기와 엔진이 사용
+    - opponent_belief: 상대 세트 추론기 (OpponentBelief, None이면 사용 안 함). 미공개 상대를 factory 세트 분포로 채움
+    - track_state: True면 배틀별 상태를 턴 사이에 유지하고 바뀐 부분만 반영 (BattleTracker).
+                   False면 매 턴 SimplifiedBattle을 새로 만들어 미공개 상대 팀도 다시 추론
+    - time_budget: 결정당 시간 예산 (초, None이면 depth 고정 탐색). 주어지면 깊이 1부터 max_depth까지 반복 심화하고
+                   시간이 다 되면 마지막으로 끝까지 탐색한 깊이의 최선 행동 반환
+    - max_depth: 반복 심화 최대 깊이
+    - expectiminimax: True면 행동 조합마다 한 번 샘플링하는 대신 확률 노드를 두고
+                      engine.outcome_branches의 결과를 확률 가중 평균 (Star1 / Star2 경계로 가지치기, 결과는 복제 없이 재생 / 되돌림)
+    - min_probability: expectiminimax에서 작은 쪽 분기 확률이 이보다 작은 사건(급소 등)은 나누지 않고 샘플링.
+                       기본 0.25는 동속 / 명중률 75% 이하 기술 등 큰 사건만 나눔 (낮출수록 안정적이지만 느림)
+    - move_ordering: True면 깊이 1부터 반복 심화하며 (time_budget이 없으면 depth까지) 양쪽 행동 순서를
+                     전치표 / 직전 깊이의 최선 응수 > 킬러 > 히스토리 > 정적 점수 순으로 정렬 (가지치기 효율 증가).
+                     복제 방식이면 이전 깊이에서 진행한 자식 상태를 재사용해 같은 턴을 다시 시뮬레이션하지 않음
+    - root_parallel: 루트 분할 병렬 탐색기 (ParallelMinimaxSearcher, None이면 사용 안 함).
+                     주어지면 고정 깊이 탐색의 루트 행동을 워커 프로세스에 나눠 탐색.
+                     워커는 전치표 / 행동 순서 / 시간 예산을 쓰지 않으므로 transposition_table / move_ordering /
+                     time_budget / search_executor와 함께 주면 ValueError
+    - search_executor: 공유 탐색 실행기 (MinimaxSearchExecutor, None이면 이벤트 루프 스레드에서 직접 탐색).
+                       주어지면 choose_move가 탐색 전체를 워커 프로세스에 넘기고 결과를 await
+    - decision_deadline: search_executor 사용 시 결정당 최대 대기 시간 (초, None이면 무제한).
+                         넘기거나 대기열이 가득 차면 정적 점수 최상위 행동으로 대체 (fallback_count)
     """
     
-    def __init__(self, battle_format="gen9randombattle", max_concurrent_battles=1, depth=2, **kwargs):
+    def __init__(self, battle_format="gen9randombattle", max_concurrent_battles=1, depth=2, use_array_state=False,
+                 transposition_table: Optional[TranspositionTable] = None, use_undo: bool = False, rng=None,
+                 opponent_belief=None, track_state: bool = True, time_budget: Optional[float] = None,
+                 max_depth: int = 6, expectiminimax: bool = False, min_probability: float = 0.25,
+                 move_ordering: bool = False, root_parallel=None, search_executor=None,
+                 decision_deadline: Optional[float] = 5.0, **kwargs):
+        if root_parallel is not None and search_executor is not None:
+            raise ValueError("root_parallel과 search_executor는 함께 사용할 수 없습니다")
         super().__init__(battle_format=battle_format, max_concurrent_battles=max_concurrent_battles, **kwargs)
+        self.search_executor = search_executor
+        self.decision_deadline = decision_deadline
+        self.fallback_count = 0  # 탐색 실행기 대기열 초과 / 마감 초과로 대체 행동을 낸 횟수
+        self._init_search(depth=depth, use_array_state=use_array_state, transposition_table=transposition_table,
+                          use_undo=use_undo, rng=rng, opponent_belief=opponent_belief, track_state=track_state,
+                          time_budget=time_budget, max_depth=max_depth, expectiminimax=expectiminimax,
+                          min_probability=min_probability, move_ordering=move_ordering, root_parallel=root_parallel)
+
+    @classmethod
+    def search_only(cls, **kwargs) -> 'MinimaxPlayer':
+        """
+        서버 연결 없이 탐색 메서드만 쓰는 인스턴스 (Player 초기화 생략)
+        poke-env Player는 이벤트 루프 스레드에 의존해 fork한 워커 프로세스에서 만들 수 없으므로 워커는 이것을 사용
+        Args:
+            kwargs: __init__의 탐색 옵션 (depth / use_undo / rng 등)
+        """
+        player = cls.__new__(cls)
+        kwargs.setdefault('track_state', False)
+        player._init_search(**kwargs)
+        return player
+
+    def _init_search(self, depth=2, use_array_state=False, transposition_table: Optional[TranspositionTable] = None,
+                     use_undo: bool = False, rng=None, opponent_belief=None, track_state: bool = True,
+                     time_budget: Optional[float] = None, max_depth: int = 6, expectiminimax: bool = False,
+                     min_probability: float = 0.25, move_ordering: bool = False, root_parallel=None):
+        """탐색 옵션과 상태 초기화 (__init__ / search_only 공용)"""
+        if root_parallel is not None:
+            conflicts = [name for name, used in (('transposition_table', transposition_table is not None),
+                                                 ('move_ordering', move_ordering),
+                                                 ('time_budget', time_budget is not None)) if used]
+            if conflicts:
+                raise ValueError(f"root_parallel은 고정 깊이 탐색만 지원합니다 (함께 줄 수 없는 옵션: {', '.join(conflicts)})")
         self.depth = depth # 기본 2턴 추천
-        self.engine = SimplifiedBattleEngine()
+        self.use_array_state = use_array_state
+        self.transposition_table = transposition_table
+        self.use_undo = use_undo
+        self.rng = rng
+        self.opponent_belief = opponent_belief
+        self.trackers = BattleTrackers(rng=rng, opponent_belief=opponent_belief) if track_state else None
+        self.engine = SimplifiedBattleEngine(rng=rng)
+        self.stat_cache_info = None  # 마지막 탐색의 스탯 캐시 적중 통계
+        self.node_count = 0  # 마지막 탐색에서 방문한 Max 노드 수
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.expectiminimax = expectiminimax
+        self.min_probability = min_probability
+        self.chance_count = 0  # 마지막 탐색에서 방문한 확률 노드 수
+        self.outcome_count = 0  # 마지막 탐색에서 확률 노드가 나열한 결과 수 합
+        self._reach = 1.0  # 루트에서 현재 노드까지 확률 사건 결과 확률의 곱
+        self.move_ordering = move_ordering
+        self.root_parallel = root_parallel
+        self._shared_alpha = None  # 루트 분할 워커에서 공유 alpha를 읽는 함수 (ParallelMinimax)
+        self.depth_reached = 0  # 마지막 탐색에서 끝까지 탐색한 깊이
+        self.depth_stats: List[Tuple[int, int, float]] = []  # 마지막 탐색의 깊이별 (깊이, Max 노드 수, 그 깊이까지 누적 시간)
+        # 행동 순서 (move_ordering) - 행동 키는 _action_key, side는 True = 나 / False = 상대
+        self._killers: Dict[Tuple[bool, int], list] = {}  # (side, 루트부터의 턴 수) -> 컷오프를 낸 행동 최대 2개
+        self._history: Dict[Tuple[bool, tuple], int] = {}  # (side, 행동) -> 컷오프 때 남은 깊이^2 합
+        self._replies: Dict[Tuple[int, tuple], tuple] = {}  # (상태 해시, 내 행동) -> 상대 최선 응수
+        self._children: Optional[dict] = None  # (상태 해시, 내 행동, 상대 행동) -> 자식 상태 (복제 방식 반복 심화에서만)
+        self.search_time = 0.0  # 마지막 탐색 시간 (초)
+        self._deadline = None
+        self._root_depth = depth
+        self._pv_action = None
+
+    def _battle_finished_callback(self, battle: Battle):
+        if self.trackers is not None:
+            self.trackers.discard(battle.battle_tag)
+        if self.time_budget is not None:
+            # 탐색 동안 GC를 멈췄던 플레이어는 배틀 사이에 남은 순환 참조 쓰레기를 정리
+            collect_idle()
 
     def choose_move(self, battle: Battle):
         if not battle.available_moves and not battle.available_switches:
             return self.choose_random_move(battle)
         
         # 1. 현재 상태 변환
-        root_state = SimplifiedBattle(battle, fill_unknown_data=True)
+        if self.trackers is not None:
+            root_state = self.trackers.update(battle)
+        else:
+            root_state = SimplifiedBattle(battle, fill_unknown_data=True, rng=self.rng,
+                                          opponent_belief=self.opponent_belief)
         self.engine._sync_references(root_state)
+        if self.use_array_state:
+            root_state = ArrayBattle.from_battle(root_state)
 
-        # 2. 미니맥스 탐색 (재귀)
-        best_action = self._max_value(root_state, self.depth, -float('inf'), float('inf'))[1]
+        # 2. 미니맥스 탐색 (재귀) - search_executor가 있으면 워커 프로세스에 넘기고 결과를 기다리는 코루틴 반환
+        if self.search_executor is not None:
+            return self._choose_move_offloaded(battle, root_state)
+        best_action = self.search(root_state)
 
         # 3. 결과 실행
         return self._convert_to_order(battle, best_action)
 
+    async def _choose_move_offloaded(self, battle: Battle, root_state):
+        """
+        공유 탐색 실행기에서 결정 (이벤트 루프는 기다리는 동안 다른 배틀 메시지 / 타이머를 처리)
+        대기열이 가득 찼거나 decision_deadline까지 결과가 없으면 정적 점수 최상위 행동으로 대체
+        """
+        start = time.perf_counter()
+        decision = await self.search_executor.decide(root_state, self._search_options(), self.decision_deadline,
+                                                      self.rng.spawn(1)[0] if hasattr(self.rng, 'spawn') else None)
+        self.search_time = time.perf_counter() - start
+        if decision is None:
+            self.fallback_count += 1
+            actions = self._get_smart_actions(root_state, is_player=True)
+            return self._convert_to_order(battle, actions[0] if actions else None)
+        best_action, self.node_count, self.depth_reached = decision
+        return self._convert_to_order(battle, best_action)
+
+    def _search_options(self) -> dict:
+        """워커(search_only 인스턴스)에 설정할 탐색 옵션 (전치표는 워커마다 따로 둠)"""
+        return {'depth': self.depth, 'use_array_state': self.use_array_state, 'use_undo': self.use_undo,
+                'time_budget': self.time_budget, 'max_depth': self.max_depth,
+                'expectiminimax': self.expectiminimax, 'min_probability': self.min_probability,
+                'move_ordering': self.move_ordering, 'transposition_table': self.transposition_table is not None}
+
+    def search(self, root_state):
+        """
+        루트 상태에서 최선 행동 탐색 (choose_move / 탐색 실행기 워커 공용)
+        Returns:
+            최선 행동 (SimplifiedMove / SimplifiedPokemon, 없으면 None)
+        """
+        SimplifiedPokemon.reset_stat_cache_info()
+        self.node_count = 0
+        self.chance_count = self.outcome_count = 0
+        self._killers.clear()
+        self._history.clear()
+        self._replies.clear()
+        # 제자리 진행(use_undo / expectiminimax)은 자식 상태를 보관할 수 없음
+        self._children = {} if self.move_ordering and not (self.use_undo or self.expectiminimax) else None
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+        start = time.perf_counter()
+        if self.root_parallel is not None:
+            best_action = self._parallel_search(root_state)
+        elif self.time_budget is not None:
+            best_action = self._iterative_deepening(root_state, start + self.time_budget, self.max_depth)
+        elif self.move_ordering:
+            best_action = self._iterative_deepening(root_state, None, self.depth)
+        else:
+            self._root_depth = self.depth
+            best_action = self._max_value(root_state, self.depth, -float('inf'), float('inf'))[1]
+            self.depth_reached = self.depth
+            self.depth_stats = [(self.depth, self.node_count, time.perf_counter() - start)]
+        self.search_time = time.perf_counter() - start
+        self._children = None
+        self.stat_cache_info = SimplifiedPokemon.stat_cache_info()
+        return best_action
+
+    def _parallel_search(self, root_state):
+        """루트 행동을 root_parallel 워커에 나눠 고정 깊이 탐색 (워커 노드 수를 node_count에 합산)"""
+        options = {'use_undo': self.use_undo, 'use_array_state': self.use_array_state,
+                   'expectiminimax': self.expectiminimax, 'min_probability': self.min_probability}
+        actions = self._get_smart_actions(root_state, is_player=True)
+        result = self.root_parallel.search(root_state, actions, self.depth, options)
+        self.node_count += result.node_count
+        self.depth_reached = self.depth
+        self.depth_stats = [(self.depth, self.node_count, result.elapsed)]
+        return result.action
+
+    def _iterative_deepening(self, root_state, deadline: Optional[float], max_depth: int):
+        """
+        깊이 1부터 max_depth까지 한 단계씩 탐색하고 마감 시각이 지나면 마지막으로 끝난 깊이의 최선 행동 반환
+        다음 깊이의 예상 시간(직전 깊이 시간 x 직전 증가율)이 남은 시간을 넘으면 시작하지 않음
+        Args:
+            deadline: 마감 시각 (perf_counter 기준, None이면 max_depth까지 모두 탐색)
+        """
+        self.depth_reached = 0
+        self.depth_stats = []
+        self._pv_action = None
+        start = time.perf_counter()
+        best_action = None
+        last_time = growth = None
+        # GC 멈춤이 마감 시각을 넘기지 않도록 탐색 동안 자동 GC 정지 (마감 없는 move_ordering 탐색은 그대로 둠)
+        with gc_paused(deadline is not None):
+            try:
+                for depth in range(1, max_depth + 1):
+                    now = time.perf_counter()
+                    if deadline is not None and last_time is not None and growth is not None \
+                            and now + last_time * growth > deadline:
+                        break
+                    nodes = self.node_count
+                    # 중단된 깊이에서 상태가 바뀌었을 수 있으므로 깊이마다 루트 복제본에서 시작
+                    state = root_state.clone() if self.use_undo or self.expectiminimax else root_state
+                    self._root_depth = depth
+                    self._deadline = deadline
+                    try:
+                        _, action = self._max_value(state, depth, -float('inf'), float('inf'))
+                    except SearchTimeout:
+                        break
+                    if action is not None:
+                        best_action = self._pv_action = action
+                    self.depth_reached = depth
+                    self.depth_stats.append((depth, self.node_count - nodes, time.perf_counter() - start))
+                    elapsed = time.perf_counter() - now
+                    growth = elapsed / last_time if last_time else None
+                    last_time = elapsed
+                    if state.finished:
+                        break
+            finally:
+                self._deadline = None
+
+        if best_action is None:
+            # 깊이 1도 끝내지 못함 - 정적 점수 최상위 행동
+            actions = self._get_smart_actions(root_state, is_player=True)
+            best_action = actions[0] if actions else None
+        return best_action
+
     # =================================================================
     # [Core] Minimax Recursive Logic
     # =================================================================
-    def _max_value(self, state: SimplifiedBattle, depth: int, alpha: float, beta: float):
-        """Max Node (나의 턴)"""
+    def _max_value(self, state: SimplifiedBattle, depth: int, alpha: float, beta: float, first=None):
+        """
+        Max Node (나의 턴)
+        Args:
+            first: (행동, 값) - 확률 노드의 Star2 탐색에서 이미 값을 구한 행동 (다시 탐색하지 않고 최선값으로 시작)
+        """
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchTimeout()
+        self.node_count += 1
+        tt = self.transposition_table
+        tt_action = None
+        key = state.zobrist_hash() if tt is not None or self.move_ordering else None
+        if tt is not None:
+            entry = tt.probe(key)
+            if entry is not None:
+                tt_action = entry.action
+                # 같거나 더 깊이 탐색한 결과만 사용 (루트는 행동이 필요하므로 행동이 있을 때만)
+                if entry.depth >= depth and (depth < self._root_depth or tt_action is not None):
+                    if entry.flag == EXACT:
+                        return entry.value, tt_action
+                    if entry.flag == LOWER and entry.value >= beta:
+                        return entry.value, tt_action
+                    if entry.flag == UPPER and entry.value <= alpha:
+                        return entry.value, tt_action
+
         if depth == 0 or state.finished:
-            return self._evaluate_state(state), None
+            value = self._evaluate_state(state)
+            if tt is not None:
+                tt.store(key, value, depth)
+            return value, None
 
+        alpha_orig = alpha
         best_value = -float('inf')
         best_action = None
         
+        ply = self._root_depth - depth
         actions = self._get_smart_actions(state, is_player=True)
+        if self.move_ordering:
+            first_action = tt_action if tt_action is not None else (self._pv_action if depth == self._root_depth else None)
+            actions = self._order_actions(actions, True, ply, self._action_key(first_action) if first_action is not None else None)
+        elif tt_action is not None:
+            # 전치표의 최선 행동을 먼저 탐색 (가지치기 효율 증가)
+            actions.sort(key=lambda a: not self._same_action(a, tt_action))
+        elif self._pv_action is not None and depth == self._root_depth:
+            # 반복 심화: 루트에서는 직전 깊이의 최선 행동을 먼저 탐색
+            actions.sort(key=lambda a: not self._same_action(a, self._pv_action))
+
+        if first is not None:
+            best_action, best_value = first
+            alpha = max(alpha, best_value)
+            actions = [a for a in actions if not self._same_action(a, best_action)] if beta > alpha else []
 
         for action in actions:
             # Min Node로 넘김 (내 행동을 고정하고 상대 턴 예측)
-            val = self._min_value(state, action, depth, alpha, beta)
+            val = self._min_value(state, action, depth, alpha, beta, key)
             
             if val > best_value:
                 best_value = val
@@ -62,43 +339,213 @@ class MinimaxPlayer(Player):
             
             alpha = max(alpha, best_value)
             if beta <= alpha:
+                if self.move_ordering:
+                    self._record_cutoff(True, ply, action, depth)
                 break
+
+        if tt is not None:
+            if best_value <= alpha_orig:
+                flag = UPPER
+            elif best_value >= beta:
+                flag = LOWER
+            else:
+                flag = EXACT
+            tt.store(key, best_value, depth, flag, best_action)
         
         return best_value, best_action
 
-    def _min_value(self, state: SimplifiedBattle, my_action, depth: int, alpha: float, beta: float):
-        """Min Node (상대 턴)"""
+    @staticmethod
+    def _same_action(a, b) -> bool:
+        """기술은 id, 교체는 종 이름으로 비교 (다른 상태의 객체끼리 비교하기 위함)"""
+        if hasattr(a, 'id') or hasattr(b, 'id'):
+            return getattr(a, 'id', None) == getattr(b, 'id', None)
+        return getattr(a, 'species', a) == getattr(b, 'species', b)
+
+    def _min_value(self, state: SimplifiedBattle, my_action, depth: int, alpha: float, beta: float,
+                   state_key: Optional[int] = None):
+        """
+        Min Node (상대 턴)
+        Args:
+            state_key: 부모 Max Node의 상태 해시 (move_ordering / 전치표 사용 시, 최선 응수와 자식 상태 재사용에 사용)
+        """
         if state.finished:
              return self._evaluate_state(state)
 
         min_val = float('inf')
+        best_reply = None
         
         opp_actions = self._get_smart_actions(state, is_player=False)
+        if self.move_ordering:
+            ply = self._root_depth - depth
+            reply_key = (state_key, self._action_key(my_action)) if state_key is not None else None
+            opp_actions = self._order_actions(opp_actions, False, ply, self._replies.get(reply_key))
 
         for opp_action in opp_actions:
-            next_state = state.clone()
-            
-            p_idx, p_sw = self._parse_action(next_state, my_action, is_player=True)
-            o_idx, _    = self._parse_action(next_state, opp_action, is_player=False)
-            
-            self.engine.simulate_turn(
-                next_state,
-                player_move_idx=p_idx, player_switch_to=p_sw,
-                opponent_move_idx=o_idx
-            )
-            
-            # 다음 Depth의 Max Node 호출
-            val, _ = self._max_value(next_state, depth - 1, alpha, beta)
+            if self._shared_alpha is not None and depth == self._root_depth:
+                # 루트 분할: 다른 워커가 찾은 루트 최선값으로 alpha 갱신
+                alpha = max(alpha, self._shared_alpha())
+                if beta <= alpha:
+                    break
+            if self.expectiminimax:
+                # 확률 노드 - 가능한 결과의 확률 가중 평균
+                val = self._chance_value(state, my_action, opp_action, depth, alpha, beta)
+            else:
+                child_key = None
+                next_state = None
+                if self._children is not None and state_key is not None:
+                    # 반복 심화의 이전 깊이에서 진행한 자식 상태 재사용 (같은 행동 조합은 같은 샘플 결과)
+                    child_key = (state_key, self._action_key(my_action), self._action_key(opp_action))
+                    next_state = self._children.get(child_key)
+                if next_state is None:
+                    next_state = state if self.use_undo else state.clone()
+
+                    p_idx, p_sw = self._parse_action(next_state, my_action, is_player=True)
+                    o_idx, _    = self._parse_action(next_state, opp_action, is_player=False)
+
+                    self.engine.simulate_turn(
+                        next_state,
+                        player_move_idx=p_idx, player_switch_to=p_sw,
+                        opponent_move_idx=o_idx,
+                        record_undo=self.use_undo
+                    )
+                    if child_key is not None:
+                        self._children[child_key] = next_state
+
+                # 다음 Depth의 Max Node 호출
+                val, _ = self._max_value(next_state, depth - 1, alpha, beta)
+                if self.use_undo:
+                    self.engine.undo_turn(state)
             
             if val < min_val:
                 min_val = val
+                best_reply = opp_action
             
             beta = min(beta, min_val)
             if beta <= alpha:
+                if self.move_ordering:
+                    self._record_cutoff(False, ply, opp_action, depth)
                 break
-                
+
+        if self.move_ordering and reply_key is not None and best_reply is not None:
+            self._replies[reply_key] = self._action_key(best_reply)
         return min_val
 
+    def _chance_value(self, state: SimplifiedBattle, my_action, opp_action, depth: int, alpha: float, beta: float) -> float:
+        """
+        Chance Node (행동 조합 이후의 확률 사건) - 결과별 Max Node 값의 확률 가중 평균
+        결과 상태는 engine.outcome_branches / play_outcome으로 state에서 그 자리에서 재생하고 undo_turn으로 되돌림.
+        나열하는 동안 결과 상태를 바로 평가(잎) / 첫 행동 탐색(Star2)해 결과마다 재생을 한 번 줄임
+        결과는 확률이 큰 순서로 탐색하고, 아직 탐색하지 않은 결과의 값 범위로 기대값의 경계를 계산해
+        (alpha, beta) 밖으로 나가는 것이 확실해지면 중단한다 (fail-soft).
+            - Star1: 남은 결과를 [-WIN_SCORE, WIN_SCORE]로 두고 각 결과의 탐색 창을 좁힘
+            - Star2: 다음 깊이가 있으면 결과마다 첫 행동만 먼저 탐색해 Max Node 값의 하한을 구하고,
+                     하한의 기대값이 beta 이상이면 바로 중단. 전체 탐색은 그 행동 값을 재사용(first)
+        """
+        p_idx, p_sw = self._parse_action(state, my_action, is_player=True)
+        o_idx, _ = self._parse_action(state, opp_action, is_player=False)
+        joint = dict(player_move_idx=p_idx, player_switch_to=p_sw, opponent_move_idx=o_idx)
+        # 루트 기준 경로 확률로 가지치기 (도달 확률이 낮은 노드일수록 더 적게 나눔)
+        reach = self._reach
+        leaf = depth - 1 == 0
+
+        def visit(outcome_state, probability):
+            # 나열하면서 결과 상태를 바로 사용 - 잎이면 평가값, 아니면 Star2 첫 행동 탐색 (같은 결과를 다시 재생하지 않음)
+            if leaf:
+                return self._max_value(outcome_state, 0, -float('inf'), float('inf'))[0]
+            self._reach = reach * probability
+            return self._probe(outcome_state, depth - 1)
+
+        # 결과 상태를 복제하지 않고 분기 인덱스만 받아, 탐색할 때 그 자리에서 재생 후 되돌림
+        try:
+            outcomes = self.engine.outcome_branches(state, min_probability=min(1.0, self.min_probability / reach),
+                                                    visit=visit, **joint)
+        finally:
+            self._reach = reach
+        self.chance_count += 1
+        self.outcome_count += len(outcomes)
+        if leaf:
+            # 잎 결과는 나열할 때 평가를 마침
+            return sum(probability * value for probability, _, value in outcomes)
+
+        try:
+            # Star2 - 결과별 Max Node 하한 (첫 행동 값)
+            lower_bounds = [probe[1] if probe is not None else -WIN_SCORE for _, _, probe in outcomes]
+            expected_lower = sum(probability * bound for (probability, _, _), bound in zip(outcomes, lower_bounds))
+            if expected_lower >= beta:
+                return expected_lower
+
+            # Star1 - 확률 순서로 탐색하며 남은 결과의 범위로 창 계산
+            searched = 0.0
+            remaining = 1.0
+            remaining_lower = expected_lower
+            for (probability, branches, probe), bound in zip(outcomes, lower_bounds):
+                remaining -= probability
+                remaining_lower -= probability * bound
+                child_alpha = (alpha - searched - WIN_SCORE * remaining) / probability
+                child_beta = (beta - searched - remaining_lower) / probability
+                self._reach = reach * probability
+                self.engine.play_outcome(state, branches, record_undo=True, **joint)
+                value, _ = self._max_value(state, depth - 1, max(child_alpha, -WIN_SCORE), min(child_beta, WIN_SCORE), probe)
+                self.engine.undo_turn(state)
+                searched += probability * value
+                if value <= child_alpha:
+                    return searched + WIN_SCORE * remaining  # 상한 <= alpha
+                if value >= child_beta:
+                    return searched + remaining_lower        # 하한 >= beta
+            return searched
+        finally:
+            self._reach = reach
+
+    def _probe(self, state: SimplifiedBattle, depth: int):
+        """Star2 탐색 - Max Node의 첫 행동(전치표 / 정적 점수 최상위)만 탐색한 (행동, 값), 행동이 없으면 None"""
+        if state.finished:
+            return None
+        action = None
+        if self.transposition_table is not None:
+            entry = self.transposition_table.probe(state.zobrist_hash())
+            action = entry.action if entry is not None else None
+        if action is None:
+            actions = self._get_smart_actions(state, is_player=True)
+            if not actions:
+                return None
+            action = actions[0]
+        return action, self._min_value(state, action, depth, -float('inf'), float('inf'))
+
+    # =================================================================
+    # [Helpers] 행동 순서 (move_ordering)
+    # =================================================================
+    @staticmethod
+    def _action_key(action) -> tuple:
+        """상태가 달라도 같은 행동이면 같은 키 (기술은 id, 교체는 종 이름)"""
+        if hasattr(action, 'id'):
+            return ('move', action.id)
+        return ('switch', getattr(action, 'species', action))
+
+    def _order_actions(self, actions: list, is_player: bool, ply: int, first: Optional[tuple]) -> list:
+        """
+        행동 정렬: first(전치표 / 직전 깊이 최선 행동) > 같은 턴 수의 킬러 > 히스토리 점수 > 정적 점수(_get_smart_actions 순서)
+        """
+        if len(actions) < 2:
+            return actions
+        killers = self._killers.get((is_player, ply), ())
+        history = self._history
+
+        def rank(action):
+            key = self._action_key(action)
+            killer = killers.index(key) if key in killers else len(killers)
+            return key != first, killer, -history.get((is_player, key), 0)
+
+        return sorted(actions, key=rank)
+
+    def _record_cutoff(self, is_player: bool, ply: int, action, depth: int):
+        """컷오프를 낸 행동을 킬러(턴 수별 최근 2개)와 히스토리(남은 깊이^2 가중)에 기록"""
+        key = self._action_key(action)
+        killers = self._killers.setdefault((is_player, ply), [])
+        if key not in killers:
+            killers.insert(0, key)
+            del killers[2:]
+        self._history[(is_player, key)] = self._history.get((is_player, key), 0) + depth * depth
+
     # =================================================================
     # [Helpers] 행동 가지치기 & 평가
     # =================================================================
@@ -120,7 +567,7 @@ class MinimaxPlayer(Player):
                 else:
                     score = m.base_power
                     if opp_active:
-                        mult = opp_active.damage_multiplier(m.type)
+                        mult = opp_active.damage_multiplier(m.type_code)
                         if mult == 0: score = -999 
                         else: score *= mult
                         if m.type in active.types: score *= 1.5 # 자속
@@ -135,7 +582,7 @@ class MinimaxPlayer(Player):
         if is_player and switches:
             is_danger = False
             if active and opp_active:
-                for t in opp_active.types:
+                for t in opp_active.type_codes:
                     if active.damage_multiplier(t) >= 2.0: is_danger = True
                 if (active.current_hp / active.max_hp) < 0.3: is_danger = True
             
@@ -145,7 +592,7 @@ class MinimaxPlayer(Player):
                     if p.current_hp <= 0: continue
                     threat_score = 0
                     if opp_active:
-                        for t in opp_active.types:
+                        for t in opp_active.type_codes:
                             threat_score += p.damage_multiplier(t)
                     scored_switches.append((threat_score, p))
                 
@@ -159,8 +606,8 @@ class MinimaxPlayer(Player):
 
     def _evaluate_state(self, battle: SimplifiedBattle) -> float:
         """[평가 함수] 승패 + 체력 + 스피드 + 상성"""
-        if battle.won: return 10000.0
-        if battle.lost: return -10000.0
+        if battle.won: return WIN_SCORE
+        if battle.lost: return -WIN_SCORE
         
         score = 0.0
         # 내 팀 점수 - 상대 팀 점수
@@ -201,7 +648,7 @@ class MinimaxPlayer(Player):
                     max_mult = 0.0
                     for m in p.moves:
                         if m.category.name != 'STATUS':
-                            mult = opponent_active.damage_multiplier(m.type)
+                            mult = opponent_active.damage_multiplier(m.type_code)
                             if mult > max_mult: max_mult = mult
                     
                     if max_mult >= 2.0: side_score += 40  # 약점 찌름
@@ -0,0 +1,231 @@
+"""
+루트 분할 병렬 미니맥스 (프로세스 풀)
+
+MinimaxPlayer.choose_move는 루트 행동(기술 최대 3개 + 교체 최대 2개)을 한 코어에서 차례로 탐색하지만
+루트 행동의 Min Node 서브트리는 서로 독립이다.
+ParallelMinimaxSearcher는 엔진 / 게임 데이터 / 워커용 MinimaxPlayer를 미리 올려 둔 워커 프로세스 K개에
+루트 행동을 하나씩 나눠 주고, 루트 alpha(지금까지 찾은 최선값)를 공유 메모리로 주고받는다.
+    - 워커는 탐색을 시작할 때와 루트 Min Node에서 상대 행동을 하나 볼 때마다 공유 alpha를 읽어 가지치기에 반영
+    - 끝난 워커는 자기 값이 alpha보다 크면 alpha를 갱신 (fail-low 값은 alpha를 넘지 못함)
+    - 최선 행동은 완료 순서와 상관없이 메인 프로세스에서 고름: 최댓값 중 루트 행동 번호가 가장 작은 행동
+      (단일 프로세스 _max_value와 같은 동점 처리). 더 앞선 행동이 fail-low 상한으로 동점이면 최댓값 바로 아래 창으로
+      다시 탐색해 정확히 같은 값인지 확인
+    - young_brothers_wait: True면 첫 행동(정적 점수 최상위)을 먼저 끝내 alpha를 정한 뒤 나머지를 병렬 탐색
+    - 행동별 난수 스트림은 메인 rng에서 spawn (워커 수와 상관없이 같은 시드면 같은 시뮬레이션)
+"""
+import math
+import os
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.llm_pruner import LLMPruner
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleClass.ArrayBattle import ArrayBattle
+from sim.Supporting.BattleRandom import BattleRandom
+
+# 공유 배열 칸: 결정 번호 / 루트 alpha
+_GENERATION, _ALPHA = 0, 1
+
+# 워커 프로세스 전역 (초기화에서 설정)
+_shared = None
+_player = None
+
+
+def _warm_worker(gen: int, shared):
+    """워커 초기화 - 게임 데이터 / 상성표 / 기술 색인 / 엔진과 탐색 전용 MinimaxPlayer를 미리 로드"""
+    global _shared, _player
+    from sim.Supporting.DataPack import DataPack
+    from sim.Supporting.TypeChart import TypeChart
+    from sim.BattleClass.LearnsetIndex import LearnsetIndex
+    from player.minimax.MinimaxPlayer import MinimaxPlayer
+    DataPack.from_gen(gen)
+    TypeChart.from_gen(gen)
+    LearnsetIndex.from_gen(gen)
+    _shared = shared
+    _player = MinimaxPlayer.search_only()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _read_alpha(generation: int) -> float:
+    """현재 결정의 공유 alpha (이미 다음 결정으로 넘어갔으면 -inf)"""
+    with _shared.get_lock():
+        return _shared[_ALPHA] if _shared[_GENERATION] == generation else -float('inf')
+
+
+def _publish(generation: int, value: float):
+    """value가 공유 alpha보다 크면 alpha 갱신"""
+    with _shared.get_lock():
+        if _shared[_GENERATION] == generation and value > _shared[_ALPHA]:
+            _shared[_ALPHA] = value
+
+
+def _worker_search(root_state, index: int, action_id: str, depth: int, options: dict, generation: int, rng,
+                   alpha: Optional[float] = None):
+    """
+    루트 행동 하나의 Min Node 서브트리 탐색
+    Args:
+        alpha: 고정 alpha (동점 확인용 재탐색, None이면 공유 alpha를 읽으며 탐색)
+    Returns:
+        (행동 번호, 값 또는 None(행동 없음), 정확한 값인지 (False면 fail-low 상한), Max 노드 수)
+    """
+    player = _player
+    for name, value in options.items():
+        setattr(player, name, value)
+    player.rng = player.engine.rng = rng
+    state = root_state
+    if player.use_array_state and not isinstance(state, ArrayBattle):
+        state = ArrayBattle.from_battle(state)
+    player.engine._sync_references(state)
+    action = next((a for a in player._get_smart_actions(state, is_player=True)
+                   if LLMPruner.action_identifier(a) == action_id), None)
+    if action is None:
+        return index, None, False, 0
+
+    player.node_count = 0
+    player._root_depth = depth
+    player._reach = 1.0
+    if alpha is not None:
+        value = player._min_value(state, action, depth, alpha, float('inf'))
+        return index, value, value > alpha, player.node_count
+
+    # 탐색 중 읽은 가장 큰 alpha보다 큰 값만 정확한 값 (fail-soft)
+    seen = [_read_alpha(generation)]
+
+    def shared_alpha():
+        seen[0] = max(seen[0], _read_alpha(generation))
+        return seen[0]
+
+    player._shared_alpha = shared_alpha
+    try:
+        value = player._min_value(state, action, depth, seen[0], float('inf'))
+    finally:
+        player._shared_alpha = None
+    _publish(generation, value)
+    return index, value, value > seen[0], player.node_count
+
+
+class ParallelMinimaxResult:
+    """
+    루트 분할 탐색 결과
+    Args:
+        action: 선택한 행동 (SimplifiedMove / SimplifiedPokemon, 가능한 행동이 없으면 None)
+        values: 행동 id → 루트 Min Node 값 (alpha 이하로 잘린 행동은 상한)
+        node_count: 모든 워커의 Max 노드 수 합
+        elapsed: 탐색 시간 (초, 워커 전달 / 결과 수집 포함)
+    """
+
+    def __init__(self, action, values: Dict[str, float], node_count: int, elapsed: float):
+        self.action = action
+        self.values = values
+        self.node_count = node_count
+        self.elapsed = elapsed
+
+
+class ParallelMinimaxSearcher:
+    """
+    프로세스 풀 루트 분할 미니맥스
+    Args:
+        workers: 워커 프로세스 수 (None이면 os.cpu_count())
+        gen: 포켓몬 세대 (워커 미리 로드용)
+        young_brothers_wait: True면 첫 루트 행동을 먼저 끝내고 그 값을 alpha로 나머지를 병렬 탐색
+        rng: 난수 생성기 (BattleRandom, None이면 새 시드). 루트 행동별 스트림을 spawn하는 데 사용
+    """
+
+    def __init__(self, workers: Optional[int] = None, gen: int = 9, young_brothers_wait: bool = True,
+                 rng: Optional[BattleRandom] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.gen = gen
+        self.young_brothers_wait = young_brothers_wait
+        self.rng = rng if rng is not None else BattleRandom()
+        self._shared = multiprocessing.Array('d', 2)
+        self._shared[_ALPHA] = -float('inf')
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    # =================================================================
+    # 풀 관리
+    # =================================================================
+    def start(self) -> 'ParallelMinimaxSearcher':
+        """워커 프로세스를 띄우고 초기화가 끝날 때까지 대기 (첫 결정에서 로드 시간이 드러나지 않도록)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker,
+                                                 initargs=(self.gen, self._shared))
+            for future in [self._executor.submit(_ping) for _ in range(self.workers)]:
+                future.result()
+        return self
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> 'ParallelMinimaxSearcher':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # =================================================================
+    # 탐색
+    # =================================================================
+    def search(self, root_battle, actions: list, depth: int, options: Optional[dict] = None) -> ParallelMinimaxResult:
+        """
+        루트 행동마다 워커 하나에서 Min Node 서브트리를 탐색하고 최댓값 행동 선택
+        Args:
+            root_battle: 루트 상태 (SimplifiedBattle / ArrayBattle)
+            actions: 루트 행동 목록 (탐색 순서, MinimaxPlayer._get_smart_actions 결과)
+            depth: 탐색 깊이
+            options: 워커 MinimaxPlayer에 설정할 속성 (use_undo / expectiminimax / min_probability 등)
+        """
+        start = time.perf_counter()
+        if len(actions) <= 1:
+            return ParallelMinimaxResult(actions[0] if actions else None, {}, 0, time.perf_counter() - start)
+        self.start()
+
+        # clone으로 인스턴스 rng / 추론기 참조를 떼어 내 워커 전달 크기를 줄임
+        root_state = root_battle.clone() if isinstance(root_battle, SimplifiedBattle) else root_battle
+        options = dict(options or {})
+        with self._shared.get_lock():
+            generation = self._shared[_GENERATION] + 1
+            self._shared[_GENERATION] = generation
+            self._shared[_ALPHA] = -float('inf')
+
+        ids = [LLMPruner.action_identifier(a) for a in actions]
+        rngs = self.rng.spawn(len(actions))
+
+        def submit(i, alpha=None):
+            return self._executor.submit(_worker_search, root_state, i, ids[i], depth, options, generation, rngs[i],
+                                         alpha)
+
+        results = []
+        pending = list(range(len(actions)))
+        if self.young_brothers_wait:
+            results.append(submit(pending.pop(0)).result())
+        results.extend(future.result() for future in [submit(i) for i in pending])
+
+        node_count = sum(nodes for *_, nodes in results)
+        searched = sorted((i, value, exact) for i, value, exact, _ in results if value is not None)
+        values = {ids[i]: value for i, value, _ in searched}
+        if not searched:
+            return ParallelMinimaxResult(actions[0], values, node_count, time.perf_counter() - start)
+
+        # 최댓값 중 가장 앞선 행동 (최댓값을 낸 정확한 값은 항상 있음)
+        best_value = max(value for _, value, _ in searched)
+        tied = [(i, exact) for i, value, exact in searched if value == best_value]
+        best = next((i for i, exact in tied if exact), tied[0][0])
+        # 그보다 앞선 fail-low 동점은 최댓값 바로 아래 창으로 다시 탐색해 값이 정확히 같으면 선택 (같은 rng 스트림)
+        recheck = [i for i, exact in tied if i < best]
+        if recheck:
+            below = math.nextafter(best_value, -math.inf)
+            for i, value, _, nodes in [future.result() for future in [submit(i, below) for i in recheck]]:
+                node_count += nodes
+                if value > below:
+                    best = min(best, i)
+        return ParallelMinimaxResult(actions[best], values, node_count, time.perf_counter() - start)
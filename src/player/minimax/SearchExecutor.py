@@ -0,0 +1,185 @@
+"""
+공유 미니맥스 탐색 실행기 (프로세스 풀)
+
+MinimaxPlayer.choose_move는 동기 함수라 재귀 탐색 전체가 asyncio 이벤트 루프 스레드에서 돌고,
+max_concurrent_battles > 1이면 깊은 탐색 하나가 다른 배틀의 웹소켓 메시지 / 타이머를 모두 멈춘다.
+MinimaxSearchExecutor는 여러 플레이어 / 배틀이 함께 쓰는 프로세스 풀로, 결정 하나를 워커 프로세스에 넘기고
+이벤트 루프는 결과를 await만 한다.
+    - 워커는 게임 데이터 / 엔진 / 탐색 전용 MinimaxPlayer(search_only)를 미리 로드
+    - 대기열 제한: 실행 중 + 대기 중 결정이 max_pending개면 새 결정은 바로 거절 (호출 측 대체 행동)
+    - 결정별 마감: deadline까지 결과가 없으면 None (아직 시작하지 않은 작업은 취소)
+    - 워커가 죽어 풀이 깨지면 그 결정은 None, 풀은 다음 결정에서 새로 띄움
+"""
+import asyncio
+import os
+import random
+import sys
+import threading
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from typing import Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# 워커 프로세스 전역 (초기화에서 설정)
+_player = None
+
+
+def _warm_worker(gen: int, niceness: int):
+    """워커 초기화 - 게임 데이터 / 상성표 / 기술 색인 / 엔진과 탐색 전용 MinimaxPlayer를 미리 로드"""
+    global _player
+    if niceness and hasattr(os, 'nice'):
+        os.nice(niceness)
+    from sim.Supporting.DataPack import DataPack
+    from sim.Supporting.TypeChart import TypeChart
+    from sim.BattleClass.LearnsetIndex import LearnsetIndex
+    from player.minimax.MinimaxPlayer import MinimaxPlayer
+    DataPack.from_gen(gen)
+    TypeChart.from_gen(gen)
+    LearnsetIndex.from_gen(gen)
+    _player = MinimaxPlayer.search_only()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _worker_decide(root_state, options: dict, rng) -> Tuple[object, int, int]:
+    """
+    워커에서 결정 1회
+    Returns:
+        (최선 행동, Max 노드 수, 끝까지 탐색한 깊이)
+    """
+    from player.TranspositionTable import TranspositionTable
+    player = _player
+    for name, value in options.items():
+        if name == 'transposition_table':
+            # 전치표는 프로세스 간에 공유하지 않고 워커마다 하나를 계속 사용
+            if not value:
+                player.transposition_table = None
+            elif player.transposition_table is None:
+                player.transposition_table = TranspositionTable()
+            continue
+        setattr(player, name, value)
+    # rng가 없으면 전역 random 모듈 (이전 결정의 난수 생성기를 이어 쓰지 않도록 매번 지정)
+    player.rng = rng
+    player.engine.rng = rng if rng is not None else random
+    player.engine._sync_references(root_state)
+    action = player.search(root_state)
+    return action, player.node_count, player.depth_reached
+
+
+class MinimaxSearchExecutor:
+    """
+    여러 MinimaxPlayer가 공유하는 탐색 프로세스 풀
+    Args:
+        workers: 워커 프로세스 수 (None이면 os.cpu_count())
+        max_pending: 실행 중 + 대기 중 결정 최대 수 (None이면 workers * 2)
+        gen: 포켓몬 세대 (워커 미리 로드용)
+        niceness: 워커 프로세스 우선순위 낮춤 정도 (os.nice). 코어를 나눠 쓸 때 이벤트 루프 스레드가 먼저 실행되도록 함
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None, gen: int = 9,
+                 niceness: int = 10):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self.gen = gen
+        self.niceness = niceness
+        self.pending = 0
+        self.rejected = 0  # 대기열이 가득 차 거절한 결정 수
+        self.timeouts = 0  # 마감을 넘긴 결정 수
+        self.failures = 0  # 풀이 깨져(워커 종료 등) 실패한 결정 수
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    # =================================================================
+    # 풀 관리
+    # =================================================================
+    def start(self) -> 'MinimaxSearchExecutor':
+        """
+        워커 프로세스를 띄우고 초기화가 끝날 때까지 대기 (첫 결정에서 로드 시간이 드러나지 않도록)
+        블로킹 호출이므로 이벤트 루프 밖(플레이어 생성 전 / with 블록)에서 호출. decide는 시작 전이면 스레드에서 호출
+        """
+        with self._start_lock:
+            if self._executor is None:
+                executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker,
+                                               initargs=(self.gen, self.niceness))
+                try:
+                    for future in [executor.submit(_ping) for _ in range(self.workers)]:
+                        future.result()
+                except BaseException:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                self._executor = executor
+        return self
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> 'MinimaxSearchExecutor':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # =================================================================
+    # 결정
+    # =================================================================
+    async def decide(self, root_state, options: dict, deadline: Optional[float] = None,
+                     rng=None) -> Optional[Tuple[object, int, int]]:
+        """
+        워커에서 root_state의 최선 행동을 탐색하고 결과를 기다림
+        Args:
+            root_state: 루트 상태 (SimplifiedBattle / ArrayBattle)
+            options: 워커 MinimaxPlayer에 설정할 탐색 옵션 (MinimaxPlayer._search_options)
+            deadline: 최대 대기 시간 (초, None이면 무제한)
+            rng: 이 결정에 쓸 난수 생성기 (BattleRandom 등, None이면 워커의 전역 random)
+        Returns:
+            (최선 행동, Max 노드 수, 끝까지 탐색한 깊이), 대기열이 가득 찼거나 마감을 넘기면 None
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                return None
+            self.pending += 1
+        executor = None
+        submitted = False
+        try:
+            if self._executor is None:
+                # 풀 생성 / 데이터 로드가 이벤트 루프를 막지 않도록 스레드에서 시작
+                await asyncio.get_running_loop().run_in_executor(None, self.start)
+            executor = self._executor
+            # clone으로 인스턴스 rng / 추론기 참조를 떼어 내 워커 전달 크기를 줄임
+            future = executor.submit(_worker_decide, root_state.clone(), options, rng)
+            submitted = True
+            future.add_done_callback(self._release)
+            return await asyncio.wait_for(asyncio.wrap_future(future), deadline)
+        except asyncio.TimeoutError:
+            # 이미 실행 중인 작업은 멈출 수 없으므로 끝날 때까지 대기열 한 칸을 차지함
+            with self._lock:
+                self.timeouts += 1
+            return None
+        except BrokenExecutor:
+            # 워커가 죽어 풀이 깨짐 - 호출 측은 대체 행동, 다음 결정에서 풀을 새로 띄움
+            with self._lock:
+                self.failures += 1
+            self._discard(executor)
+            return None
+        finally:
+            # 제출 전에 실패 / 취소되면 완료 콜백이 없으므로 여기서 대기열 칸 반환
+            if not submitted:
+                self._release(None)
+
+    def _discard(self, executor: Optional[ProcessPoolExecutor]):
+        """깨진 풀을 버림 (다른 결정이 이미 새 풀로 바꿨으면 그대로 둠)"""
+        with self._start_lock:
+            if executor is None or self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _release(self, future):
+        with self._lock:
+            self.pending -= 1
@@ -0,0 +1,811 @@
+"""
+배열 기반 배틀 상태 (ArrayBattle)
+
+SimplifiedBattle.clone()은 모든 SimplifiedPokemon / SimplifiedMove 객체를 새로 만들기 때문에
+MCTS 확장, 롤아웃, 미니맥스 자식 노드마다 비용이 크다.
+ArrayBattle은 배틀 중 변하는 값(HP, 상태이상, 랭크, PP, 활성 슬롯, 턴, 날씨)을
+하나의 평탄한 정수 버퍼(array('i'))에 저장하고, 변하지 않는 종족/기술 정보는 BattleLayout으로 공유한다.
+따라서 clone()은 버퍼 한 번 복사로 끝난다.
+
+엔진과 플레이어는 기존 속성 이름 그대로(active_pokemon.current_hp, moves[i].current_pp 등)
+접근할 수 있도록 PokemonView / MoveView 뷰 객체를 통해 버퍼를 읽고 쓴다.
+"""
+from array import array
+from typing import Dict, List, Optional
+import sys
+import weakref
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from poke_env.battle.status import Status
+from poke_env.battle.weather import Weather
+
+from sim.Supporting.Zobrist import (
+    SIDE_PLAYER, SIDE_OPPONENT, hp_key, status_key, boost_key, pp_key, active_key, weather_key, field_key, turn_key,
+)
+
+# 랭크 변화 대상 능력치 (버퍼 저장 순서)
+BOOST_STATS = ('atk', 'def', 'spa', 'spd', 'spe', 'accuracy', 'evasion')
+BOOST_INDEX = {stat: i for i, stat in enumerate(BOOST_STATS)}
+
+# 상태이상 / 날씨 코드 (0 = 없음)
+STATUS_LIST = [None] + list(Status)
+STATUS_CODE = {status.name: code for code, status in enumerate(STATUS_LIST) if status is not None}
+WEATHER_LIST = [None] + list(Weather)
+WEATHER_CODE = {weather: code for code, weather in enumerate(WEATHER_LIST) if weather is not None}
+
+# 능력치 타이머 값 (boost_timers 딕셔너리 대응)
+TIMER_NONE = -1        # 타이머 없음 (딕셔너리에 키 없음)
+TIMER_PERMANENT = -2   # 배틀 종료까지 영구 (None)
+
+# 배틀 헤더 오프셋
+H_TURN = 0
+H_FINISHED = 1
+H_WON = 2
+H_LOST = 3
+H_ACTIVE = 4           # 플레이어 활성 슬롯 (-1 = 없음)
+H_OPP_ACTIVE = 5       # 상대 활성 슬롯 (-1 = 없음)
+H_WEATHER = 6
+H_WEATHER_START = 7
+HEADER_SIZE = 8
+
+# 포켓몬 레코드 오프셋
+P_HP = 0
+P_STATUS = 1
+P_STATUS_COUNTER = 2
+P_TOXIC_COUNTER = 3
+P_ACTIVE = 4
+P_FIRST_TURN = 5
+P_MUST_RECHARGE = 6
+P_PROTECT_COUNTER = 7
+P_BOOSTS = 8
+P_TIMERS = P_BOOSTS + len(BOOST_STATS)
+P_PP = P_TIMERS + len(BOOST_STATS)
+
+
+def encode_status(status) -> int:
+    """상태이상 Enum을 코드로 변환 (poke-env / sim.Supporting 어느 쪽이든 이름으로 매칭)"""
+    if status is None:
+        return 0
+    return STATUS_CODE.get(getattr(status, 'name', str(status)).upper(), 0)
+
+
+def leveled_stat(pokemon, stat_name: str) -> float:
+    """SimplifiedPokemon.get_effective_stat과 동일한 기준 스탯 (랭크/상태이상 보정 전)"""
+    base = pokemon.stats.get(stat_name) if pokemon.stats else None
+    if base is None:
+        base = pokemon.base_stats.get(stat_name, 100)
+        if stat_name == 'hp':
+            base = int(((2 * base * pokemon.level) / 100) + pokemon.level + 10)
+        else:
+            base = int(((2 * base * pokemon.level) / 100) + 5)
+    return base
+
+
+# 뷰 클래스가 공유 템플릿에서 복사하지 않는 (버퍼에 저장되는) 속성
+_POKEMON_BUFFER_ATTRS = {
+    'current_hp', 'status', 'status_counter', 'toxic_counter', 'active', 'first_turn',
+    'must_recharge', 'protect_counter', 'boosts', 'boost_timers', 'volatiles', 'moves', '_stat_cache',
+    '_status', '_stats',
+}
+_MOVE_BUFFER_ATTRS = {'current_pp'}
+
+# 뷰 클래스로 복사하지 않는 SimplifiedPokemon의 Zobrist / 되돌리기 속성 (뷰는 배틀 단위로 처리)
+_POKEMON_BUFFER_ATTRS |= {'zobrist_slot', '_zobrist', '_undo'}
+
+
+class BattleLayout:
+    """
+    배틀 간 공유되는 불변 정보
+    Args:
+        source: 레이아웃을 만들 SimplifiedBattle 객체
+    """
+
+    def __init__(self, source):
+        self.gen = source.gen
+
+        # 슬롯 = 플레이어 팀 + 상대 팀 (순서 고정)
+        self.team_ids: List[str] = list(source.team.keys())
+        self.opponent_team_ids: List[str] = list(source.opponent_team.keys())
+        self.templates = list(source.team.values()) + list(source.opponent_team.values())
+        self.player_slots = range(0, len(self.team_ids))
+        self.opponent_slots = range(len(self.team_ids), len(self.templates))
+
+        # 활성 포켓몬 슬롯 (팀 딕셔너리에서 종 이름으로 찾음, 없으면 -1)
+        self.active_slot = self._find_slot(source.active_pokemon, self.player_slots)
+        self.opponent_active_slot = self._find_slot(source.opponent_active_pokemon, self.opponent_slots)
+
+        self.max_moves = max((len(p.moves) for p in self.templates), default=0)
+        self.record_size = P_PP + self.max_moves
+        self.offsets = [self.record_offset(slot) for slot in range(len(self.templates))]
+
+        # 슬롯별 뷰 클래스 - 불변 정보를 클래스 속성으로 가지므로 뷰 생성 비용은 그대로, 조회는 일반 속성 수준
+        self.view_classes = [_make_pokemon_view_class(p) for p in self.templates]
+
+        # 필드/사이드 컨디션은 엔진이 변경하지 않으므로 공유
+        self.fields = source.fields
+        self.side_conditions = source.side_conditions
+        self.opponent_side_conditions = source.opponent_side_conditions
+
+        # 사용 가능한 기술 (활성 슬롯, 기술 인덱스)
+        self.available_moves = []
+        active = self.templates[self.active_slot] if self.active_slot >= 0 else None
+        for move in source.available_moves:
+            if active is None:
+                break
+            for i, m in enumerate(active.moves):
+                if m.id == move.id:
+                    self.available_moves.append((self.active_slot, i))
+                    break
+
+        # 사용 가능한 교체 (이름이 같은 팀 슬롯)
+        self.available_switches = []
+        for switch_poke in source.available_switches:
+            for slot in self.player_slots:
+                if self.templates[slot].species == switch_poke.species:
+                    self.available_switches.append(slot)
+                    break
+
+    def __getstate__(self):
+        # 뷰 클래스는 동적으로 만든 클래스라 피클할 수 없으므로 빼고 보냄 (받는 쪽에서 템플릿으로 다시 생성)
+        state = self.__dict__.copy()
+        del state['view_classes']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.view_classes = [_make_pokemon_view_class(p) for p in self.templates]
+
+    def _find_slot(self, pokemon, slots: range) -> int:
+        if pokemon is None:
+            return -1
+        for slot in slots:
+            if self.templates[slot] is pokemon or self.templates[slot].species == pokemon.species:
+                return slot
+        return -1
+
+    def record_offset(self, slot: int) -> int:
+        return HEADER_SIZE + slot * self.record_size
+
+
+class MoveView:
+    """
+    버퍼의 PP를 읽고 쓰는 기술 뷰
+    나머지 속성(id, type, base_power 등)은 기술별 하위 클래스의 클래스 속성으로 공유된다.
+    """
+
+    __slots__ = ('_buf', '_index')
+
+    def __init__(self, buf: array, index: int):
+        self._buf = buf
+        self._index = index
+
+    @property
+    def current_pp(self) -> int:
+        return self._buf[self._index]
+
+    @current_pp.setter
+    def current_pp(self, value: int):
+        self._buf[self._index] = value
+
+    def use(self):
+        """PP 소모"""
+        self._buf[self._index] = max(0, self._buf[self._index] - 1)
+
+    def __getattr__(self, name):
+        return getattr(self._tpl, name)
+
+
+class _VolatilesView:
+    """volatiles 딕셔너리 대응 - 버퍼에 저장되는 키만 지원"""
+
+    __slots__ = ('_buf', '_base')
+
+    _KEYS = {'must_recharge': P_MUST_RECHARGE}
+
+    def __init__(self, buf: array, base: int):
+        self._buf = buf
+        self._base = base
+
+    def get(self, key, default=None):
+        offset = self._KEYS.get(key)
+        if offset is None:
+            return default
+        return bool(self._buf[self._base + offset])
+
+    def __getitem__(self, key):
+        return bool(self._buf[self._base + self._KEYS[key]])
+
+    def __setitem__(self, key, value):
+        self._buf[self._base + self._KEYS[key]] = 1 if value else 0
+
+    def __contains__(self, key):
+        return key in self._KEYS and bool(self._buf[self._base + self._KEYS[key]])
+
+    def copy(self) -> Dict:
+        return {key: self[key] for key in self._KEYS}
+
+
+class PokemonView:
+    """
+    버퍼 위의 포켓몬 뷰 - SimplifiedPokemon과 같은 인터페이스 제공
+    불변 정보(species, types, stats, ability 등)는 슬롯별 하위 클래스의 클래스 속성으로 공유된다.
+    Args:
+        battle: 소속 ArrayBattle
+        slot: 레이아웃 슬롯 번호
+        base: 버퍼 내 포켓몬 레코드 시작 위치
+    """
+
+    __slots__ = ('_battle', '_buf', '_slot', '_base', '_moves', '_volatiles')
+
+    # 되돌리기는 ArrayBattle의 버퍼 스냅샷으로 처리하므로 포켓몬 단위 기록 없음
+    _undo = None
+
+    def __init__(self, battle: 'ArrayBattle', slot: int, base: int):
+        # 배틀 → 뷰 캐시 → 배틀 순환을 만들지 않도록 약한 참조 (복제본이 참조 카운트로 바로 해제됨)
+        self._battle = weakref.proxy(battle)
+        self._buf = battle._buf
+        self._slot = slot
+        self._base = base
+        self._moves = None
+        self._volatiles = None
+
+    @property
+    def moves(self) -> List[MoveView]:
+        moves = self._moves
+        if moves is None:
+            buf = self._buf
+            pp_base = self._base + P_PP
+            moves = self._moves = [cls(buf, pp_base + i) for i, cls in enumerate(self._move_classes)]
+        return moves
+
+    # 가변 정보 (버퍼)
+    @property
+    def current_hp(self) -> int:
+        return self._buf[self._base + P_HP]
+
+    @current_hp.setter
+    def current_hp(self, value: int):
+        self._set_hp(value)
+
+    @property
+    def status(self):
+        return STATUS_LIST[self._buf[self._base + P_STATUS]]
+
+    @status.setter
+    def status(self, value):
+        self._set_status_code(encode_status(value))
+
+    @property
+    def status_counter(self) -> int:
+        return self._buf[self._base + P_STATUS_COUNTER]
+
+    @status_counter.setter
+    def status_counter(self, value: int):
+        self._buf[self._base + P_STATUS_COUNTER] = value
+
+    @property
+    def toxic_counter(self) -> int:
+        return self._buf[self._base + P_TOXIC_COUNTER]
+
+    @toxic_counter.setter
+    def toxic_counter(self, value: int):
+        self._buf[self._base + P_TOXIC_COUNTER] = value
+
+    @property
+    def active(self) -> bool:
+        return bool(self._buf[self._base + P_ACTIVE])
+
+    @active.setter
+    def active(self, value: bool):
+        self._buf[self._base + P_ACTIVE] = 1 if value else 0
+
+    @property
+    def first_turn(self) -> bool:
+        return bool(self._buf[self._base + P_FIRST_TURN])
+
+    @first_turn.setter
+    def first_turn(self, value: bool):
+        self._buf[self._base + P_FIRST_TURN] = 1 if value else 0
+
+    @property
+    def must_recharge(self) -> bool:
+        return bool(self._buf[self._base + P_MUST_RECHARGE])
+
+    @property
+    def protect_counter(self) -> int:
+        return self._buf[self._base + P_PROTECT_COUNTER]
+
+    @protect_counter.setter
+    def protect_counter(self, value: int):
+        self._buf[self._base + P_PROTECT_COUNTER] = value
+
+    @property
+    def volatiles(self) -> _VolatilesView:
+        volatiles = self._volatiles
+        if volatiles is None:
+            volatiles = self._volatiles = _VolatilesView(self._buf, self._base)
+        return volatiles
+
+    @property
+    def boosts(self) -> Dict[str, int]:
+        """랭크 변화 (읽기 전용 스냅샷 - 변경은 boost() 사용)"""
+        b = self._base + P_BOOSTS
+        return {stat: self._buf[b + i] for i, stat in enumerate(BOOST_STATS)}
+
+    @property
+    def boost_timers(self) -> Dict[str, Optional[int]]:
+        """능력치 타이머 (읽기 전용 스냅샷)"""
+        b = self._base + P_TIMERS
+        timers = {}
+        for i, stat in enumerate(BOOST_STATS):
+            value = self._buf[b + i]
+            if value == TIMER_PERMANENT:
+                timers[stat] = None
+            elif value != TIMER_NONE:
+                timers[stat] = value
+        return timers
+
+    def __getattr__(self, name):
+        # 클래스 속성으로 복사되지 않은 나머지 정보는 템플릿에서 읽음
+        return getattr(self._tpl, name)
+
+    # 버퍼 쓰기 + 배틀 Zobrist 해시 갱신
+    def _set_hp(self, hp: int):
+        offset = self._base + P_HP
+        battle = self._battle
+        if battle._zobrist is not None:
+            battle._zobrist ^= hp_key(self._slot, self._buf[offset], self.max_hp) ^ hp_key(self._slot, hp, self.max_hp)
+        self._buf[offset] = hp
+
+    def _set_status_code(self, code: int):
+        offset = self._base + P_STATUS
+        battle = self._battle
+        if battle._zobrist is not None:
+            battle._zobrist ^= status_key(self._slot, STATUS_LIST[self._buf[offset]]) ^ status_key(self._slot, STATUS_LIST[code])
+        self._buf[offset] = code
+
+    def _set_boost(self, idx: int, value: int):
+        offset = self._base + P_BOOSTS + idx
+        battle = self._battle
+        if battle._zobrist is not None:
+            battle._zobrist ^= boost_key(self._slot, idx, self._buf[offset]) ^ boost_key(self._slot, idx, value)
+        self._buf[offset] = value
+
+    def damage(self, amount: int):
+        """데미지 받기"""
+        hp = max(0, self._buf[self._base + P_HP] - amount)
+        self._set_hp(hp)
+        if hp == 0:
+            self.faint()
+
+    def heal(self, amount: int):
+        """회복"""
+        self._set_hp(min(self.max_hp, self._buf[self._base + P_HP] + amount))
+
+    def faint(self):
+        """기절"""
+        self._set_hp(0)
+        self._set_status_code(_FNT)
+        self._buf[self._base + P_ACTIVE] = 0
+
+    def boost(self, stat: str, amount: int):
+        """능력치 변화"""
+        idx = BOOST_INDEX.get(stat)
+        if idx is None:
+            return
+        self._set_boost(idx, max(-6, min(6, self._buf[self._base + P_BOOSTS + idx] + amount)))
+
+    def spend_pp(self, move: MoveView):
+        """기술 PP 1 소모 (Zobrist 해시 갱신 포함)"""
+        if not isinstance(move, MoveView):
+            # 엔진의 기본 기술(tackle) 등 버퍼 밖의 기술
+            move.current_pp = max(0, move.current_pp - 1)
+            return
+        index = move._index
+        current = self._buf[index]
+        self._buf[index] = max(0, current - 1)
+        battle = self._battle
+        if battle._zobrist is not None:
+            i = index - self._base - P_PP
+            battle._zobrist ^= pp_key(self._slot, i, current) ^ pp_key(self._slot, i, self._buf[index])
+
+    def reset_zobrist(self):
+        """배틀 Zobrist 해시 무효화"""
+        self._battle._zobrist = None
+
+    def set_boost_with_timer(self, stat: str, amount: int, turns: Optional[int] = None):
+        """능력치 변화 (타이머 포함)"""
+        self.boost(stat, amount)
+        idx = BOOST_INDEX.get(stat)
+        if idx is None:
+            return
+        self._buf[self._base + P_TIMERS + idx] = TIMER_PERMANENT if turns is None else turns
+
+    def decrement_boost_timers(self):
+        """턴 종료 시 능력치 타이머 감소 및 해제"""
+        buf = self._buf
+        t = self._base + P_TIMERS
+        for i in range(len(BOOST_STATS)):
+            turns_left = buf[t + i]
+            if turns_left < 0:
+                # 타이머 없음 / 영구 유지
+                continue
+            turns_left -= 1
+            if turns_left <= 0:
+                self._set_boost(i, 0)
+                buf[t + i] = TIMER_NONE
+            else:
+                buf[t + i] = turns_left
+
+    def damage_multiplier(self, move_type, gen: int = 9) -> float:
+        """타입 상성 계산"""
+        return self._tpl.damage_multiplier(move_type, gen)
+
+    def get_effective_stat(self, stat_name: str) -> float:
+        """능력치 변화 반영한 실제 스탯"""
+        base = self._leveled_stats.get(stat_name, 100)
+
+        idx = BOOST_INDEX.get(stat_name)
+        boost = self._buf[self._base + P_BOOSTS + idx] if idx is not None else 0
+        if boost >= 0:
+            multiplier = (2 + boost) / 2
+        else:
+            multiplier = 2 / (2 - boost)
+
+        status = self._buf[self._base + P_STATUS]
+        if stat_name == 'atk' and status == _BRN:
+            multiplier *= 0.5
+        if stat_name == 'spe' and status == _PAR:
+            multiplier *= 0.5
+
+        return base * multiplier
+
+    def print_summary(self):
+        """포켓몬 정보 출력"""
+        print("Pokemon Summary:")
+        print(f" Species: {self.species}")
+        print(f" HP: {self.current_hp}/{self.max_hp}")
+        print(f" Status: {self.status}")
+        print(f" Boosts: {self.boosts}")
+        print(" Moves:")
+        for move in self.moves:
+            print(move.id, move.current_pp, move.max_pp)
+
+
+_BRN = STATUS_CODE['BRN']
+_PAR = STATUS_CODE['PAR']
+_FNT = STATUS_CODE['FNT']
+
+
+def _make_move_view_class(move) -> type:
+    """기술 템플릿의 불변 속성을 클래스 속성으로 가지는 MoveView 하위 클래스 생성"""
+    attrs = {name: value for name, value in vars(move).items() if name not in _MOVE_BUFFER_ATTRS}
+    attrs['__slots__'] = ()
+    attrs['_tpl'] = move
+    return type('MoveView', (MoveView,), attrs)
+
+
+def _make_pokemon_view_class(pokemon) -> type:
+    """포켓몬 템플릿의 불변 속성을 클래스 속성으로 가지는 PokemonView 하위 클래스 생성"""
+    attrs = {name: value for name, value in vars(pokemon).items() if name not in _POKEMON_BUFFER_ATTRS}
+    attrs['__slots__'] = ()
+    attrs['_tpl'] = pokemon
+    attrs['stats'] = pokemon.stats
+    attrs['_move_classes'] = tuple(_make_move_view_class(m) for m in pokemon.moves)
+    # 레벨 보정까지 끝난 기준 스탯 (랭크/상태이상 보정 전)
+    attrs['_leveled_stats'] = {
+        stat: leveled_stat(pokemon, stat) for stat in ('hp', 'atk', 'def', 'spa', 'spd', 'spe')
+    }
+    return type('PokemonView', (PokemonView,), attrs)
+
+
+class ArrayBattle:
+    """
+    배열 기반 배틀 상태 - SimplifiedBattle과 같은 인터페이스 제공
+    Args:
+        layout: 공유 불변 정보 (BattleLayout)
+        buf: 가변 상태 버퍼 (None이면 새로 할당)
+        zobrist: buf 상태의 Zobrist 해시 (None이면 zobrist_hash() 호출 시 계산)
+    """
+
+    __slots__ = ('layout', '_buf', '_views', '_team', '_opponent_team', '_active', '_opponent_active', '_zobrist',
+                 '_undo_stack', '__weakref__')
+
+    def __init__(self, layout: BattleLayout, buf: Optional[array] = None, zobrist: Optional[int] = None):
+        self.layout = layout
+        self._buf = buf if buf is not None else array('i', bytes(4 * (HEADER_SIZE + len(layout.templates) * layout.record_size)))
+        self._zobrist = zobrist if buf is not None else None
+        self._undo_stack = None
+        self._reset_views()
+
+    def _reset_views(self):
+        """뷰 캐시 초기화 (버퍼를 직접 덮어쓴 뒤 호출)"""
+        self._views = None
+        self._team = None
+        self._opponent_team = None
+        # False = 아직 조회하지 않음
+        self._active = False
+        self._opponent_active = False
+
+    @classmethod
+    def from_battle(cls, battle) -> 'ArrayBattle':
+        """SimplifiedBattle 객체로부터 ArrayBattle 생성"""
+        layout = BattleLayout(battle)
+        new_battle = cls(layout)
+        buf = new_battle._buf
+
+        buf[H_TURN] = battle.turn
+        buf[H_FINISHED] = 1 if battle.finished else 0
+        buf[H_WON] = 1 if battle.won else 0
+        buf[H_LOST] = 1 if battle.lost else 0
+        buf[H_ACTIVE] = layout.active_slot
+        buf[H_OPP_ACTIVE] = layout.opponent_active_slot
+
+        for weather, start in battle.weather.items():
+            buf[H_WEATHER] = WEATHER_CODE.get(weather, 0)
+            buf[H_WEATHER_START] = start if isinstance(start, int) else 0
+            break
+
+        # 엔진의 _sync_references와 같이 팀 딕셔너리의 객체 값을 기준으로 사용
+        for slot, p in enumerate(layout.templates):
+            base = layout.offsets[slot]
+            buf[base + P_HP] = int(p.current_hp or 0)
+            buf[base + P_STATUS] = encode_status(p.status)
+            buf[base + P_STATUS_COUNTER] = p.status_counter or 0
+            buf[base + P_TOXIC_COUNTER] = getattr(p, 'toxic_counter', 0) or 0
+            buf[base + P_ACTIVE] = 1 if p.active else 0
+            buf[base + P_FIRST_TURN] = 1 if p.first_turn else 0
+            buf[base + P_MUST_RECHARGE] = 1 if p.volatiles.get('must_recharge') else 0
+            buf[base + P_PROTECT_COUNTER] = p.protect_counter or 0
+
+            timers = getattr(p, 'boost_timers', {})
+            for i, stat in enumerate(BOOST_STATS):
+                buf[base + P_BOOSTS + i] = p.boosts.get(stat, 0)
+                if stat not in timers:
+                    buf[base + P_TIMERS + i] = TIMER_NONE
+                elif timers[stat] is None:
+                    buf[base + P_TIMERS + i] = TIMER_PERMANENT
+                else:
+                    buf[base + P_TIMERS + i] = timers[stat]
+
+            for i, m in enumerate(p.moves):
+                buf[base + P_PP + i] = m.current_pp or 0
+
+        return new_battle
+
+    def clone(self) -> 'ArrayBattle':
+        """버퍼 한 번 복사로 배틀 복제 (레이아웃은 공유)"""
+        return ArrayBattle(self.layout, self._buf[:], self._zobrist)
+
+    def __deepcopy__(self, memo):
+        return self.clone()
+
+    def __reduce__(self):
+        # 버퍼 / 레이아웃만 전달 (뷰 캐시 / 되돌리기 스택 제외, 프로세스 풀 워커에 루트 상태를 보낼 때 사용)
+        return ArrayBattle, (self.layout, self._buf, self._zobrist)
+
+    # 되돌리기 (SimplifiedBattle과 같은 인터페이스)
+    # 모든 가변 상태가 버퍼 하나에 있으므로 변경 기록 대신 턴 시작 시 버퍼 스냅샷 한 번으로 처리
+    def begin_undo_turn(self):
+        """되돌리기 기록 시작 (중첩 호출 가능)"""
+        stack = self._undo_stack
+        if stack is None:
+            stack = self._undo_stack = []
+        stack.append((self._buf[:], self._zobrist))
+
+    def undo_turn(self):
+        """마지막 begin_undo_turn() 시점의 상태로 복원 (뷰 객체는 그대로 유효)"""
+        if not self._undo_stack:
+            raise IndexError("begin_undo_turn() 없이 undo_turn()이 호출되었습니다")
+        buf, self._zobrist = self._undo_stack.pop()
+        self._buf[:] = buf
+        self._active = False
+        self._opponent_active = False
+
+    # Zobrist 해시
+    def zobrist_hash(self) -> int:
+        """
+        배틀 상태의 64비트 Zobrist 해시 (SimplifiedBattle.zobrist_hash()와 같은 값)
+        처음 한 번만 버퍼 전체로 계산하고, 이후에는 뷰 / setter에서 증분 갱신된 값을 돌려준다.
+        """
+        h = self._zobrist
+        if h is None:
+            h = self._zobrist = self._compute_zobrist()
+        return h
+
+    def reset_zobrist(self):
+        """Zobrist 해시 무효화 (버퍼를 직접 덮어쓴 경우 호출)"""
+        self._zobrist = None
+
+    def _compute_zobrist(self) -> int:
+        buf = self._buf
+        layout = self.layout
+        h = turn_key(buf[H_TURN]) ^ weather_key(self.weather) ^ field_key(layout.fields)
+        h ^= active_key(SIDE_PLAYER, buf[H_ACTIVE]) ^ active_key(SIDE_OPPONENT, buf[H_OPP_ACTIVE])
+        for slot, (base, template) in enumerate(zip(layout.offsets, layout.templates)):
+            h ^= hp_key(slot, buf[base + P_HP], template.max_hp)
+            h ^= status_key(slot, STATUS_LIST[buf[base + P_STATUS]])
+            for i in range(len(BOOST_STATS)):
+                h ^= boost_key(slot, i, buf[base + P_BOOSTS + i])
+            for i in range(len(template.moves)):
+                h ^= pp_key(slot, i, buf[base + P_PP + i])
+        return h
+
+    # 뷰 관리
+    def _view(self, slot: int) -> Optional[PokemonView]:
+        if slot < 0:
+            return None
+        views = self._views
+        if views is None:
+            # 한 번에 모든 슬롯의 뷰 생성 (팀 순회가 매 턴 일어나므로)
+            layout = self.layout
+            views = self._views = [
+                cls(self, slot, base)
+                for slot, (base, cls) in enumerate(zip(layout.offsets, layout.view_classes))
+            ]
+        return views[slot]
+
+    # 기본 정보
+    @property
+    def gen(self) -> int:
+        return self.layout.gen
+
+    @property
+    def turn(self) -> int:
+        return self._buf[H_TURN]
+
+    @turn.setter
+    def turn(self, value: int):
+        if self._zobrist is not None:
+            self._zobrist ^= turn_key(self._buf[H_TURN]) ^ turn_key(value)
+        self._buf[H_TURN] = value
+
+    @property
+    def finished(self) -> bool:
+        return bool(self._buf[H_FINISHED])
+
+    @finished.setter
+    def finished(self, value: bool):
+        self._buf[H_FINISHED] = 1 if value else 0
+
+    @property
+    def won(self) -> bool:
+        return bool(self._buf[H_WON])
+
+    @won.setter
+    def won(self, value: bool):
+        self._buf[H_WON] = 1 if value else 0
+
+    @property
+    def lost(self) -> bool:
+        return bool(self._buf[H_LOST])
+
+    @lost.setter
+    def lost(self, value: bool):
+        self._buf[H_LOST] = 1 if value else 0
+
+    # 팀 정보
+    @property
+    def team(self) -> Dict[str, PokemonView]:
+        if self._team is None:
+            self._team = {
+                identifier: self._view(slot)
+                for identifier, slot in zip(self.layout.team_ids, self.layout.player_slots)
+            }
+        return self._team
+
+    @property
+    def opponent_team(self) -> Dict[str, PokemonView]:
+        if self._opponent_team is None:
+            self._opponent_team = {
+                identifier: self._view(slot)
+                for identifier, slot in zip(self.layout.opponent_team_ids, self.layout.opponent_slots)
+            }
+        return self._opponent_team
+
+    @property
+    def active_pokemon(self) -> Optional[PokemonView]:
+        active = self._active
+        if active is False:
+            active = self._active = self._view(self._buf[H_ACTIVE])
+        return active
+
+    @active_pokemon.setter
+    def active_pokemon(self, pokemon: Optional[PokemonView]):
+        slot = -1 if pokemon is None else pokemon._slot
+        if self._zobrist is not None:
+            self._zobrist ^= active_key(SIDE_PLAYER, self._buf[H_ACTIVE]) ^ active_key(SIDE_PLAYER, slot)
+        self._buf[H_ACTIVE] = slot
+        self._active = False
+
+    @property
+    def opponent_active_pokemon(self) -> Optional[PokemonView]:
+        active = self._opponent_active
+        if active is False:
+            active = self._opponent_active = self._view(self._buf[H_OPP_ACTIVE])
+        return active
+
+    @opponent_active_pokemon.setter
+    def opponent_active_pokemon(self, pokemon: Optional[PokemonView]):
+        slot = -1 if pokemon is None else pokemon._slot
+        if self._zobrist is not None:
+            self._zobrist ^= active_key(SIDE_OPPONENT, self._buf[H_OPP_ACTIVE]) ^ active_key(SIDE_OPPONENT, slot)
+        self._buf[H_OPP_ACTIVE] = slot
+        self._opponent_active = False
+
+    # 필드 효과
+    @property
+    def weather(self) -> Dict:
+        code = self._buf[H_WEATHER]
+        if code == 0:
+            return {}
+        return {WEATHER_LIST[code]: self._buf[H_WEATHER_START]}
+
+    @weather.setter
+    def weather(self, value: Dict):
+        if self._zobrist is not None:
+            self._zobrist ^= weather_key(self.weather) ^ weather_key(value)
+        self._buf[H_WEATHER] = 0
+        self._buf[H_WEATHER_START] = 0
+        for weather, start in value.items():
+            self._buf[H_WEATHER] = WEATHER_CODE.get(weather, 0)
+            self._buf[H_WEATHER_START] = start if isinstance(start, int) else 0
+            break
+
+    @property
+    def fields(self) -> Dict:
+        return self.layout.fields
+
+    @property
+    def side_conditions(self) -> Dict:
+        return self.layout.side_conditions
+
+    @property
+    def opponent_side_conditions(self) -> Dict:
+        return self.layout.opponent_side_conditions
+
+    # 턴 관련 정보
+    @property
+    def available_moves(self) -> List[MoveView]:
+        return [self._view(slot).moves[i] for slot, i in self.layout.available_moves]
+
+    @property
+    def available_switches(self) -> List[PokemonView]:
+        return [self._view(slot) for slot in self.layout.available_switches]
+
+    # SimplifiedBattle 호환 메서드
+    def get_alive_team(self):
+        """살아있는 팀 포켓몬 반환 (Dict)"""
+        return {id: p for id, p in self.team.items() if p.current_hp > 0}
+
+    def get_alive_opponent_team(self):
+        """살아있는 상대 팀 포켓몬 반환 (Dict)"""
+        return {id: p for id, p in self.opponent_team.items() if p.current_hp > 0}
+
+    def get_alive_count(self, is_player: bool = True):
+        """살아있는 포켓몬 개수"""
+        buf = self._buf
+        slots = self.layout.player_slots if is_player else self.layout.opponent_slots
+        offsets = self.layout.offsets
+        return sum(1 for slot in slots if buf[offsets[slot] + P_HP] > 0)
+
+    def get_fainted_count(self, is_player: bool = True):
+        """기절한 포켓몬 개수"""
+        slots = self.layout.player_slots if is_player else self.layout.opponent_slots
+        return len(slots) - self.get_alive_count(is_player)
+
+    def print_summary(self):
+        print(f"=== ArrayBattle Summary ===")
+        print(f"Turn: {self.turn}, Gen: {self.gen}, Finished: {self.finished}, Won: {self.won}")
+        print(f"\n--- Team ---")
+        for id, p in self.team.items():
+            status = f"(기절)" if p.current_hp <= 0 else f"(HP: {p.current_hp}/{p.max_hp})"
+            print(f"{id}: {p.species} {status}")
+        print(f"\n--- Opponent Team ---")
+        for id, p in self.opponent_team.items():
+            status = f"(기절)" if p.current_hp <= 0 else f"(HP: {p.current_hp}/{p.max_hp})"
+            print(f"{id}: {p.species} {status}")
+        print(f"\n--- Field Effects ---")
+        print(f"Weather: {self.weather}")
@@ -0,0 +1,341 @@
+"""
+오프라인 배틀 생성기 (poke-env Battle / Showdown 서버 불필요)
+
+factory-sets.json 세트나 간단한 팀 명세로 6 vs 6 SimplifiedBattle을 바로 만든다.
+종(pokedex) / 기술(SimplifiedMove) / 실수치 계산 결과와 완성된 포켓몬 원형을 캐시해 두고,
+종 / 기술 데이터는 데이터 팩에서 읽으므로 GenData를 로드하지 않는다 (poke-env Battle 경로에서만 GenData 사용).
+배틀마다 원형을 clone()해서 조립하므로 시작 상태를 초당 수천 개 만들 수 있다.
+플레이어 choose_move / SimplifiedBattle(fill_unknown_data=True) 경로가 필요하면 같은 명세로 poke-env Battle도 만든다
+(상대는 종만 공개).
+
+팀 명세 (포켓몬 1마리):
+    {'species': 'Garchomp', 'level': 100, 'nature': 'Jolly', 'item': 'Choice Scarf', 'ability': 'Rough Skin',
+     'evs': {'atk': 252, 'spe': 252, 'hp': 4}, 'ivs': {...} (생략 시 31), 'moves': ['Earthquake', ...]}
+"""
+import itertools
+import json
+import logging
+import os
+import random
+import sys
+from typing import Dict, List, Optional
+
+from poke_env.battle import Battle, Pokemon
+from poke_env.battle.move import Move
+from poke_env.battle.pokemon_type import PokemonType
+from poke_env.data.normalize import to_id_str
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleClass.SimplifiedMove import SimplifiedMove
+from sim.BattleClass.SimplifiedPokemon import SimplifiedPokemon
+from sim.Supporting.DataPack import DataPack
+
+STAT_ORDER = ('hp', 'atk', 'def', 'spa', 'spd', 'spe')
+FACTORY_LEVEL = 100
+
+# 성격 → (올리는 스탯, 내리는 스탯), 무보정 성격(Hardy, Docile, Serious, Bashful, Quirky)은 없음
+NATURES = {
+    'lonely': ('atk', 'def'), 'brave': ('atk', 'spe'), 'adamant': ('atk', 'spa'), 'naughty': ('atk', 'spd'),
+    'bold': ('def', 'atk'), 'relaxed': ('def', 'spe'), 'impish': ('def', 'spa'), 'lax': ('def', 'spd'),
+    'timid': ('spe', 'atk'), 'hasty': ('spe', 'def'), 'jolly': ('spe', 'spa'), 'naive': ('spe', 'spd'),
+    'modest': ('spa', 'atk'), 'mild': ('spa', 'def'), 'quiet': ('spa', 'spe'), 'rash': ('spa', 'spd'),
+    'calm': ('spd', 'atk'), 'gentle': ('spd', 'def'), 'sassy': ('spd', 'spe'), 'careful': ('spd', 'spa'),
+}
+
+class _PackMove(Move):
+    """데이터 팩 기술 항목을 읽는 poke-env Move (GenData를 로드하지 않고 Move와 같은 값으로 SimplifiedMove 생성)"""
+
+    def __init__(self, move_id: str, gen: int, entry: dict):
+        self._entry = entry
+        super().__init__(move_id, gen)
+
+    @property
+    def entry(self) -> dict:
+        return self._entry
+
+
+_battle_ids = itertools.count()  # poke-env Battle 태그 (배틀별 상태 추적기가 태그로 구분하므로 생성기마다 겹치지 않게)
+
+
+class BattleBuilder:
+    """
+    팀 명세 / factory 세트로 SimplifiedBattle 생성
+    Args:
+        gen: 포켓몬 세대 (기본값: 9)
+        factory_sets_path: factory-sets.json 경로 (None이면 데이터 팩에 포함된 세트 사용, 처음 쓸 때 한 번만 읽음)
+        rng: 난수 생성기 (BattleRandom 등, None이면 전역 random 모듈). factory 세트 선택에 사용
+    """
+
+    def __init__(self, gen: int = 9, factory_sets_path: Optional[str] = None, rng=None):
+        self.gen = gen
+        self.data = DataPack.from_gen(gen)
+        self.factory_sets_path = factory_sets_path
+        self.rng = rng if rng is not None else random
+
+        self._factory_sets = None
+        self._species_cache: Dict[str, tuple] = {}
+        self._move_cache: Dict[str, Optional[SimplifiedMove]] = {}
+        self._stats_cache: Dict[tuple, List[int]] = {}
+        self._pokemon_cache: Dict[tuple, SimplifiedPokemon] = {}
+
+    # =================================================================
+    # 캐시
+    # =================================================================
+    def _species(self, species: str) -> tuple:
+        """종 id → (id, 타입 리스트, 종족값, 기본 특성 id)"""
+        species_id = to_id_str(species)
+        template = self._species_cache.get(species_id)
+        if template is None:
+            entry = self.data.pokedex.get(species_id)
+            if entry is None:
+                raise KeyError(f"pokedex에 없는 포켓몬: {species}")
+            types = [PokemonType.from_name(t) for t in entry.get('types', ['Normal'])]
+            abilities = entry.get('abilities', {})
+            ability = to_id_str(abilities.get('0', abilities.get('H', '')))
+            template = (species_id, types, dict(entry['baseStats']), ability)
+            self._species_cache[species_id] = template
+        return template
+
+    def _move(self, move: str) -> Optional[SimplifiedMove]:
+        """기술 id → SimplifiedMove 원형 (배틀마다 clone해서 사용, 데이터에 없으면 None)"""
+        move_id = to_id_str(move)
+        if move_id not in self._move_cache:
+            move_data = self.data.moves.get(move_id)
+            if move_data is not None:
+                self._move_cache[move_id] = SimplifiedMove(_PackMove(move_id, self.gen, move_data))
+            else:
+                print(f"[WARNING] 기술 데이터 없음: {move}")
+                self._move_cache[move_id] = None
+        return self._move_cache[move_id]
+
+    def _stats(self, species_id: str, level: int, evs: tuple, ivs: tuple, nature: str) -> List[int]:
+        """실수치 [hp, atk, def, spa, spd, spe] (poke-env compute_raw_stats와 같은 공식)"""
+        key = (species_id, level, evs, ivs, nature)
+        stats = self._stats_cache.get(key)
+        if stats is None:
+            base_stats = self._species(species_id)[2]
+            plus, minus = NATURES.get(nature, (None, None))
+            stats = []
+            for stat, ev, iv in zip(STAT_ORDER, evs, ivs):
+                raw = (2 * base_stats[stat] + iv + ev // 4) * level // 100
+                if stat == 'hp':
+                    stats.append(1 if species_id == 'shedinja' else raw + level + 10)
+                else:
+                    stats.append(int((raw + 5) * (1.1 if stat == plus else 0.9 if stat == minus else 1)))
+            self._stats_cache[key] = stats
+        return stats
+
+    # =================================================================
+    # 포켓몬 / 배틀 생성
+    # =================================================================
+    def pokemon(self, spec: dict) -> SimplifiedPokemon:
+        """팀 명세 1개로 SimplifiedPokemon 생성 (같은 명세는 캐시된 원형을 복제)"""
+        evs = tuple(spec.get('evs', {}).get(stat, 0) for stat in STAT_ORDER)
+        ivs = tuple(spec.get('ivs', {}).get(stat, 31) for stat in STAT_ORDER)
+        key = (to_id_str(spec['species']), spec.get('level', FACTORY_LEVEL), evs, ivs,
+               to_id_str(spec.get('nature') or 'serious'), to_id_str(spec.get('item') or ''),
+               to_id_str(spec.get('ability') or ''), tuple(to_id_str(m) for m in spec.get('moves', ())))
+
+        prototype = self._pokemon_cache.get(key)
+        if prototype is None:
+            prototype = self._create_pokemon(*key)
+            self._pokemon_cache[key] = prototype
+        return prototype.clone()
+
+    def _create_pokemon(self, species: str, level: int, evs: tuple, ivs: tuple, nature: str,
+                        item: str, ability: str, moves: tuple) -> SimplifiedPokemon:
+        species_id, types, base_stats, default_ability = self._species(species)
+        stats = self._stats(species_id, level, evs, ivs, nature)
+
+        pokemon = SimplifiedPokemon.__new__(SimplifiedPokemon)
+        pokemon.species = species_id
+        pokemon.level = level
+        pokemon.gender = None
+
+        pokemon.types = list(types)
+        pokemon.type_1 = types[0]
+        pokemon.type_2 = types[1] if len(types) > 1 else None
+        pokemon.refresh_type_codes()
+
+        pokemon.max_hp = pokemon.current_hp = stats[0]
+        pokemon._status = None
+        pokemon.status_counter = 0
+        pokemon.toxic_counter = 0
+
+        pokemon.base_stats = base_stats
+        pokemon.stats = dict(zip(STAT_ORDER, stats))
+        pokemon.boosts = {stat: 0 for stat in ('accuracy', 'atk', 'def', 'evasion', 'spa', 'spd', 'spe')}
+        pokemon.boost_timers = {}
+
+        pokemon.moves = []
+        for move_id in moves:
+            move = self._move(move_id)
+            if move is not None:
+                pokemon.moves.append(move.clone())
+
+        pokemon.ability = ability or default_ability
+        pokemon.item = item or None
+        pokemon.effects = {}
+        pokemon.volatiles = {}
+
+        pokemon.active = False
+        pokemon.first_turn = True
+        pokemon.must_recharge = False
+        pokemon.protect_counter = 0
+        return pokemon
+
+    def battle(self, team: List[dict], opponent_team: List[dict],
+               active: int = 0, opponent_active: int = 0) -> SimplifiedBattle:
+        """
+        팀 명세 리스트 두 개로 SimplifiedBattle 생성
+        Args:
+            team: 내 팀 명세 리스트
+            opponent_team: 상대 팀 명세 리스트
+            active / opponent_active: 처음 나와 있는 포켓몬 인덱스
+        """
+        battle = SimplifiedBattle.__new__(SimplifiedBattle)
+        battle.gen = self.gen
+        battle.turn = 1
+        battle.finished = False
+        battle.won = False
+        battle.lost = False
+
+        battle.team = {}
+        battle.opponent_team = {}
+        for side, specs, prefix in ((battle.team, team, 'p1'), (battle.opponent_team, opponent_team, 'p2')):
+            for spec in specs:
+                pokemon = self.pokemon(spec)
+                side[f"{prefix}: {pokemon.species}"] = pokemon
+
+        battle.active_pokemon = list(battle.team.values())[active]
+        battle.opponent_active_pokemon = list(battle.opponent_team.values())[opponent_active]
+        battle.active_pokemon.active = True
+        battle.opponent_active_pokemon.active = True
+
+        battle.weather = {}
+        battle.fields = {}
+        battle.side_conditions = {}
+        battle.opponent_side_conditions = {}
+        battle.available_moves = [m.clone() for m in battle.active_pokemon.moves]
+        battle.available_switches = [p for p in battle.team.values() if p is not battle.active_pokemon]
+        return battle
+
+    # =================================================================
+    # factory 세트
+    # =================================================================
+    @property
+    def factory_sets(self) -> dict:
+        """티어 → 종 → {'weight', 'sets'} (처음 접근할 때 한 번만 로드)"""
+        if self._factory_sets is None:
+            if self.factory_sets_path is None:
+                self._factory_sets = DataPack.from_gen(self.gen).factory_sets
+            else:
+                with open(self.factory_sets_path, encoding='utf-8') as f:
+                    self._factory_sets = json.load(f)
+        return self._factory_sets
+
+    def resolve_factory_set(self, factory_set: dict, rng=None) -> dict:
+        """factory 세트 1개(슬롯별 후보 목록)에서 후보를 하나씩 골라 팀 명세로 변환"""
+        rng = rng if rng is not None else self.rng
+        return {
+            'species': factory_set['species'],
+            'level': FACTORY_LEVEL,
+            'evs': factory_set.get('evs', {}),
+            'ivs': factory_set.get('ivs', {}),
+            'nature': rng.choice(factory_set.get('nature') or ['Serious']),
+            'item': rng.choice(factory_set.get('item') or ['']),
+            'ability': rng.choice(factory_set.get('ability') or ['']),
+            'moves': [rng.choice(slot) for slot in factory_set.get('moves', [])],
+        }
+
+    def _pick_factory_set(self, entry: dict, rng) -> dict:
+        """종 하나의 세트 중 weight 비율로 1개를 골라 팀 명세로 변환"""
+        sets = entry['sets']
+        factory_set = rng.choices(sets, weights=[s.get('weight', 1) for s in sets])[0]
+        return self.resolve_factory_set(factory_set, rng)
+
+    def factory_team(self, tier: str = 'OU', team_num: int = 6, rng=None, exclude=()) -> List[dict]:
+        """
+        factory 세트로 팀 명세 리스트 생성 (종 중복 없음, 세트는 weight 비율로 선택)
+        Args:
+            tier: factory-sets.json의 티어 키 (Uber, OU, UU, RU, NU ...)
+            team_num: 팀의 포켓몬 수
+            rng: 난수 생성기 (None이면 생성기 기본값)
+            exclude: 제외할 종 id (상대 팀과 겹치지 않게 할 때)
+        """
+        rng = rng if rng is not None else self.rng
+        entries = self.factory_sets[tier]
+        pool = [species for species in entries if species not in exclude]
+        return [self._pick_factory_set(entries[species], rng) for species in rng.sample(pool, team_num)]
+
+    def factory_battle(self, tier: str = 'OU', team_num: int = 6, rng=None) -> SimplifiedBattle:
+        """factory 세트로 양쪽 팀을 뽑아 6 vs 6 SimplifiedBattle 생성"""
+        team = self.factory_team(tier, team_num, rng)
+        opponent_team = self.factory_team(tier, team_num, rng, exclude={to_id_str(s['species']) for s in team})
+        return self.battle(team, opponent_team)
+
+    # =================================================================
+    # poke-env Battle (플레이어 choose_move / SimplifiedBattle 변환 경로)
+    # =================================================================
+    def poke_env_pokemon(self, spec: dict) -> Pokemon:
+        """팀 명세 1개로 스탯 / 기술이 채워진 poke-env Pokemon 생성"""
+        pokemon = Pokemon(gen=self.gen, species=spec['species'])
+        level = spec.get('level', FACTORY_LEVEL)
+        evs = tuple(spec.get('evs', {}).get(stat, 0) for stat in STAT_ORDER)
+        ivs = tuple(spec.get('ivs', {}).get(stat, 31) for stat in STAT_ORDER)
+        stats = self._stats(pokemon.species, level, evs, ivs, to_id_str(spec.get('nature') or 'serious'))
+
+        pokemon._level = level
+        pokemon._item = to_id_str(spec.get('item') or '')
+        pokemon._ability = to_id_str(spec.get('ability') or '')
+        pokemon._stats = dict(zip(STAT_ORDER, stats))
+        pokemon._max_hp = pokemon._current_hp = stats[0]
+        for move in spec.get('moves', ()):
+            move_id = to_id_str(move)
+            pokemon._moves[move_id] = Move(move_id, gen=self.gen)
+        return pokemon
+
+    def poke_env_battle(self, team: List[dict], opponent_species: List[str],
+                        battle_tag: Optional[str] = None) -> Battle:
+        """
+        내 팀 명세와 공개된 상대 종으로 poke-env Battle 생성 (첫 포켓몬이 나와 있는 턴 시작 요청 상태)
+        Args:
+            team: 내 팀 명세 리스트
+            opponent_species: 공개된 상대 종 (기술 / 스탯 미공개, HP는 백분율)
+            battle_tag: 배틀 태그 (None이면 겹치지 않는 태그)
+        """
+        if battle_tag is None:
+            battle_tag = f"offline-{next(_battle_ids)}"
+        battle = Battle(battle_tag, "offline", logging.getLogger("BattleBuilder"), gen=self.gen)
+        battle._player_role = "p1"
+
+        for i, spec in enumerate(team):
+            pokemon = self.poke_env_pokemon(spec)
+            pokemon._active = i == 0
+            battle._team[f"p1: {pokemon.species}"] = pokemon
+
+        for i, species in enumerate(opponent_species):
+            pokemon = Pokemon(gen=self.gen, species=species)
+            pokemon._active = i == 0
+            pokemon._current_hp = pokemon._max_hp = 100
+            battle._opponent_team[f"p2: {pokemon.species}"] = pokemon
+
+        active = battle.active_pokemon
+        battle._available_moves = list(active.moves.values())
+        battle._available_switches = [p for p in battle.team.values() if p is not active]
+        return battle
+
+    def factory_poke_env_battle(self, tier: str = 'OU', team_num: int = 6, revealed_opponents: int = 3,
+                                rng=None, battle_tag: Optional[str] = None) -> Battle:
+        """
+        factory 세트로 내 팀 team_num마리와 공개된 상대 revealed_opponents마리의 poke-env Battle 생성
+        Args:
+            rng: 난수 생성기 (None이면 생성기 기본값, 같은 시드면 같은 배틀)
+        """
+        rng = rng if rng is not None else self.rng
+        entries = self.factory_sets[tier]
+        species = rng.sample(sorted(entries), team_num + revealed_opponents)
+        team = [self._pick_factory_set(entries[name], rng) for name in species[:team_num]]
+        return self.poke_env_battle(team, species[team_num:], battle_tag)
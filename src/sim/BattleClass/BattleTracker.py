@@ -0,0 +1,263 @@
+"""
+배틀별 SimplifiedBattle 상태 유지 (턴마다 바뀐 부분만 반영)
+
+플레이어는 매 턴 SimplifiedBattle(battle, fill_unknown_data=True)를 새로 만들었다.
+그때마다 미공개 상대 팀 / 기술을 다시 무작위로 뽑고, 모든 poke-env 객체를 다시 변환하며,
+지난 턴에 추론한 내용을 버리므로 연속된 결정이 서로 다른 상대를 가정하게 된다.
+
+BattleTracker는 첫 턴에만 SimplifiedBattle을 만들고, 이후에는 poke-env Battle에서 바뀐 부분만 반영한다.
+    - HP / 상태이상 / 랭크 / 도구 / 특성 / 타입 / 효과 / PP: 기존 포켓몬 객체에 값만 덮어씀
+    - 기술: 기술 id 목록이 바뀐 포켓몬만 다시 변환 (공개된 상대 기술이 추론과 다르면 그 포켓몬만 다시 추론)
+    - 새로 공개된 상대 종: 같은 종으로 추론해 둔 자리(없으면 마지막 추론 자리)를 대체
+    - 날씨 / 필드 / 사이드 조건 / 교체 가능 포켓몬 / 사용 가능 기술
+탐색에는 유지 중인 상태의 복제본을 넘기므로 탐색이 상태를 바꿔도 다음 턴에 영향이 없다.
+"""
+import os
+import sys
+from typing import Dict, Optional
+
+from poke_env.battle import Battle
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle, DEFAULT_MOVES, UNKNOWN_ITEM
+from sim.BattleClass.SimplifiedMove import SimplifiedMove
+from sim.BattleClass.SimplifiedPokemon import SimplifiedPokemon
+
+
+class BattleTracker:
+    """
+    poke-env Battle 1개(battle_tag 1개)의 SimplifiedBattle 상태를 턴 사이에 유지
+    Args:
+        team_num: 팀의 포켓몬 수 (기본값: 6)
+        rng: 난수 생성기 (BattleRandom 등, None이면 전역 random 모듈). 상대 팀 채우기에 사용
+        opponent_belief: 상대 세트 추론기 (OpponentBelief, None이면 pokedex / learnset 규칙)
+    """
+
+    def __init__(self, team_num: int = 6, rng=None, opponent_belief=None):
+        self.team_num = team_num
+        self.rng = rng
+        self.opponent_belief = opponent_belief
+
+        self.state: Optional[SimplifiedBattle] = None
+        self.battle_tag: Optional[str] = None
+        # 상대 포켓몬별 마지막으로 반영한 공개 기술 id
+        self._seen_moves: Dict[str, tuple] = {}
+        # 마지막 update에서 다시 변환 / 추론한 포켓몬 수 (변경량 확인용)
+        self.rebuilt = 0
+
+    def update(self, battle: Battle) -> SimplifiedBattle:
+        """
+        poke-env Battle의 변경 내용을 유지 중인 상태에 반영하고 탐색용 복제본 반환
+        Args:
+            battle: 현재 턴의 poke-env Battle (첫 호출의 battle_tag와 같아야 함)
+        """
+        if self.state is None or battle.battle_tag != self.battle_tag:
+            self._reset(battle)
+        else:
+            self._apply(battle)
+        return self.state.clone()
+
+    # =================================================================
+    # 첫 턴
+    # =================================================================
+    def _reset(self, battle: Battle):
+        self.battle_tag = battle.battle_tag
+        state = SimplifiedBattle(battle, fill_unknown_data=True, team_num=self.team_num, rng=self.rng,
+                                 opponent_belief=self.opponent_belief)
+        # 활성 / 교체 가능 포켓몬을 팀 딕셔너리 객체로 연결 (이후 갱신은 팀 객체에만 반영)
+        state.active_pokemon = self._find(state.team, battle.team, battle.active_pokemon) or state.active_pokemon
+        state.opponent_active_pokemon = (self._find(state.opponent_team, battle.opponent_team,
+                                                    battle.opponent_active_pokemon)
+                                         or state.opponent_active_pokemon)
+        state.available_switches = self._switches(state, battle)
+        self.state = state
+        self._seen_moves = {identifier: tuple(p.moves) for identifier, p in battle.opponent_team.items()}
+        self.rebuilt = len(state.team) + len(state.opponent_team)
+
+    # =================================================================
+    # 이후 턴 (변경분 반영)
+    # =================================================================
+    def _apply(self, battle: Battle):
+        state = self.state
+        self.rebuilt = 0
+
+        state.turn = battle.turn
+        state.finished = battle.finished
+        state.won = battle.won if hasattr(battle, 'won') else False
+        state.lost = battle.lost if hasattr(battle, 'lost') else False
+        state.weather = battle.weather.copy()
+        state.fields = battle.fields.copy()
+        state.side_conditions = battle.side_conditions.copy()
+        state.opponent_side_conditions = battle.opponent_side_conditions.copy()
+
+        for identifier, pokemon in battle.team.items():
+            tracked = state.team.get(identifier)
+            if tracked is None:
+                state.team[identifier] = SimplifiedPokemon(pokemon)
+                self.rebuilt += 1
+            else:
+                self._sync_pokemon(tracked, pokemon)
+                tracked.current_hp = pokemon.current_hp
+                tracked.max_hp = pokemon.max_hp
+                if tracked.stats != pokemon.stats:
+                    tracked.stats = pokemon.stats.copy()
+                self._sync_moves(tracked, pokemon)
+
+        for identifier, pokemon in battle.opponent_team.items():
+            tracked = state.opponent_team.get(identifier)
+            if tracked is None:
+                self._reveal_opponent(identifier, pokemon)
+            else:
+                self._sync_pokemon(tracked, pokemon)
+                # 상대 HP는 백분율이므로 재계산한 최대 HP에 비율만 반영
+                if pokemon.max_hp:
+                    tracked.current_hp = int(tracked.max_hp * pokemon.current_hp / pokemon.max_hp)
+                self._sync_opponent_moves(identifier, tracked, pokemon)
+
+        state.active_pokemon = self._find(state.team, battle.team, battle.active_pokemon) or self._first_alive(state.team)
+        state.opponent_active_pokemon = (self._find(state.opponent_team, battle.opponent_team,
+                                                    battle.opponent_active_pokemon)
+                                         or self._first_alive(state.opponent_team))
+
+        active = state.active_pokemon
+        known_moves = {m.id: m for m in active.moves} if active is not None else {}
+        state.available_moves = [known_moves[m.id].clone() if m.id in known_moves else SimplifiedMove(m)
+                                 for m in battle.available_moves if m is not None]
+        state.available_switches = self._switches(state, battle)
+        state.reset_zobrist()
+
+    def _sync_pokemon(self, tracked: SimplifiedPokemon, pokemon):
+        """양쪽 공통 상태 덮어쓰기 (값이 바뀐 경우에만 캐시 무효화)"""
+        if tracked.status is not pokemon.status:
+            tracked.status = pokemon.status
+        tracked.status_counter = pokemon.status_counter
+        if tracked.boosts != pokemon.boosts:
+            tracked.boosts = pokemon.boosts.copy()
+            tracked.invalidate_stat_cache()
+        if tracked.types != pokemon.types:
+            tracked.types = pokemon.types.copy()
+            tracked.type_1 = pokemon.type_1
+            tracked.type_2 = pokemon.type_2
+            tracked.refresh_type_codes()
+
+        # 상대의 미공개 도구 / 특성은 추론한 값 유지
+        if pokemon.item != UNKNOWN_ITEM:
+            tracked.item = pokemon.item
+        if pokemon.ability:
+            tracked.ability = pokemon.ability
+        tracked.effects = pokemon.effects.copy()
+        tracked.active = pokemon.active
+        tracked.first_turn = pokemon.first_turn
+        tracked.must_recharge = pokemon.must_recharge
+        tracked.protect_counter = pokemon.protect_counter
+
+    def _sync_moves(self, tracked: SimplifiedPokemon, pokemon):
+        """내 포켓몬 기술: id 목록이 바뀐 경우에만 다시 변환, PP는 매번 반영"""
+        moves = pokemon.moves
+        if [m.id for m in tracked.moves] != list(moves):
+            tracked.moves = [SimplifiedMove(move) for move in moves.values()]
+            self.rebuilt += 1
+            return
+        for move in tracked.moves:
+            move.current_pp = moves[move.id].current_pp
+
+    def _sync_opponent_moves(self, identifier: str, tracked: SimplifiedPokemon, pokemon):
+        """상대 기술: 새로 공개된 기술이 추론한 기술과 다를 때만 그 포켓몬의 기술을 다시 추론"""
+        seen = tuple(pokemon.moves)
+        if seen != self._seen_moves.get(identifier):
+            self._seen_moves[identifier] = seen
+            if not set(seen) <= {m.id for m in tracked.moves}:
+                self._reinfer_moves(identifier, tracked, pokemon)
+
+        for move in tracked.moves:
+            revealed = pokemon.moves.get(move.id)
+            if revealed is not None:
+                move.current_pp = revealed.current_pp
+
+    def _reinfer_moves(self, identifier: str, tracked: SimplifiedPokemon, pokemon):
+        """공개된 기술을 유지하고 나머지 기술만 다시 추론"""
+        state = self.state
+        revealed = [SimplifiedMove(move) for move in pokemon.moves.values()]
+        if state._opponent_belief is not None:
+            tracked.moves = revealed
+            state._fill_revealed_moves(identifier, tracked)
+        else:
+            # 추론기가 없으면 공개되지 않은 기존 추론 기술을 앞에서부터 공개된 기술로 대체
+            seen = {m.id for m in revealed}
+            inferred = [m for m in tracked.moves if m.id not in seen]
+            tracked.moves = revealed + inferred[:max(0, DEFAULT_MOVES - len(revealed))]
+        self.rebuilt += 1
+
+    def _reveal_opponent(self, identifier: str, pokemon):
+        """새로 공개된 상대 포켓몬을 변환하고, 추론해 둔 미공개 자리 하나를 대체"""
+        state = self.state
+        tracked = SimplifiedPokemon(pokemon)
+        state._recalculate_opponent_stats(tracked)
+        state._fill_revealed_moves(identifier, tracked)
+        self._seen_moves[identifier] = tuple(pokemon.moves)
+
+        # 같은 종으로 추론한 자리를 우선 대체 (없으면 마지막 추론 자리)
+        hidden = [key for key in state.opponent_team if key not in self._seen_moves]
+        replaced = next((key for key in hidden if state.opponent_team[key].species == tracked.species),
+                        hidden[-1] if hidden else None)
+        if replaced is not None:
+            del state.opponent_team[replaced]
+        state.opponent_team[identifier] = tracked
+        self.rebuilt += 1
+
+    # =================================================================
+    # 보조
+    # =================================================================
+    @staticmethod
+    def _find(tracked_team: dict, poke_env_team: dict, pokemon) -> Optional[SimplifiedPokemon]:
+        """poke-env 포켓몬 객체와 같은 식별자의 유지 중인 포켓몬"""
+        if pokemon is None:
+            return None
+        for identifier, candidate in poke_env_team.items():
+            if candidate is pokemon:
+                return tracked_team.get(identifier)
+        return None
+
+    @staticmethod
+    def _first_alive(team: dict) -> Optional[SimplifiedPokemon]:
+        return next((p for p in team.values() if p.current_hp > 0), None)
+
+    def _switches(self, state: SimplifiedBattle, battle: Battle) -> list:
+        switches = []
+        for pokemon in battle.available_switches:
+            tracked = self._find(state.team, battle.team, pokemon)
+            if tracked is not None:
+                switches.append(tracked)
+        return switches
+
+
+class BattleTrackers:
+    """
+    battle_tag → BattleTracker (플레이어가 동시에 진행하는 배틀별로 1개)
+    Args:
+        team_num / rng / opponent_belief: 새 BattleTracker 생성 인자
+    """
+
+    def __init__(self, team_num: int = 6, rng=None, opponent_belief=None):
+        self.team_num = team_num
+        self.rng = rng
+        self.opponent_belief = opponent_belief
+        self._trackers: Dict[str, BattleTracker] = {}
+
+    def update(self, battle: Battle) -> SimplifiedBattle:
+        """battle_tag의 추적기에 변경 내용을 반영하고 탐색용 복제본 반환 (처음 보는 배틀이면 추적기 생성)"""
+        tracker = self._trackers.get(battle.battle_tag)
+        if tracker is None:
+            tracker = self._trackers[battle.battle_tag] = BattleTracker(self.team_num, self.rng, self.opponent_belief)
+        return tracker.update(battle)
+
+    def get(self, battle_tag: str) -> Optional[BattleTracker]:
+        return self._trackers.get(battle_tag)
+
+    def discard(self, battle_tag: str):
+        """끝난 배틀의 추적기 제거"""
+        self._trackers.pop(battle_tag, None)
+
+    def __len__(self) -> int:
+        return len(self._trackers)
@@ -0,0 +1,178 @@
+"""
+종별 learnset 기술 분류 색인 (상대 기술 생성용)
+
+SimplifiedBattle._generate_random_moves_fallback은 미공개 상대 포켓몬마다
+이름 정규화 → learnset 조회 → 배울 수 있는 기술 전체를 위력 / 타입별로 분류하는 과정을 매번 반복했다.
+이 색인은 (종, 포켓몬 타입) 단위로 분류 결과를 한 번만 계산해 두고,
+각 분류에는 공유 기술 원형(SimplifiedMove)을 정렬된 튜플로 담아 둔다.
+이후 기술 생성은 튜플 몇 개에서 rng.sample 하고 원형을 clone하는 것으로 끝난다.
+
+분류 기준 (기존 생성 규칙과 동일):
+    strong_stab  위력 70 이상 자속 기술 (위력 내림차순) - 앞에서부터 최대 2개
+    stab         자속 기술 (strong_stab이 없을 때 1개 무작위)
+    strong       위력 80 이상 비자속
+    medium       위력 60~79 비자속
+    weak         위력 50~59 비자속
+    status       위력 0 기술
+"""
+import os
+import re
+import sys
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sim.BattleClass.SimplifiedMove import SimplifiedMove
+from sim.Supporting.DataPack import DataPack
+
+MoveBuckets = namedtuple('MoveBuckets', ['strong_stab', 'stab', 'strong', 'medium', 'weak', 'status'])
+
+DEFAULT_TACKLE_DATA = {'basePower': 40, 'type': 'Normal', 'category': 'Physical'}
+
+
+class LearnsetIndex:
+    """
+    세대별 learnset 기술 분류 색인 (from_gen으로 프로세스당 1개 공유)
+    Args:
+        gen: 포켓몬 세대
+    """
+
+    _CACHE: Dict[int, 'LearnsetIndex'] = {}
+
+    def __init__(self, gen: int = 9):
+        self.gen = gen
+        self.data = DataPack.from_gen(gen)
+        self._templates: Dict[str, SimplifiedMove] = {}
+        self._learnset_keys: Dict[str, Optional[str]] = {}
+        self._buckets: Dict[Tuple[str, Tuple[str, ...]], Optional[MoveBuckets]] = {}
+
+    @classmethod
+    def from_gen(cls, gen: int = 9) -> 'LearnsetIndex':
+        index = cls._CACHE.get(gen)
+        if index is None:
+            index = cls._CACHE[gen] = cls(gen)
+        return index
+
+    # =================================================================
+    # 색인 생성
+    # =================================================================
+    def template(self, move_id: str) -> SimplifiedMove:
+        """기술 원형 (공유 객체이므로 배틀에 넣을 때는 clone()해서 사용)"""
+        move = self._templates.get(move_id)
+        if move is None:
+            move_data = self.data.moves.get(move_id, DEFAULT_TACKLE_DATA if move_id == 'tackle' else {})
+            move = self._templates[move_id] = SimplifiedMove.from_data(move_id, move_data)
+        return move
+
+    def candidates(self, species: str) -> List[str]:
+        """learnset 검색 이름 후보 (정규화한 종 이름, baseSpecies, '-' 앞부분)"""
+        search_candidates = [species.lower().replace(' ', '').replace('-', '').replace('.', '').replace("'", "")]
+
+        pokedex_entry = self.data.pokedex.get(search_candidates[0], {})
+        if 'baseSpecies' in pokedex_entry:
+            base_species_key = re.sub(r'[^a-z0-9]', '', pokedex_entry['baseSpecies'].lower())
+            if base_species_key not in search_candidates:
+                search_candidates.append(base_species_key)
+
+        if '-' in species:
+            base_name_key = re.sub(r'[^a-z0-9]', '', species.split('-')[0].lower())
+            if base_name_key not in search_candidates:
+                search_candidates.append(base_name_key)
+        return search_candidates
+
+    def learnset_key(self, species: str) -> Optional[str]:
+        """기술 목록이 있는 첫 번째 후보 이름 (없으면 None)"""
+        if species not in self._learnset_keys:
+            self._learnset_keys[species] = next(
+                (name for name in self.candidates(species) if self.data.learnable_moves(name) is not None), None)
+        return self._learnset_keys[species]
+
+    def buckets(self, species: str, types: Tuple[str, ...]) -> Optional[MoveBuckets]:
+        """
+        (종, 타입) 기술 분류 (처음 요청 시 계산 후 캐시)
+        Args:
+            species: 포켓몬 종 이름
+            types: 포켓몬 타입 이름 튜플 (대문자, 자속 판정용)
+        Returns:
+            MoveBuckets (각 분류는 기술 원형 튜플), learnset 데이터가 없으면 None
+        """
+        key = (species, types)
+        if key in self._buckets:
+            return self._buckets[key]
+
+        name = self.learnset_key(species)
+        if name is None:
+            self._buckets[key] = None
+            return None
+
+        stab, strong, medium, weak, status = [], [], [], [], []
+        for move_id in self.data.learnable_moves(name):
+            move_data = self.data.moves.get(move_id, {})
+            base_power = move_data.get('basePower', 0)
+            if base_power > 0:
+                if move_data.get('type', 'Normal').upper() in types:
+                    stab.append((base_power, move_id))
+                elif base_power >= 80:
+                    strong.append(move_id)
+                elif base_power >= 60:
+                    medium.append(move_id)
+                elif base_power >= 50:
+                    weak.append(move_id)
+            else:
+                status.append(move_id)
+
+        # 위력 내림차순 (같은 위력은 learnset 순서 유지)
+        strong_stab = sorted((m for m in stab if m[0] >= 70), key=lambda m: m[0], reverse=True)
+        t = self.template
+        buckets = MoveBuckets(
+            strong_stab=tuple(t(move_id) for _, move_id in strong_stab),
+            stab=tuple(t(move_id) for _, move_id in stab),
+            strong=tuple(map(t, strong)),
+            medium=tuple(map(t, medium)),
+            weak=tuple(map(t, weak)),
+            status=tuple(map(t, status)),
+        )
+        self._buckets[key] = buckets
+        return buckets
+
+    # =================================================================
+    # 기술 생성
+    # =================================================================
+    def generate(self, species: str, types: Tuple[str, ...], num_to_add: int, rng) -> Optional[List[SimplifiedMove]]:
+        """
+        분류에서 기술 num_to_add개 선택 (모자라면 몸통박치기로 채움)
+        Args:
+            species: 포켓몬 종 이름
+            types: 포켓몬 타입 이름 튜플 (대문자)
+            num_to_add: 생성할 기술 수
+            rng: 난수 생성기 (sample 사용)
+        Returns:
+            복제된 SimplifiedMove 리스트, learnset 데이터가 없으면 None
+        """
+        buckets = self.buckets(species, types)
+        if buckets is None:
+            return None
+
+        selected = []
+        # 자속 기술 우선
+        if buckets.stab:
+            if buckets.strong_stab:
+                selected.extend(buckets.strong_stab[:min(2, len(buckets.strong_stab), num_to_add)])
+            else:
+                selected.extend(rng.sample(buckets.stab, min(1, len(buckets.stab), num_to_add)))
+
+        # 상성 보완 기술 → 변화 기술 순서로 채움
+        remaining = num_to_add - len(selected)
+        for bucket in (buckets.strong, buckets.medium, buckets.weak, buckets.status):
+            if remaining <= 0:
+                break
+            if bucket:
+                count = min(remaining, len(bucket))
+                selected.extend(rng.sample(bucket, count))
+                remaining -= count
+
+        moves = [move.clone() for move in selected]
+        while len(moves) < num_to_add:
+            moves.append(self.template('tackle').clone())
+        return moves
@@ -0,0 +1,201 @@
+"""
+factory 세트 기반 상대 세트 추론 (공개 정보 조건부 샘플링)
+
+SimplifiedBattle은 미공개 상대 포켓몬을 pokedex 전체에서 균등하게 뽑고 (rng.choice + list.remove),
+기술은 위력 / 타입 규칙으로 만들었다. 실제 상대 팀과는 거리가 먼 세트가 많아 탐색이 의미 없는 상대에 롤아웃을 쓴다.
+
+이 모듈은 factory-sets.json(데이터 팩 FACT 구역)을 티어별로 한 번 색인하고,
+종 weight / 세트 weight로 별칭 표(AliasTable)를 만들어 O(1)에 완성된 세트
+(종, 도구, 특성, 노력치, 성격, 기술)를 뽑는다. 공개된 정보에 맞춰 조건부로 뽑는다.
+    - 공개된 종: 그 종의 세트 중 이미 본 기술을 모두 가질 수 있는 세트만 weight 비율로 선택
+      (조건별 별칭 표는 처음 요청 시 만들어 캐시)
+    - 미공개 종: 티어 종 분포에서 이미 공개된 종을 제외하고 선택 (거절 샘플링)
+    - 기술: 본 기술은 그대로 두고, 본 기술이 차지하지 않은 기술 슬롯에서만 후보를 고름
+"""
+import os
+import sys
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from poke_env.data.normalize import to_id_str
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sim.BattleClass.BattleBuilder import BattleBuilder, FACTORY_LEVEL
+from sim.Supporting.AliasTable import AliasTable
+from sim.Supporting.DataPack import DataPack
+
+# 제외 종을 거절 샘플링할 최대 횟수 (넘으면 남은 종으로 별칭 표를 새로 만듦)
+MAX_REJECTIONS = 32
+
+
+class FactorySet:
+    """factory 세트 1개 (이름은 id로 정규화, 기술 슬롯별 후보 튜플)"""
+
+    __slots__ = ('species', 'weight', 'items', 'abilities', 'natures', 'evs', 'ivs', 'move_slots', 'move_pool')
+
+    def __init__(self, factory_set: dict):
+        self.species = to_id_str(factory_set['species'])
+        self.weight = factory_set.get('weight', 1)
+        self.items = tuple(to_id_str(i) for i in factory_set.get('item') or ()) or (None,)
+        self.abilities = tuple(to_id_str(a) for a in factory_set.get('ability') or ()) or (None,)
+        self.natures = tuple(factory_set.get('nature') or ('Serious',))
+        self.evs = dict(factory_set.get('evs', {}))
+        self.ivs = dict(factory_set.get('ivs', {}))
+        self.move_slots = tuple(tuple(to_id_str(m) for m in slot) for slot in factory_set.get('moves', ()))
+        self.move_pool = frozenset(m for slot in self.move_slots for m in slot)
+
+
+class OpponentBelief:
+    """
+    티어별 factory 세트 색인 + 조건부 세트 샘플러 (from_tier로 프로세스당 1개 공유)
+    Args:
+        tier: factory-sets.json의 티어 키 (Uber, OU, UU, RU, NU, PU). 미공개 종의 사전 분포
+        gen: 포켓몬 세대 (기본값: 9)
+        builder: 세트 → SimplifiedPokemon 변환에 쓸 BattleBuilder (None이면 새로 생성)
+    """
+
+    _CACHE: Dict[Tuple[int, str], 'OpponentBelief'] = {}
+
+    def __init__(self, tier: str = 'OU', gen: int = 9, builder: Optional[BattleBuilder] = None):
+        self.tier = tier
+        self.gen = gen
+        self.builder = builder if builder is not None else BattleBuilder(gen)
+
+        factory_sets = DataPack.from_gen(gen).factory_sets
+        if tier not in factory_sets:
+            raise KeyError(f"factory 세트에 없는 티어: {tier} (가능: {list(factory_sets)})")
+
+        # 종 → 세트 목록 (선택한 티어 우선, 다른 티어에만 있는 종은 공개됐을 때 쓰도록 같이 색인)
+        self._sets: Dict[str, Tuple[FactorySet, ...]] = {}
+        for tier_name in [tier] + [t for t in factory_sets if t != tier]:
+            for species, entry in factory_sets[tier_name].items():
+                if species not in self._sets:
+                    self._sets[species] = tuple(FactorySet(s) for s in entry['sets'])
+
+        entries = factory_sets[tier]
+        self.species = tuple(entries)
+        self._species_table = AliasTable([entries[s].get('weight', 1) for s in self.species])
+        self._conditioned: Dict[Tuple[str, FrozenSet[str]], Optional[Tuple[tuple, AliasTable]]] = {}
+
+    @classmethod
+    def from_tier(cls, tier: str = 'OU', gen: int = 9) -> 'OpponentBelief':
+        key = (gen, tier)
+        belief = cls._CACHE.get(key)
+        if belief is None:
+            belief = cls._CACHE[key] = cls(tier, gen)
+        return belief
+
+    # =================================================================
+    # 조건부 분포
+    # =================================================================
+    def knows(self, species: str) -> bool:
+        """종의 factory 세트가 있는지"""
+        return to_id_str(species) in self._sets
+
+    def _set_table(self, species: str, seen_moves: FrozenSet[str]) -> Optional[Tuple[tuple, AliasTable]]:
+        """(종, 본 기술) 조건을 만족하는 세트와 별칭 표 (처음 요청 시 만들어 캐시)"""
+        key = (species, seen_moves)
+        if key in self._conditioned:
+            return self._conditioned[key]
+
+        sets = self._sets.get(species)
+        table = None
+        if sets:
+            consistent = tuple(s for s in sets if seen_moves <= s.move_pool)
+            # 본 기술과 맞는 세트가 없으면 (세트 밖 기술) 종의 전체 세트에서 선택
+            if not consistent:
+                consistent = sets
+            table = (consistent, AliasTable([s.weight for s in consistent]))
+        self._conditioned[key] = table
+        return table
+
+    def sample_species(self, rng, exclude: Iterable[str] = ()) -> Optional[str]:
+        """
+        티어 종 분포에서 종 1개 선택 (weight 비율)
+        Args:
+            rng: 난수 생성기 (random 사용)
+            exclude: 제외할 종 id (이미 공개된 종 등)
+        Returns:
+            종 id, 제외하고 남은 종이 없으면 None
+        """
+        exclude = exclude if isinstance(exclude, (set, frozenset)) else set(exclude)
+        for _ in range(MAX_REJECTIONS):
+            species = self.species[self._species_table.sample(rng)]
+            if species not in exclude:
+                return species
+
+        remaining = [i for i, s in enumerate(self.species) if s not in exclude]
+        if not remaining:
+            return None
+        probabilities = self._species_table.probabilities()
+        table = AliasTable([probabilities[i] for i in remaining])
+        return self.species[remaining[table.sample(rng)]]
+
+    def sample_set(self, species: str, rng, seen_moves: Iterable[str] = ()) -> Optional[dict]:
+        """
+        공개 정보에 맞는 세트 1개를 팀 명세(BattleBuilder 형식)로 선택
+        Args:
+            species: 종 이름
+            rng: 난수 생성기 (random / choice 사용)
+            seen_moves: 이미 본 기술 id (결과 기술에 항상 포함)
+        Returns:
+            {'species', 'level', 'evs', 'ivs', 'nature', 'item', 'ability', 'moves'}, 종의 세트가 없으면 None
+        """
+        seen = [to_id_str(m) for m in seen_moves]
+        table = self._set_table(to_id_str(species), frozenset(seen))
+        if table is None:
+            return None
+        sets, alias = table
+        factory_set = sets[alias.sample(rng)]
+
+        # 본 기술이 들어갈 슬롯을 먼저 차지하고 남은 슬롯에서만 후보 선택
+        moves = list(dict.fromkeys(seen))
+        free_slots = list(factory_set.move_slots)
+        for move_id in moves:
+            for i, slot in enumerate(free_slots):
+                if move_id in slot:
+                    del free_slots[i]
+                    break
+        for slot in free_slots:
+            if len(moves) >= len(factory_set.move_slots):
+                break
+            candidates = [m for m in slot if m not in moves]
+            if candidates:
+                moves.append(candidates[0] if len(candidates) == 1 else rng.choice(candidates))
+
+        return {
+            'species': factory_set.species,
+            'level': FACTORY_LEVEL,
+            'evs': factory_set.evs,
+            'ivs': factory_set.ivs,
+            'nature': rng.choice(factory_set.natures),
+            'item': rng.choice(factory_set.items),
+            'ability': rng.choice(factory_set.abilities),
+            'moves': moves,
+        }
+
+    def sample_team(self, rng, revealed: Optional[Dict[str, Iterable[str]]] = None, team_num: int = 6) -> List[dict]:
+        """
+        공개된 포켓몬(종 → 본 기술)을 포함한 팀 명세 리스트 선택
+        Args:
+            rng: 난수 생성기
+            revealed: 공개된 종 → 본 기술 id (None이면 전부 미공개)
+            team_num: 팀의 포켓몬 수
+        Returns:
+            공개된 종의 명세(세트가 없는 종은 제외) + 미공개 자리를 채운 명세
+        """
+        revealed = revealed or {}
+        team = []
+        for species, seen_moves in revealed.items():
+            spec = self.sample_set(species, rng, seen_moves)
+            if spec is not None:
+                team.append(spec)
+
+        exclude = {to_id_str(s) for s in revealed}
+        for _ in range(team_num - len(revealed)):
+            species = self.sample_species(rng, exclude)
+            if species is None:
+                break
+            exclude.add(species)
+            team.append(self.sample_set(species, rng))
+        return team
@@ -1,19 +1,35 @@
 from poke_env.battle import Battle
-from typing import Dict
+from typing import Dict, Optional
 import sys
 import os
-sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from SimplifiedPokemon import SimplifiedPokemon
-from SimplifiedMove import SimplifiedMove
+from sim.BattleClass.SimplifiedPokemon import SimplifiedPokemon
+from sim.BattleClass.SimplifiedMove import SimplifiedMove
+from sim.BattleClass.LearnsetIndex import LearnsetIndex
+from sim.BattleClass.UndoLog import U_BATTLE, undo_to_mark
+from sim.Supporting.DataPack import DataPack
+from sim.Supporting.Zobrist import SIDE_PLAYER, SIDE_OPPONENT, active_key, weather_key, field_key, turn_key
 import random
 
 # 기본 기술 개수
 DEFAULT_MOVES = 4
 DEFAULT_LEVEL = 80
+# poke-env가 아직 공개되지 않은 상대 도구에 쓰는 값
+UNKNOWN_ITEM = 'unknown_item'
 
 class SimplifiedBattle:
-    def __init__(self, poke_env_battle: Battle, fill_unknown_data: bool = True, gen : int = 9, team_num: int = 6):
+    # 되돌리기 기록 (begin_undo_turn() 첫 호출 시 생성, clone에는 복사하지 않음)
+    _undo_log = None
+
+    # 상대 팀 정보 채우기에 쓰는 난수 (__new__로 만든 객체는 전역 random 모듈)
+    _rng = random
+
+    # 상대 세트 추론기 (None이면 pokedex / learnset 규칙으로 채움)
+    _opponent_belief = None
+
+    def __init__(self, poke_env_battle: Battle, fill_unknown_data: bool = True, gen : int = 9, team_num: int = 6,
+                 rng=None, opponent_belief=None):
         """
         배틀 정보 경량화 클래스
         Args:
@@ -21,7 +37,14 @@ class SimplifiedBattle:
             fill_unknown_data: 상대 팀의 부족한 정보를 랜덤으로 채울지 여부
             gen : 포켓몬 세대 (기본값: 9)
             team_num : 팀의 포켓몬 수 (기본값: 6)
+            rng : 난수 생성기 (BattleRandom 등, None이면 전역 random 모듈)
+            opponent_belief : 상대 세트 추론기 (OpponentBelief). 주어지면 공개된 종 / 기술에 맞는 factory 세트로
+                              상대 팀을 채우고, 세트가 없는 종만 기존 규칙 사용
         """
+        if rng is not None:
+            self._rng = rng
+        if opponent_belief is not None:
+            self._opponent_belief = opponent_belief
     
         # 기본 정보
         self.turn = poke_env_battle.turn
@@ -69,6 +92,8 @@ class SimplifiedBattle:
                     break
         
         # 상대 포켓몬 기술 정보가 없으면 채우기
+        if fill_unknown_data and self.opponent_active_pokemon and self._opponent_belief is not None:
+            self._complete_from_belief(self.opponent_active_pokemon)
         if self.opponent_active_pokemon and (not self.opponent_active_pokemon.moves or len(self.opponent_active_pokemon.moves) == 0):
             generated_moves = self._generate_random_moves(self.opponent_active_pokemon, DEFAULT_MOVES)
             if generated_moves and len(generated_moves) > 0:
@@ -91,55 +116,15 @@ class SimplifiedBattle:
     
     def _fill_opponent_team_data(self, team_num: int = 6):
         """상대 팀의 부족한 정보를 pokedex 데이터 기반으로 채우기"""
-        from poke_env.data import GenData
-        
-        data = GenData.from_gen(self.gen)
+        data = DataPack.from_gen(self.gen)
         
         # 0. 공개된 포켓몬들의 스탯 재계산 (HP 및 능력치) - DEFAULT_LEVEL 기준
         for pokemon_id, pokemon in self.opponent_team.items():
-            pokedex_data = data.pokedex.get(pokemon.species.lower(), {})
-            if pokedex_data:
-                base_stats = pokedex_data.get('baseStats', {})
-                
-                # HP 재계산
-                base_hp = base_stats.get('hp', 100)
-                # Random Battle 표준: IV 31, EV 84 (Gen 9 기준)
-                recalculated_max_hp = int(((base_hp * 2 + 31 + (84 // 4)) * DEFAULT_LEVEL / 100) + DEFAULT_LEVEL + 10)
-                
-                # 현재 체력 비율 유지 로직
-                if pokemon.max_hp > 0:
-                    hp_ratio = pokemon.current_hp / pokemon.max_hp
-                else:
-                    hp_ratio = 1.0
-                
-                pokemon.max_hp = recalculated_max_hp
-                pokemon.current_hp = int(recalculated_max_hp * hp_ratio) # 비율에 맞춰 재설정
-                pokemon.level = DEFAULT_LEVEL
-
-                # 나머지 스탯(Atk, Def...) 재계산 (누락된 부분 추가)
-                # Random Battle은 보통 성격 보정을 알 수 없으므로 Neutral(1.0) 가정, EV 84
-                new_stats = {}
-                for stat_name in ['atk', 'def', 'spa', 'spd', 'spe']:
-                    base_val = base_stats.get(stat_name, 100)
-                    val = int(((base_val * 2 + 31 + (84 // 4)) * DEFAULT_LEVEL / 100) + 5)
-                    new_stats[stat_name] = val
-                
-                pokemon.stats = new_stats # 스탯 덮어쓰기
+            self._recalculate_opponent_stats(pokemon, data)
         
-        # 1. 기존 공개된 포켓몬의 기술이 없으면 랜덤 기술 생성
+        # 1. 기존 공개된 포켓몬의 기술이 없으면 랜덤 기술 생성 (추론기가 있으면 본 기술에 맞는 세트로 완성)
         for pokemon_id, pokemon in self.opponent_team.items():
-            if not pokemon.moves or len(pokemon.moves) == 0:
-                # 부족한 기술 개수만큼 채우기
-                generated_moves = self._generate_random_moves(pokemon, DEFAULT_MOVES - len(pokemon.moves))
-                
-                # 기술 생성 실패 체크
-                if generated_moves and len(generated_moves) > 0:
-                    pokemon.moves = generated_moves
-                else:
-                    # 기술 생성 실패 시 fallback
-                    print(f"[WARNING] {pokemon_id}의 기술 생성 실패, fallback 사용")
-                    default_move = self._create_default_move(pokemon)
-                    pokemon.moves = [default_move] if default_move else []
+            self._fill_revealed_moves(pokemon_id, pokemon)
         
         # 2. 상대 팀이 6마리 미만이면 미공개 포켓몬을 랜덤으로 추가
         if len(self.opponent_team) < team_num:
@@ -148,6 +133,11 @@ class SimplifiedBattle:
             
             # 추가할 포켓몬 개수
             num_to_add = team_num - len(self.opponent_team)
+
+            # 추론기가 있으면 티어 종 분포 / 세트 분포에서 선택
+            if self._opponent_belief is not None:
+                self._add_belief_pokemon(existing_species, num_to_add)
+                return
             
             # pokedex에서 랜덤으로 포켓몬 선택 (기존 포켓몬 제외)
             available_species = [s for s in data.pokedex.keys() if s not in existing_species]
@@ -161,7 +151,7 @@ class SimplifiedBattle:
                     break
                 
                 # 랜덤 포켓몬 선택
-                species = random.choice(available_species)
+                species = self._rng.choice(available_species)
                 available_species.remove(species)
                 
                 # 더미 포켓몬 생성
@@ -174,33 +164,100 @@ class SimplifiedBattle:
                 dummy_id = f"p2: {species}_{i}"
                 self.opponent_team[dummy_id] = dummy_pokemon
     
+    def _recalculate_opponent_stats(self, pokemon: SimplifiedPokemon, data=None):
+        """공개된 상대 포켓몬의 스탯 재계산 (HP 및 능력치) - DEFAULT_LEVEL 기준, 현재 HP 비율 유지"""
+        data = data if data is not None else DataPack.from_gen(self.gen)
+        pokedex_data = data.pokedex.get(pokemon.species.lower(), {})
+        if pokedex_data:
+            base_stats = pokedex_data.get('baseStats', {})
+                
+            # HP 재계산
+            base_hp = base_stats.get('hp', 100)
+            # Random Battle 표준: IV 31, EV 84 (Gen 9 기준)
+            recalculated_max_hp = int(((base_hp * 2 + 31 + (84 // 4)) * DEFAULT_LEVEL / 100) + DEFAULT_LEVEL + 10)
+                
+            # 현재 체력 비율 유지 로직
+            if pokemon.max_hp > 0:
+                hp_ratio = pokemon.current_hp / pokemon.max_hp
+            else:
+                hp_ratio = 1.0
+                
+            pokemon.max_hp = recalculated_max_hp
+            pokemon.current_hp = int(recalculated_max_hp * hp_ratio) # 비율에 맞춰 재설정
+            pokemon.level = DEFAULT_LEVEL
+
+            # 나머지 스탯(Atk, Def...) 재계산 (누락된 부분 추가)
+            # Random Battle은 보통 성격 보정을 알 수 없으므로 Neutral(1.0) 가정, EV 84
+            new_stats = {}
+            for stat_name in ['atk', 'def', 'spa', 'spd', 'spe']:
+                base_val = base_stats.get(stat_name, 100)
+                val = int(((base_val * 2 + 31 + (84 // 4)) * DEFAULT_LEVEL / 100) + 5)
+                new_stats[stat_name] = val
+                
+            pokemon.stats = new_stats # 스탯 덮어쓰기
+
+    def _fill_revealed_moves(self, pokemon_id: str, pokemon: SimplifiedPokemon):
+        """공개된 상대 포켓몬의 기술이 없으면 랜덤 기술 생성 (추론기가 있으면 본 기술에 맞는 세트로 완성)"""
+        if self._opponent_belief is not None and self._complete_from_belief(pokemon):
+            return
+        if not pokemon.moves or len(pokemon.moves) == 0:
+            # 부족한 기술 개수만큼 채우기
+            generated_moves = self._generate_random_moves(pokemon, DEFAULT_MOVES - len(pokemon.moves))
+                
+            # 기술 생성 실패 체크
+            if generated_moves and len(generated_moves) > 0:
+                pokemon.moves = generated_moves
+            else:
+                # 기술 생성 실패 시 fallback
+                print(f"[WARNING] {pokemon_id}의 기술 생성 실패, fallback 사용")
+                default_move = self._create_default_move(pokemon)
+                pokemon.moves = [default_move] if default_move else []
+
+    def _complete_from_belief(self, pokemon: SimplifiedPokemon) -> bool:
+        """
+        공개된 상대 포켓몬의 빈 기술 / 도구 / 특성을 본 기술에 맞는 factory 세트로 채우기
+        Returns:
+            세트를 찾아 채웠으면 True (종의 세트가 없으면 False → 기존 규칙 사용)
+        """
+        spec = self._opponent_belief.sample_set(pokemon.species, self._rng, [m.id for m in pokemon.moves])
+        if spec is None:
+            return False
+
+        index = LearnsetIndex.from_gen(self.gen)
+        known = {m.id for m in pokemon.moves}
+        for move_id in spec['moves']:
+            if len(pokemon.moves) >= DEFAULT_MOVES:
+                break
+            if move_id not in known:
+                pokemon.moves.append(index.template(move_id).clone())
+        if pokemon.item == UNKNOWN_ITEM and spec['item']:
+            pokemon.item = spec['item']
+        if not pokemon.ability and spec['ability']:
+            pokemon.ability = spec['ability']
+        return True
+
+    def _add_belief_pokemon(self, existing_species: set, num_to_add: int):
+        """미공개 상대 포켓몬을 추론기의 종 / 세트 분포에서 뽑아 추가 (레벨은 공개된 포켓몬과 같은 DEFAULT_LEVEL)"""
+        belief = self._opponent_belief
+        exclude = set(existing_species)
+        for i in range(num_to_add):
+            species = belief.sample_species(self._rng, exclude)
+            if species is None:
+                break
+            exclude.add(species)
+
+            spec = belief.sample_set(species, self._rng)
+            spec['level'] = DEFAULT_LEVEL
+            self.opponent_team[f"p2: {species}_{i}"] = belief.builder.pokemon(spec)
+
     def _create_dummy_pokemon_list(self, exisiting_species, num_to_add, gen = 9):
         """랜덤 포켓몬 생성 리스트"""
-        from poke_env.data import GenData
-        data = GenData.from_gen(self.gen)
+        data = DataPack.from_gen(self.gen)
 
         # TODO 베이즈추론 등 적용
-        # 유효한 포켓몬 목록 필터링
-        valid_species = []
-        for name, entry in data.pokedex.items():
-            # 1. 이미 있는 포켓몬 제외
-            if name in exisiting_species:
-                continue
-                
-            # 2. 비표준 포켓몬 제외 (Pokestar, CAP 등)
-            # isNonstandard 속성이 있으면 거름
-            if entry.get('isNonstandard'):
-                continue
-                
-            # 3. 도감 번호가 0 이하인 더미 제외
-            if entry.get('num', 0) <= 0:
-                continue
-                
-            # 4. 진화체가 있는 미진화 포켓몬 제외
-            if 'evos' in entry:
-                continue
-            
-            valid_species.append(name)
+        # 유효한 포켓몬 목록 필터링 (비표준 / 도감 번호 0 이하 더미 / 미진화 포켓몬은 팩 빌드 시 제외됨)
+        # 이미 있는 포켓몬 제외
+        valid_species = [name for name in data.standard_species() if name not in exisiting_species]
 
         # 개수만큼 생성
         pokemon_list = []
@@ -208,7 +265,7 @@ class SimplifiedBattle:
             if not valid_species:
                 break
                 
-            random_species = random.choice(valid_species)
+            random_species = self._rng.choice(valid_species)
             # 중복 방지를 위해 선택 후 제거 (선택적)
             
             pokemon_list.append(self._create_dummy_pokemon(random_species))
@@ -217,15 +274,14 @@ class SimplifiedBattle:
     
     def _create_dummy_pokemon(self, species: str = None):
         """pokedex 데이터를 기반으로 더미 포켓몬 생성"""
-        from poke_env.data import GenData
         from poke_env.battle.pokemon_type import PokemonType
         
         # 데이터 로드
-        data = GenData.from_gen(self.gen)
+        data = DataPack.from_gen(self.gen)
         
         # species 랜덤 선택 (없으면)
         if species is None:
-            species = random.choice(list(data.pokedex.keys()))
+            species = self._rng.choice(list(data.pokedex.keys()))
         
         pokedex_data = data.pokedex.get(species.lower(), {})
         
@@ -263,18 +319,19 @@ class SimplifiedBattle:
             except KeyError:
                 types_converted.append(PokemonType.NORMAL)
         dummy_pokemon.types = types_converted if types_converted else [PokemonType.NORMAL]
+        dummy_pokemon.refresh_type_codes()
         
         # 스탯 계산
         base_stats = pokedex_data.get('baseStats', {'hp': 100, 'atk': 100, 'def': 100, 'spa': 100, 'spd': 100, 'spe': 100})
         
         # IV와 EV 랜덤 생성
-        iv = random.randint(0, 31)  # 0~31 균등 분포
+        iv = self._rng.randint(0, 31)  # 0~31 균등 분포
         
         # EV를 랜덤 생성
-        if random.random() < 0.75:
-            ev = random.randint(150, 252)
+        if self._rng.random() < 0.75:
+            ev = self._rng.randint(150, 252)
         else:
-            ev = random.randint(0, 100)
+            ev = self._rng.randint(0, 100)
         
         # HP 계산
         base_hp = base_stats.get('hp', 100)
@@ -294,11 +351,11 @@ class SimplifiedBattle:
                 dummy_pokemon.stats[stat_name] = dummy_pokemon.max_hp
             else:
                 # 다른 스탯들
-                stat_iv = random.randint(0, 31)
-                if random.random() < 0.75:
-                    stat_ev = random.randint(150, 252)
+                stat_iv = self._rng.randint(0, 31)
+                if self._rng.random() < 0.75:
+                    stat_ev = self._rng.randint(150, 252)
                 else:
-                    stat_ev = random.randint(0, 100)
+                    stat_ev = self._rng.randint(0, 100)
                 
                 dummy_pokemon.stats[stat_name] = int(((base * 2 + stat_iv + stat_ev // 4) * DEFAULT_LEVEL / 100) + 5)
         
@@ -333,148 +390,15 @@ class SimplifiedBattle:
         return self._generate_random_moves_fallback(pokemon, num_to_add)
 
     def _generate_random_moves_fallback(self, pokemon : SimplifiedPokemon, num_to_add=4):
-        """포켓몬에 맞는 랜덤 기술 생성 """
-        from poke_env.data import GenData
-        import re
-        import random 
-        
-        data = GenData.from_gen(self.gen)
-        
-        # 검색할 이름 후보군 리스트 생성
-        search_candidates = [pokemon.species.lower().replace(' ', '').replace('-', '').replace('.', '').replace("'", "")]
-        
-        pokedex_entry = data.pokedex.get(search_candidates[0], {})
-        if 'baseSpecies' in pokedex_entry:
-            base_species = pokedex_entry['baseSpecies'].lower()
-            base_species_key = re.sub(r'[^a-z0-9]', '', base_species)
-            if base_species_key not in search_candidates:
-                search_candidates.append(base_species_key)
-                
-        if '-' in pokemon.species:
-            base_name = pokemon.species.split('-')[0].lower()
-            base_name_key = re.sub(r'[^a-z0-9]', '', base_name)
-            if base_name_key not in search_candidates:
-                search_candidates.append(base_name_key)
-
-        # 기술 목록 찾기
-        learnable_moves = []
-        
-        for name in search_candidates:
-            # 포켓몬 데이터 가져오기
-            pokemon_learn_data = data.learnset.get(name)
-            
-            if not pokemon_learn_data:
-                continue
+        """포켓몬에 맞는 랜덤 기술 생성 (종별 기술 분류 색인에서 선택)"""
+        index = LearnsetIndex.from_gen(self.gen)
+        pokemon_types = tuple(t.name.upper() for t in pokemon.types)
+        moves = index.generate(pokemon.species, pokemon_types, num_to_add, self._rng)
 
-            # 일반적인 learnset이 있는 경우
-            if 'learnset' in pokemon_learn_data:
-                learnable_moves = list(pokemon_learn_data['learnset'].keys())
-                break
-            
-            # eventData만 있는 경우
-            elif 'eventData' in pokemon_learn_data:
-                # eventData는 리스트 형태이며, 여러 기술 세트가 있을 수 있음
-                # 예: [{"moves": ["tackle", ...]}, {"moves": ["scratch", ...]}]
-                event_moves = set()
-                for event in pokemon_learn_data['eventData']:
-                    if 'moves' in event:
-                        event_moves.update(event['moves'])
-                
-                if event_moves:
-                    learnable_moves = list(event_moves)
-                    break
-        
         # 데이터가 없는 경우
-        if not learnable_moves:
-            print(f"[WARNING] {pokemon.species}의 learnset/eventData 데이터 없음 (후보: {search_candidates})")
-            tackle_data = data.moves.get('tackle', {'basePower': 40, 'type': 'Normal', 'category': 'Physical'})
-            return [self._create_move_from_pokedex('tackle', tackle_data)]
-        
-        # 포켓몬 타입과 일치하는 기술들 필터링
-        type_moves = [] 
-        strong_coverage = [] 
-        medium_coverage = [] 
-        weak_coverage = []   
-        status_moves = [] 
-        
-        for move_id in learnable_moves:
-            move_data = data.moves.get(move_id, {})
-            move_type = move_data.get('type', 'Normal').upper()
-            base_power = move_data.get('basePower', 0)
-            
-            # 내 포켓몬 타입
-            pokemon_types = [t.name.upper() for t in pokemon.types]
-            
-            if base_power > 0:
-                # 위력이 있는 기술
-                if move_type in pokemon_types:
-                    # 1. 포켓몬 타입과 일치하는 기술 (STAB)
-                    type_moves.append((move_id, move_data))
-                elif base_power >= 80:
-                    # 2-1. 위력 80 이상
-                    strong_coverage.append((move_id, move_data))
-                elif base_power >= 60:
-                    # 2-2. 위력 60-79
-                    medium_coverage.append((move_id, move_data))
-                elif base_power >= 50:
-                    # 2-3. 위력 50-59
-                    weak_coverage.append((move_id, move_data))
-            else:
-                # 위력 0 기술
-                status_moves.append((move_id, move_data))
-        
-        selected_moves = []
-
-        #STAB 기술 우선
-        if type_moves:
-            strong_stab = sorted([m for m in type_moves if m[1].get('basePower', 0) >= 70], 
-                                key=lambda x: x[1].get('basePower', 0), reverse=True)
-            if strong_stab:
-                stab_count = min(2, len(strong_stab), num_to_add)
-                selected_moves.extend(strong_stab[:stab_count])
-            else:
-                stab_count = min(1, len(type_moves), num_to_add)
-                selected_moves.extend(random.sample(type_moves, stab_count))
-        
-        # 강한 상성 극복 기술
-        if len(selected_moves) < num_to_add:
-            remaining = num_to_add - len(selected_moves)
-            
-            if strong_coverage:
-                strong_count = min(remaining, len(strong_coverage))
-                selected_moves.extend(random.sample(strong_coverage, strong_count))
-                remaining -= strong_count
-            
-            if remaining > 0 and medium_coverage:
-                medium_count = min(remaining, len(medium_coverage))
-                selected_moves.extend(random.sample(medium_coverage, medium_count))
-                remaining -= medium_count
-                
-            if remaining > 0 and weak_coverage:
-                weak_count = min(remaining, len(weak_coverage))
-                selected_moves.extend(random.sample(weak_coverage, weak_count))
-                remaining -= weak_count
-            
-            if remaining > 0 and status_moves:
-                status_count = min(remaining, len(status_moves))
-                selected_moves.extend(random.sample(status_moves, status_count))
-        
-        # SimplifiedMove로 변환
-        moves = []
-        for move_id, move_data in selected_moves[:num_to_add]:
-            move = self._create_move_from_pokedex(move_id, move_data)
-            if move:
-                moves.append(move)
-        
-        # 기본 기술 - 몸통박치기
-        while len(moves) < num_to_add:
-            tackle_data = data.moves.get('tackle', {'basePower': 40, 'type': 'Normal', 'category': 'Physical'})
-            tackle_move = self._create_move_from_pokedex('tackle', tackle_data)
-            if tackle_move:
-                moves.append(tackle_move)
-            else:
-                break
-        
+        if moves is None:
+            print(f"[WARNING] {pokemon.species}의 learnset/eventData 데이터 없음 (후보: {index.candidates(pokemon.species)})")
+            return [index.template('tackle').clone()]
         return moves
     
     def _create_move_from_pokedex(self, move_id: str, move_data: dict):
@@ -527,87 +451,7 @@ class SimplifiedBattle:
         
     def _create_move_from_pokedex(self, move_id: str, move_data: dict):
         """pokedex 데이터에서 기술 객체 생성"""
-        from poke_env.battle.pokemon_type import PokemonType
-        from poke_env.battle.move_category import MoveCategory
-        from poke_env.battle.status import Status  # 상태이상 Enum 필요
-        
-        # 기술 데이터 추출
-        base_power = move_data.get('basePower', 0)
-        accuracy = move_data.get('accuracy', 100)
-        category = move_data.get('category', 'Physical')
-        move_type = move_data.get('type', 'Normal')
-        priority = move_data.get('priority', 0)
-        
-        # 추가 데이터 추출
-        recoil_data = move_data.get('recoil', None)      # 반동
-        drain_data = move_data.get('drain', None)        # 흡수
-        boosts_data = move_data.get('boosts', None)      # 상대 랭크 다운
-        self_boost_data = move_data.get('selfBoost', None) # 자신 랭크 업
-        status_str = move_data.get('status', None)       # 상태이상
-        crit_ratio = move_data.get('critRatio', 0)       # 급소율
-        flags_data = move_data.get('flags', {})          # 기술 플래그
-        secondary_data = move_data.get('secondary', None) # 부가 효과
-
-        # 타입 변환
-        try:
-            move_type_enum = PokemonType[move_type.upper()]
-        except (KeyError, AttributeError):
-            move_type_enum = PokemonType.NORMAL
-        
-        # 카테고리 변환
-        try:
-            category_enum = MoveCategory[category.upper()]
-        except (KeyError, AttributeError):
-            category_enum = MoveCategory.PHYSICAL
-
-        # 상태이상 변환
-        status_enum = None
-        if status_str:
-            try:
-                status_enum = Status[status_str.upper()]
-            except (KeyError, AttributeError):
-                status_enum = None
-
-        # 더미 무브 클래스 정의
-        class DummyMove:
-            def __init__(self):
-                self.id = move_id
-                self.base_power = base_power if base_power else 0
-                self.type = move_type_enum
-                self.category = category_enum
-                
-                # Accuracy 정규화 (0~1.0)
-                if accuracy is None or accuracy is True:
-                    self.accuracy = 1.0
-                elif isinstance(accuracy, int) or isinstance(accuracy, float):
-                    if accuracy > 1: 
-                        self.accuracy = accuracy / 100.0 
-                    else: 
-                        self.accuracy = accuracy
-                else:
-                    self.accuracy = 1.0
-
-                self.priority = priority
-                self.current_pp = 16
-                self.max_pp = 16
-                
-                # 데이터 할당
-                self.recoil = recoil_data
-                self.drain = drain_data
-                self.boosts = boosts_data
-                self.self_boost = self_boost_data
-                self.status = status_enum
-                self.secondary = secondary_data
-                self.crit_ratio = crit_ratio
-                self.expected_hits = 1
-                
-                # Flags 처리
-                self.flags = set(flags_data.keys())
-                
-                self.breaks_protect = False
-                self.is_protect_move = False
-    
-        return SimplifiedMove(DummyMove())
+        return SimplifiedMove.from_data(move_id, move_data)
 
     def print_summary(self):
         print(f"=== SimplifiedBattle Summary ===")
@@ -655,6 +499,71 @@ class SimplifiedBattle:
         team = self.team if is_player else self.opponent_team
         return sum(1 for p in team.values() if p.current_hp <= 0)
     
+    def zobrist_hash(self) -> int:
+        """
+        배틀 상태의 64비트 Zobrist 해시
+        활성 슬롯, 포켓몬별 HP / 상태이상 / 랭크 / PP, 날씨, 필드, 턴 홀짝을 반영한다.
+        포켓몬 단위 해시는 damage / heal / boost 등에서 증분 갱신되므로 여기서는 XOR만 한다.
+        슬롯 번호는 플레이어 팀 + 상대 팀 순서 (ArrayBattle.zobrist_hash()와 같은 값)
+        """
+        h = turn_key(self.turn) ^ weather_key(self.weather) ^ field_key(self.fields)
+        slot = 0
+        active_slot = opponent_active_slot = None
+        active, opponent_active = self.active_pokemon, self.opponent_active_pokemon
+        for team, is_player in ((self.team, True), (self.opponent_team, False)):
+            for p in team.values():
+                if p.zobrist_slot != slot:
+                    p.zobrist_slot = slot
+                    p._zobrist = None
+                h ^= p.zobrist_hash()
+                if is_player:
+                    if active_slot is None and active is not None and (p is active or p.species == active.species):
+                        active_slot = slot
+                elif opponent_active_slot is None and opponent_active is not None and (p is opponent_active or p.species == opponent_active.species):
+                    opponent_active_slot = slot
+                slot += 1
+        return h ^ active_key(SIDE_PLAYER, active_slot) ^ active_key(SIDE_OPPONENT, opponent_active_slot)
+
+    def reset_zobrist(self):
+        """모든 포켓몬의 Zobrist 해시 무효화 (상태를 직접 덮어쓴 경우 호출)"""
+        for team in (self.team, self.opponent_team):
+            for p in team.values():
+                p.reset_zobrist()
+
+    def begin_undo_turn(self):
+        """
+        되돌리기 기록 시작 - 이후 포켓몬 변경 내용을 undo_turn()으로 되돌릴 수 있음
+        중첩 호출 가능 (깊이 우선 탐색에서 턴마다 한 번씩 호출하고 역순으로 undo_turn())
+        """
+        log = self._undo_log
+        if log is None:
+            log = self._undo_log = []
+        # 호출마다 연결 (앞선 표시 이후 팀에 들어온 포켓몬도 기록되게)
+        self._attach_undo(log)
+        header = (self.turn, self.active_pokemon, self.opponent_active_pokemon,
+                  self.finished, self.won, self.lost, self.weather, self.fields)
+        log.append((U_BATTLE, self, None, header, None))
+
+    def undo_turn(self):
+        """마지막 begin_undo_turn() 이후의 변경을 모두 되돌림 (남은 표시가 없으면 기록 분리)"""
+        log = self._undo_log or []
+        undo_to_mark(log, self)
+        if not log:
+            self._attach_undo(None)
+
+    def _attach_undo(self, log: Optional[list]):
+        """
+        팀 / 활성 포켓몬에 되돌리기 기록 연결 (None이면 분리)
+        마지막 표시까지 되돌린 뒤에도 연결돼 있으면 기록 없는 시뮬레이션이 되돌릴 일 없는 항목을 계속 쌓는다
+        """
+        for team in (self.team, self.opponent_team):
+            for p in team.values():
+                p._undo = log
+        # 팀 딕셔너리에 없는 활성 포켓몬 객체 (엔진의 _sync_references 전)
+        for p in (self.active_pokemon, self.opponent_active_pokemon):
+            if p is not None:
+                p._undo = log
+
     def clone(self):
         """
         성능 최적화를 위한 Battle 객체 복제 메서드
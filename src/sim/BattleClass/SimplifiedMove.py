@@ -7,6 +7,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from sim.Supporting.PokemonType import PokemonType
 from sim.Supporting.PokemonMoveCategory import MoveCategory
+from sim.Supporting.TypeChart import type_code
 
 class SimplifiedMove:
     """
@@ -19,6 +20,7 @@ class SimplifiedMove:
         self.id = poke_env_move.id
         self.base_power = poke_env_move.base_power
         self.type = poke_env_move.type
+        self.type_code = type_code(self.type)  # 상성표 인덱스
         self.category = poke_env_move.category
         
         # 정확도 정규화
@@ -79,4 +81,67 @@ class SimplifiedMove:
         if hasattr(self, 'flags') and isinstance(self.flags, dict):
             new_move.flags = self.flags.copy()
         
-        return new_move
\ No newline at end of file
+        return new_move
+    @classmethod
+    def from_data(cls, move_id: str, move_data: dict) -> 'SimplifiedMove':
+        """
+        pokedex 기술 데이터(GenData / DataPack moves 항목)로 생성 (poke-env Move 없이)
+        Args:
+            move_id: 기술 id
+            move_data: 기술 데이터 딕셔너리 (basePower, accuracy, category, type, priority 등)
+        """
+        from types import SimpleNamespace
+        from poke_env.battle.pokemon_type import PokemonType as EnvPokemonType
+        from poke_env.battle.move_category import MoveCategory as EnvMoveCategory
+        from poke_env.battle.status import Status
+
+        # 타입 / 카테고리 / 상태이상 변환
+        try:
+            move_type = EnvPokemonType[move_data.get('type', 'Normal').upper()]
+        except (KeyError, AttributeError):
+            move_type = EnvPokemonType.NORMAL
+
+        try:
+            category = EnvMoveCategory[move_data.get('category', 'Physical').upper()]
+        except (KeyError, AttributeError):
+            category = EnvMoveCategory.PHYSICAL
+
+        status = None
+        status_str = move_data.get('status', None)
+        if status_str:
+            try:
+                status = Status[status_str.upper()]
+            except (KeyError, AttributeError):
+                status = None
+
+        # Accuracy 정규화 (0~1.0)
+        accuracy = move_data.get('accuracy', 100)
+        if accuracy is None or accuracy is True:
+            accuracy = 1.0
+        elif isinstance(accuracy, (int, float)):
+            accuracy = accuracy / 100.0 if accuracy > 1 else accuracy
+        else:
+            accuracy = 1.0
+
+        base_power = move_data.get('basePower', 0)
+        return cls(SimpleNamespace(
+            id=move_id,
+            base_power=base_power if base_power else 0,
+            type=move_type,
+            category=category,
+            accuracy=accuracy,
+            priority=move_data.get('priority', 0),
+            current_pp=16,
+            max_pp=16,
+            recoil=move_data.get('recoil', None),
+            drain=move_data.get('drain', None),
+            boosts=move_data.get('boosts', None),
+            self_boost=move_data.get('selfBoost', None),
+            status=status,
+            secondary=move_data.get('secondary', None),
+            crit_ratio=move_data.get('critRatio', 0),
+            expected_hits=1,
+            flags=set(move_data.get('flags', {}).keys()),
+            breaks_protect=False,
+            is_protect_move=False,
+        ))
@@ -7,8 +7,13 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from sim.Supporting.PokemonStatus import Status
-from SimplifiedMove import SimplifiedMove
-from poke_env.data import GenData
+from sim.Supporting.TypeChart import TypeChart, DUAL_STRIDE, type_code, defense_key
+from sim.BattleClass.SimplifiedMove import SimplifiedMove
+from sim.Supporting.Zobrist import BOOST_INDEX, hp_key, status_key, boost_key, pp_key
+from sim.BattleClass.UndoLog import U_ATTR, U_STATUS, U_BOOST, U_TIMER, U_PP, MISSING
+
+# 실효 스탯 캐시 적중 통계 [적중, 미적중] (탐색 중 적중률 확인용)
+_STAT_CACHE_COUNTS = [0, 0]
 
 class SimplifiedPokemon:
     """
@@ -17,8 +22,21 @@ class SimplifiedPokemon:
             poke_env_pokemon : poke-env의 Pokemon 객체 - 포켓몬 정보
             is_percentage_hp : poke_env_pokemon.current_hp가 백분율인지 여부
         """
-    _GEN_DATA_CACHE = {}
-    
+
+    # 실효 스탯 캐시 (get_effective_stat 결과)
+    # boost / decrement_boost_timers / status 변경 / stats 덮어쓰기 때만 무효화되므로
+    # boosts 딕셔너리를 직접 수정했다면 invalidate_stat_cache()를 호출해야 한다
+    _stat_cache = None
+
+    # Zobrist 해시 (SimplifiedBattle.zobrist_hash()가 처음 호출될 때 슬롯 번호를 배정하고 계산)
+    # 이후 damage / heal / faint / boost / status / spend_pp에서 증분 갱신되며,
+    # 그 외 방법으로 HP / 랭크 / PP를 직접 수정했다면 reset_zobrist()를 호출해야 한다
+    zobrist_slot = None
+    _zobrist = None
+
+    # 되돌리기 기록 (SimplifiedBattle.begin_undo_turn()이 배틀의 기록 리스트를 연결, clone에는 복사하지 않음)
+    _undo = None
+
     def __init__(self, poke_env_pokemon: Pokemon, is_percentage_hp: bool = False):
         # 기본 정보
         self.species = poke_env_pokemon.species
@@ -32,6 +50,7 @@ class SimplifiedPokemon:
         self.type_1 = poke_env_pokemon.type_1
         self.type_2 = poke_env_pokemon.type_2
         self.types = poke_env_pokemon.types.copy()  # List
+        self.refresh_type_codes()
 
         # HP
         if is_percentage_hp:
@@ -82,27 +101,119 @@ class SimplifiedPokemon:
         # 성능 최적화용 캐시
         self._stat_cache = {}
 
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        if self._undo is not None:
+            self._undo.append((U_STATUS, self, None, self._status, self._zobrist))
+        if self._zobrist is not None:
+            self._zobrist ^= status_key(self.zobrist_slot, self._status) ^ status_key(self.zobrist_slot, value)
+        self._status = value
+        # 화상(공격) / 마비(스피드) 보정이 바뀌므로 해당 스탯 캐시 무효화
+        cache = self._stat_cache
+        if cache:
+            cache.pop('atk', None)
+            cache.pop('spe', None)
+
+    @property
+    def stats(self):
+        return self._stats
+
+    @stats.setter
+    def stats(self, value):
+        self._stats = value
+        self.invalidate_stat_cache()
+
+    def invalidate_stat_cache(self):
+        """실효 스탯 캐시 전체 무효화 (boosts / stats 딕셔너리를 직접 수정한 경우 호출)"""
+        self._stat_cache = {}
+
+    @staticmethod
+    def stat_cache_info() -> dict:
+        """실효 스탯 캐시 적중 통계 (reset_stat_cache_info() 이후 누적)"""
+        hits, misses = _STAT_CACHE_COUNTS
+        total = hits + misses
+        return {'hits': hits, 'misses': misses, 'hit_rate': hits / total if total else 0.0}
+
+    @staticmethod
+    def reset_stat_cache_info():
+        """실효 스탯 캐시 적중 통계 초기화"""
+        _STAT_CACHE_COUNTS[0] = 0
+        _STAT_CACHE_COUNTS[1] = 0
+
+
+    def zobrist_hash(self) -> int:
+        """포켓몬 단위 Zobrist 해시 (HP / 상태이상 / 랭크 / PP, 처음 한 번만 전체 계산)"""
+        h = self._zobrist
+        if h is None:
+            slot = self.zobrist_slot
+            h = hp_key(slot, self.current_hp, self.max_hp) ^ status_key(slot, self._status)
+            for stat, value in self.boosts.items():
+                idx = BOOST_INDEX.get(stat)
+                if idx is not None:
+                    h ^= boost_key(slot, idx, value)
+            for i, move in enumerate(self.moves):
+                h ^= pp_key(slot, i, move.current_pp)
+            self._zobrist = h
+        return h
+
+    def reset_zobrist(self):
+        """Zobrist 해시 무효화 (HP / 랭크 / PP를 직접 수정한 경우 호출)"""
+        self._zobrist = None
+
+    def _set_hp(self, hp: int):
+        """HP 변경 (Zobrist 해시 갱신 포함)"""
+        if self._undo is not None:
+            self._undo.append((U_ATTR, self, 'current_hp', self.current_hp, self._zobrist))
+        if self._zobrist is not None:
+            slot = self.zobrist_slot
+            self._zobrist ^= hp_key(slot, self.current_hp, self.max_hp) ^ hp_key(slot, hp, self.max_hp)
+        self.current_hp = hp
 
     def damage(self, amount: int):
         """데미지 받기"""
-        self.current_hp = max(0, self.current_hp - amount)
+        self._set_hp(max(0, self.current_hp - amount))
         if self.current_hp == 0:
             self.faint()
 
     def heal(self, amount: int):
         """회복"""
-        self.current_hp = min(self.max_hp, self.current_hp + amount)
+        self._set_hp(min(self.max_hp, self.current_hp + amount))
 
     def faint(self):
         """기절"""
-        self.current_hp = 0
+        self._set_hp(0)
         self.status = Status.FNT
+        if self._undo is not None:
+            self._undo.append((U_ATTR, self, 'active', self.active, self._zobrist))
         self.active = False
 
     def boost(self, stat: str, amount: int):
         """능력치 변화"""
         current = self.boosts.get(stat, 0)
-        self.boosts[stat] = max(-6, min(6, current + amount))
+        if self._undo is not None:
+            self._undo.append((U_BOOST, self, stat, self.boosts.get(stat, MISSING), self._zobrist))
+        new = self.boosts[stat] = max(-6, min(6, current + amount))
+        if self._stat_cache:
+            self._stat_cache.pop(stat, None)
+        if self._zobrist is not None and stat in BOOST_INDEX:
+            idx = BOOST_INDEX[stat]
+            self._zobrist ^= boost_key(self.zobrist_slot, idx, current) ^ boost_key(self.zobrist_slot, idx, new)
+
+    def spend_pp(self, move):
+        """기술 PP 1 소모 (Zobrist 해시 갱신 포함)"""
+        current = move.current_pp
+        if self._undo is not None:
+            self._undo.append((U_PP, self, move, current, self._zobrist))
+        move.current_pp = max(0, current - 1)
+        if self._zobrist is not None:
+            for i, m in enumerate(self.moves):
+                if m is move:
+                    self._zobrist ^= pp_key(self.zobrist_slot, i, current) ^ pp_key(self.zobrist_slot, i, move.current_pp)
+                    break
 
     def set_boost_with_timer(self, stat: str, amount: int, turns: Optional[int] = None):
         """능력치 변화 (타이머 포함)
@@ -117,6 +228,8 @@ class SimplifiedPokemon:
             self.boost_timers = {}
         
         self.boost(stat, amount)
+        if self._undo is not None:
+            self._undo.append((U_TIMER, self, stat, self.boost_timers.get(stat, MISSING), self._zobrist))
         if turns is None:
             # 영구 유지 (해제하지 않음)
             self.boost_timers[stat] = None
@@ -144,37 +257,54 @@ class SimplifiedPokemon:
                 stats_to_reset.append(stat)
             else:
                 # 남은 턴 업데이트
+                if self._undo is not None:
+                    self._undo.append((U_TIMER, self, stat, self.boost_timers[stat], self._zobrist))
                 self.boost_timers[stat] = turns_left
         
         # 만료된 능력치 리셋
         for stat in stats_to_reset:
             current = self.boosts.get(stat, 0)
+            if self._undo is not None:
+                self._undo.append((U_BOOST, self, stat, self.boosts.get(stat, MISSING), self._zobrist))
+                self._undo.append((U_TIMER, self, stat, self.boost_timers[stat], self._zobrist))
             self.boosts[stat] = 0
             del self.boost_timers[stat]
+            if self._stat_cache:
+                self._stat_cache.pop(stat, None)
+            if self._zobrist is not None and stat in BOOST_INDEX:
+                self._zobrist ^= boost_key(self.zobrist_slot, BOOST_INDEX[stat], current)
 
-    def damage_multiplier(self, move_type: PokemonType, gen : int = 9) -> float:
-        """타입 상성 계산"""
-        
-        # 캐시에서 GenData 가져오기
-        if gen not in self._GEN_DATA_CACHE:
-            self._GEN_DATA_CACHE[gen] = GenData.from_gen(gen)
-        
-        gen_data = self._GEN_DATA_CACHE[gen]
-        
-        # gen_data.type_chart 사용
-        multiplier = 1.0
-        for poke_type in self.types:
-            multiplier *= poke_type.damage_multiplier(
-                move_type,
-                type_chart=gen_data.type_chart 
-            )
-        
-        return multiplier
+    def refresh_type_codes(self):
+        """타입 정수 코드 갱신 (types / type_1 / type_2 변경 후 호출)"""
+        self.type_codes = tuple(type_code(t) for t in self.types)
+        self.type_code_1 = type_code(self.type_1)
+        self.type_code_2 = type_code(self.type_2)
+        self.defense_key = defense_key(self.type_1, self.type_2)
+
+    def damage_multiplier(self, move_type, gen : int = 9) -> float:
+        """타입 상성 계산 (move_type: PokemonType 또는 정수 타입 코드)"""
+        code = move_type if type(move_type) is int else type_code(move_type)
+        return TypeChart.from_gen(gen).dual[code * DUAL_STRIDE + self.defense_key]
 
     def get_effective_stat(self, stat_name: str) -> float:
-        """능력치 변화 반영한 실제 스탯"""
+        """능력치 변화 반영한 실제 스탯 (캐시 사용)"""
+        cache = self._stat_cache
+        if cache is None:
+            cache = self._stat_cache = {}
+
+        value = cache.get(stat_name)
+        if value is not None:
+            _STAT_CACHE_COUNTS[0] += 1
+            return value
 
-        base = self.stats.get(stat_name)
+        _STAT_CACHE_COUNTS[1] += 1
+        value = cache[stat_name] = self._compute_effective_stat(stat_name)
+        return value
+
+    def _compute_effective_stat(self, stat_name: str) -> float:
+        """능력치 변화 반영한 실제 스탯 계산"""
+
+        base = self._stats.get(stat_name)
         
         # stats가 None이면 base_stats에서 가져오고 레벨 보정 적용
         if base is None:
@@ -196,10 +326,11 @@ class SimplifiedPokemon:
         else:
             multiplier = 2 / (2 - boost)
 
-        # 상태이상 보정
-        if stat_name == 'atk' and self.status == Status.BRN:
+        # 상태이상 보정 (poke-env / sim.Supporting Status 모두 쓰이므로 이름으로 비교)
+        status_name = self._status.name if self._status is not None else None
+        if stat_name == 'atk' and status_name == 'BRN':
             multiplier *= 0.5
-        if stat_name == 'spe' and self.status == Status.PAR:
+        if stat_name == 'spe' and status_name == 'PAR':
             multiplier *= 0.5
 
         return base * multiplier
@@ -222,7 +353,7 @@ class SimplifiedPokemon:
         new_poke.max_hp = self.max_hp
         new_poke.current_hp = self.current_hp
         
-        new_poke.status = self.status
+        new_poke._status = self._status
         new_poke.status_counter = self.status_counter
         new_poke.toxic_counter = getattr(self, 'toxic_counter', 0)
         
@@ -236,10 +367,14 @@ class SimplifiedPokemon:
 
         # 컬렉션 얕은 복사
         new_poke.types = list(self.types) 
+        new_poke.type_codes = self.type_codes
+        new_poke.type_code_1 = self.type_code_1
+        new_poke.type_code_2 = self.type_code_2
+        new_poke.defense_key = self.defense_key
         
         # 스탯 및 랭크
         new_poke.base_stats = self.base_stats 
-        new_poke.stats = self.stats.copy()    
+        new_poke._stats = self._stats.copy()
         new_poke.boosts = self.boosts.copy() 
         
         # 상태 관리
@@ -252,12 +387,16 @@ class SimplifiedPokemon:
         else:
             new_poke.boost_timers = {}
 
-        # 캐시 초기화
-        new_poke._stat_cache = {}
+        # 캐시 복사 (스탯 / 랭크 / 상태이상이 같으므로 그대로 유효)
+        new_poke._stat_cache = self._stat_cache.copy() if self._stat_cache else {}
 
         # 객체 재귀 복사
         new_poke.moves = [m.clone() for m in self.moves]
 
+        # Zobrist 해시 (상태가 같으므로 그대로 유효)
+        new_poke.zobrist_slot = self.zobrist_slot
+        new_poke._zobrist = self._zobrist
+
         return new_poke
     
     def print_summary(self):
@@ -0,0 +1,75 @@
+"""
+턴 단위 되돌리기 기록 (make / unmake)
+
+SimplifiedBattle을 복제하지 않고 그 자리에서 턴을 진행한 뒤 정확히 이전 상태로 되돌리기 위한 기록.
+SimplifiedBattle.begin_undo_turn()이 배틀 헤더(턴, 활성 포켓몬, 종료/승패 플래그, 날씨, 필드)를 쌓고,
+이후 SimplifiedPokemon의 변경 메서드(damage / heal / boost / status / spend_pp 등)와 엔진이
+바꾸기 직전의 값을 한 항목씩 쌓는다. undo_turn()은 마지막 헤더까지 거꾸로 복원한다.
+
+항목 형식: (종류, 대상, 키, 이전 값, 이전 Zobrist 해시)
+"""
+
+# 항목 종류
+U_BATTLE = 0    # 턴 시작 표시 + 배틀 헤더 (키 없음)
+U_ATTR = 1      # 포켓몬 속성 (current_hp, status_counter, first_turn, active 등)
+U_STATUS = 2    # 상태이상 (_status, 스탯 캐시 무효화 필요)
+U_BOOST = 3     # boosts[키] (스탯 캐시 무효화 필요)
+U_TIMER = 4     # boost_timers[키]
+U_VOLATILE = 5  # volatiles[키]
+U_PP = 6        # 기술 PP (키 = 기술 객체)
+
+# 딕셔너리에 키가 없었음을 나타내는 값
+MISSING = object()
+
+
+def record_attr(pokemon, attr: str):
+    """포켓몬 속성을 바꾸기 전에 호출 (되돌리기 기록 중이 아니면 아무것도 하지 않음)"""
+    log = pokemon._undo
+    if log is not None:
+        log.append((U_ATTR, pokemon, attr, getattr(pokemon, attr), pokemon._zobrist))
+
+
+def record_volatile(pokemon, key: str):
+    """volatiles[key]를 바꾸기 전에 호출"""
+    log = pokemon._undo
+    if log is not None:
+        log.append((U_VOLATILE, pokemon, key, pokemon.volatiles.get(key, MISSING), pokemon._zobrist))
+
+
+def _restore_item(d: dict, key, old):
+    if old is MISSING:
+        d.pop(key, None)
+    else:
+        d[key] = old
+
+
+def undo_to_mark(log: list, battle):
+    """마지막 U_BATTLE 항목까지 거꾸로 복원"""
+    while log:
+        kind, target, key, old, zobrist = log.pop()
+        if kind == U_BATTLE:
+            (battle.turn, battle.active_pokemon, battle.opponent_active_pokemon,
+             battle.finished, battle.won, battle.lost, battle.weather, battle.fields) = old
+            return
+
+        if kind == U_ATTR:
+            setattr(target, key, old)
+        elif kind == U_STATUS:
+            target._status = old
+            cache = target._stat_cache
+            if cache:
+                cache.pop('atk', None)
+                cache.pop('spe', None)
+        elif kind == U_BOOST:
+            _restore_item(target.boosts, key, old)
+            if target._stat_cache:
+                target._stat_cache.pop(key, None)
+        elif kind == U_TIMER:
+            _restore_item(target.boost_timers, key, old)
+        elif kind == U_VOLATILE:
+            _restore_item(target.volatiles, key, old)
+        elif kind == U_PP:
+            key.current_pp = old
+        target._zobrist = zobrist
+
+    raise IndexError("begin_undo_turn() 없이 undo_turn()이 호출되었습니다")
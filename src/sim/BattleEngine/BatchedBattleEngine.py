@@ -0,0 +1,608 @@
+"""
+NumPy 기반 배치 배틀 엔진
+
+SimplifiedBattleEngine.simulate_turn은 배틀 하나를 파이썬 코드로 처리하기 때문에
+MCTS 100회 반복 = 파이썬 턴 처리 100회가 된다.
+BatchState는 N개 배틀의 상태를 (배틀, 진영, 슬롯, ...) 모양의 배열 묶음(struct-of-arrays)으로 저장하고,
+BatchedBattleEngine.simulate_turn은 N개 배틀을 같은 단계씩(lockstep) 벡터 연산으로 한 번에 진행한다.
+
+행동 코드 (배틀당 정수 하나)
+- 0 ~ num_moves-1 : 활성 포켓몬의 기술 인덱스
+- num_moves + slot : 같은 팀의 slot번 포켓몬으로 교체 (switch_action 참고)
+- 음수 : 랜덤 기술
+
+규칙은 SimplifiedBattleEngine과 같게 맞췄고, 다음만 단순화했다.
+- 능력치 타이머(boost_timers)는 다루지 않는다 (엔진이 타이머를 새로 설정하지 않음)
+- 잘못된 기술 인덱스는 PP가 남은 기술 중 랜덤 선택 (데미지 0 기술 필터 생략)
+- 반동(recharge) 턴은 아무 행동도 하지 않는 우선도 0 행동으로 처리
+"""
+from typing import List, Optional, Tuple
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sim.BattleClass.ArrayBattle import (
+    BOOST_STATS,
+    BOOST_INDEX,
+    STATUS_CODE,
+    STATUS_LIST,
+    WEATHER_CODE,
+    encode_status,
+    leveled_stat,
+)
+from sim.Supporting.BattleRandom import numpy_generator
+from sim.Supporting.TypeChart import TypeChart, TYPE_CODE, TYPELESS, NUM_TYPES, DUAL_STRIDE, type_code
+from poke_env.battle.effect import Effect
+from poke_env.battle.weather import Weather
+
+# 스탯 배열 순서
+STAT_NAMES = ('atk', 'def', 'spa', 'spd', 'spe')
+STAT_INDEX = {stat: i for i, stat in enumerate(STAT_NAMES)}
+
+# 기술 분류 코드
+CATEGORY_CODE = {'PHYSICAL': 0, 'SPECIAL': 1, 'STATUS': 2}
+PHYSICAL, SPECIAL, STATUS = 0, 1, 2
+
+# 급소 확률 (SimplifiedBattleEngine._check_critical_hit과 동일)
+CRIT_RATIOS = np.array([1 / 24, 1 / 8, 1 / 2, 1 / 4])
+HIGH_CRIT_MOVES = ('stoneedge', 'crosschop', 'razorleaf', 'crabhammer')
+
+_BRN = STATUS_CODE['BRN']
+_PAR = STATUS_CODE['PAR']
+_PSN = STATUS_CODE['PSN']
+_TOX = STATUS_CODE['TOX']
+_FNT = STATUS_CODE['FNT']
+
+_RAIN = WEATHER_CODE[Weather.RAINDANCE]
+_SUN = WEATHER_CODE[Weather.SUNNYDAY]
+_SAND = WEATHER_CODE[Weather.SANDSTORM]
+_HAIL = WEATHER_CODE[Weather.HAIL]
+
+_WATER = TYPE_CODE['WATER']
+_FIRE = TYPE_CODE['FIRE']
+_ICE = TYPE_CODE['ICE']
+_SAND_IMMUNE = np.array([TYPE_CODE['ROCK'], TYPE_CODE['GROUND'], TYPE_CODE['STEEL']])
+
+_ACC = BOOST_INDEX['accuracy']
+_EVA = BOOST_INDEX['evasion']
+_SIDES = np.array([0, 1])
+
+
+class BatchState:
+    """
+    N개 배틀 상태 묶음 (struct-of-arrays)
+    Args:
+        size: 배틀 수 N
+        num_slots: 진영당 최대 포켓몬 수 S
+        num_moves: 포켓몬당 최대 기술 수 M
+    """
+
+    # 턴 진행 중 변하는 배열 (copy() 시 복사)
+    MUTABLE_FIELDS = (
+        'hp', 'status', 'status_counter', 'boosts', 'must_recharge', 'pp',
+        'active', 'turn', 'finished', 'won', 'lost',
+    )
+    # 변하지 않는 배열 (복사본끼리 공유)
+    STATIC_FIELDS = (
+        'exists', 'max_hp', 'level', 'stats', 'types', 'focus_energy', 'weather',
+        'move_exists', 'move_power', 'move_type', 'move_category', 'move_accuracy', 'move_priority',
+        'move_crit_stage', 'move_recharge', 'move_recoil', 'move_drain', 'move_status',
+        'move_self_boost', 'move_boosts',
+    )
+
+    def __init__(self, size: int, num_slots: int, num_moves: int):
+        self.size = size
+        self.num_slots = num_slots
+        self.num_moves = num_moves
+
+        pokemon_shape = (size, 2, num_slots)
+        move_shape = pokemon_shape + (num_moves,)
+        num_boosts = len(BOOST_STATS)
+
+        # 포켓몬 (배틀, 진영 0=플레이어 1=상대, 슬롯)
+        self.exists = np.zeros(pokemon_shape, dtype=bool)
+        self.hp = np.zeros(pokemon_shape, dtype=np.int64)
+        self.max_hp = np.ones(pokemon_shape, dtype=np.int64)
+        self.level = np.ones(pokemon_shape, dtype=np.int64)
+        self.stats = np.full(pokemon_shape + (len(STAT_NAMES),), 100.0)
+        self.types = np.full(pokemon_shape + (2,), TYPELESS, dtype=np.int64)
+        self.status = np.zeros(pokemon_shape, dtype=np.int64)
+        self.status_counter = np.zeros(pokemon_shape, dtype=np.int64)
+        self.boosts = np.zeros(pokemon_shape + (num_boosts,), dtype=np.int64)
+        self.must_recharge = np.zeros(pokemon_shape, dtype=bool)
+        self.focus_energy = np.zeros(pokemon_shape, dtype=bool)
+
+        # 기술 (배틀, 진영, 슬롯, 기술)
+        self.move_exists = np.zeros(move_shape, dtype=bool)
+        self.move_power = np.zeros(move_shape)
+        self.move_type = np.full(move_shape, TYPELESS, dtype=np.int64)
+        self.move_category = np.full(move_shape, STATUS, dtype=np.int64)
+        self.move_accuracy = np.ones(move_shape)           # 1.0 이상 = 필중
+        self.move_priority = np.zeros(move_shape, dtype=np.int64)
+        self.move_crit_stage = np.zeros(move_shape, dtype=np.int64)
+        self.move_recharge = np.zeros(move_shape, dtype=bool)
+        self.move_recoil = np.zeros(move_shape + (2,), dtype=np.int64)   # [분자, 분모]
+        self.move_drain = np.zeros(move_shape + (2,), dtype=np.int64)    # [분자, 분모]
+        self.move_status = np.zeros(move_shape, dtype=np.int64)
+        self.move_self_boost = np.zeros(move_shape + (num_boosts,), dtype=np.int64)
+        self.move_boosts = np.zeros(move_shape + (num_boosts,), dtype=np.int64)
+        self.pp = np.zeros(move_shape, dtype=np.int64)
+
+        # 배틀 (배틀, 진영) / (배틀,)
+        self.active = np.full((size, 2), -1, dtype=np.int64)
+        self.weather = np.zeros(size, dtype=np.int64)
+        self.turn = np.zeros(size, dtype=np.int64)
+        self.finished = np.zeros(size, dtype=bool)
+        self.won = np.zeros(size, dtype=bool)
+        self.lost = np.zeros(size, dtype=bool)
+
+    @classmethod
+    def from_battles(cls, battles: List, num_slots: Optional[int] = None, num_moves: Optional[int] = None,
+                     template: Optional['BatchState'] = None) -> 'BatchState':
+        """
+        SimplifiedBattle / ArrayBattle 목록으로부터 생성
+        Args:
+            battles: 배틀 객체 목록 (슬롯 순서 = 팀 딕셔너리 순서)
+            num_slots: 진영당 슬롯 수 (None이면 가장 큰 팀 크기)
+            num_moves: 포켓몬당 기술 수 (None이면 가장 많은 기술 수)
+            template: 같은 팀 구성(같은 루트에서 파생된 상태)의 BatchState.
+                      주어지면 불변 배열은 template의 0번 배틀에서 복사하고 변하는 값만 읽는다.
+        """
+        teams = [(list(b.team.values()), list(b.opponent_team.values())) for b in battles]
+        if template is not None:
+            return cls._from_template(battles, teams, template)
+        if num_slots is None:
+            num_slots = max((len(team) for pair in teams for team in pair), default=1)
+        if num_moves is None:
+            num_moves = max((len(p.moves) for pair in teams for team in pair for p in team), default=1)
+
+        state = cls(len(battles), max(1, num_slots), max(1, num_moves))
+        for i, (battle, pair) in enumerate(zip(battles, teams)):
+            for side, team in enumerate(pair):
+                for slot, pokemon in enumerate(team[:state.num_slots]):
+                    state._fill_pokemon(i, side, slot, pokemon)
+            state._fill_battle(i, battle, pair)
+        return state
+
+    @classmethod
+    def _from_template(cls, battles: List, teams: List, template: 'BatchState') -> 'BatchState':
+        """불변 배열은 template에서 가져오고 배틀마다 변하는 값만 기록"""
+        state = template.take(np.zeros(len(battles), dtype=np.int64))
+        for i, (battle, pair) in enumerate(zip(battles, teams)):
+            for side, team in enumerate(pair):
+                for slot, pokemon in enumerate(team[:state.num_slots]):
+                    state._fill_dynamic(i, side, slot, pokemon)
+            state._fill_battle(i, battle, pair)
+        return state
+
+    def _fill_battle(self, i: int, battle, pair):
+        """활성 슬롯, 날씨, 턴, 승패 기록"""
+        # 활성 포켓몬 슬롯 (_sync_references와 같이 종 이름으로 찾음)
+        for side, active in enumerate((battle.active_pokemon, battle.opponent_active_pokemon)):
+            self.active[i, side] = -1
+            if active is None:
+                continue
+            for slot, pokemon in enumerate(pair[side][:self.num_slots]):
+                if pokemon.species == active.species:
+                    self.active[i, side] = slot
+                    break
+
+        weather = next(iter(battle.weather), None) if battle.weather else None
+        self.weather[i] = WEATHER_CODE.get(weather, 0)
+        self.turn[i] = battle.turn
+        self.finished[i] = bool(battle.finished)
+        self.won[i] = bool(battle.won)
+        self.lost[i] = bool(battle.lost)
+
+    def _fill_dynamic(self, i: int, side: int, slot: int, pokemon):
+        """포켓몬 하나의 변하는 값(HP, 상태이상, 랭크, PP 등)을 기록"""
+        index = (i, side, slot)
+        self.hp[index] = pokemon.current_hp
+        self.status[index] = encode_status(pokemon.status)
+        self.status_counter[index] = pokemon.status_counter
+        self.must_recharge[index] = bool(pokemon.volatiles.get('must_recharge'))
+        self.boosts[index] = 0
+        for stat, amount in pokemon.boosts.items():
+            if stat in BOOST_INDEX:
+                self.boosts[index + (BOOST_INDEX[stat],)] = amount
+        current_pp = [move.current_pp for move in pokemon.moves[:self.num_moves]]
+        self.pp[index][:len(current_pp)] = current_pp
+
+    def _fill_pokemon(self, i: int, side: int, slot: int, pokemon):
+        """포켓몬 하나의 값을 배열에 기록"""
+        index = (i, side, slot)
+        self.exists[index] = True
+        self.max_hp[index] = pokemon.max_hp
+        self.level[index] = pokemon.level
+        self.stats[index] = [leveled_stat(pokemon, stat) for stat in STAT_NAMES]
+        self.types[index] = (type_code(pokemon.type_1), type_code(pokemon.type_2))
+        self.focus_energy[index] = Effect.FOCUS_ENERGY in (pokemon.effects or ())
+
+        for j, move in enumerate(pokemon.moves[:self.num_moves]):
+            self._fill_move(index + (j,), move)
+        self._fill_dynamic(i, side, slot, pokemon)
+
+    def _fill_move(self, index: Tuple[int, int, int, int], move):
+        """기술 하나의 값을 배열에 기록"""
+        self.move_exists[index] = True
+        self.move_power[index] = move.base_power or 0
+        self.move_type[index] = type_code(move.type)
+        self.move_category[index] = CATEGORY_CODE.get(move.category.name, STATUS)
+        self.move_accuracy[index] = 1.0 if move.accuracy is None else float(move.accuracy)
+        self.move_priority[index] = move.priority
+        self.move_crit_stage[index] = 1 if move.id in HIGH_CRIT_MOVES else 0
+        self.move_recharge[index] = 'recharge' in (move.flags or ())
+        self.move_status[index] = encode_status(move.status) if move.status else 0
+
+        for target, fraction in ((self.move_recoil, move.recoil), (self.move_drain, move.drain)):
+            if fraction and isinstance(fraction, list) and len(fraction) == 2:
+                target[index] = fraction
+        for target, boosts in ((self.move_self_boost, move.self_boost), (self.move_boosts, move.boosts)):
+            for stat, amount in (boosts or {}).items():
+                if stat in BOOST_INDEX:
+                    target[index + (BOOST_INDEX[stat],)] = amount
+
+    def copy(self) -> 'BatchState':
+        """변하는 배열만 복사 (불변 배열은 공유)"""
+        new_state = BatchState.__new__(BatchState)
+        new_state.size = self.size
+        new_state.num_slots = self.num_slots
+        new_state.num_moves = self.num_moves
+        for name in self.STATIC_FIELDS:
+            setattr(new_state, name, getattr(self, name))
+        for name in self.MUTABLE_FIELDS:
+            setattr(new_state, name, getattr(self, name).copy())
+        return new_state
+
+    def take(self, indices) -> 'BatchState':
+        """
+        일부 배틀만 골라 (또는 반복해) 새 BatchState 생성
+        Args:
+            indices: 배틀 인덱스 배열 (예: np.repeat(np.arange(N), K)로 배틀마다 K개 복제)
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        new_state = BatchState.__new__(BatchState)
+        new_state.size = len(indices)
+        new_state.num_slots = self.num_slots
+        new_state.num_moves = self.num_moves
+        for name in self.STATIC_FIELDS + self.MUTABLE_FIELDS:
+            setattr(new_state, name, getattr(self, name)[indices])
+        return new_state
+
+    def broadcast(self, index: int, count: int) -> 'BatchState':
+        """
+        index번 배틀 하나를 count개로 복제 (한 상태에서 여러 행동 조합을 동시에 진행할 때)
+        불변 배열은 복사하지 않고 읽기 전용 브로드캐스트 뷰로 공유하고, 변하는 배열만 count개 복사한다.
+        Args:
+            index: 복제할 배틀 인덱스
+            count: 복제 수
+        """
+        new_state = BatchState.__new__(BatchState)
+        new_state.size = count
+        new_state.num_slots = self.num_slots
+        new_state.num_moves = self.num_moves
+        for name in self.STATIC_FIELDS:
+            field = getattr(self, name)
+            setattr(new_state, name, np.broadcast_to(field[index:index + 1], (count,) + field.shape[1:]))
+        for name in self.MUTABLE_FIELDS:
+            setattr(new_state, name, np.repeat(getattr(self, name)[index:index + 1], count, axis=0))
+        return new_state
+
+    def switch_action(self, slot) -> np.ndarray:
+        """slot번 포켓몬으로 교체하는 행동 코드"""
+        return self.num_moves + np.asarray(slot)
+
+    def write_to(self, battle, index: int):
+        """
+        index번 배틀의 변하는 값을 배틀 객체(SimplifiedBattle / ArrayBattle)에 다시 기록
+        Args:
+            battle: from_battles에 넣었던 것과 같은 팀 구성의 배틀 객체
+            index: 배틀 인덱스
+        """
+        teams = (list(battle.team.values()), list(battle.opponent_team.values()))
+        for side, team in enumerate(teams):
+            for slot, pokemon in enumerate(team[:self.num_slots]):
+                position = (index, side, slot)
+                pokemon.current_hp = int(self.hp[position])
+                pokemon.status = STATUS_LIST[int(self.status[position])]
+                pokemon.status_counter = int(self.status_counter[position])
+                pokemon.volatiles['must_recharge'] = bool(self.must_recharge[position])
+                for stat, k in BOOST_INDEX.items():
+                    amount = int(self.boosts[position + (k,)]) - pokemon.boosts.get(stat, 0)
+                    if amount:
+                        pokemon.boost(stat, amount)
+                for j, move in enumerate(pokemon.moves[:self.num_moves]):
+                    move.current_pp = int(self.pp[position + (j,)])
+
+        active, opponent_active = (int(slot) for slot in self.active[index])
+        battle.active_pokemon = teams[0][active] if active >= 0 else None
+        battle.opponent_active_pokemon = teams[1][opponent_active] if opponent_active >= 0 else None
+        battle.turn = int(self.turn[index])
+        battle.finished = bool(self.finished[index])
+        battle.won = bool(self.won[index])
+        battle.lost = bool(self.lost[index])
+        # HP / PP를 직접 덮어썼으므로 증분 해시를 다시 계산하도록 무효화
+        battle.reset_zobrist()
+
+
+class BatchedBattleEngine:
+    """N개 배틀을 한 번에 진행하는 배치 엔진"""
+
+    def __init__(self, gen: int = 9):
+        """
+        Args:
+            gen: 세대 (기본값: 9)
+        """
+        self.gen = gen
+        self.type_table = TypeChart.from_gen(gen)
+        self.dual = np.asarray(self.type_table.dual)
+
+    def simulate_turn(
+        self,
+        state: BatchState,
+        player_actions,
+        opponent_actions,
+        rng=None,
+        copy: bool = True
+    ) -> Tuple[BatchState, np.ndarray, np.ndarray]:
+        """
+        N개 배틀 1턴 동시 시뮬레이션
+
+        Args:
+            state: BatchState
+            player_actions: 플레이어 행동 코드 (N,)
+            opponent_actions: 상대 행동 코드 (N,)
+            rng: 난수 생성기 (numpy Generator 또는 BattleRandom, None이면 새로 생성)
+            copy: False면 state를 직접 수정
+
+        Returns:
+            (다음 상태, done 마스크 (N,), 승자 (N,) 1=플레이어 / -1=상대 / 0=미정)
+        """
+        s = state.copy() if copy else state
+        rng = numpy_generator(rng)
+        n = s.size
+        rows = np.arange(n)
+        side_rows = rows[:, None]
+
+        actions = np.stack([
+            np.broadcast_to(np.asarray(player_actions, dtype=np.int64), (n,)),
+            np.broadcast_to(np.asarray(opponent_actions, dtype=np.int64), (n,)),
+        ], axis=1)
+
+        s.turn += 1
+
+        # 진행 가능한 배틀: 양쪽 활성 포켓몬이 있고 살아있음
+        slots = np.maximum(s.active, 0)
+        live = (s.active >= 0).all(axis=1) & (s.hp[side_rows, _SIDES, slots] > 0).all(axis=1)
+
+        # 교체 (행동 순서 결정 전에 바로 반영)
+        is_switch = actions >= s.num_moves
+        switch_slot = np.clip(actions - s.num_moves, 0, s.num_slots - 1)
+        do_switch = live[:, None] & is_switch & (s.hp[side_rows, _SIDES, switch_slot] > 0)
+        s.active = np.where(do_switch, switch_slot, s.active)
+        slots = np.maximum(s.active, 0)
+
+        # 기술 선택
+        recharge = ~is_switch & s.must_recharge[side_rows, _SIDES, slots]
+        uses_move = live[:, None] & ~is_switch & ~recharge
+        move_idx = self._resolve_moves(s, actions, slots, rng)
+
+        # 행동 순서 (교체 > 우선도 > 스피드 > 랜덤)
+        priority = np.where(uses_move, s.move_priority[side_rows, _SIDES, slots, move_idx], 0)
+        speed = self._effective_stat(s, side_rows, _SIDES, slots, 'spe')
+        coin = rng.random(n) < 0.5
+        player_first = np.select(
+            [
+                is_switch[:, 0] & ~is_switch[:, 1],
+                is_switch[:, 1] & ~is_switch[:, 0],
+                is_switch[:, 0] & is_switch[:, 1],
+                priority[:, 0] > priority[:, 1],
+                priority[:, 1] > priority[:, 0],
+                speed[:, 0] > speed[:, 1],
+                speed[:, 1] > speed[:, 0],
+            ],
+            [True, False, coin, True, False, True, False],
+            default=coin,
+        )
+
+        # 선공 / 후공 실행
+        first_side = np.where(player_first, 0, 1)
+        for order, attacker_side in enumerate((first_side, 1 - first_side)):
+            acting = uses_move[rows, attacker_side]
+            if order == 1:
+                acting = acting & self._both_alive(s, rows)
+            self._execute_moves(s, rows, attacker_side, move_idx[rows, attacker_side], acting, rng)
+
+        # 턴 종료 처리
+        self._end_of_turn(s, rows, live)
+
+        # 활성 포켓몬 기절 시 교체
+        for side in (0, 1):
+            self._auto_switch(s, rows, side, live, rng)
+
+        # 승패 확인
+        self._check_winner(s, live)
+
+        winner = np.where(s.won, 1, np.where(s.lost, -1, 0)).astype(np.int8)
+        return s, s.finished.copy(), winner
+
+    def _resolve_moves(self, s: BatchState, actions: np.ndarray, slots: np.ndarray, rng) -> np.ndarray:
+        """행동 코드를 기술 인덱스로 변환 (잘못된 인덱스는 PP가 남은 기술 중 랜덤)"""
+        side_rows = np.arange(s.size)[:, None]
+        exists = s.move_exists[side_rows, _SIDES, slots]       # (N, 2, M)
+        clipped = np.clip(actions, 0, s.num_moves - 1)
+        valid = (actions >= 0) & (actions < s.num_moves) & np.take_along_axis(exists, clipped[..., None], axis=2)[..., 0]
+
+        candidates = exists & (s.pp[side_rows, _SIDES, slots] > 0)
+        candidates = np.where(candidates.any(axis=2, keepdims=True), candidates, exists)
+        random_idx = np.where(candidates, rng.random(candidates.shape), -1.0).argmax(axis=2)
+        return np.where(valid, clipped, random_idx)
+
+    def _both_alive(self, s: BatchState, rows: np.ndarray) -> np.ndarray:
+        """양쪽 활성 포켓몬 생존 여부"""
+        slots = np.maximum(s.active, 0)
+        return (s.hp[rows[:, None], _SIDES, slots] > 0).all(axis=1)
+
+    def _effective_stat(self, s: BatchState, rows, sides, slots, stat_name: str) -> np.ndarray:
+        """SimplifiedPokemon.get_effective_stat의 벡터 버전"""
+        base = s.stats[rows, sides, slots, STAT_INDEX[stat_name]]
+        boost = s.boosts[rows, sides, slots, BOOST_INDEX[stat_name]]
+        # boost >= 0 : (2 + boost) / 2, boost < 0 : 2 / (2 - boost)
+        multiplier = (2 + np.maximum(boost, 0)) / (2 + np.maximum(-boost, 0))
+        if stat_name == 'atk':
+            multiplier = np.where(s.status[rows, sides, slots] == _BRN, multiplier * 0.5, multiplier)
+        elif stat_name == 'spe':
+            multiplier = np.where(s.status[rows, sides, slots] == _PAR, multiplier * 0.5, multiplier)
+        return base * multiplier
+
+    def _execute_moves(self, s: BatchState, rows, attacker_side, move_idx, acting, rng):
+        """acting인 배틀에서 attacker_side 쪽 활성 포켓몬의 기술 실행"""
+        defender_side = 1 - attacker_side
+        attacker_slot = np.maximum(s.active[rows, attacker_side], 0)
+        defender_slot = np.maximum(s.active[rows, defender_side], 0)
+        attacker = (rows, attacker_side, attacker_slot)
+        defender = (rows, defender_side, defender_slot)
+        move = attacker + (move_idx,)
+
+        # PP 소모
+        s.pp[move] = np.where(acting, np.maximum(0, s.pp[move] - 1), s.pp[move])
+
+        # 명중 판정
+        accuracy = s.move_accuracy[move]
+        acc_boost = s.boosts[attacker + (_ACC,)]
+        eva_boost = s.boosts[defender + (_EVA,)]
+        acc_mult = (3 + np.maximum(acc_boost, 0)) / (3 + np.maximum(-acc_boost, 0))
+        eva_mult = (3 + np.maximum(-eva_boost, 0)) / (3 + np.maximum(eva_boost, 0))
+        final_accuracy = np.clip(accuracy * acc_mult * eva_mult, 0.01, 1.0)
+        hit = acting & ((accuracy >= 1.0) | (rng.random(len(rows)) < final_accuracy))
+
+        # 급소 판정
+        category = s.move_category[move]
+        damaging = hit & (category != STATUS)
+        crit_stage = np.minimum(s.move_crit_stage[move] + 2 * s.focus_energy[attacker], 3)
+        crit = damaging & (rng.random(len(rows)) < CRIT_RATIOS[crit_stage])
+
+        # 데미지 계산 및 적용
+        damage = self._calculate_damage(s, attacker, defender, move, category, crit)
+        damage = np.where(damaging & (s.move_power[move] != 0), damage, 0)
+        self._apply_damage(s, defender, damage, damaging)
+
+        s.must_recharge[attacker] |= hit & s.move_recharge[move]
+
+        # 추가 효과 (랭크업, 상대 랭크 다운, 상태이상, 반동, 흡수)
+        s.boosts[attacker] = np.where(hit[:, None], np.clip(s.boosts[attacker] + s.move_self_boost[move], -6, 6), s.boosts[attacker])
+        s.boosts[defender] = np.where(hit[:, None], np.clip(s.boosts[defender] + s.move_boosts[move], -6, 6), s.boosts[defender])
+
+        move_status = s.move_status[move]
+        inflict = hit & (move_status != 0) & (s.status[defender] == 0)
+        s.status[defender] = np.where(inflict, move_status, s.status[defender])
+
+        numerator, denominator = s.move_recoil[move].T
+        recoil = hit & (denominator != 0) & (damage > 0)
+        recoil_damage = np.maximum(1, (damage * numerator / np.where(recoil, denominator, 1)).astype(np.int64))
+        self._apply_damage(s, attacker, recoil_damage, recoil)
+
+        numerator, denominator = s.move_drain[move].T
+        drain = hit & (denominator != 0) & (damage > 0)
+        heal_amount = np.maximum(1, (damage * numerator / np.where(drain, denominator, 1)).astype(np.int64))
+        s.hp[attacker] = np.where(drain, np.minimum(s.max_hp[attacker], s.hp[attacker] + heal_amount), s.hp[attacker])
+
+    def _calculate_damage(self, s: BatchState, attacker, defender, move, category, crit) -> np.ndarray:
+        """데미지 계산 (DamageModifierChain 기본 구성과 같은 순서로 보정)"""
+        rows, attacker_side, attacker_slot = attacker
+        _, defender_side, defender_slot = defender
+        physical = category == PHYSICAL
+
+        A = np.where(
+            physical,
+            self._effective_stat(s, rows, attacker_side, attacker_slot, 'atk'),
+            self._effective_stat(s, rows, attacker_side, attacker_slot, 'spa'),
+        )
+        D = np.where(
+            physical,
+            self._effective_stat(s, rows, defender_side, defender_slot, 'def'),
+            self._effective_stat(s, rows, defender_side, defender_slot, 'spd'),
+        )
+
+        level_factor = (2 * s.level[attacker] / 5 + 2)
+        damage = (level_factor * s.move_power[move] * A / D) / 50 + 2
+
+        move_type = s.move_type[move]
+        weather = s.weather[rows]
+        attacker_types = s.types[attacker]
+        defender_types = s.types[defender]
+
+        # 화상
+        damage = np.where(physical & (s.status[attacker] == _BRN) & ~crit, damage * 0.5, damage)
+        # 날씨
+        boosted = ((weather == _RAIN) & (move_type == _WATER)) | ((weather == _SUN) & (move_type == _FIRE))
+        weakened = ((weather == _RAIN) & (move_type == _FIRE)) | ((weather == _SUN) & (move_type == _WATER))
+        damage = np.where(boosted, damage * 1.5, np.where(weakened, damage * 0.5, damage))
+        # 급소
+        damage = np.where(crit, damage * 1.5, damage)
+        # 자속 보정
+        stab = (move_type == attacker_types[:, 0]) | ((move_type == attacker_types[:, 1]) & (attacker_types[:, 1] != TYPELESS))
+        damage = np.where(stab, damage * 1.5, damage)
+        # 타입 상성
+        damage = damage * self.dual[move_type * DUAL_STRIDE + defender_types[:, 0] * NUM_TYPES + defender_types[:, 1]]
+
+        return np.maximum(1, damage.astype(np.int64))
+
+    def _apply_damage(self, s: BatchState, target, amount: np.ndarray, mask: np.ndarray):
+        """mask인 배틀의 target 포켓몬에 데미지 적용 (HP 0이면 기절)"""
+        hp = np.where(mask, np.maximum(0, s.hp[target] - amount), s.hp[target])
+        s.hp[target] = hp
+        s.status[target] = np.where(mask & (hp == 0), _FNT, s.status[target])
+
+    def _end_of_turn(self, s: BatchState, rows, live):
+        """턴 종료 처리 (날씨 데미지 → 상태이상 데미지 → 반동 해제)"""
+        for side in (0, 1):
+            slot = np.maximum(s.active[:, side], 0)
+            target = (rows, side, slot)
+            types = s.types[target]
+            alive = live & (s.hp[target] > 0)
+
+            sand = (s.weather == _SAND) & ~np.isin(types, _SAND_IMMUNE).any(axis=1)
+            hail = (s.weather == _HAIL) & (types != _ICE).all(axis=1)
+            self._apply_damage(s, target, s.max_hp[target] // 16, alive & (sand | hail))
+
+        for side in (0, 1):
+            slot = np.maximum(s.active[:, side], 0)
+            target = (rows, side, slot)
+            alive = live & (s.hp[target] > 0)
+            status = s.status[target]
+            max_hp = s.max_hp[target]
+
+            toxic = alive & (status == _TOX)
+            s.status_counter[target] += toxic
+            amount = np.select(
+                [status == _BRN, status == _PSN, status == _TOX],
+                [max_hp // 16, max_hp // 8, (max_hp * s.status_counter[target]) // 16],
+                default=0,
+            )
+            self._apply_damage(s, target, amount, alive & ((status == _BRN) | (status == _PSN) | toxic))
+
+            s.must_recharge[target] &= ~live
+
+    def _auto_switch(self, s: BatchState, rows, side: int, live, rng):
+        """활성 포켓몬이 기절한 배틀은 살아있는 포켓몬 중 랜덤 교체 (없으면 -1)"""
+        slot = np.maximum(s.active[:, side], 0)
+        needs_switch = live & (s.hp[rows, side, slot] <= 0)
+        alive = s.hp[:, side, :] > 0
+        choice = np.where(alive, rng.random(alive.shape), -1.0).argmax(axis=1)
+        replacement = np.where(alive.any(axis=1), choice, -1)
+        s.active[:, side] = np.where(needs_switch, replacement, s.active[:, side])
+
+    def _check_winner(self, s: BatchState, live):
+        """승패 확인"""
+        player_alive = (s.hp[:, 0, :] > 0).any(axis=1)
+        opponent_alive = (s.hp[:, 1, :] > 0).any(axis=1)
+
+        lost = live & ~player_alive
+        won = live & player_alive & ~opponent_alive
+        s.finished |= lost | won
+        s.won = np.where(lost, False, s.won | won)
+        s.lost = np.where(won, False, s.lost | lost)
@@ -1,13 +1,19 @@
 """
 데미지 보정 클래스들 (책임 연쇄 패턴)
+
+DamageModifierChain.compile()은 체인을 날씨 설정별로 특화된 하나의 함수로 합친다.
+기본 보정(화상/날씨/급소/STAB/상성/랜덤)이 기본 순서대로 이어진 구간은 fused 함수 하나로,
+사용자 정의 보정은 기존처럼 apply 호출로 이어 붙인다.
 """
 from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from sim.BattleClass.SimplifiedPokemon import SimplifiedPokemon
 from sim.BattleClass.SimplifiedMove import SimplifiedMove
+from sim.Supporting.TypeChart import TypeChart, TYPE_CODE, NUM_TYPES, DUAL_STRIDE
 from poke_env.battle.status import Status
 from poke_env.battle.pokemon_type import PokemonType
 from poke_env.battle.weather import Weather
@@ -58,6 +64,17 @@ class BurnModifier(DamageModifier):
 
 class WeatherModifier(DamageModifier):
     """날씨 보정"""
+
+    @staticmethod
+    def weather_key(weather) -> Optional[Weather]:
+        """데미지에 영향을 주는 날씨 (apply와 같이 비 → 쾌청 순으로 확인, 없으면 None)"""
+        if not weather:
+            return None
+        if Weather.RAINDANCE in weather:
+            return Weather.RAINDANCE
+        if Weather.SUNNYDAY in weather:
+            return Weather.SUNNYDAY
+        return None
     
     def apply(self, damage: float, attacker: SimplifiedPokemon, defender: SimplifiedPokemon, 
               move: SimplifiedMove, crit: bool, battle_context: dict) -> float:
@@ -103,6 +120,11 @@ class TypeEffectivenessModifier(DamageModifier):
     
     def apply(self, damage: float, attacker: SimplifiedPokemon, defender: SimplifiedPokemon, 
               move: SimplifiedMove, crit: bool, battle_context: dict) -> float:
+        # 정수 인덱스 상성표가 있으면 배열 인덱스 한 번으로 계산
+        type_table = battle_context.get('type_table')
+        if type_table is not None:
+            return damage * type_table.dual[move.type_code * DUAL_STRIDE + defender.defense_key]
+
         type_chart = battle_context.get('type_chart')
         effectiveness = move.type.damage_multiplier(
                 defender.type_1,
@@ -121,15 +143,138 @@ class RandomModifier(DamageModifier):
         return damage * 1.0
 
 
+# fused 함수로 합칠 수 있는 기본 보정 (기본 체인 순서)
+FUSABLE_MODIFIERS = (
+    BurnModifier,
+    WeatherModifier,
+    CriticalHitModifier,
+    STABModifier,
+    TypeEffectivenessModifier,
+    RandomModifier,
+)
+
+# 보정 함수 시그니처: (damage, attacker, defender, move, crit, battle_context) -> damage
+DamageFunction = Callable[[float, SimplifiedPokemon, SimplifiedPokemon, SimplifiedMove, bool, Optional[dict]], float]
+
+
+def _fuse_builtin_run(kinds: set, weather_key: Optional[Weather], type_table: TypeChart) -> DamageFunction:
+    """
+    기본 보정 구간을 하나의 함수로 합침
+    Args:
+        kinds: 구간에 포함된 기본 보정 클래스 집합
+        weather_key: WeatherModifier.weather_key() 결과 (None이면 날씨 단계 자체를 생략)
+        type_table: STAB / 상성 조회용 정수 인덱스 상성표
+    """
+    burn = BurnModifier in kinds
+    crit_boost = CriticalHitModifier in kinds
+    stab = type_table.stab if STABModifier in kinds else None
+    dual = type_table.dual if TypeEffectivenessModifier in kinds else None
+
+    # 기술 타입 코드별 날씨 배율
+    weather_factors = None
+    if WeatherModifier in kinds and weather_key is not None:
+        boosted, weakened = ('WATER', 'FIRE') if weather_key == Weather.RAINDANCE else ('FIRE', 'WATER')
+        weather_factors = [1.0] * NUM_TYPES
+        weather_factors[TYPE_CODE[boosted]] = 1.5
+        weather_factors[TYPE_CODE[weakened]] = 0.5
+
+    physical = MoveCategory.PHYSICAL
+    burned = Status.BRN
+
+    def fused(damage, attacker, defender, move, crit, battle_context=None):
+        if burn and not crit and move.category == physical and attacker.status == burned:
+            damage = damage * 0.5
+        if weather_factors is not None:
+            damage = damage * weather_factors[move.type_code]
+        if crit and crit_boost:
+            damage = damage * 1.5
+
+        # 상성 배율은 항상 2의 거듭제곱이므로 STAB과 먼저 곱해도 체인 순서대로 곱한 결과와 같다
+        offset = move.type_code * DUAL_STRIDE
+        if stab is not None:
+            if dual is not None:
+                return damage * (stab[offset + attacker.defense_key] * dual[offset + defender.defense_key])
+            return damage * stab[offset + attacker.defense_key]
+        if dual is not None:
+            return damage * dual[offset + defender.defense_key]
+        return damage
+
+    return fused
+
+
 class DamageModifierChain:
     """보정 체인"""
     
     def __init__(self):
         self.modifiers = []
+        self._compiled: Dict[tuple, DamageFunction] = {}
+        # 사용자 정의 보정이 있어 battle_context 딕셔너리가 필요한지 여부
+        self.needs_context = False
         
     def add_modifier(self, modifier: DamageModifier):
         """보정 추가"""
         self.modifiers.append(modifier)
+        self._compiled.clear()
+        self.needs_context = self.needs_context or type(modifier) not in FUSABLE_MODIFIERS
+
+    def compile(self, weather_key: Optional[Weather] = None, type_table: Optional[TypeChart] = None) -> DamageFunction:
+        """
+        체인을 배틀 설정(날씨)에 특화된 하나의 함수로 컴파일 (설정별로 캐시)
+
+        Args:
+            weather_key: WeatherModifier.weather_key(battle.weather)
+            type_table: 정수 인덱스 상성표 (None이면 9세대)
+
+        Returns:
+            fn(damage, attacker, defender, move, crit, battle_context) -> damage
+            battle_context는 needs_context일 때만 필요 (기본 보정만 있으면 None 전달 가능)
+        """
+        type_table = type_table or TypeChart.from_gen(9)
+        key = (weather_key, id(type_table), len(self.modifiers))
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._build(weather_key, type_table)
+            self._compiled[key] = compiled
+        return compiled
+
+    def _build(self, weather_key: Optional[Weather], type_table: TypeChart) -> DamageFunction:
+        """기본 보정이 기본 순서대로 이어진 구간은 fused 함수로, 나머지는 apply 호출로 단계 구성"""
+        self.needs_context = any(type(modifier) not in FUSABLE_MODIFIERS for modifier in self.modifiers)
+        steps = []
+        run = set()
+        last_order = -1
+        for modifier in self.modifiers:
+            # 기본 보정을 상속해 apply를 바꾼 클래스는 사용자 정의 보정으로 취급 (정확한 타입만 합침)
+            kind = type(modifier)
+            order = FUSABLE_MODIFIERS.index(kind) if kind in FUSABLE_MODIFIERS else -1
+            if order > last_order:
+                run.add(kind)
+                last_order = order
+                continue
+
+            if run:
+                steps.append(_fuse_builtin_run(run, weather_key, type_table))
+            run = set()
+            last_order = -1
+            if order >= 0:
+                run.add(kind)
+                last_order = order
+            else:
+                steps.append(modifier.apply)
+        if run:
+            steps.append(_fuse_builtin_run(run, weather_key, type_table))
+
+        if not steps:
+            return lambda damage, attacker, defender, move, crit, battle_context=None: damage
+        if len(steps) == 1:
+            return steps[0]
+
+        def chained(damage, attacker, defender, move, crit, battle_context=None):
+            for step in steps:
+                damage = step(damage, attacker, defender, move, crit, battle_context)
+            return damage
+
+        return chained
         
     def apply_all(
         self,
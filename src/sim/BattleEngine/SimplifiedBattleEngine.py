@@ -4,7 +4,7 @@ SimplifiedBattle 시뮬레이션 엔진
 import copy
 import random
 import logging
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 import sys
 import os
 
@@ -13,6 +13,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
 from sim.BattleClass.SimplifiedPokemon import SimplifiedPokemon
 from sim.BattleClass.SimplifiedMove import SimplifiedMove
+from sim.BattleClass.UndoLog import record_attr, record_volatile
+from sim.Supporting.TypeChart import TypeChart
+from sim.Supporting.DataPack import DataPack
 from .DamageModifiers import (
     DamageModifierChain,
     BurnModifier,
@@ -27,23 +30,96 @@ from poke_env.battle.move_category import MoveCategory
 from poke_env.battle.status import Status
 from poke_env.battle.pokemon_type import PokemonType
 from poke_env.battle.weather import Weather
-from poke_env.data import GenData
+
+
+class OutcomeScript:
+    """
+    enumerate_outcomes가 턴 하나를 재생하는 동안 확률 사건(명중 / 급소 / 동속 / 랜덤 선택)의 결과를 정해 주는 기록
+    Args:
+        prefix: 앞에서부터 사건별로 고를 결과 인덱스 (prefix보다 뒤의 사건은 0번 분기)
+        min_probability: 나눴을 때 더 작은 쪽 분기의 경로 확률이 이보다 작은 사건은 나누지 않고 rng로 샘플링
+                         (샘플 결과가 그 사건의 확률 전체를 가짐, 같은 prefix를 재생할 때는 샘플 결과를 그대로 사용)
+    """
+
+    def __init__(self, prefix: List[int], min_probability: float = 0.0):
+        self.prefix = prefix
+        self.min_probability = min_probability
+        self.trace: List[Tuple[int, int]] = []  # [(고른 결과, 나열할 결과 수 - 샘플링한 사건은 1)]
+        self.probability = 1.0
+
+    def _branch(self, probabilities: Tuple[float, ...], sampled: Optional[int]) -> int:
+        """
+        Args:
+            probabilities: 결과별 확률
+            sampled: 나누지 않는 사건이면 rng로 뽑은 결과 (처음 재생할 때만 사용)
+        """
+        depth = len(self.trace)
+        if depth < len(self.prefix):
+            index = self.prefix[depth]
+        else:
+            index = 0 if sampled is None else sampled
+        if sampled is None:
+            self.trace.append((index, len(probabilities)))
+            self.probability *= probabilities[index]
+        else:
+            self.trace.append((index, 1))
+        return index
+
+    def chance(self, probability: float, rng) -> bool:
+        if probability >= 1.0:
+            return True
+        if probability <= 0.0:
+            return False
+        sampled = None
+        if self.probability * min(probability, 1.0 - probability) < self.min_probability:
+            sampled = 0 if rng.random() < probability else 1
+        return self._branch((probability, 1.0 - probability), sampled) == 0
+
+    def choose(self, options: list, rng):
+        if len(options) == 1:
+            return options[0]
+        sampled = None
+        if self.probability / len(options) < self.min_probability:
+            sampled = rng.randrange(len(options))
+        return options[self._branch((1.0 / len(options),) * len(options), sampled)]
+
+    def next_prefix(self) -> Optional[List[int]]:
+        """아직 재생하지 않은 다음 결과 조합 (깊이 우선, 없으면 None)"""
+        trace = self.trace
+        while trace and trace[-1][0] + 1 >= trace[-1][1]:
+            trace.pop()
+        if not trace:
+            return None
+        return [index for index, _ in trace[:-1]] + [trace[-1][0] + 1]
+
+
+def outcome_key(battle) -> tuple:
+    """같은 결과 병합용 키 (Zobrist 해시 + 해시에 없는 승패 / 반동 플래그)"""
+    recharge = tuple(bool(p is not None and p.volatiles.get('must_recharge'))
+                     for p in (battle.active_pokemon, battle.opponent_active_pokemon))
+    return battle.zobrist_hash(), battle.finished, battle.won, battle.lost, recharge
 
 
 class SimplifiedBattleEngine:
     """SimplifiedBattle 시뮬레이션 엔진"""
 
     logger = logging.getLogger("SimplifiedBattleEngine")
+    _outcomes: Optional[OutcomeScript] = None  # enumerate_outcomes 재생 중에만 설정
     
-    def __init__(self, gen: int = 9):
+    def __init__(self, gen: int = 9, fused_damage: bool = True, rng=None):
         """
         Args:
             gen: 세대 (기본값: 9)
+            fused_damage: True면 보정 체인을 날씨별로 컴파일한 fused 함수 사용, False면 보정 객체를 하나씩 순회
+            rng: 난수 생성기 (BattleRandom 등 random.Random 호환 객체, None이면 전역 random 모듈)
         """
-        # GenData에서 타입 차트 가져오기
-        data = GenData.from_gen(gen)
-        self.type_chart = data.type_chart
+        # 행동 순서 / 명중 / 급소 / 랜덤 기술 / 자동 교체에 쓰는 난수
+        self.rng = rng if rng is not None else random
+        # 데이터 팩에서 타입 차트 가져오기 (GenData 전체를 읽지 않음)
+        self.type_chart = DataPack.from_gen(gen).type_chart
+        self.type_table = TypeChart.from_gen(gen)  # 정수 인덱스 상성표
         self.gen = gen
+        self.fused_damage = fused_damage
         
         # 데미지 보정 체인 초기화
         self.damage_modifiers = DamageModifierChain()
@@ -62,7 +138,8 @@ class SimplifiedBattleEngine:
         opponent_move_name: Optional[str] = None,
         player_switch_to: Optional[str] = None,
         opponent_switch_to: Optional[str] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        record_undo: bool = False
     ) -> SimplifiedBattle:
         """
         1턴 시뮬레이션
@@ -72,11 +149,14 @@ class SimplifiedBattleEngine:
             player_move_idx: 플레이어 기술 인덱스 (None이면 랜덤)
             opponent_move_idx: 상대 기술 인덱스 (None이면 랜덤)
             opponent_move_name: 상대 기술 이름 (opponent_move_idx 대신 사용 가능)
+            record_undo: True면 변경 내용을 기록해 undo_turn(battle)으로 되돌릴 수 있게 함 (복제 없이 탐색할 때 사용)
             
         Returns:
             새로운 SimplifiedBattle 객체 (원본 유지)
         """
         # 배틀 초기화
+        if record_undo:
+            new_battle.begin_undo_turn()
 
         if verbose:
             self.logger.info(f"시뮬레이션 시작 : {new_battle.turn}")
@@ -159,7 +239,7 @@ class SimplifiedBattleEngine:
                 opponent_move = "recharge" # 특수 행동 키워드
                 if verbose: self.logger.info("상대는 반동으로 움직일 수 없습니다!")
             else:
-                opponent_move = self.select_move(new_battle.opponent_active_pokemon, new_battle.active_pokemon, new_battle, move_name=opponent_move_name, verbose=verbose)
+                opponent_move = self.select_move(new_battle.opponent_active_pokemon, new_battle.active_pokemon, new_battle, move_idx=opponent_move_idx, move_name=opponent_move_name, verbose=verbose)
 
         if verbose:
             self.logger.info("=============================================== \n\n")
@@ -212,6 +292,146 @@ class SimplifiedBattleEngine:
         
         return new_battle
     
+    def undo_turn(self, battle: SimplifiedBattle):
+        """record_undo=True로 진행한 마지막 턴을 되돌림 (턴 시작 직전 상태로 정확히 복원)"""
+        battle.undo_turn()
+
+    def enumerate_outcomes(
+        self,
+        battle: SimplifiedBattle,
+        player_move_idx: Optional[int] = None,
+        opponent_move_idx: Optional[int] = None,
+        opponent_move_name: Optional[str] = None,
+        player_switch_to: Optional[str] = None,
+        opponent_switch_to: Optional[str] = None,
+        min_probability: float = 0.0
+    ) -> List[Tuple[float, SimplifiedBattle]]:
+        """
+        행동 조합 하나로 1턴 진행했을 때 나올 수 있는 서로 다른 결과와 그 확률
+        명중 / 급소 / 동속 순서 / 랜덤 기술 / 자동 교체 사건의 분기 조합을 깊이 우선으로 모두 재생하고,
+        결과 상태가 같은 조합(outcome_key)은 확률을 합쳐 하나로 만든다.
+
+        Args:
+            battle: 시작 상태 (변경되지 않음, 결과는 복제본)
+            player_move_idx ~ opponent_switch_to: simulate_turn과 동일
+            min_probability: 작은 쪽 분기의 경로 확률이 이보다 작은 사건은 샘플링 (예: 0.05면 급소 1/24는 나누지 않음,
+                             0이면 전부 나열, 확률 합은 항상 1)
+
+        Returns:
+            [(확률, 결과 상태), ...] 확률 내림차순
+        """
+        actions = dict(player_move_idx=player_move_idx, opponent_move_idx=opponent_move_idx,
+                       opponent_move_name=opponent_move_name, player_switch_to=player_switch_to,
+                       opponent_switch_to=opponent_switch_to)
+        return self._enumerate(battle, actions, min_probability, in_place=False)
+
+    def outcome_branches(
+        self,
+        battle: SimplifiedBattle,
+        player_move_idx: Optional[int] = None,
+        opponent_move_idx: Optional[int] = None,
+        opponent_move_name: Optional[str] = None,
+        player_switch_to: Optional[str] = None,
+        opponent_switch_to: Optional[str] = None,
+        min_probability: float = 0.0,
+        visit: Optional[Callable[[SimplifiedBattle, float], object]] = None
+    ) -> list:
+        """
+        enumerate_outcomes의 복제 없는 버전 (make / unmake)
+        battle을 그 자리에서 분기 조합마다 진행했다가 되돌리고, 결과 상태 대신 그 결과를 다시 만드는 분기 인덱스를 반환한다.
+        결과 상태가 필요할 때 play_outcome(battle, branches, ...)으로 진행하고 undo_turn으로 되돌린다.
+
+        Args:
+            visit: 서로 다른 결과 상태를 처음 만났을 때 되돌리기 전에 호출할 함수 visit(결과 상태, 그 분기 조합의 확률).
+                   나열하면서 결과 상태를 바로 쓰면(평가 / 첫 행동 탐색) 같은 결과를 다시 재생하지 않아도 됨.
+                   결과 상태를 바꿨다면 되돌려 놓아야 함
+
+        Returns:
+            [(확률, 분기 인덱스 목록), ...] 확률 내림차순 (battle은 호출 전 상태로 복원됨).
+            visit이 있으면 [(확률, 분기 인덱스 목록, visit 반환값), ...]
+        """
+        actions = dict(player_move_idx=player_move_idx, opponent_move_idx=opponent_move_idx,
+                       opponent_move_name=opponent_move_name, player_switch_to=player_switch_to,
+                       opponent_switch_to=opponent_switch_to)
+        return self._enumerate(battle, actions, min_probability, in_place=True, visit=visit)
+
+    def play_outcome(
+        self,
+        battle: SimplifiedBattle,
+        branches: List[int],
+        player_move_idx: Optional[int] = None,
+        opponent_move_idx: Optional[int] = None,
+        opponent_move_name: Optional[str] = None,
+        player_switch_to: Optional[str] = None,
+        opponent_switch_to: Optional[str] = None,
+        record_undo: bool = False
+    ) -> SimplifiedBattle:
+        """outcome_branches가 돌려준 분기 인덱스대로 battle을 1턴 진행 (행동 조합은 outcome_branches와 같아야 함)"""
+        self._outcomes = OutcomeScript(branches)
+        try:
+            return self.simulate_turn(
+                battle,
+                player_move_idx=player_move_idx,
+                opponent_move_idx=opponent_move_idx,
+                opponent_move_name=opponent_move_name,
+                player_switch_to=player_switch_to,
+                opponent_switch_to=opponent_switch_to,
+                record_undo=record_undo
+            )
+        finally:
+            self._outcomes = None
+
+    def _enumerate(self, battle: SimplifiedBattle, actions: dict, min_probability: float, in_place: bool,
+                   visit: Optional[Callable] = None) -> list:
+        """
+        분기 조합을 깊이 우선으로 재생하고 같은 결과끼리 확률 합산
+        Args:
+            in_place: True면 battle에서 진행 후 되돌리고 (확률, 분기 인덱스), False면 복제본을 진행해 (확률, 결과 상태)
+            visit: in_place에서 새 결과마다 되돌리기 전에 호출 (반환값을 결과 뒤에 붙임, outcome_branches 참고)
+        """
+        outcomes = {}
+        prefix: Optional[List[int]] = []
+        while prefix is not None:
+            script = OutcomeScript(prefix, min_probability)
+            state = battle if in_place else battle.clone()
+            self._outcomes = script
+            try:
+                self.simulate_turn(state, record_undo=in_place, **actions)
+            finally:
+                self._outcomes = None
+
+            if in_place:
+                result = [index for index, _ in script.trace]
+            else:
+                result = state
+            next_prefix = script.next_prefix()
+            # 분기 조합이 하나뿐이면 병합할 결과가 없으므로 해시 생략
+            key = outcome_key(state) if outcomes or next_prefix is not None else None
+            entry = outcomes.get(key)
+            if entry is None:
+                entry = outcomes[key] = [script.probability, result]
+                if visit is not None:
+                    entry.append(visit(state, script.probability))
+            else:
+                entry[0] += script.probability
+            if in_place:
+                self.undo_turn(state)
+            prefix = next_prefix
+
+        return sorted((tuple(entry) for entry in outcomes.values()), key=lambda outcome: -outcome[0])
+
+    def _chance(self, probability: float) -> bool:
+        """probability 확률로 True (enumerate_outcomes 재생 중에는 정해진 분기)"""
+        if self._outcomes is not None:
+            return self._outcomes.chance(probability, self.rng)
+        return self.rng.random() < probability
+
+    def _choose(self, options: list):
+        """options 중 균등 랜덤 선택 (enumerate_outcomes 재생 중에는 정해진 분기)"""
+        if self._outcomes is not None:
+            return self._outcomes.choose(options, self.rng)
+        return self.rng.choice(options)
+
     def _sync_references(self, battle: SimplifiedBattle):
         """
         활성 포켓몬과 팀 딕셔너리의 포켓몬 객체를 동기화
@@ -295,7 +515,7 @@ class SimplifiedBattleEngine:
                 valid_moves = available_moves
 
             if valid_moves:
-                selected_move = random.choice(valid_moves)
+                selected_move = self._choose(valid_moves)
             else:
                 return self._create_default_move(pokemon) # PP 없음
 
@@ -361,7 +581,7 @@ class SimplifiedBattleEngine:
             return attacker2, move2, attacker1, move1
         elif move1 == "switch" and move2 == "switch":
             # 둘 다 교체면 랜덤 순서
-            if random.random() < 0.5:
+            if self._chance(0.5):
                 return attacker1, move1, attacker2, move2
             else:
                 return attacker2, move2, attacker1, move1
@@ -385,7 +605,7 @@ class SimplifiedBattleEngine:
             return attacker2, move2, attacker1, move1
         
         # 동속: 랜덤 (50:50)
-        if random.random() < 0.5:
+        if self._chance(0.5):
             return attacker1, move1, attacker2, move2
         else:
             return attacker2, move2, attacker1, move1
@@ -413,8 +633,8 @@ class SimplifiedBattleEngine:
         if(verbose): 
             self.logger.info(f"기술 정보 - Power: {move.base_power}, Accuracy: {move.accuracy}, Category: {move.category.name}")
 
-        # PP 소모
-        move.current_pp = max(0, move.current_pp - 1)
+        # PP 소모 (포켓몬 쪽에서 소모해야 Zobrist 해시가 갱신됨)
+        attacker.spend_pp(move)
         
         # 1. 명중 판정
         if not self._check_accuracy(attacker, defender, move, verbose=verbose):
@@ -441,6 +661,7 @@ class SimplifiedBattleEngine:
                 self.logger.info(f"{defender.species} HP is now {defender.current_hp}/{defender.max_hp}")
         
         if 'recharge' in move.flags:
+            record_volatile(attacker, 'must_recharge')
             attacker.volatiles['must_recharge'] = True
             if verbose:
                 self.logger.info(f"  [Effect] {attacker.species} must recharge next turn!")
@@ -489,7 +710,7 @@ class SimplifiedBattleEngine:
         final_accuracy = max(0.01, min(1.0, final_accuracy))
         
         # 확률 판정
-        return random.random() < final_accuracy
+        return self._chance(final_accuracy)
     
     def _check_critical_hit(
         self,
@@ -510,7 +731,7 @@ class SimplifiedBattleEngine:
         crit_ratios = [1/24, 1/8, 1/2, 1/4]
         crit_ratio = crit_ratios[min(crit_stage, 3)]
         
-        return random.random() < crit_ratio
+        return self._chance(crit_ratio)
     
     def _calculate_damage(
         self,
@@ -553,18 +774,18 @@ class SimplifiedBattleEngine:
             self.logger.info(f" - Pure Base Damage: {base_damage:.2f}")
 
         # 보정 적용
-        battle_context = {
-            'weather': battle.weather,
-            'fields': battle.fields,
-            'type_chart': self.type_chart
-        }
-        
-        # Modifier 적용 전후 비교
         final_damage = base_damage
         if hasattr(self, 'damage_modifiers'):
-             final_damage = self.damage_modifiers.apply_all(
-                base_damage, attacker, defender, move, crit, battle_context
-            )
+            chain = self.damage_modifiers
+            if self.fused_damage:
+                # 날씨별로 컴파일된 함수 사용 (사용자 정의 보정이 없으면 컨텍스트 딕셔너리도 만들지 않음)
+                damage_fn = chain.compile(WeatherModifier.weather_key(battle.weather), self.type_table)
+                battle_context = self._make_battle_context(battle) if chain.needs_context else None
+                final_damage = damage_fn(base_damage, attacker, defender, move, crit, battle_context)
+            else:
+                final_damage = chain.apply_all(
+                    base_damage, attacker, defender, move, crit, self._make_battle_context(battle)
+                )
         
         if verbose:
              self.logger.info(f" - Final Damage (After Modifiers): {final_damage}")
@@ -572,6 +793,15 @@ class SimplifiedBattleEngine:
 
         return max(1, int(final_damage))
     
+    def _make_battle_context(self, battle: SimplifiedBattle) -> dict:
+        """데미지 보정에 전달할 배틀 컨텍스트"""
+        return {
+            'weather': battle.weather,
+            'fields': battle.fields,
+            'type_chart': self.type_chart,
+            'type_table': self.type_table
+        }
+
     def _end_of_turn(self, battle: SimplifiedBattle):
         """턴 종료 처리"""
         # 능력치 타이머 업데이트 (만료된 boost 해제)
@@ -588,6 +818,7 @@ class SimplifiedBattleEngine:
             if p and p.volatiles.get('must_recharge'):
                 # TODO 이번 턴에 행동이 'recharge'였는지 확인하는 로직이 필요하지만,
                 # 일단 턴이 지나면 무조건 해제
+                record_volatile(p, 'must_recharge')
                 p.volatiles['must_recharge'] = False
     
     def _apply_move_effects(
@@ -699,6 +930,7 @@ class SimplifiedBattleEngine:
         elif pokemon.status == Status.PSN:
             pokemon.damage(pokemon.max_hp // 8)
         elif pokemon.status == Status.TOX:
+            record_attr(pokemon, 'status_counter')
             pokemon.status_counter += 1
             damage = (pokemon.max_hp * pokemon.status_counter) // 16
             pokemon.damage(damage)
@@ -813,7 +1045,7 @@ class SimplifiedBattleEngine:
             # 살아있는 포켓몬이 현재 활성 포켓몬뿐이면 그것 선택
             new_active = alive_pokemon[0]
         else:
-            new_active = random.choice(available)
+            new_active = self._choose(available)
         
         if is_player:
             battle.active_pokemon = new_active
@@ -821,6 +1053,7 @@ class SimplifiedBattleEngine:
             battle.opponent_active_pokemon = new_active
         
         # first_turn 초기화
+        record_attr(new_active, 'first_turn')
         new_active.first_turn = True
 
     def swtich_active_pokemon(
@@ -847,6 +1080,7 @@ class SimplifiedBattleEngine:
                 battle.opponent_active_pokemon = switch_pokemon
             
             # first_turn 초기화
+            record_attr(switch_pokemon, 'first_turn')
             switch_pokemon.first_turn = True
     
     def _print_battle_status(self, battle: SimplifiedBattle, label: str):
@@ -2,6 +2,7 @@
 Battle 시뮬레이션 관련 모듈
 """
 from .SimplifiedBattleEngine import SimplifiedBattleEngine
+from .BatchedBattleEngine import BatchState, BatchedBattleEngine
 from .DamageModifiers import (
     DamageModifier,
     DamageModifierChain,
@@ -15,6 +16,8 @@ from .DamageModifiers import (
 
 __all__ = [
     'SimplifiedBattleEngine',
+    'BatchState',
+    'BatchedBattleEngine',
     'DamageModifier',
     'DamageModifierChain',
     'BurnModifier',
@@ -0,0 +1,60 @@
+"""
+가중치 이산 분포 O(1) 샘플링 (Walker / Vose alias method)
+
+rng.choices(population, weights=...)는 호출마다 누적 가중치를 만들고 이분 탐색을 하므로
+같은 분포에서 여러 번 뽑을 때 매번 O(n)이 든다.
+별칭 표는 만들 때 O(n)을 한 번 쓰고, 이후 샘플 1개는 난수 1개 + 비교 1번으로 끝난다.
+"""
+from typing import Sequence
+
+
+class AliasTable:
+    """
+    가중치 → 별칭 표
+    Args:
+        weights: 항목별 가중치 (0 이상, 합이 0보다 커야 함)
+    """
+
+    __slots__ = ('size', 'prob', 'alias')
+
+    def __init__(self, weights: Sequence[float]):
+        size = len(weights)
+        total = float(sum(weights))
+        if size == 0 or total <= 0:
+            raise ValueError(f"별칭 표 가중치가 비어 있거나 합이 0 이하: {list(weights)}")
+
+        # 평균이 1이 되도록 정규화한 뒤 1보다 작은 칸을 큰 칸의 일부로 채움
+        scaled = [w * size / total for w in weights]
+        prob = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # 남은 칸은 부동소수점 오차만 있으므로 확률 1로 둠
+
+        self.size = size
+        self.prob = prob
+        self.alias = alias
+
+    def sample(self, rng) -> int:
+        """인덱스 1개 샘플 (rng.random() 1회 사용)"""
+        u = rng.random() * self.size
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def probabilities(self) -> list:
+        """표가 나타내는 항목별 확률 (검증용)"""
+        result = [0.0] * self.size
+        for i in range(self.size):
+            result[i] += self.prob[i] / self.size
+            result[self.alias[i]] += (1.0 - self.prob[i]) / self.size
+        return result
+
+    def __len__(self) -> int:
+        return self.size
@@ -0,0 +1,80 @@
+"""
+주입 가능한 배틀 난수 생성기
+
+엔진 / 배틀 생성 / 플레이어가 프로세스 전역 random 모듈 대신 이 객체를 받아 쓰면
+- 같은 시드로 탐색 결과를 그대로 재현할 수 있고
+- split()으로 워커 / 롤아웃마다 서로 독립적인 스트림을 나눠 병렬 탐색끼리 간섭하지 않으며
+- 같은 스트림을 두 방법에 주면 공통 난수(common random numbers) 비교가 가능하다.
+
+random.Random 하위 클래스이므로 random(), choice(), randint(), sample() 등을 그대로 쓸 수 있다.
+시드는 numpy SeedSequence로 관리하며, 배치 엔진용 numpy Generator도 같은 시드에서 파생된다.
+"""
+import random
+from typing import List, Union
+
+import numpy as np
+
+# numpy Generator에 쓰는 예약 자식 키 (split()으로 만드는 자식 스트림과 겹치지 않음)
+_NUMPY_STREAM_KEY = 2 ** 32 - 1
+
+
+class BattleRandom(random.Random):
+    """
+    시드 / 분할 가능한 난수 생성기
+    Args:
+        seed: 정수 시드, SeedSequence, 또는 None (OS 엔트로피)
+    """
+
+    def __init__(self, seed: Union[int, np.random.SeedSequence, None] = None):
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed_sequence = seed
+        self._np = None
+        super().__init__(self._python_seed(seed))
+
+    @staticmethod
+    def _python_seed(seed_sequence: np.random.SeedSequence) -> int:
+        words = seed_sequence.generate_state(4, dtype=np.uint32)
+        return int.from_bytes(words.tobytes(), 'little')
+
+    def split(self) -> 'BattleRandom':
+        """독립된 자식 스트림 1개 (호출 순서가 같으면 항상 같은 스트림)"""
+        return BattleRandom(self.seed_sequence.spawn(1)[0])
+
+    def spawn(self, n: int) -> List['BattleRandom']:
+        """독립된 자식 스트림 n개 (워커 / 롤아웃별 분배용)"""
+        return [BattleRandom(child) for child in self.seed_sequence.spawn(n)]
+
+    def numpy(self) -> np.random.Generator:
+        """같은 시드에서 파생된 numpy Generator (배치 엔진 / 대량 추출용)"""
+        if self._np is None:
+            seq = self.seed_sequence
+            child = np.random.SeedSequence(seq.entropy, spawn_key=seq.spawn_key + (_NUMPY_STREAM_KEY,),
+                                           pool_size=seq.pool_size)
+            self._np = np.random.Generator(np.random.PCG64(child))
+        return self._np
+
+    def random_batch(self, n: int) -> np.ndarray:
+        """[0, 1) 균등 난수 n개를 한 번에 추출"""
+        return self.numpy().random(n)
+
+    # pickle (프로세스 풀 전달) 시 시드 계보와 두 생성기 상태를 함께 보존
+    def __reduce__(self):
+        np_state = self._np.bit_generator.state if self._np is not None else None
+        return (self.__class__, (self.seed_sequence,), (self.getstate(), np_state))
+
+    def __setstate__(self, state):
+        py_state, np_state = state
+        self.setstate(py_state)
+        if np_state is not None:
+            self.numpy().bit_generator.state = np_state
+
+
+def numpy_generator(rng) -> np.random.Generator:
+    """BattleRandom / numpy Generator / None(새 Generator)을 numpy Generator로 변환"""
+    if rng is None:
+        return np.random.default_rng()
+    if isinstance(rng, BattleRandom):
+        return rng.numpy()
+    return rng
+
@@ -0,0 +1,408 @@
+"""
+미리 컴파일한 게임 데이터 팩 (mmap 공유, 읽기 전용)
+
+poke-env GenData는 프로세스마다 pokedex / moves / learnset JSON 전체를 파싱해 딕셔너리로 들고 있다.
+이 모듈은 시뮬레이터가 쓰는 필드만 골라 하나의 바이너리 파일로 컴파일하고,
+mmap(ACCESS_READ)으로 열어 필요한 레코드만 그때그때 해석한다.
+파일 페이지는 OS 페이지 캐시를 통해 워커 프로세스끼리 공유된다.
+
+파일 구성 (리틀 엔디언):
+    헤더        MAGIC, 버전, 세대, 섹션 수 + 섹션 표 (이름, 오프셋, 크기)
+    STRS        문자열 표 (개수, 오프셋 배열, UTF-8 바이트) - 모든 이름 / id / JSON 조각이 여기 있음
+    SPEC        종 레코드 (고정 폭, 문자열은 STRS 인덱스)
+    MOVE        기술 레코드 (고정 폭, 플래그는 비트마스크, 부가 효과는 JSON 문자열 인덱스)
+    FLAG        기술 플래그 이름 목록
+    LIDX/LMOV   learnset 키별 (시작, 개수) + 배울 수 있는 기술 id 배열
+    TYPE        타입 상성표 (방어 타입 x 공격 타입 float32)
+    FACT        factory-sets.json (압축 JSON)
+
+처음 DataPack.from_gen()을 호출할 때 파일이 없거나 버전이 다르면 GenData로부터 한 번 빌드한다.
+직접 빌드: python DataPack.py --gen 9
+"""
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple
+
+MAGIC = b'PKDPACK1'
+VERSION = 1
+NONE = 0xFFFFFFFF  # 없는 문자열
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data')
+
+_HEADER = struct.Struct('<8sIII')
+_SECTION = struct.Struct('<4sQQ')
+_U32 = struct.Struct('<I')
+
+# 종: id, name, num, baseSpecies, forme, 타입1, 타입2, 종족값 6개, 특성 0/1/H/S, 무게(0.1kg), prevo, evos(JSON), isNonstandard
+_SPECIES = struct.Struct('<IIiIIII6HIIIIIIII')
+STAT_ORDER = ('hp', 'atk', 'def', 'spa', 'spd', 'spe')
+ABILITY_SLOTS = ('0', '1', 'H', 'S')
+
+# 기술: id, name, num, basePower, accuracy(255=반드시 명중), pp, priority, critRatio,
+#       type, category, target, status, isNonstandard, recoil(분자, 분모), drain(분자, 분모), flags, 부가 효과(JSON)
+_MOVE = struct.Struct('<IIiHBBbBIIIIIBBBBQI')
+ALWAYS_HITS = 255
+# 고정 폭 필드 외에 JSON으로 보존하는 기술 키
+MOVE_EXTRA_KEYS = (
+    'boosts', 'selfBoost', 'secondary', 'secondaries', 'self', 'volatileStatus', 'sideCondition',
+    'slotCondition', 'pseudoWeather', 'weather', 'terrain', 'heal', 'multihit', 'selfSwitch', 'forceSwitch',
+    'ignoreAbility', 'ignoreImmunity', 'breaksProtect', 'willCrit', 'ohko', 'damage', 'selfdestruct',
+    'stallingMove', 'thawsTarget', 'sleepUsable',
+)
+
+_LEARNSET = struct.Struct('<III')
+
+
+# =================================================================
+# 빌드
+# =================================================================
+class _StringTable:
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def add(self, value) -> int:
+        if value is None:
+            return NONE
+        value = str(value)
+        i = self.index.get(value)
+        if i is None:
+            i = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return i
+
+    def add_json(self, value) -> int:
+        return NONE if value is None else self.add(json.dumps(value, separators=(',', ':'), sort_keys=True))
+
+    def pack(self) -> bytes:
+        encoded = [s.encode('utf-8') for s in self.strings]
+        offsets = [0]
+        for b in encoded:
+            offsets.append(offsets[-1] + len(b))
+        return (_U32.pack(len(encoded)) + struct.pack(f'<{len(offsets)}I', *offsets) + b''.join(encoded))
+
+
+def _pair(value) -> Tuple[int, int]:
+    return (value[0], value[1]) if value else (0, 0)
+
+
+def build_pack(gen: int = 9, path: Optional[str] = None, factory_sets_path: Optional[str] = None) -> str:
+    """
+    GenData와 factory-sets.json으로 데이터 팩 파일 생성
+    Args:
+        gen: 포켓몬 세대
+        path: 출력 경로 (None이면 data/gen{gen}/datapack.bin)
+        factory_sets_path: factory-sets.json 경로 (None이면 data/gen{gen}/factory-sets.json, 없으면 빈 객체)
+    """
+    from poke_env.data import GenData
+    data = GenData.from_gen(gen)
+    path = path or default_pack_path(gen)
+    strings = _StringTable()
+
+    species_records = []
+    for species_id, entry in data.pokedex.items():
+        types = entry.get('types', [])
+        stats = entry.get('baseStats', {})
+        abilities = entry.get('abilities', {})
+        weight = entry.get('weightkg')
+        species_records.append(_SPECIES.pack(
+            strings.add(species_id), strings.add(entry.get('name')), entry.get('num', 0),
+            strings.add(entry.get('baseSpecies')), strings.add(entry.get('forme')),
+            strings.add(types[0] if types else None), strings.add(types[1] if len(types) > 1 else None),
+            *(stats.get(stat, 0) for stat in STAT_ORDER),
+            *(strings.add(abilities.get(slot)) for slot in ABILITY_SLOTS),
+            NONE if weight is None else round(weight * 10),
+            strings.add(entry.get('prevo')), strings.add_json(entry.get('evos')),
+            strings.add(entry.get('isNonstandard')),
+        ))
+
+    flag_names = sorted({flag for entry in data.moves.values() for flag in entry.get('flags', {})})
+    flag_bit = {name: 1 << i for i, name in enumerate(flag_names)}
+    move_records = []
+    for move_id, entry in data.moves.items():
+        accuracy = entry.get('accuracy', True)
+        extra = {key: entry[key] for key in MOVE_EXTRA_KEYS if key in entry}
+        move_records.append(_MOVE.pack(
+            strings.add(move_id), strings.add(entry.get('name')), entry.get('num', 0),
+            entry.get('basePower', 0), ALWAYS_HITS if accuracy is True else accuracy, entry.get('pp', 0),
+            entry.get('priority', 0), entry.get('critRatio', 0),
+            strings.add(entry.get('type')), strings.add(entry.get('category')), strings.add(entry.get('target')),
+            strings.add(entry.get('status')), strings.add(entry.get('isNonstandard')),
+            *_pair(entry.get('recoil')), *_pair(entry.get('drain')),
+            sum(flag_bit[flag] for flag in entry.get('flags', {})),
+            strings.add_json(extra or None),
+        ))
+
+    # learnset: 'learnset'이 있으면 그 키 순서대로, 없으면 eventData 기술 합집합 (정렬)
+    learnset_records = []
+    learnset_moves = []
+    for name, entry in data.learnset.items():
+        if 'learnset' in entry:
+            moves = list(entry['learnset'].keys())
+        else:
+            moves = sorted({m for event in entry.get('eventData', []) for m in event.get('moves', [])})
+            if not moves:
+                continue
+        learnset_records.append(_LEARNSET.pack(strings.add(name), len(learnset_moves), len(moves)))
+        learnset_moves.extend(strings.add(m) for m in moves)
+
+    type_names = list(data.type_chart.keys())
+    type_table = [float(data.type_chart[defender].get(attacker, 1)) for defender in type_names for attacker in type_names]
+
+    factory_sets_path = factory_sets_path or os.path.join(DATA_DIR, f'gen{gen}', 'factory-sets.json')
+    factory_sets = {}
+    if os.path.exists(factory_sets_path):
+        with open(factory_sets_path, encoding='utf-8') as f:
+            factory_sets = json.load(f)
+
+    sections = [
+        (b'SPEC', _U32.pack(len(species_records)) + b''.join(species_records)),
+        (b'MOVE', _U32.pack(len(move_records)) + b''.join(move_records)),
+        (b'FLAG', _U32.pack(len(flag_names)) + struct.pack(f'<{len(flag_names)}I', *map(strings.add, flag_names))),
+        (b'LIDX', _U32.pack(len(learnset_records)) + b''.join(learnset_records)),
+        (b'LMOV', struct.pack(f'<{len(learnset_moves)}I', *learnset_moves)),
+        (b'TYPE', _U32.pack(len(type_names)) + struct.pack(f'<{len(type_names)}I', *map(strings.add, type_names))
+         + struct.pack(f'<{len(type_table)}f', *type_table)),
+        (b'FACT', json.dumps(factory_sets, separators=(',', ':')).encode('utf-8')),
+    ]
+    sections.insert(0, (b'STRS', strings.pack()))  # 다른 섹션이 문자열을 모두 등록한 뒤 마지막에 직렬화
+
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    for name, payload in sections:
+        offset += -offset % 8  # 섹션 시작 8바이트 정렬
+        table.append(_SECTION.pack(name, offset, len(payload)))
+        offset += len(payload)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, gen, len(sections)))
+        f.write(b''.join(table))
+        for (name, payload), entry in zip(sections, table):
+            f.seek(_SECTION.unpack(entry)[1])
+            f.write(payload)
+    # 여러 프로세스가 동시에 빌드해도 완성된 파일만 보이도록 교체
+    os.replace(tmp_path, path)
+    return path
+
+
+def default_pack_path(gen: int) -> str:
+    return os.path.normpath(os.path.join(DATA_DIR, f'gen{gen}', 'datapack.bin'))
+
+
+# =================================================================
+# 읽기
+# =================================================================
+class _RecordTable(Mapping):
+    """id → 레코드 딕셔너리 (GenData의 pokedex / moves와 같은 형태, 접근한 레코드만 해석 후 캐시)"""
+
+    def __init__(self, ids: List[str], decode):
+        self._index = {record_id: i for i, record_id in enumerate(ids)}
+        self._decode = decode
+        self._cache: Dict[str, dict] = {}
+
+    def __getitem__(self, key: str) -> dict:
+        entry = self._cache.get(key)
+        if entry is None:
+            entry = self._cache[key] = self._decode(self._index[key])
+        return entry
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def keys(self):
+        return self._index.keys()
+
+
+class DataPack:
+    """
+    mmap으로 연 데이터 팩
+    Args:
+        path: 팩 파일 경로
+    """
+
+    _CACHE: Dict[int, 'DataPack'] = {}
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.gen, count = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self._buf.close()
+            raise ValueError(f"데이터 팩 형식이 맞지 않습니다: {path} (버전 {version})")
+
+        self._sections = {}
+        for i in range(count):
+            name, offset, size = _SECTION.unpack_from(self._buf, _HEADER.size + i * _SECTION.size)
+            self._sections[name] = (offset, size)
+
+        strs = self._sections[b'STRS'][0]
+        self._num_strings = _U32.unpack_from(self._buf, strs)[0]
+        self._str_offsets = strs + 4
+        self._str_base = self._str_offsets + (self._num_strings + 1) * 4
+        self._str_cache: Dict[int, str] = {}
+
+        self._species_base, species_count = self._table(b'SPEC')
+        self._move_base, move_count = self._table(b'MOVE')
+        flag_base, flag_count = self._table(b'FLAG')
+        self._flag_names = [self._str(i) for i in struct.unpack_from(f'<{flag_count}I', self._buf, flag_base)]
+
+        self.pokedex = _RecordTable(
+            [self._str(_U32.unpack_from(self._buf, self._species_base + i * _SPECIES.size)[0]) for i in range(species_count)],
+            self._decode_species)
+        self.moves = _RecordTable(
+            [self._str(_U32.unpack_from(self._buf, self._move_base + i * _MOVE.size)[0]) for i in range(move_count)],
+            self._decode_move)
+
+        learnset_base, learnset_count = self._table(b'LIDX')
+        self._learnset_index = {}
+        for i in range(learnset_count):
+            name, start, n = _LEARNSET.unpack_from(self._buf, learnset_base + i * _LEARNSET.size)
+            self._learnset_index[self._str(name)] = (start, n)
+        self._learnset_cache: Dict[str, Tuple[str, ...]] = {}
+
+        self._type_chart = None
+        self._factory_sets = None
+        self._standard_species = None
+
+    @classmethod
+    def from_gen(cls, gen: int = 9) -> 'DataPack':
+        """세대별 팩 (프로세스당 1회만 열고 캐시, 파일이 없거나 버전이 다르면 빌드)"""
+        pack = cls._CACHE.get(gen)
+        if pack is None:
+            path = default_pack_path(gen)
+            try:
+                pack = cls(path)
+            except (FileNotFoundError, ValueError):
+                pack = cls(build_pack(gen, path))
+            cls._CACHE[gen] = pack
+        return pack
+
+    def _table(self, name: bytes) -> Tuple[int, int]:
+        offset = self._sections[name][0]
+        return offset + 4, _U32.unpack_from(self._buf, offset)[0]
+
+    def _str(self, i: int) -> Optional[str]:
+        if i == NONE:
+            return None
+        s = self._str_cache.get(i)
+        if s is None:
+            start, end = struct.unpack_from('<II', self._buf, self._str_offsets + i * 4)
+            s = self._str_cache[i] = self._buf[self._str_base + start:self._str_base + end].decode('utf-8')
+        return s
+
+    def _json(self, i: int):
+        return None if i == NONE else json.loads(self._str(i))
+
+    # -----------------------------------------------------------------
+    # 레코드 해석 (GenData JSON과 같은 키 이름, 없는 필드는 키도 없음)
+    # -----------------------------------------------------------------
+    def _decode_species(self, i: int) -> dict:
+        fields = _SPECIES.unpack_from(self._buf, self._species_base + i * _SPECIES.size)
+        (_, name, num, base_species, forme, type_1, type_2), stats = fields[:7], fields[7:13]
+        abilities, (weight, prevo, evos, nonstandard) = fields[13:17], fields[17:]
+
+        entry = {'num': num, 'name': self._str(name),
+                 'types': [self._str(t) for t in (type_1, type_2) if t != NONE],
+                 'baseStats': dict(zip(STAT_ORDER, stats)),
+                 'abilities': {slot: self._str(a) for slot, a in zip(ABILITY_SLOTS, abilities) if a != NONE}}
+        for key, value in (('baseSpecies', base_species), ('forme', forme), ('prevo', prevo),
+                           ('isNonstandard', nonstandard)):
+            if value != NONE:
+                entry[key] = self._str(value)
+        if weight != NONE:
+            entry['weightkg'] = weight / 10
+        if evos != NONE:
+            entry['evos'] = self._json(evos)
+        return entry
+
+    def _decode_move(self, i: int) -> dict:
+        (_, name, num, base_power, accuracy, pp, priority, crit_ratio, move_type, category, target, status,
+         nonstandard, recoil_n, recoil_d, drain_n, drain_d, flags, extra) = _MOVE.unpack_from(
+            self._buf, self._move_base + i * _MOVE.size)
+
+        entry = {'num': num, 'name': self._str(name), 'basePower': base_power,
+                 'accuracy': True if accuracy == ALWAYS_HITS else accuracy, 'pp': pp, 'priority': priority,
+                 'type': self._str(move_type), 'category': self._str(category), 'target': self._str(target),
+                 'flags': {flag: 1 for bit, flag in enumerate(self._flag_names) if flags >> bit & 1}}
+        if crit_ratio:
+            entry['critRatio'] = crit_ratio
+        if status != NONE:
+            entry['status'] = self._str(status)
+        if nonstandard != NONE:
+            entry['isNonstandard'] = self._str(nonstandard)
+        if recoil_d:
+            entry['recoil'] = [recoil_n, recoil_d]
+        if drain_d:
+            entry['drain'] = [drain_n, drain_d]
+        if extra != NONE:
+            entry.update(self._json(extra))
+        return entry
+
+    # -----------------------------------------------------------------
+    # 조회
+    # -----------------------------------------------------------------
+    def learnable_moves(self, name: str) -> Optional[Tuple[str, ...]]:
+        """learnset 키의 배울 수 있는 기술 id (learnset 우선, 없으면 eventData 기술), 데이터가 없으면 None"""
+        moves = self._learnset_cache.get(name)
+        if moves is None:
+            location = self._learnset_index.get(name)
+            if location is None:
+                return None
+            start, n = location
+            base = self._sections[b'LMOV'][0] + start * 4
+            moves = self._learnset_cache[name] = tuple(
+                self._str(i) for i in struct.unpack_from(f'<{n}I', self._buf, base))
+        return moves
+
+    def standard_species(self) -> List[str]:
+        """랜덤 포켓몬 후보 (도감 번호 > 0, 비표준 아님, 최종 진화형)"""
+        if self._standard_species is None:
+            species = []
+            for i, species_id in enumerate(self.pokedex):
+                fields = _SPECIES.unpack_from(self._buf, self._species_base + i * _SPECIES.size)
+                num, evos, nonstandard = fields[2], fields[19], fields[20]
+                if num > 0 and evos == NONE and nonstandard == NONE:
+                    species.append(species_id)
+            self._standard_species = species
+        return self._standard_species
+
+    @property
+    def type_chart(self) -> Dict[str, Dict[str, float]]:
+        """{방어 타입: {공격 타입: 배율}} (GenData.type_chart 형식)"""
+        if self._type_chart is None:
+            base, n = self._table(b'TYPE')
+            names = [self._str(i) for i in struct.unpack_from(f'<{n}I', self._buf, base)]
+            values = struct.unpack_from(f'<{n * n}f', self._buf, base + n * 4)
+            self._type_chart = {defender: {attacker: values[d * n + a] for a, attacker in enumerate(names)}
+                                for d, defender in enumerate(names)}
+        return self._type_chart
+
+    @property
+    def factory_sets(self) -> dict:
+        """factory-sets.json 내용 (처음 접근할 때 해석)"""
+        if self._factory_sets is None:
+            offset, size = self._sections[b'FACT']
+            self._factory_sets = json.loads(self._buf[offset:offset + size])
+        return self._factory_sets
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="게임 데이터 팩 빌드")
+    parser.add_argument('--gen', type=int, default=9)
+    parser.add_argument('--out', help="출력 경로 (기본값: data/gen{gen}/datapack.bin)")
+    args = parser.parse_args()
+    out = build_pack(args.gen, args.out)
+    print(f"데이터 팩 생성: {out} ({os.path.getsize(out) / 1024:.0f} KB)")
@@ -0,0 +1,35 @@
+"""
+시간 예산 탐색 중 순환 참조 GC 일시 정지
+
+게임 데이터 / 캐시가 올라온 프로세스에는 추적 대상 객체가 20만 개 이상이라 2세대 GC 한 번이 100ms 이상 걸리고,
+탐색 중 clone으로 객체가 계속 생기므로 이 멈춤이 결정 중간에 끼어 마감 시각을 그만큼 넘긴다 (처리량도 절반 가까이 줄어듦).
+탐색 동안 자동 GC를 끄고 끝나면 다시 켠다.
+    - 탐색 트리 / 상태는 참조 카운트로 해제됨 (MCTS 트리의 부모 / 자식 순환은 MCTSSearcher.release로,
+      ArrayBattle 뷰 → 배틀 참조는 약한 참조로 끊음)
+    - 그래도 생긴 순환 참조 쓰레기는 다시 켠 뒤 자동 GC가 수집하고 (영구 세대로 옮기지 않음),
+      배틀이 끝날 때처럼 지연이 중요하지 않은 시점에 collect_idle로 한 번 더 정리
+"""
+import gc
+from contextlib import contextmanager
+
+
+@contextmanager
+def gc_paused(enabled: bool = True):
+    """
+    블록 동안 자동 GC 정지, 끝나면 다시 켬
+    Args:
+        enabled: False면 GC를 그대로 둠 (마감 시각 없는 탐색). 이미 꺼져 있으면 아무것도 하지 않음
+    """
+    if not enabled or not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def collect_idle() -> int:
+    """지연이 중요하지 않은 시점(배틀 종료 등)의 전체 수집 (수집한 객체 수 반환)"""
+    return gc.collect()
@@ -0,0 +1,121 @@
+# TypeChart.py
+# 정수 인덱스 기반 타입 상성표
+
+"""
+타입 상성 계산을 배열 인덱스 한 번으로 끝내기 위한 상성표
+
+- 타입마다 정수 코드 부여 (poke-env PokemonType 순서, TYPELESS = 무타입/???/스텔라)
+- single[공격 * NUM_TYPES + 방어] : 단일 타입 상성
+- dual[공격 * DUAL_STRIDE + 방어 키] : 복합 타입 방어자 상성 (방어 키 = defense_key(타입1, 타입2))
+- stab[기술 타입 * DUAL_STRIDE + 공격자 키] : 자속 보정 배율 (공격자 키도 defense_key와 같은 방식)
+
+SimplifiedPokemon은 type_code_1 / type_code_2 / defense_key, SimplifiedMove는 type_code를 가지므로
+엔진과 휴리스틱에서는 chart.dual[move.type_code * DUAL_STRIDE + pokemon.defense_key]로 상성을 얻는다.
+"""
+import json
+import os
+from typing import Dict, List, Optional
+
+# 상성표에 포함되는 타입 (poke-env PokemonType 선언 순서)
+TYPE_NAMES = (
+    'BUG', 'DARK', 'DRAGON', 'ELECTRIC', 'FAIRY', 'FIGHTING', 'FIRE', 'FLYING', 'GHOST',
+    'GRASS', 'GROUND', 'ICE', 'NORMAL', 'POISON', 'PSYCHIC', 'ROCK', 'STEEL', 'WATER',
+)
+TYPE_CODE = {name: code for code, name in enumerate(TYPE_NAMES)}
+
+# 무타입 (None, ???, 스텔라) - 항상 등배
+TYPELESS = len(TYPE_NAMES)
+NUM_TYPES = TYPELESS + 1
+DUAL_STRIDE = NUM_TYPES * NUM_TYPES
+
+DEFAULT_TYPE_CHART_PATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data', 'type_chart.json')
+
+
+def type_code(poke_type) -> int:
+    """PokemonType (poke-env / sim.Supporting 어느 쪽이든) 또는 타입 이름을 정수 코드로 변환"""
+    if poke_type is None:
+        return TYPELESS
+    if isinstance(poke_type, int):
+        return poke_type
+    name = poke_type if isinstance(poke_type, str) else poke_type.name
+    return TYPE_CODE.get(name.upper(), TYPELESS)
+
+
+def defense_key(type_1, type_2=None) -> int:
+    """복합 타입 방어자 키 (dual 테이블의 열 인덱스)"""
+    return type_code(type_1) * NUM_TYPES + type_code(type_2)
+
+
+class TypeChart:
+    """
+    세대별 정수 인덱스 상성표
+    Args:
+        chart: {방어 타입: {공격 타입: 배율}} 형태의 상성 딕셔너리 (GenData.type_chart 형식)
+    """
+
+    _CACHE: Dict[int, 'TypeChart'] = {}
+
+    def __init__(self, chart: Dict[str, Dict[str, float]]):
+        # 단일 타입 상성 (공격 * NUM_TYPES + 방어)
+        self.single: List[float] = [1.0] * (NUM_TYPES * NUM_TYPES)
+        for defender_name, row in chart.items():
+            defender = TYPE_CODE.get(defender_name.upper())
+            if defender is None:
+                continue
+            for attacker_name, multiplier in row.items():
+                attacker = TYPE_CODE.get(attacker_name.upper())
+                if attacker is None:
+                    continue
+                self.single[attacker * NUM_TYPES + defender] = float(multiplier)
+
+        # 복합 타입 방어자 상성 (공격 * DUAL_STRIDE + 방어 키)
+        # PokemonType.damage_multiplier와 같이 첫 번째 타입이 무타입이면 등배
+        self.dual: List[float] = [1.0] * (NUM_TYPES * DUAL_STRIDE)
+        for attacker in range(TYPELESS):
+            row = attacker * NUM_TYPES
+            for defender_1 in range(TYPELESS):
+                m1 = self.single[row + defender_1]
+                base = attacker * DUAL_STRIDE + defender_1 * NUM_TYPES
+                for defender_2 in range(NUM_TYPES):
+                    self.dual[base + defender_2] = m1 * self.single[row + defender_2]
+
+        # 자속 보정 (기술 타입이 공격자 타입 중 하나면 1.5, 무타입 기술은 제외)
+        self.stab: List[float] = [1.0] * (NUM_TYPES * DUAL_STRIDE)
+        for move_type in range(TYPELESS):
+            for other in range(NUM_TYPES):
+                self.stab[move_type * DUAL_STRIDE + move_type * NUM_TYPES + other] = 1.5
+                self.stab[move_type * DUAL_STRIDE + other * NUM_TYPES + move_type] = 1.5
+
+    @classmethod
+    def from_gen(cls, gen: int = 9) -> 'TypeChart':
+        """데이터 팩(GenData와 같은 상성표)으로부터 생성 (세대별 1회만 생성 후 캐시)"""
+        chart = cls._CACHE.get(gen)
+        if chart is None:
+            from sim.Supporting.DataPack import DataPack
+            chart = cls(DataPack.from_gen(gen).type_chart)
+            cls._CACHE[gen] = chart
+        return chart
+
+    @classmethod
+    def from_json(cls, path: Optional[str] = None) -> 'TypeChart':
+        """data/type_chart.json ({공격 타입: {방어 타입: 배율}} 형식)으로부터 생성"""
+        with open(path or DEFAULT_TYPE_CHART_PATH, 'r', encoding='utf-8') as f:
+            attacker_major = json.load(f)
+
+        chart: Dict[str, Dict[str, float]] = {}
+        for attacker_name, row in attacker_major.items():
+            for defender_name, multiplier in row.items():
+                chart.setdefault(defender_name, {})[attacker_name] = multiplier
+        return cls(chart)
+
+    def multiplier(self, attack_code: int, defend_code: int) -> float:
+        """단일 타입 상성"""
+        return self.single[attack_code * NUM_TYPES + defend_code]
+
+    def effectiveness(self, attack_code: int, defender_key: int) -> float:
+        """복합 타입 방어자 상성 (defender_key = defense_key(타입1, 타입2))"""
+        return self.dual[attack_code * DUAL_STRIDE + defender_key]
+
+    def stab_multiplier(self, move_code: int, attacker_key: int) -> float:
+        """자속 보정 배율 (attacker_key = defense_key(공격자 타입1, 타입2))"""
+        return self.stab[move_code * DUAL_STRIDE + attacker_key]
@@ -0,0 +1,126 @@
+"""
+Zobrist 해시 키
+
+배틀 상태의 요소(포켓몬 슬롯별 HP / 상태이상 / 랭크 / PP, 활성 슬롯, 날씨, 필드, 턴 홀짝)마다
+고정된 64비트 키를 두고, 상태 해시는 해당 키들의 XOR로 정의한다.
+값이 바뀔 때 (이전 값 키 ^ 새 값 키)를 XOR하면 전체를 다시 계산하지 않고 해시를 갱신할 수 있다.
+
+키는 난수 표 대신 splitmix64로 (요소, 슬롯, 값)에서 결정적으로 만들기 때문에
+프로세스/실행이 달라도 같은 상태는 같은 해시를 가진다.
+값이 '없음'(랭크 0, 상태이상 없음, 날씨 없음)인 경우 키는 0이므로
+딕셔너리에 키가 없는 것과 값이 0인 것이 같은 해시가 된다.
+"""
+import zlib
+from typing import Optional
+
+MASK64 = (1 << 64) - 1
+
+# 요소 번호 (랭크 / PP는 능력치 / 기술 인덱스를 더해서 사용)
+F_HP = 1
+F_STATUS = 2
+F_ACTIVE = 3
+F_WEATHER = 4
+F_FIELD = 5
+F_TURN = 6
+F_BOOST = 16
+F_PP = 32
+
+# 랭크 변화 대상 능력치 (ArrayBattle 버퍼 저장 순서와 같음)
+BOOST_STATS = ('atk', 'def', 'spa', 'spd', 'spe', 'accuracy', 'evasion')
+BOOST_INDEX = {stat: i for i, stat in enumerate(BOOST_STATS)}
+
+# 활성 슬롯 키의 슬롯 자리 (플레이어 / 상대)
+SIDE_PLAYER = 0
+SIDE_OPPONENT = 1
+
+# HP 구간 수 (None = 실제 HP 값 그대로 해시)
+_HP_BUCKETS: Optional[int] = None
+
+_KEYS = {}
+
+
+def splitmix64(x: int) -> int:
+    """64비트 정수 혼합 함수"""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def zobrist_key(feature: int, slot: int, value) -> int:
+    """(요소, 슬롯, 값)의 64비트 키 (값이 0 / None이면 0)"""
+    if not value:
+        return 0
+    k = (feature, slot, value)
+    key = _KEYS.get(k)
+    if key is None:
+        if type(value) is not int:
+            value = zlib.crc32(str(value).encode())
+        key = splitmix64(splitmix64(splitmix64(feature) ^ slot) ^ (value & MASK64))
+        _KEYS[k] = key
+    return key
+
+
+def set_hp_buckets(buckets: Optional[int]):
+    """
+    HP 해시 구간 설정
+    Args:
+        buckets: 최대 HP를 나눌 구간 수 (None = 실제 HP 값)
+    구간을 쓰면 HP가 조금 다른 상태도 같은 해시가 되어 전치표 적중이 늘어난다.
+    이미 계산된 해시에는 반영되지 않으므로 탐색 시작 전에 설정해야 한다.
+    """
+    global _HP_BUCKETS
+    _HP_BUCKETS = buckets
+
+
+def get_hp_buckets() -> Optional[int]:
+    return _HP_BUCKETS
+
+
+def hp_key(slot: int, hp: int, max_hp: int) -> int:
+    """HP 키 (구간 설정 시 살아있으면 1 ~ buckets 구간)"""
+    buckets = _HP_BUCKETS
+    if buckets is not None and hp > 0 and max_hp:
+        hp = -(-hp * buckets // max_hp)
+    return zobrist_key(F_HP, slot, hp)
+
+
+def status_key(slot: int, status) -> int:
+    """상태이상 키 (poke-env / sim.Supporting Status 모두 이름으로 매칭)"""
+    if status is None:
+        return 0
+    return zobrist_key(F_STATUS, slot, getattr(status, 'name', status))
+
+
+def boost_key(slot: int, index: int, value: int) -> int:
+    return zobrist_key(F_BOOST + index, slot, value)
+
+
+def pp_key(slot: int, index: int, value: int) -> int:
+    return zobrist_key(F_PP + index, slot, value)
+
+
+def active_key(side: int, slot: Optional[int]) -> int:
+    """활성 슬롯 키 (없으면 0, 슬롯 0과 구분하기 위해 +1)"""
+    if slot is None or slot < 0:
+        return 0
+    return zobrist_key(F_ACTIVE, side, slot + 1)
+
+
+def weather_key(weather: dict) -> int:
+    h = 0
+    for w in weather:
+        h ^= zobrist_key(F_WEATHER, 0, getattr(w, 'name', w))
+    return h
+
+
+def field_key(fields: dict) -> int:
+    h = 0
+    for f in fields:
+        h ^= zobrist_key(F_FIELD, 0, getattr(f, 'name', f))
+    return h
+
+
+def turn_key(turn: int) -> int:
+    """턴 홀짝 키"""
+    return zobrist_key(F_TURN, 0, turn & 1)
@@ -14,6 +14,8 @@ from sim.BattleClass.SimplifiedPokemon import SimplifiedPokemon
 from sim.BattleClass.SimplifiedMove import SimplifiedMove
 from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
 from sim.Supporting.PokemonStatus import Status
+from sim.Supporting.TypeChart import type_code
+from sim.Supporting.DataPack import DataPack
 
 
 class SimulationReplay:
@@ -64,7 +66,6 @@ class SimulationReplay:
         Returns:
             SimplifiedPokemon 객체
         """
-        from poke_env.data import GenData
         from poke_env.battle.pokemon_type import PokemonType
         
         if not pokemon_dict:
@@ -108,6 +109,7 @@ class SimulationReplay:
                 pokemon.type_2 = pokemon.types[1] if len(pokemon.types) > 1 else None
         else:
             pokemon.type_2 = pokemon.types[1] if len(pokemon.types) > 1 else None
+        pokemon.refresh_type_codes()
         
         # HP
         pokemon.current_hp = pokemon_dict.get('current_hp', 0)
@@ -150,6 +152,7 @@ class SimulationReplay:
                             move.type = PokemonType[type_str] if isinstance(type_str, str) else type_str
                         except:
                             move.type = type_str
+                    move.type_code = type_code(getattr(move, 'type', None))
                     
                     # Category 객체 복원
                     category_str = move_data.get('category')
@@ -294,19 +297,15 @@ class SimulationReplay:
             except (KeyError, TypeError):
                 pass
         
-        # 사용 가능한 기술 복원
-        from poke_env.data import GenData
-        gen_data = GenData.from_gen(battle.gen)
+        # 사용 가능한 기술 복원 (데이터 팩의 기술 데이터로 생성)
+        pack = DataPack.from_gen(battle.gen)
         
         battle.available_moves = []
         moves_list = battle_dict.get('available_moves', [])
         for move_id in moves_list:
-            try:
-                move_obj = gen_data.moves.get(move_id)
-                if move_obj:
-                    battle.available_moves.append(SimplifiedMove(move_obj))
-            except:
-                pass
+            move_data = pack.moves.get(move_id)
+            if move_data:
+                battle.available_moves.append(battle._create_move_from_pokedex(move_id, move_data))
         
         # 사용 가능한 교체 포켓몬 복원
         battle.available_switches = []
@@ -5,12 +5,24 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from player.mcts.MctsPlayer import mcts_search
+from player.mcts.RootParallelMcts import RootParallelSearcher
 from poke_env.player import Player
 from poke_env.ps_client.account_configuration import AccountConfiguration
 from poke_env.ps_client.server_configuration import LocalhostServerConfiguration
 from poke_env.battle import Battle
 
+# 루트 병렬 워커 수 (0이면 기존처럼 스레드 executor에서 단일 탐색)
+MCTS_WORKERS = 0
+MCTS_ITERATIONS = 100
+# 결정당 시간 예산 (초, None이면 MCTS_ITERATIONS 고정 반복). 주면 반복 수 제한 없이 마감 시각까지 탐색
+MCTS_TIME_BUDGET = None
+
 class MCTSPlayer(Player):
+    def __init__(self, *args, workers: int = MCTS_WORKERS, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 워커 프로세스는 첫 결정 전에 미리 띄워 둠 (게임 데이터 / 엔진 로드 포함)
+        self.root_parallel = RootParallelSearcher(workers=workers).start() if workers > 0 else None
+
     def _convert_simplified_action_to_battle_action(self, battle: Battle, simplified_action):
         """MCTS 결과를 poke-env 행동 객체로 변환"""
         if simplified_action is None: return None
@@ -41,13 +53,18 @@ class MCTSPlayer(Player):
         
         loop = asyncio.get_running_loop()
         try:
-            simplified_action = await loop.run_in_executor(
-                None, 
-                mcts_search, 
-                battle, 
-                100,    # iterations
-                True,  # verbose
-            )
+            if self.root_parallel is not None:
+                # 탐색은 워커 프로세스에서 진행되고, 스레드는 결과를 기다리기만 함
+                result = await loop.run_in_executor(
+                    None, lambda: self.root_parallel.search(
+                        battle, iterations=None if MCTS_TIME_BUDGET else MCTS_ITERATIONS,
+                        time_budget=MCTS_TIME_BUDGET))
+                simplified_action = result.action
+            else:
+                simplified_action = await loop.run_in_executor(
+                    None,
+                    lambda: mcts_search(battle, None if MCTS_TIME_BUDGET else MCTS_ITERATIONS, True,
+                                        time_budget=MCTS_TIME_BUDGET))
         except Exception as e:
             print(f"\n❌ [MCTS Error] {e}")
             import traceback
@@ -0,0 +1,238 @@
+# 엔진 / 복제 / 롤아웃 / 탐색 처리량을 서버 없이 한 번에 측정하고 JSON으로 저장하는 벤치마크 모음
+
+"""
+오프라인 벤치마크 모음 (서버 불필요)
+- factory 세트로 BattleBuilder가 만든 poke-env Battle(상대 일부만 공개)을 대표 배틀로 사용
+- 항목별로 워밍업 후 여러 번 반복 측정, 호출 단위 지연 시간 백분위수(p50 / p90 / p99)와 처리량 보고
+- --json으로 결과 저장, --compare로 이전 결과와 비교
+
+예시:
+    python BenchmarkSuite.py --json base.json
+    python BenchmarkSuite.py --only clone turn --compare base.json
+"""
+import sys
+import os
+import json
+import time
+import platform
+import argparse
+import statistics
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import numpy as np
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleClass.ArrayBattle import ArrayBattle
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
+from sim.Supporting.BattleRandom import BattleRandom
+from player.mcts.MctsPlayer import MCTSSearcher, SmartRolloutPolicy
+from player.minimax.MinimaxPlayer import MinimaxPlayer
+
+PERCENTILES = (50, 90, 99)
+
+
+# =================================================================
+# 측정 도구
+# =================================================================
+def _summarize(latencies: list, units: list, rates: list) -> dict:
+    """호출별 지연 시간(초) / 처리 단위 수, 반복별 처리량으로 요약 통계 계산"""
+    lat_us = np.asarray(latencies) * 1e6
+    summary = {
+        'calls': len(latencies),
+        'units': int(sum(units)),
+        'rate': statistics.median(rates),  # 반복별 처리량(단위/초)의 중앙값
+        'rate_min': min(rates),
+        'rate_max': max(rates),
+        'rate_stdev': statistics.stdev(rates) if len(rates) > 1 else 0.0,
+        'mean_us': float(lat_us.mean()),
+    }
+    for p, value in zip(PERCENTILES, np.percentile(lat_us, PERCENTILES)):
+        summary[f'p{p}_us'] = float(value)
+    return summary
+
+
+def run_case(func, setup=None, warmup: float = 0.3, repeats: int = 5, sample_time: float = 0.5) -> dict:
+    """
+    func를 워밍업 후 repeats번, 각 sample_time초 동안 반복 측정
+    Args:
+        func: 측정 대상. setup이 있으면 setup() 결과를 인자로 받음.
+              처리한 단위 수(MCTS 반복 수, 미니맥스 노드 수 등)를 정수로 반환. 정수가 아니면 1로 셈
+        setup: 호출마다 실행되는 준비 함수 (복제 등, 측정 시간에서 제외)
+        warmup: 워밍업 시간(초) - 캐시 / 지연 초기화 비용을 측정에서 제외
+        repeats: 반복 측정 횟수
+        sample_time: 반복 1회당 측정 시간(초)
+    """
+    perf_counter = time.perf_counter
+
+    def sample(duration):
+        latencies, units = [], []
+        end = perf_counter() + duration
+        while perf_counter() < end:
+            arg = setup() if setup is not None else None
+            start = perf_counter()
+            n = func(arg) if setup is not None else func()
+            latencies.append(perf_counter() - start)
+            units.append(n if type(n) is int else 1)
+        return latencies, units
+
+    sample(warmup)
+    all_latencies, all_units, rates = [], [], []
+    for _ in range(repeats):
+        latencies, units = sample(sample_time)
+        all_latencies.extend(latencies)
+        all_units.extend(units)
+        rates.append(sum(units) / sum(latencies))
+    return _summarize(all_latencies, all_units, rates)
+
+
+class _Cycle:
+    """대표 배틀 목록을 순환하며 setup 값을 만들어 주는 도우미"""
+
+    def __init__(self, items, prepare=None):
+        self.items = items
+        self.prepare = prepare
+        self.index = 0
+
+    def __call__(self):
+        item = self.items[self.index]
+        self.index = (self.index + 1) % len(self.items)
+        return self.prepare(item) if self.prepare is not None else item
+
+
+# =================================================================
+# 벤치마크 항목
+# =================================================================
+def build_cases(num_battles: int = 8, seed: int = 0, mcts_iterations: int = 100, minimax_depth: int = 2) -> dict:
+    """항목 이름 → (단위 이름, func, setup)"""
+    builder = BattleBuilder(rng=BattleRandom(seed))
+    battles = [builder.factory_poke_env_battle(rng=BattleRandom(seed + i)) for i in range(num_battles)]
+    simple_roots = [SimplifiedBattle(b, fill_unknown_data=True, rng=BattleRandom(seed + i)) for i, b in enumerate(battles)]
+    array_roots = [ArrayBattle.from_battle(root) for root in simple_roots]
+    engine = SimplifiedBattleEngine(gen=9, rng=BattleRandom(seed))
+    construct_rng = BattleRandom(seed)
+
+    def simulate_turn(state):
+        engine.simulate_turn(state, player_move_idx=0, opponent_move_idx=0)
+
+    def rollout(policy):
+        return lambda state: policy.run(state, engine)
+
+    def mcts(searcher):
+        searcher.search(mcts_iterations)
+        return mcts_iterations
+
+    minimax = MinimaxPlayer(depth=minimax_depth, rng=BattleRandom(seed), start_listening=False)
+
+    def minimax_search(state):
+        minimax.node_count = 0
+        minimax._max_value(state, minimax_depth, -float('inf'), float('inf'))
+        return minimax.node_count
+
+    cases = {
+        'build.SimplifiedBattle(fill_unknown)': (
+            'battle', lambda b: SimplifiedBattle(b, fill_unknown_data=True, rng=construct_rng), _Cycle(battles)),
+        'build.SimplifiedBattle(known_only)': (
+            'battle', lambda b: SimplifiedBattle(b, fill_unknown_data=False), _Cycle(battles)),
+        'build.BattleBuilder.factory_battle': ('battle', builder.factory_battle, None),
+        'build.ArrayBattle.from_battle': ('battle', ArrayBattle.from_battle, _Cycle(simple_roots)),
+        'clone.SimplifiedBattle': ('clone', lambda s: s.clone(), _Cycle(simple_roots)),
+        'clone.ArrayBattle': ('clone', lambda s: s.clone(), _Cycle(array_roots)),
+        'turn.SimplifiedBattle': ('turn', simulate_turn, _Cycle(simple_roots, lambda s: s.clone())),
+        'turn.ArrayBattle': ('turn', simulate_turn, _Cycle(array_roots, lambda s: s.clone())),
+        'rollout.1turn': ('rollout', rollout(SmartRolloutPolicy(max_turns=1)), _Cycle(simple_roots)),
+        'rollout.10turn': ('rollout', rollout(SmartRolloutPolicy(max_turns=10)), _Cycle(simple_roots)),
+        'mcts.SimplifiedBattle': ('iteration', mcts, _Cycle(simple_roots, lambda s: MCTSSearcher(
+            s.clone(), rng=BattleRandom(seed)))),
+        'mcts.ArrayBattle': ('iteration', mcts, _Cycle(array_roots, lambda s: MCTSSearcher(
+            s.clone(), rng=BattleRandom(seed)))),
+        f'minimax.depth{minimax_depth}': ('node', minimax_search, _Cycle(simple_roots, lambda s: s.clone())),
+    }
+    return cases
+
+
+# =================================================================
+# 보고 / 저장 / 비교
+# =================================================================
+def _environment() -> dict:
+    import poke_env
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'numpy': np.__version__,
+        'poke_env': getattr(poke_env, '__version__', 'unknown'),
+    }
+
+
+def print_results(results: dict, baseline: dict = None):
+    print("=" * 100)
+    header = f"{'benchmark':<38} {'rate':>14} {'p50':>10} {'p90':>10} {'p99':>10}"
+    if baseline:
+        header += f" {'vs base':>9}"
+    print(header)
+    print("-" * 100)
+    for name, r in results.items():
+        line = (f"{name:<38} {r['rate']:>9,.0f} {r['unit']:<4}/s"
+                f" {r['p50_us']:>8.1f}us {r['p90_us']:>8.1f}us {r['p99_us']:>8.1f}us")
+        if baseline and name in baseline:
+            line += f" {r['rate'] / baseline[name]['rate']:>8.2f}x"
+        print(line)
+    print("=" * 100)
+
+
+def run_suite(only=None, warmup: float = 0.3, repeats: int = 5, sample_time: float = 0.5,
+              num_battles: int = 8, seed: int = 0) -> dict:
+    """
+    벤치마크 전체 실행
+    Args:
+        only: 이름에 이 문자열 중 하나가 포함된 항목만 실행 (None이면 전체)
+        warmup / repeats / sample_time: run_case 참고
+        num_battles: 대표 배틀 수
+        seed: 배틀 생성 / 엔진 난수 시드
+    """
+    cases = build_cases(num_battles=num_battles, seed=seed)
+    results = {}
+    for name, (unit, func, setup) in cases.items():
+        if only and not any(key in name for key in only):
+            continue
+        results[name] = {'unit': unit, **run_case(func, setup, warmup, repeats, sample_time)}
+    return {
+        'environment': _environment(),
+        'config': {'warmup': warmup, 'repeats': repeats, 'sample_time': sample_time,
+                   'num_battles': num_battles, 'seed': seed},
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 배틀 엔진 / 탐색 벤치마크")
+    parser.add_argument('--only', nargs='*', help="이름에 포함된 문자열로 항목 선택 (예: clone turn mcts)")
+    parser.add_argument('--warmup', type=float, default=0.3, help="항목별 워밍업 시간(초)")
+    parser.add_argument('--repeats', type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument('--sample-time', type=float, default=0.5, help="반복 1회당 측정 시간(초)")
+    parser.add_argument('--battles', type=int, default=8, help="대표 배틀 수")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    report = run_suite(args.only, args.warmup, args.repeats, args.sample_time, args.battles, args.seed)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+    print_results(report['results'], baseline)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
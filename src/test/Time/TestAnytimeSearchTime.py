@@ -0,0 +1,65 @@
+# 시간 예산별 MCTS 반복 수 / 미니맥스 반복 심화 깊이와 결정 지연 시간을 측정하는 코드
+
+"""
+시간 예산 탐색 확인 (서버 불필요)
+- 예산별로 여러 루트 상태에서 결정 1회씩 실행
+- MCTS: 도달한 반복 수, 미니맥스: 끝까지 탐색한 깊이 / 노드 수
+- 결정 지연 시간 p50 / p95 / 최대와 예산 초과량 (지연 시간 SLO 조정용)
+"""
+import sys
+import os
+import argparse
+import statistics
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import mcts_search
+from player.minimax.MinimaxPlayer import MinimaxPlayer
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.Supporting.BattleRandom import BattleRandom
+
+
+def _latency_summary(latencies: list, budget: float) -> str:
+    ms = np.asarray(latencies) * 1000
+    return (f"p50 {np.percentile(ms, 50):7.1f}ms  p95 {np.percentile(ms, 95):7.1f}ms  "
+            f"max {ms.max():7.1f}ms  (over budget max {ms.max() - budget * 1000:+6.1f}ms)")
+
+
+def run_anytime_benchmark(budgets, num_states: int):
+    battles = [BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)) for seed in range(num_states)]
+
+    print("=" * 100)
+    print(f"{num_states} roots per budget")
+    print("-" * 100)
+    for budget in budgets:
+        latencies, iterations = [], []
+        for seed, battle in enumerate(battles):
+            report = {}
+            mcts_search(battle, iterations=None, time_budget=budget, rng=BattleRandom(seed), report=report)
+            latencies.append(report['elapsed'])
+            iterations.append(report['iterations'])
+        print(f"[MCTS    {budget:5.2f}s] iterations median {statistics.median(iterations):>7,.0f} "
+              f"(min {min(iterations):,})   {_latency_summary(latencies, budget)}")
+
+    for budget in budgets:
+        player = MinimaxPlayer(start_listening=False, time_budget=budget, track_state=False, rng=BattleRandom(0))
+        latencies, depths, nodes = [], [], []
+        for battle in battles:
+            player.choose_move(battle)
+            latencies.append(player.search_time)
+            depths.append(player.depth_reached)
+            nodes.append(player.node_count)
+        depth_counts = ", ".join(f"d{d}:{depths.count(d)}" for d in sorted(set(depths)))
+        print(f"[Minimax {budget:5.2f}s] depth {depth_counts:<14} nodes median {statistics.median(nodes):>7,.0f}   "
+              f"{_latency_summary(latencies, budget)}")
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="시간 예산 탐색 지연 시간 / 도달 반복 수 / 깊이")
+    parser.add_argument('--budgets', type=float, nargs='+', default=[0.05, 0.1, 0.25, 0.5, 1.0])
+    parser.add_argument('--states', type=int, default=10)
+    args = parser.parse_args()
+    run_anytime_benchmark(args.budgets, args.states)
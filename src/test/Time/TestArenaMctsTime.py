@@ -0,0 +1,109 @@
+# 객체 트리(MCTSNode) MCTS와 배열 트리(ArenaMCTSSearcher) MCTS의 노드 메모리 / 선택 비용을 비교하는 코드
+
+"""
+배열 기반 MCTS 트리 확인 (서버 불필요)
+- 같은 시드로 만든 두 트리의 루트 통계가 같은지 (확장 순서 / UCT 동점 처리 동일)
+- 1만 반복 이상 탐색 후
+    노드당 트리 구조 / 통계 메모리 (게임 상태 제외), 남아 있는 게임 상태 수
+    선택 + 역전파 1회 비용 (완성된 트리에서 _select → _backpropagate 반복)
+    전체 탐색 시간 (롤아웃 / 확장 복제가 대부분이라 차이가 작음)
+"""
+import sys
+import os
+import gc
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import MCTSSearcher, MCTSNode
+from player.mcts.ArenaMcts import ArenaMCTSSearcher
+from player.mcts.llm_pruner import LLMPruner
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.Supporting.BattleRandom import BattleRandom
+
+
+def _object_tree_bytes(root: MCTSNode) -> tuple:
+    """(노드 수, 노드 객체 / __dict__ / 리스트 / 보상 float 크기 합, 게임 상태 수)"""
+    count = total = states = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        states += node.state is not None
+        total += (sys.getsizeof(node) + sys.getsizeof(node.__dict__) + sys.getsizeof(node.children)
+                  + sys.getsizeof(node.untried_actions) + (sys.getsizeof(node.wins) if isinstance(node.wins, float) else 0))
+        stack.extend(node.children)
+    return count, total, states
+
+
+def _arena_tree_bytes(searcher: ArenaMCTSSearcher) -> tuple:
+    arena = searcher.arena
+    count = 1 + sum(arena.num_children[i] for i in range(arena.size))
+    states = sum(state is not None for state in arena.states[:arena.size])
+    return count, arena.nbytes(), states
+
+
+def _select_cost(searcher, repeats: int) -> float:
+    """선택 + 역전파 1회 평균 시간 (초)"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        searcher._backpropagate(searcher._select(), 0.5)
+    return (time.perf_counter() - start) / repeats
+
+
+def _root_stats(searcher) -> list:
+    return [(LLMPruner.action_identifier(a), v, round(w, 9)) for a, v, w in searcher.root_statistics()]
+
+
+def run_arena_benchmark(iterations: int, num_states: int, select_repeats: int):
+    gc.disable()  # 두 트리 모두 GC 멈춤 없이 비교
+    totals = {cls.__name__: {'time': 0.0, 'nodes': 0, 'bytes': 0, 'states': 0, 'select': 0.0}
+              for cls in (MCTSSearcher, ArenaMCTSSearcher)}
+    identical = 0
+    for seed in range(num_states):
+        root = SimplifiedBattle(BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)), fill_unknown_data=True, rng=BattleRandom(seed)).clone()
+        stats = []
+        for cls in (MCTSSearcher, ArenaMCTSSearcher):
+            searcher = cls(root.clone(), rng=BattleRandom(seed + 1000), use_llm_pruner=False)
+            start = time.perf_counter()
+            searcher.search(iterations)
+            row = totals[cls.__name__]
+            row['time'] += time.perf_counter() - start
+            stats.append(_root_stats(searcher))
+
+            if cls is MCTSSearcher:
+                nodes, size, states = _object_tree_bytes(searcher.root)
+            else:
+                nodes, size, states = _arena_tree_bytes(searcher)
+            row['nodes'] += nodes
+            row['bytes'] += size
+            row['states'] += states
+            row['select'] += _select_cost(searcher, select_repeats)
+            searcher.release()
+        identical += stats[0] == stats[1]
+    gc.enable()
+
+    print("=" * 92)
+    print(f"{num_states} roots x {iterations:,} iterations, 같은 시드 루트 통계 일치: {identical} / {num_states}")
+    print(f"{'tree':<20} {'search':>10} {'iter/s':>9} {'bytes/node':>11} {'states kept':>12} {'select+backprop':>16}")
+    print("-" * 92)
+    for name, row in totals.items():
+        print(f"{name:<20} {row['time']:>9.2f}s {iterations * num_states / row['time']:>9,.0f} "
+              f"{row['bytes'] / row['nodes']:>11.0f} {row['states'] / row['nodes'] * 100:>11.0f}% "
+              f"{row['select'] / num_states * 1e6:>14.1f}us")
+    base, arena = totals['MCTSSearcher'], totals['ArenaMCTSSearcher']
+    print("-" * 92)
+    print(f"노드당 메모리 {base['bytes'] / base['nodes']:.0f} → {arena['bytes'] / arena['nodes']:.0f} bytes, "
+          f"선택 + 역전파 {base['select'] / arena['select']:.2f}x")
+    print("=" * 92)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="배열 기반 MCTS 트리 메모리 / 선택 비용")
+    parser.add_argument('--iterations', type=int, default=10000)
+    parser.add_argument('--states', type=int, default=2)
+    parser.add_argument('--select-repeats', type=int, default=20000)
+    args = parser.parse_args()
+    run_arena_benchmark(args.iterations, args.states, args.select_repeats)
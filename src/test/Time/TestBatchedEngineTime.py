@@ -0,0 +1,73 @@
+# SimplifiedBattleEngine(배틀 1개씩)과 BatchedBattleEngine(N개 동시)의 초당 턴 처리 수를 비교하는 코드
+
+"""
+배치 엔진 처리량 비교 (서버 불필요)
+"""
+import sys
+import os
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from TestCloneTime import measure_rate
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.Supporting.BattleRandom import BattleRandom
+from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
+from sim.BattleEngine.BatchedBattleEngine import BatchState, BatchedBattleEngine
+from player.mcts.MctsPlayer import MCTSSearcher
+
+
+def run_batched_benchmark(batch_sizes=(1, 64, 1024, 4096), duration: float = 1.0):
+    battle = BattleBuilder(rng=BattleRandom(0)).factory_battle()
+    engine = SimplifiedBattleEngine(gen=9)
+    batched_engine = BatchedBattleEngine(gen=9)
+    rng = np.random.default_rng(0)
+
+    # 배틀 1개씩 (복제 + 1턴)
+    def scalar_step():
+        engine.simulate_turn(battle.clone(), player_move_idx=0, opponent_move_idx=0)
+
+    results = {'SimplifiedBattleEngine': measure_rate(scalar_step, duration)}
+
+    # N개 동시 (복제 + 1턴), 초당 배틀-턴 수로 환산
+    root = BatchState.from_battles([battle])
+    for n in batch_sizes:
+        state = root.take(np.zeros(n, dtype=np.int64))
+        actions = np.zeros(n, dtype=np.int64)
+
+        def batched_step():
+            batched_engine.simulate_turn(state, actions, actions, rng=rng)
+
+        results[f'BatchedBattleEngine N={n}'] = measure_rate(batched_step, duration) * n
+
+    print("=" * 60)
+    base = results['SimplifiedBattleEngine']
+    for name, rate in results.items():
+        print(f"{name:<32} {rate:>12,.0f} turns/s  ({rate / base:5.1f}x)")
+    print("=" * 60)
+    return results
+
+
+def run_leaf_parallel_benchmark(iterations: int = 2000, leaf_batch_size: int = 64):
+    """MCTS 순차 롤아웃 vs leaf-parallel 배치 롤아웃 (초당 반복 수, 두 경우 모두 ArrayBattle 상태)"""
+    battle = BattleBuilder(rng=BattleRandom(0)).factory_battle()
+    results = {}
+    for label, batch_size in (('MCTS sequential', 1), (f'MCTS leaf-parallel x{leaf_batch_size}', leaf_batch_size)):
+        searcher = MCTSSearcher(battle.clone(), use_array_state=True, leaf_batch_size=batch_size)
+        start = time.perf_counter()
+        searcher.search(iterations)
+        results[label] = iterations / (time.perf_counter() - start)
+
+    print("=" * 60)
+    for name, rate in results.items():
+        print(f"{name:<32} {rate:>12,.0f} iter/s")
+    print("=" * 60)
+    return results
+
+
+if __name__ == "__main__":
+    run_batched_benchmark()
+    run_leaf_parallel_benchmark()
@@ -1,7 +1,8 @@
 # 랜덤으로 포켓몬을 추정했을 때, 해당 포켓몬의 추정이 약하게 되는지를 확인하는 코드
 
 """
-MCTS + SimplifiedBattle 통합 테스트
+MCTS + SimplifiedBattle 통합 테스트 (Showdown 서버 필요)
+- 서버 없이 엔진 / 탐색 처리량을 측정하려면 BenchmarkSuite.py 사용
 """
 import time  # ← time 모듈 자체를 import
 import asyncio
@@ -16,8 +17,8 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from poke_env.player import Player, SimpleHeuristicsPlayer
-from sim.SimplifiedBattle import SimplifiedBattle
-from sim.battle.SimplifiedBattleEngine import SimplifiedBattleEngine
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
 
 
 class TestPlayer(Player):
@@ -30,10 +31,10 @@ class TestPlayer(Player):
             simple_battle_engine = SimplifiedBattleEngine(gen=9)
 
             # 100번 실행하는데 걸리는 시간 계산
-            start_time = time.time()
+            start_time = time.perf_counter()
             for _ in range(100):
                 simple_battle_engine.simulate_full_battle(battle=simple_battle, verbose=False)
-            end_time = time.time()
+            end_time = time.perf_counter()
             elapsed_time = end_time - start_time
             print(f"100번 실행하는데 걸리는 시간: {elapsed_time:.2f}초") 
         # ✅ 항상 유효한 선택지 반환
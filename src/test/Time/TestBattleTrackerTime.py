@@ -0,0 +1,146 @@
+# 매 턴 SimplifiedBattle을 새로 만드는 방식과 BattleTracker로 바뀐 부분만 반영하는 방식을 비교하는 코드
+
+"""
+배틀 상태 추적 확인 (서버 불필요)
+- factory 세트로 만든 poke-env Battle을 여러 턴 동안 직접 바꿔 가며 (HP, 랭크, 상태이상, 날씨, 상대 기술 / 종 공개)
+  추적 상태가 새로 변환한 상태와 같은 공개 정보를 갖는지 확인
+- 연속된 턴에서 미공개 상대 팀 추론이 바뀐 비율 (새로 생성 vs 추적)
+- 턴당 상태 준비 시간: SimplifiedBattle(fill_unknown_data=True) vs BattleTracker.update
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from poke_env.battle import Pokemon
+from poke_env.battle.status import Status
+
+from TestCloneTime import measure_rate
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleClass.BattleTracker import BattleTracker
+from sim.BattleClass.OpponentBelief import OpponentBelief
+from sim.Supporting.BattleRandom import BattleRandom
+from sim.Supporting.DataPack import DataPack
+
+
+def _advance(battle, turn: int, rng):
+    """poke-env Battle을 1턴 진행한 것처럼 직접 수정 (서버 메시지 없이)"""
+    battle._turn = turn
+    own, opponent = battle.active_pokemon, battle.opponent_active_pokemon
+    own._current_hp = max(1, own._current_hp - rng.randint(0, own._max_hp // 8))
+    opponent._current_hp = max(1, opponent._current_hp - rng.randint(0, 12))
+    own._boosts['atk'] = min(6, own._boosts['atk'] + rng.randint(0, 1))
+    opponent._boosts['spe'] = max(-6, opponent._boosts['spe'] - rng.randint(0, 1))
+    if turn == 3:
+        opponent._status = Status.BRN
+        battle._weather = {}
+
+    # 상대가 기술을 하나씩 공개 (factory 세트의 실제 기술)
+    entries = DataPack.from_gen(9).factory_sets['OU']
+    factory_set = entries[opponent.species]['sets'][0]
+    slot = factory_set['moves'][turn % len(factory_set['moves'])]
+    opponent._add_move(slot[0].lower().replace(' ', '').replace('-', ''))
+
+    # 4턴째에 새 상대 종 공개
+    if turn == 4:
+        revealed = {p.species for p in battle.opponent_team.values()}
+        species = next(s for s in sorted(entries) if s not in revealed)
+        pokemon = Pokemon(gen=9, species=species)
+        pokemon._current_hp = pokemon._max_hp = 100
+        battle._opponent_team[f"p2: {pokemon.species}"] = pokemon
+
+
+def _public_view(state: SimplifiedBattle, battle) -> dict:
+    """공개 정보만 추려서 비교 (추론한 미공개 정보 제외)"""
+    view = {'turn': state.turn}
+    for identifier in battle.team:
+        p = state.team[identifier]
+        view[identifier] = (p.current_hp, p.max_hp, getattr(p.status, 'name', None), tuple(sorted(p.boosts.items())),
+                            tuple((m.id, m.current_pp) for m in p.moves))
+    for identifier, pokemon in battle.opponent_team.items():
+        p = state.opponent_team[identifier]
+        seen = set(pokemon.moves)
+        view[identifier] = (p.current_hp, p.max_hp, getattr(p.status, 'name', None),
+                            tuple(sorted(p.boosts.items())), seen <= {m.id for m in p.moves})
+    return view
+
+
+def _hidden_team(state: SimplifiedBattle, battle) -> tuple:
+    return tuple(sorted(p.species for key, p in state.opponent_team.items() if key not in battle.opponent_team))
+
+
+def run_consistency_check(num_battles: int = 20, num_turns: int = 6):
+    belief = OpponentBelief.from_tier('OU')
+    mismatches = 0
+    changed = {'SimplifiedBattle': 0, 'BattleTracker': 0}
+    rebuilt = []
+    comparisons = 0
+    for seed in range(num_battles):
+        battle = BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed))
+        rng = BattleRandom(seed)
+        tracker = BattleTracker(rng=rng.split(), opponent_belief=belief)
+        fresh_rng = rng.split()
+        previous = {}
+        for turn in range(1, num_turns + 1):
+            if turn > 1:
+                _advance(battle, turn, rng)
+            fresh = SimplifiedBattle(battle, fill_unknown_data=True, rng=fresh_rng, opponent_belief=belief)
+            tracked = tracker.update(battle)
+            if turn > 1:
+                rebuilt.append(tracker.rebuilt)
+            mismatches += _public_view(fresh, battle) != _public_view(tracked, battle)
+            comparisons += 1
+            for name, state in (('SimplifiedBattle', fresh), ('BattleTracker', tracked)):
+                hidden = _hidden_team(state, battle)
+                # 새 종이 공개된 턴은 추론 자리가 하나 줄어드므로 제외
+                if name in previous and turn != 4:
+                    changed[name] += hidden != previous[name]
+                previous[name] = hidden
+
+    turns = num_battles * (num_turns - 2)
+    print("=" * 60)
+    print(f"[consistency] {num_battles} battles x {num_turns} turns")
+    print(f"공개 정보 불일치: {mismatches} / {comparisons}")
+    for name, count in changed.items():
+        print(f"미공개 상대 팀 추론이 바뀐 턴 ({name}): {count / turns * 100:.1f}%")
+    print(f"턴당 다시 변환 / 추론한 포켓몬 수 (BattleTracker): {sum(rebuilt) / len(rebuilt):.2f}")
+
+
+def run_update_benchmark(duration: float = 1.0):
+    belief = OpponentBelief.from_tier('OU')
+    battle = BattleBuilder().factory_poke_env_battle(rng=BattleRandom(0))
+    rng = BattleRandom(0)
+    tracker = BattleTracker(rng=rng, opponent_belief=belief)
+    tracker.update(battle)
+    state = {'turn': 1}
+
+    def next_turn():
+        state['turn'] += 1
+        battle._turn = state['turn']
+        battle.active_pokemon._current_hp = max(1, battle.active_pokemon._current_hp - 1)
+
+    def fresh():
+        next_turn()
+        SimplifiedBattle(battle, fill_unknown_data=True, rng=rng, opponent_belief=belief)
+
+    def tracked():
+        next_turn()
+        tracker.update(battle)
+
+    results = {
+        'SimplifiedBattle(fill_unknown_data=True)': measure_rate(fresh, duration),
+        'BattleTracker.update': measure_rate(tracked, duration),
+    }
+    print("=" * 60)
+    for name, rate in results.items():
+        print(f"{name:<42} {rate:>12,.0f} /s")
+    print("-" * 60)
+    print(f"턴당 상태 준비 속도 향상: {results['BattleTracker.update'] / results['SimplifiedBattle(fill_unknown_data=True)']:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_consistency_check()
+    run_update_benchmark()
@@ -0,0 +1,101 @@
+# 확률 사건 결과 나열(enumerate_outcomes)의 정확한 기대값과 샘플 평균의 오차 / 비용을 비교하는 코드
+
+"""
+확률 사건 결과 나열 확인 (서버 불필요)
+- 행동 조합(내 기술 x 상대 기술)마다 서로 다른 결과 수, 확률 합 (= 1), 원래 상태 유지 여부
+- 나열 1회 시간과 샘플 1회(clone + simulate_turn) 시간, 나열이 샘플 몇 번 비용인지
+- 정확한 기대값(evaluate_state) 대비 샘플 k개 평균의 평균 절대 오차
+- min_probability로 작은 분기를 샘플링했을 때 결과 수 / 시간 / 기대값 오차
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import BattleHeuristics
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine, outcome_key
+from sim.Supporting.BattleRandom import BattleRandom
+
+SAMPLE_COUNTS = (1, 4, 16, 64)
+
+
+def _expected_value(outcomes) -> float:
+    return sum(probability * BattleHeuristics.evaluate_state(state) for probability, state in outcomes)
+
+
+def _timed_enumeration(engine, root, joint: dict, min_probability: float, repeats: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        outcomes = engine.enumerate_outcomes(root, min_probability=min_probability, **joint)
+    return outcomes, (time.perf_counter() - start) / repeats
+
+
+def run_chance_benchmark(num_states: int, pruned_probability: float, repeats: int):
+    totals = {'joints': 0, 'outcomes': 0, 'pruned_outcomes': 0, 'enum_time': 0.0, 'pruned_time': 0.0,
+              'sample_time': 0.0, 'pruned_error': 0.0, 'mass_error': 0.0, 'unchanged': 0}
+    sample_errors = {k: 0.0 for k in SAMPLE_COUNTS}
+
+    for seed in range(num_states):
+        root = SimplifiedBattle(BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)), fill_unknown_data=True, rng=BattleRandom(seed)).clone()
+        engine = SimplifiedBattleEngine(rng=BattleRandom(seed + 1000))
+        engine._sync_references(root)
+        root_key = outcome_key(root)
+        engine.enumerate_outcomes(root, player_move_idx=0, opponent_move_idx=0)  # 데미지 함수 컴파일 등 예열
+
+        for player_idx in range(len(root.active_pokemon.moves)):
+            for opponent_idx in range(len(root.opponent_active_pokemon.moves)):
+                joint = {'player_move_idx': player_idx, 'opponent_move_idx': opponent_idx}
+                outcomes, enum_time = _timed_enumeration(engine, root, joint, 0.0, repeats)
+                pruned, pruned_time = _timed_enumeration(engine, root, joint, pruned_probability, repeats)
+                exact = _expected_value(outcomes)
+
+                start = time.perf_counter()
+                rewards = []
+                for _ in range(max(SAMPLE_COUNTS) * repeats):
+                    state = root.clone()
+                    engine.simulate_turn(state, **joint)
+                    rewards.append(BattleHeuristics.evaluate_state(state))
+                totals['sample_time'] += (time.perf_counter() - start) / (max(SAMPLE_COUNTS) * repeats)
+                for k in SAMPLE_COUNTS:
+                    chunks = [rewards[i:i + k] for i in range(0, len(rewards) - k + 1, k)]
+                    sample_errors[k] += sum(abs(sum(c) / k - exact) for c in chunks) / len(chunks)
+
+                totals['joints'] += 1
+                totals['outcomes'] += len(outcomes)
+                totals['pruned_outcomes'] += len(pruned)
+                totals['enum_time'] += enum_time
+                totals['pruned_time'] += pruned_time
+                totals['pruned_error'] += abs(_expected_value(pruned) - exact)
+                totals['mass_error'] = max(totals['mass_error'], abs(sum(p for p, _ in outcomes) - 1.0))
+        totals['unchanged'] += outcome_key(root) == root_key
+
+    n = totals['joints']
+    sample_time = totals['sample_time'] / n
+    print("=" * 84)
+    print(f"{num_states} roots, {n} joint actions, 원래 상태 유지: {totals['unchanged']} / {num_states}, "
+          f"확률 합 최대 오차: {totals['mass_error']:.1e}")
+    print("-" * 84)
+    print(f"{'method':<28} {'outcomes':>9} {'time':>10} {'= samples':>10} {'|EV error|':>11}")
+    print("-" * 84)
+    for label, outcomes_key, time_key, error in (
+            ('enumerate (exact)', 'outcomes', 'enum_time', 0.0),
+            (f'enumerate (min_p={pruned_probability})', 'pruned_outcomes', 'pruned_time', totals['pruned_error'] / n)):
+        avg_time = totals[time_key] / n
+        print(f"{label:<28} {totals[outcomes_key] / n:>9.1f} {avg_time * 1e3:>8.2f}ms "
+              f"{avg_time / sample_time:>10.1f} {error:>11.5f}")
+    for k in SAMPLE_COUNTS:
+        print(f"{f'sample mean (k={k})':<28} {k:>9} {k * sample_time * 1e3:>8.2f}ms {k:>10} {sample_errors[k] / n:>11.5f}")
+    print("=" * 84)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="확률 사건 결과 나열 / 샘플 평균 비교")
+    parser.add_argument('--states', type=int, default=4)
+    parser.add_argument('--min-probability', type=float, default=0.01)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+    run_chance_benchmark(args.states, args.min_probability, args.repeats)
@@ -0,0 +1,60 @@
+# SimplifiedBattle.clone()과 ArrayBattle.clone()의 초당 복제 횟수를 비교하는 코드
+
+"""
+배틀 상태 복제 성능 비교 (서버 불필요)
+"""
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.ArrayBattle import ArrayBattle
+from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
+from sim.Supporting.BattleRandom import BattleRandom
+
+
+def measure_rate(func, duration: float = 1.0) -> float:
+    """duration초 동안 func 반복 실행 후 초당 실행 횟수 반환"""
+    count = 0
+    start = time.perf_counter()
+    end = start + duration
+    while time.perf_counter() < end:
+        func()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def run_clone_benchmark(duration: float = 1.0):
+    simple_battle = BattleBuilder(rng=BattleRandom(0)).factory_battle()
+    array_battle = ArrayBattle.from_battle(simple_battle)
+    engine = SimplifiedBattleEngine(gen=9)
+
+    results = {
+        'SimplifiedBattle.clone': measure_rate(simple_battle.clone, duration),
+        'ArrayBattle.clone': measure_rate(array_battle.clone, duration),
+    }
+
+    # 복제 + 1턴 시뮬레이션 (롤아웃 1스텝 비용)
+    def simple_step():
+        engine.simulate_turn(simple_battle.clone(), player_move_idx=0, opponent_move_idx=0)
+
+    def array_step():
+        engine.simulate_turn(array_battle.clone(), player_move_idx=0, opponent_move_idx=0)
+
+    results['SimplifiedBattle clone+turn'] = measure_rate(simple_step, duration)
+    results['ArrayBattle clone+turn'] = measure_rate(array_step, duration)
+
+    print("=" * 60)
+    for name, rate in results.items():
+        print(f"{name:<32} {rate:>12,.0f} /s")
+    print("-" * 60)
+    print(f"clone 속도 향상: {results['ArrayBattle.clone'] / results['SimplifiedBattle.clone']:.1f}x")
+    print(f"clone+turn 속도 향상: {results['ArrayBattle clone+turn'] / results['SimplifiedBattle clone+turn']:.1f}x")
+    print("=" * 60)
+    return results
+
+
+if __name__ == "__main__":
+    run_clone_benchmark()
@@ -0,0 +1,72 @@
+# 데미지 보정 체인 순회(apply_all)와 컴파일된 fused 함수의 데미지 계산 속도를 비교하는 코드
+
+"""
+데미지 계산 파이프라인 비교 (서버 불필요)
+- 두 방식의 계산 결과가 모든 (공격자, 기술, 방어자, 급소) 조합에서 같은지 먼저 확인
+"""
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.Supporting.BattleRandom import BattleRandom
+from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
+from poke_env.battle.status import Status
+from poke_env.battle.weather import Weather
+
+
+def build_damage_cases(num_battles: int = 10):
+    """랜덤 배틀에서 (배틀, 공격자, 방어자, 기술, 급소) 조합 수집"""
+    cases = []
+    for seed in range(num_battles):
+        battle = BattleBuilder(rng=BattleRandom(seed)).factory_battle()
+        attackers = list(battle.team.values())
+        defenders = list(battle.opponent_team.values())
+        # 화상 보정도 확인하도록 일부 포켓몬은 화상 상태
+        attackers[0].status = Status.BRN
+        for attacker in attackers:
+            for defender in defenders:
+                for move in attacker.moves:
+                    for crit in (False, True):
+                        cases.append((battle, attacker, defender, move, crit))
+    return cases
+
+
+def run_damage_benchmark(repeat: int = 3):
+    chain_engine = SimplifiedBattleEngine(gen=9, fused_damage=False)
+    fused_engine = SimplifiedBattleEngine(gen=9, fused_damage=True)
+    cases = build_damage_cases()
+
+    print("=" * 60)
+    for weather in ({}, {Weather.RAINDANCE: 1}, {Weather.SUNNYDAY: 1}):
+        for battle, *_ in cases:
+            battle.weather = weather
+
+        # 결과 일치 확인
+        mismatches = sum(
+            chain_engine._calculate_damage(battle, a, d, m, crit) != fused_engine._calculate_damage(battle, a, d, m, crit)
+            for battle, a, d, m, crit in cases
+        )
+
+        rates = {}
+        for label, engine in (('chain', chain_engine), ('fused', fused_engine)):
+            calculate = engine._calculate_damage
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for battle, a, d, m, crit in cases:
+                    calculate(battle, a, d, m, crit)
+                best = min(best, time.perf_counter() - start)
+            rates[label] = len(cases) / best
+
+        name = next(iter(weather)).name if weather else 'NONE'
+        print(f"[weather={name}] cases={len(cases)} mismatches={mismatches}")
+        print(f"  chain {rates['chain']:>12,.0f} calls/s")
+        print(f"  fused {rates['fused']:>12,.0f} calls/s  ({rates['fused'] / rates['chain']:.2f}x)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_damage_benchmark()
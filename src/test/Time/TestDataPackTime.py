@@ -0,0 +1,96 @@
+# poke-env GenData 로드와 데이터 팩(mmap) 로드의 시작 시간 / 프로세스별 메모리를 비교하는 코드
+
+"""
+GenData / 데이터 팩 비교 (서버 불필요, Linux /proc 사용)
+- 새 파이썬 프로세스 여러 개를 동시에 띄워 각각 데이터를 열고 같은 조회 작업을 수행
+- 시작 시간(데이터 로드 + 조회), RSS, 익명(비공유) 메모리, PSS(공유 페이지를 프로세스 수로 나눈 값) 보고
+"""
+import sys
+import os
+import json
+import time
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def _memory_mb() -> dict:
+    """/proc/self/smaps_rollup 기준 메모리 (MB)"""
+    values = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ('Rss:', 'Pss:', 'Anonymous:'):
+                values[parts[0][:-1].lower()] = int(parts[1]) / 1024
+    return values
+
+
+def _lookup_workload(pokedex, moves, learnable_moves, species_ids):
+    """랜덤 배틀 생성과 비슷한 조회: 종 데이터 + 배울 수 있는 기술 데이터"""
+    total = 0
+    for species_id in species_ids:
+        entry = pokedex[species_id]
+        total += entry['baseStats']['hp']
+        for move_id in learnable_moves(species_id) or ():
+            total += moves.get(move_id, {}).get('basePower', 0)
+    return total
+
+
+def _worker(mode: str, num_species: int, hold: float):
+    start = time.perf_counter()
+    import poke_env  # noqa: F401 - 두 방식 모두 poke-env import 비용은 같으므로 기준선으로 분리
+    imported = time.perf_counter()
+    base_memory = _memory_mb()
+
+    if mode == 'gendata':
+        from poke_env.data import GenData
+        data = GenData.from_gen(9)
+
+        def learnable_moves(name):
+            entry = data.learnset.get(name, {})
+            return entry.get('learnset', {}).keys()
+        pokedex, moves = data.pokedex, data.moves
+    else:
+        from sim.Supporting.DataPack import DataPack
+        data = DataPack.from_gen(9)
+        pokedex, moves, learnable_moves = data.pokedex, data.moves, data.learnable_moves
+    loaded = time.perf_counter()
+
+    species_ids = list(pokedex.keys())[:num_species]
+    _lookup_workload(pokedex, moves, learnable_moves, species_ids)
+    done = time.perf_counter()
+
+    # 다른 워커도 데이터를 연 상태에서 측정 (공유 페이지가 PSS에 나뉘어 반영되도록)
+    time.sleep(hold)
+    memory = _memory_mb()
+    from poke_env.data import GenData
+    print(json.dumps({
+        'import_s': imported - start, 'load_s': loaded - imported, 'lookup_s': done - loaded,
+        'rss_mb': memory['rss'] - base_memory['rss'], 'anon_mb': memory['anonymous'] - base_memory['anonymous'],
+        'pss_mb': memory['pss'] - base_memory['pss'], 'gendata_loaded': bool(GenData._gen_data_per_gen),
+    }))
+
+
+def run_data_pack_benchmark(num_workers: int = 4, num_species: int = 200, hold: float = 2.0):
+    from sim.Supporting.DataPack import DataPack
+    DataPack.from_gen(9)  # 팩이 없으면 미리 빌드 (워커 측정에서 빌드 시간 제외)
+
+    print("=" * 80)
+    print(f"{num_workers} workers, {num_species} species lookups each (import poke_env 이후 증가량)")
+    print(f"{'mode':<10} {'load':>9} {'lookup':>9} {'rss':>9} {'anon':>9} {'pss':>9}  GenData loaded")
+    print("-" * 80)
+    for mode in ('gendata', 'pack'):
+        workers = [subprocess.Popen([sys.executable, __file__, '--worker', mode, str(num_species), str(hold)],
+                                    stdout=subprocess.PIPE, text=True) for _ in range(num_workers)]
+        reports = [json.loads(w.communicate()[0].strip().splitlines()[-1]) for w in workers]
+        avg = {key: sum(r[key] for r in reports) / num_workers for key in reports[0] if key != 'gendata_loaded'}
+        print(f"{mode:<10} {avg['load_s'] * 1000:>7.1f}ms {avg['lookup_s'] * 1000:>7.1f}ms "
+              f"{avg['rss_mb']:>7.1f}MB {avg['anon_mb']:>7.1f}MB {avg['pss_mb']:>7.1f}MB  {reports[0]['gendata_loaded']}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        _worker(sys.argv[2], int(sys.argv[3]), float(sys.argv[4]))
+    else:
+        run_data_pack_benchmark()
@@ -0,0 +1,77 @@
+# 상대 응수를 고정하는 MCTS와 양쪽 행동을 독립 선택하는 동시 행동 MCTS(DUCT)를 같은 시간 예산에서 비교하는 코드
+
+"""
+동시 행동 MCTS 확인 (서버 불필요)
+- 같은 시간 예산에서 MCTSSearcher / DUCTSearcher의 반복 수와 시뮬레이션한 (상태, 행동 조합) 샘플 수
+    MCTSSearcher: 반복 1회 = 확장 1턴 + 롤아웃 1턴 (상대 응수는 휴리스틱 하나)
+    DUCTSearcher: 반복 1회 = 행동 조합 K*L개 배치 진행 + 정적 평가 (반복 1회 비용은 약 7배)
+- 샘플 1개당 비용, 루트에서 모델링한 상대 행동 수, 두 방식이 같은 행동을 고른 비율
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import MCTSSearcher
+from player.mcts.DuctMcts import DUCTSearcher
+from player.mcts.llm_pruner import LLMPruner
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.Supporting.BattleRandom import BattleRandom
+
+SEARCHERS = {'fixed reply': MCTSSearcher, 'DUCT': DUCTSearcher}
+
+
+def _timed_search(cls, root, seed: int, time_budget: float) -> dict:
+    searcher = cls(root.clone(), rng=BattleRandom(seed), use_llm_pruner=False)
+    start = time.perf_counter()
+    action = searcher.search(10 ** 9, deadline=start + time_budget)
+    elapsed = time.perf_counter() - start
+    if isinstance(searcher, DUCTSearcher):
+        samples, replies = searcher.joint_evaluations, len(searcher.root.opp_actions)
+    else:
+        samples, replies = searcher.iterations_run, 1
+    searcher.release()
+    return {'action': LLMPruner.action_identifier(action), 'iterations': searcher.iterations_run,
+            'samples': samples, 'replies': replies, 'elapsed': elapsed}
+
+
+def run_duct_benchmark(budgets, num_states: int):
+    roots = [SimplifiedBattle(BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)), fill_unknown_data=True, rng=BattleRandom(seed)).clone()
+             for seed in range(num_states)]
+
+    print("=" * 92)
+    print(f"{num_states} roots per budget")
+    print(f"{'budget':>7} {'mode':<12} {'iterations':>11} {'samples':>10} {'samples/s':>10} "
+          f"{'per sample':>11} {'opp replies':>12} {'agree':>7}")
+    print("-" * 92)
+    for budget in budgets:
+        rows = {name: {'iterations': 0, 'samples': 0, 'replies': 0, 'elapsed': 0.0, 'actions': []} for name in SEARCHERS}
+        for seed, root in enumerate(roots):
+            for name, cls in SEARCHERS.items():
+                result = _timed_search(cls, root, seed + 1000, budget)
+                row = rows[name]
+                for key in ('iterations', 'samples', 'replies', 'elapsed'):
+                    row[key] += result[key]
+                row['actions'].append(result['action'])
+        agree = sum(a == b for a, b in zip(*(row['actions'] for row in rows.values())))
+        for name, row in rows.items():
+            print(f"{budget:>6.2f}s {name:<12} {row['iterations']:>11,} {row['samples']:>10,} "
+                  f"{row['samples'] / row['elapsed']:>10,.0f} {row['elapsed'] / row['samples'] * 1e6:>9.1f}us "
+                  f"{row['replies'] / num_states:>12.1f} {agree / num_states * 100:>6.0f}%")
+        fixed, duct = rows['fixed reply'], rows['DUCT']
+        print(f"{'':>8}DUCT: 샘플 1개당 비용 "
+              f"{(fixed['elapsed'] / fixed['samples']) / (duct['elapsed'] / duct['samples']):.1f}배 낮음, "
+              f"반복 수 {duct['iterations'] / fixed['iterations']:.2f}x")
+        print("-" * 92)
+    print("=" * 92)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상대 응수 고정 MCTS / 동시 행동 MCTS(DUCT) 샘플 처리량")
+    parser.add_argument('--budgets', type=float, nargs='+', default=[0.25, 1.0])
+    parser.add_argument('--states', type=int, default=4)
+    args = parser.parse_args()
+    run_duct_benchmark(args.budgets, args.states)
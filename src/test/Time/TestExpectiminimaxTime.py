@@ -0,0 +1,93 @@
+# 행동 조합을 한 번 샘플링하는 미니맥스와 확률 노드를 두는 expectiminimax의 시간 / 결정 안정성을 비교하는 코드
+
+"""
+Expectiminimax 확인 (서버 불필요)
+- 같은 루트 상태에서 엔진 난수 시드만 바꿔 여러 번 탐색
+    sampled: 기존 미니맥스 (행동 조합마다 simulate_turn 1회)
+    expecti: 확률 노드 + Star1 / Star2 (min_probability보다 작은 분기는 샘플링)
+    exact: min_probability=0 (모든 분기 나열) - 기준 행동
+- 깊이별 결정 1회 평균 시간, Max 노드 수, 확률 노드 / 결과 수
+- 시드 간 결정 일치율 (가장 많이 고른 행동 비율)과 기준 행동 일치율
+"""
+import sys
+import os
+import time
+import argparse
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.minimax.MinimaxPlayer import MinimaxPlayer
+from player.mcts.llm_pruner import LLMPruner
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.Supporting.BattleRandom import BattleRandom
+
+MODES = {
+    'sampled': {'expectiminimax': False},
+    'expecti': {'expectiminimax': True},
+    'exact': {'expectiminimax': True, 'min_probability': 0.0},
+}
+
+
+def _search(player: MinimaxPlayer, root, depth: int, seed: int) -> tuple:
+    """choose_move와 같은 방식으로 고정 루트에서 탐색 1회 (엔진 난수만 시드로 바꿈)"""
+    player.engine.rng = BattleRandom(seed)
+    player.node_count = player.chance_count = player.outcome_count = 0
+    player._root_depth = depth
+    start = time.perf_counter()
+    _, action = player._max_value(root.clone(), depth, -float('inf'), float('inf'))
+    return LLMPruner.action_identifier(action), time.perf_counter() - start
+
+
+def run_expectiminimax_benchmark(depths, num_states: int, num_seeds: int, min_probability: float):
+    roots = [SimplifiedBattle(BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)), fill_unknown_data=True, rng=BattleRandom(seed)).clone()
+             for seed in range(num_states)]
+
+    print("=" * 96)
+    print(f"{num_states} roots x {num_seeds} engine seeds, expecti min_probability={min_probability}")
+    print(f"{'depth':>5} {'mode':<8} {'time':>10} {'max nodes':>10} {'chance':>8} {'outcomes':>9} "
+          f"{'stable':>7} {'= exact':>8}")
+    print("-" * 96)
+    for depth in depths:
+        rows = {}
+        for name, options in MODES.items():
+            options = dict(options)
+            if name == 'expecti':
+                options['min_probability'] = min_probability
+            player = MinimaxPlayer(start_listening=False, track_state=False, rng=BattleRandom(0), **options)
+            row = rows[name] = {'time': 0.0, 'nodes': 0, 'chance': 0, 'outcomes': 0, 'stable': 0, 'actions': []}
+            for root in roots:
+                player.engine._sync_references(root)
+                _search(player, root, depth, 0)  # 예열
+                actions = []
+                for seed in range(num_seeds):
+                    action, elapsed = _search(player, root, depth, seed + 1)
+                    actions.append(action)
+                    row['time'] += elapsed
+                    row['nodes'] += player.node_count
+                    row['chance'] += player.chance_count
+                    row['outcomes'] += player.outcome_count
+                row['stable'] += Counter(actions).most_common(1)[0][1]
+                row['actions'].append(actions)
+
+        runs = num_states * num_seeds
+        reference = [Counter(actions).most_common(1)[0][0] for actions in rows['exact']['actions']]
+        for name, row in rows.items():
+            matches = sum(a == ref for actions, ref in zip(row['actions'], reference) for a in actions)
+            print(f"{depth:>5} {name:<8} {row['time'] / runs * 1e3:>8.1f}ms {row['nodes'] / runs:>10.0f} "
+                  f"{row['chance'] / runs:>8.0f} {row['outcomes'] / max(row['chance'], 1):>9.2f} "
+                  f"{row['stable'] / runs * 100:>6.0f}% {matches / runs * 100:>7.0f}%")
+        print(f"{'':>6}expecti / sampled 시간: {rows['expecti']['time'] / rows['sampled']['time']:.2f}x")
+        print("-" * 96)
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="샘플 미니맥스 / expectiminimax 시간과 결정 안정성")
+    parser.add_argument('--depths', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--states', type=int, default=6)
+    parser.add_argument('--seeds', type=int, default=5)
+    parser.add_argument('--min-probability', type=float, default=0.25)
+    args = parser.parse_args()
+    run_expectiminimax_benchmark(args.depths, args.states, args.seeds, args.min_probability)
@@ -0,0 +1,146 @@
+# 상대 기술 생성을 매번 learnset 전체를 분류하는 방식과 종별 분류 색인(LearnsetIndex) 방식으로 비교하는 코드
+
+"""
+상대 기술 생성 / fill_unknown_data 배틀 생성 속도 비교 (서버 불필요)
+- 같은 시드에서 기존 방식(딕셔너리 순회)과 색인 방식이 같은 기술을 고르는지 전체 종에 대해 확인
+- 기술 세트 1개 생성 속도, SimplifiedBattle(fill_unknown_data=True) 생성 속도
+"""
+import sys
+import os
+import re
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from TestCloneTime import measure_rate
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleClass.SimplifiedMove import SimplifiedMove
+from sim.BattleClass.LearnsetIndex import LearnsetIndex
+from sim.Supporting.BattleRandom import BattleRandom
+from sim.Supporting.DataPack import DataPack
+
+
+def _reference_moves(species: str, pokemon_types: list, num_to_add: int, rng):
+    """색인 도입 전 생성 규칙 (호출마다 이름 정규화 → learnset 조회 → 전체 기술 분류)"""
+    data = DataPack.from_gen(9)
+    search_candidates = [species.lower().replace(' ', '').replace('-', '').replace('.', '').replace("'", "")]
+    pokedex_entry = data.pokedex.get(search_candidates[0], {})
+    if 'baseSpecies' in pokedex_entry:
+        key = re.sub(r'[^a-z0-9]', '', pokedex_entry['baseSpecies'].lower())
+        if key not in search_candidates:
+            search_candidates.append(key)
+    if '-' in species:
+        key = re.sub(r'[^a-z0-9]', '', species.split('-')[0].lower())
+        if key not in search_candidates:
+            search_candidates.append(key)
+
+    learnable_moves = []
+    for name in search_candidates:
+        moves = data.learnable_moves(name)
+        if moves is not None:
+            learnable_moves = list(moves)
+            break
+    if not learnable_moves:
+        return None
+
+    type_moves, strong, medium, weak, status = [], [], [], [], []
+    for move_id in learnable_moves:
+        move_data = data.moves.get(move_id, {})
+        base_power = move_data.get('basePower', 0)
+        if base_power > 0:
+            if move_data.get('type', 'Normal').upper() in pokemon_types:
+                type_moves.append((move_id, move_data))
+            elif base_power >= 80:
+                strong.append((move_id, move_data))
+            elif base_power >= 60:
+                medium.append((move_id, move_data))
+            elif base_power >= 50:
+                weak.append((move_id, move_data))
+        else:
+            status.append((move_id, move_data))
+
+    selected = []
+    if type_moves:
+        strong_stab = sorted([m for m in type_moves if m[1].get('basePower', 0) >= 70],
+                             key=lambda x: x[1].get('basePower', 0), reverse=True)
+        if strong_stab:
+            selected.extend(strong_stab[:min(2, len(strong_stab), num_to_add)])
+        else:
+            selected.extend(rng.sample(type_moves, min(1, len(type_moves), num_to_add)))
+    remaining = num_to_add - len(selected)
+    for bucket in (strong, medium, weak, status):
+        if remaining > 0 and bucket:
+            count = min(remaining, len(bucket))
+            selected.extend(rng.sample(bucket, count))
+            remaining -= count
+
+    moves = [SimplifiedMove.from_data(move_id, move_data) for move_id, move_data in selected]
+    while len(moves) < num_to_add:
+        moves.append(SimplifiedMove.from_data('tackle', data.moves['tackle']))
+    return moves
+
+
+def _species_with_types():
+    data = DataPack.from_gen(9)
+    return [(s, tuple(t.upper() for t in data.pokedex[s]['types'])) for s in data.standard_species()]
+
+
+def run_equivalence_check():
+    index = LearnsetIndex.from_gen(9)
+    mismatches = 0
+    species_list = _species_with_types()
+    for seed, (species, types) in enumerate(species_list):
+        ref = _reference_moves(species, list(types), 4, BattleRandom(seed))
+        got = index.generate(species, types, 4, BattleRandom(seed))
+        ref_ids = None if ref is None else [m.__dict__ for m in ref]
+        got_ids = None if got is None else [m.__dict__ for m in got]
+        mismatches += ref_ids != got_ids
+    print("=" * 60)
+    print(f"[equivalence] {len(species_list)} species, mismatches={mismatches}")
+
+
+def run_generation_benchmark(duration: float = 1.0):
+    species_list = _species_with_types()
+    index = LearnsetIndex.from_gen(9)
+    rng = BattleRandom(0)
+    state = {'i': 0}
+
+    def next_species():
+        state['i'] = (state['i'] + 1) % len(species_list)
+        return species_list[state['i']]
+
+    def reference():
+        species, types = next_species()
+        _reference_moves(species, list(types), 4, rng)
+
+    def indexed():
+        species, types = next_species()
+        index.generate(species, types, 4, rng)
+
+    for species, types in species_list:  # 색인 워밍업 (전체 종 분류 1회)
+        index.buckets(species, types)
+
+    battles = [BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)) for seed in range(8)]
+    construct_rng = BattleRandom(0)
+
+    def construct():
+        state['i'] = (state['i'] + 1) % len(battles)
+        SimplifiedBattle(battles[state['i']], fill_unknown_data=True, rng=construct_rng)
+
+    results = {
+        'moveset (reference)': measure_rate(reference, duration),
+        'moveset (LearnsetIndex)': measure_rate(indexed, duration),
+        'SimplifiedBattle(fill_unknown_data=True)': measure_rate(construct, duration),
+    }
+    print("=" * 60)
+    for name, rate in results.items():
+        print(f"{name:<42} {rate:>12,.0f} /s")
+    print("-" * 60)
+    print(f"moveset 속도 향상: {results['moveset (LearnsetIndex)'] / results['moveset (reference)']:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_equivalence_check()
+    run_generation_benchmark()
@@ -0,0 +1,85 @@
+# 고정 깊이 알파-베타와 반복 심화 + 행동 순서(전치표 / 최선 응수 / 킬러 / 히스토리)의 노드 수와 깊이 도달 시간을 비교하는 코드
+
+"""
+미니맥스 행동 순서 확인 (서버 불필요)
+- 깊이별 결정 1회의 Max 노드 수 / 시간
+    fixed: 기존 고정 깊이 알파-베타 (정적 점수 순서)
+    tt: 고정 깊이 + 전치표 (전치표 행동 먼저)
+    ordered: move_ordering=True - 깊이 1부터 반복 심화, 전치표 / 최선 응수 / 킬러 / 히스토리 순서
+- ordered의 깊이별 노드 수와 그 깊이까지 누적 시간 (depth_stats)
+- fixed 깊이 2의 결정 시간을 예산으로 줬을 때 ordered 반복 심화가 끝까지 탐색한 깊이
+"""
+import sys
+import os
+import argparse
+import statistics
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.minimax.MinimaxPlayer import MinimaxPlayer
+from player.TranspositionTable import TranspositionTable
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.Supporting.BattleRandom import BattleRandom
+
+MODES = {
+    'fixed': lambda: {},
+    'tt': lambda: {'transposition_table': TranspositionTable()},
+    'ordered': lambda: {'transposition_table': TranspositionTable(), 'move_ordering': True},
+}
+
+
+def _decide(battle, seed: int, **options) -> MinimaxPlayer:
+    """루트마다 새 플레이어(새 전치표)로 결정 1회"""
+    player = MinimaxPlayer(start_listening=False, track_state=False, rng=BattleRandom(seed), **options)
+    player.choose_move(battle)
+    return player
+
+
+def run_move_ordering_benchmark(depths, num_states: int):
+    battles = [BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)) for seed in range(num_states)]
+    _decide(battles[0], 0, depth=1)  # 예열
+
+    print("=" * 88)
+    print(f"{num_states} roots")
+    print(f"{'depth':>5} {'mode':<8} {'nodes':>10} {'time':>10} {'nodes vs fixed':>15}")
+    print("-" * 88)
+    fixed_times = {}
+    per_depth = {}
+    for depth in depths:
+        rows = {}
+        for name, options in MODES.items():
+            nodes, times = [], []
+            for seed, battle in enumerate(battles):
+                player = _decide(battle, seed, depth=depth, **options())
+                nodes.append(player.node_count)
+                times.append(player.search_time)
+                if name == 'ordered' and depth == max(depths):
+                    for d, n, t in player.depth_stats:
+                        per_depth.setdefault(d, []).append((n, t))
+            rows[name] = (statistics.mean(nodes), statistics.median(times))
+        fixed_times[depth] = rows['fixed'][1]
+        for name, (nodes, elapsed) in rows.items():
+            print(f"{depth:>5} {name:<8} {nodes:>10,.0f} {elapsed * 1e3:>8.1f}ms {nodes / rows['fixed'][0]:>14.2f}x")
+        print("-" * 88)
+
+    print(f"ordered 반복 심화 (목표 깊이 {max(depths)}): 깊이별 노드 수 / 누적 시간 (중앙값)")
+    for d, samples in sorted(per_depth.items()):
+        print(f"{'':>6}depth {d}: nodes {statistics.median(n for n, _ in samples):>8,.0f}   "
+              f"time-to-depth {statistics.median(t for _, t in samples) * 1e3:>8.1f}ms")
+
+    if 2 in fixed_times:
+        budget = fixed_times[2]
+        reached = [_decide(battle, seed, time_budget=budget, max_depth=6, **MODES['ordered']()).depth_reached
+                   for seed, battle in enumerate(battles)]
+        counts = ", ".join(f"d{d}:{c}" for d, c in sorted(Counter(reached).items()))
+        print(f"fixed 깊이 2 예산 {budget * 1e3:.1f}ms에서 ordered가 끝까지 탐색한 깊이: {counts}")
+    print("=" * 88)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="미니맥스 행동 순서 / 반복 심화 노드 수와 깊이 도달 시간")
+    parser.add_argument('--depths', type=int, nargs='+', default=[1, 2, 3, 4])
+    parser.add_argument('--states', type=int, default=6)
+    args = parser.parse_args()
+    run_move_ordering_benchmark(args.depths, args.states)
@@ -0,0 +1,84 @@
+# 상태를 저장하는 closed-loop MCTS와 행동 통계만 저장하는 open-loop MCTS를 같은 시간 예산에서 비교하는 코드
+
+"""
+Open-loop MCTS 확인 (서버 불필요)
+- 같은 시간 예산에서 closed-loop (MCTSSearcher) / open-loop (OpenLoopMCTSSearcher)의 반복 수, 초당 반복 수
+- 탐색 후 트리가 차지하는 메모리 (tracemalloc, 같은 시드 / 같은 반복 수로 다시 탐색해 측정) 와 반복당 메모리
+- 두 방식이 같은 행동을 고른 비율
+"""
+import sys
+import os
+import gc
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import MCTSSearcher
+from player.mcts.OpenLoopMcts import OpenLoopMCTSSearcher
+from player.mcts.llm_pruner import LLMPruner
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.Supporting.BattleRandom import BattleRandom
+
+SEARCHERS = {'closed-loop': MCTSSearcher, 'open-loop': OpenLoopMCTSSearcher}
+
+
+def _timed_search(cls, root, seed: int, time_budget: float) -> tuple:
+    searcher = cls(root.clone(), rng=BattleRandom(seed), use_llm_pruner=False)
+    start = time.perf_counter()
+    action = searcher.search(10 ** 9, deadline=start + time_budget)
+    elapsed = time.perf_counter() - start
+    searcher.release()
+    return LLMPruner.action_identifier(action), searcher.iterations_run, elapsed
+
+
+def _tree_memory(cls, root, seed: int, iterations: int) -> int:
+    """같은 반복 수로 다시 탐색한 뒤 탐색기가 붙잡고 있는 메모리 (bytes)"""
+    gc.collect()
+    tracemalloc.start()
+    searcher = cls(root.clone(), rng=BattleRandom(seed), use_llm_pruner=False)
+    searcher.search(iterations)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    searcher.release()
+    return current
+
+
+def run_open_loop_benchmark(budgets, num_states: int):
+    roots = [SimplifiedBattle(BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)), fill_unknown_data=True, rng=BattleRandom(seed)).clone()
+             for seed in range(num_states)]
+
+    print("=" * 88)
+    print(f"{num_states} roots per budget")
+    print(f"{'budget':>7} {'mode':<12} {'iterations':>11} {'iter/s':>9} {'tree memory':>12} {'per iter':>10} {'agree':>7}")
+    print("-" * 88)
+    for budget in budgets:
+        rows = {name: {'iterations': 0, 'elapsed': 0.0, 'memory': 0, 'actions': []} for name in SEARCHERS}
+        for seed, root in enumerate(roots):
+            for name, cls in SEARCHERS.items():
+                action, iterations, elapsed = _timed_search(cls, root, seed + 1000, budget)
+                row = rows[name]
+                row['iterations'] += iterations
+                row['elapsed'] += elapsed
+                row['memory'] += _tree_memory(cls, root, seed + 1000, iterations)
+                row['actions'].append(action)
+        agree = sum(a == b for a, b in zip(*(row['actions'] for row in rows.values())))
+        for name, row in rows.items():
+            print(f"{budget:>6.2f}s {name:<12} {row['iterations']:>11,} {row['iterations'] / row['elapsed']:>9,.0f} "
+                  f"{row['memory'] / num_states / 1e6:>10.2f}MB {row['memory'] / row['iterations'] / 1e3:>8.2f}KB "
+                  f"{agree / num_states * 100:>6.0f}%")
+        closed, opened = rows['closed-loop'], rows['open-loop']
+        print(f"{'':>8}open-loop: 반복 수 {opened['iterations'] / closed['iterations']:.2f}x, "
+              f"메모리 {closed['memory'] / max(opened['memory'], 1):.0f}배 적음")
+        print("-" * 88)
+    print("=" * 88)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="closed-loop / open-loop MCTS 메모리 / 초당 반복 수")
+    parser.add_argument('--budgets', type=float, nargs='+', default=[0.25, 1.0, 3.0])
+    parser.add_argument('--states', type=int, default=4)
+    args = parser.parse_args()
+    run_open_loop_benchmark(args.budgets, args.states)
@@ -0,0 +1,125 @@
+# factory 세트 별칭 표 샘플링(OpponentBelief)의 분포 / 조건 일치와 상대 팀 채우기 속도를 확인하는 코드
+
+"""
+상대 세트 추론 확인 (서버 불필요)
+- 별칭 표가 종 weight 분포를 그대로 나타내는지 (표 확률 / 경험 빈도)
+- 본 기술 조건: 뽑은 세트가 본 기술을 항상 포함하고, 나머지 기술도 그 종의 factory 세트 안에서 나오는지
+- 채운 상대 팀의 그럴듯함: 미공개 종이 티어 안에 있는 비율, 공개된 종의 기술이 factory 세트 안에 있는 비율
+- 종 샘플링(rng.choices vs 별칭 표), SimplifiedBattle(fill_unknown_data=True) 생성 속도
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from TestCloneTime import measure_rate
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleClass.OpponentBelief import OpponentBelief
+from sim.Supporting.BattleRandom import BattleRandom
+from sim.Supporting.DataPack import DataPack
+
+TIER = 'OU'
+
+
+def run_distribution_check(num_samples: int = 200_000):
+    belief = OpponentBelief.from_tier(TIER)
+    entries = DataPack.from_gen(9).factory_sets[TIER]
+    total = sum(entries[s]['weight'] for s in belief.species)
+    expected = [entries[s]['weight'] / total for s in belief.species]
+
+    table_error = max(abs(p - q) for p, q in zip(belief._species_table.probabilities(), expected))
+    rng = BattleRandom(0)
+    counts = [0] * len(belief.species)
+    for _ in range(num_samples):
+        counts[belief._species_table.sample(rng)] += 1
+    sample_error = max(abs(c / num_samples - q) for c, q in zip(counts, expected))
+
+    print("=" * 60)
+    print(f"[distribution] {TIER} {len(belief.species)} species")
+    print(f"표 확률 최대 오차: {table_error:.2e}, {num_samples:,}개 경험 빈도 최대 오차: {sample_error:.4f}")
+
+
+def run_condition_check(samples_per_set: int = 20):
+    belief = OpponentBelief.from_tier(TIER)
+    rng = BattleRandom(1)
+    checked = violations = off_set = 0
+    for species, sets in belief._sets.items():
+        for factory_set in sets:
+            for _ in range(samples_per_set):
+                # 실제 세트에서 기술 1~2개를 공개한 상황
+                true_moves = [rng.choice(slot) for slot in factory_set.move_slots]
+                seen = rng.sample(true_moves, rng.randint(1, 2))
+                spec = belief.sample_set(species, rng, seen)
+                pool = set().union(*(s.move_pool for s in sets))
+                checked += 1
+                violations += (not set(seen) <= set(spec['moves']) or len(set(spec['moves'])) != len(spec['moves'])
+                               or len(spec['moves']) != len(factory_set.move_slots))
+                off_set += any(m not in pool for m in spec['moves'])
+    print("=" * 60)
+    print(f"[condition] {checked:,} samples, 본 기술 누락 / 중복 / 개수 오류={violations}, 세트 밖 기술={off_set}")
+
+
+def run_plausibility_check(num_battles: int = 200):
+    belief = OpponentBelief.from_tier(TIER)
+    tier_species = set(belief.species)
+    results = {}
+    for name, kwargs in (('pokedex / learnset', {}), ('OpponentBelief', {'opponent_belief': belief})):
+        hidden_in_tier = hidden = moves_in_set = moves = 0
+        for seed in range(num_battles):
+            battle = BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed))
+            revealed = set(battle.opponent_team)
+            simplified = SimplifiedBattle(battle, fill_unknown_data=True, rng=BattleRandom(seed), **kwargs)
+            for identifier, pokemon in simplified.opponent_team.items():
+                if identifier in revealed:
+                    pool = set().union(*(s.move_pool for s in belief._sets[pokemon.species]))
+                    moves += len(pokemon.moves)
+                    moves_in_set += sum(m.id in pool for m in pokemon.moves)
+                else:
+                    hidden += 1
+                    hidden_in_tier += pokemon.species in tier_species
+        results[name] = (hidden_in_tier / hidden, moves_in_set / moves)
+
+    print("=" * 60)
+    print(f"[plausibility] {num_battles} battles (상대 3마리 종만 공개)")
+    print(f"{'method':<22} {'hidden in tier':>16} {'revealed moves in sets':>24}")
+    for name, (tier_rate, move_rate) in results.items():
+        print(f"{name:<22} {tier_rate * 100:>15.1f}% {move_rate * 100:>23.1f}%")
+
+
+def run_sampling_benchmark(duration: float = 1.0):
+    belief = OpponentBelief.from_tier(TIER)
+    entries = DataPack.from_gen(9).factory_sets[TIER]
+    weights = [entries[s]['weight'] for s in belief.species]
+    rng = BattleRandom(0)
+
+    battles = [BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)) for seed in range(8)]
+    state = {'i': 0}
+
+    def construct(**kwargs):
+        state['i'] = (state['i'] + 1) % len(battles)
+        SimplifiedBattle(battles[state['i']], fill_unknown_data=True, rng=rng, **kwargs)
+
+    results = {
+        'species (rng.choices weights)': measure_rate(lambda: rng.choices(belief.species, weights=weights), duration),
+        'species (AliasTable)': measure_rate(lambda: belief.species[belief._species_table.sample(rng)], duration),
+        'full set (sample_set)': measure_rate(lambda: belief.sample_set('kingambit', rng, ('suckerpunch',)), duration),
+        'SimplifiedBattle (pokedex / learnset)': measure_rate(construct, duration),
+        'SimplifiedBattle (OpponentBelief)': measure_rate(lambda: construct(opponent_belief=belief), duration),
+    }
+    print("=" * 60)
+    for name, rate in results.items():
+        print(f"{name:<40} {rate:>12,.0f} /s")
+    print("-" * 60)
+    print(f"종 샘플링 속도 향상: {results['species (AliasTable)'] / results['species (rng.choices weights)']:.1f}x")
+    print(f"배틀 생성 속도 비율: "
+          f"{results['SimplifiedBattle (OpponentBelief)'] / results['SimplifiedBattle (pokedex / learnset)']:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_distribution_check()
+    run_condition_check()
+    run_plausibility_check()
+    run_sampling_benchmark()
@@ -0,0 +1,69 @@
+# 단일 프로세스 미니맥스와 루트 분할 병렬 미니맥스(워커 1~N개)의 결정 시간 / 노드 수를 비교하는 코드
+
+"""
+루트 분할 병렬 미니맥스 확인 (서버 불필요)
+- 깊이별로 같은 루트들에서 결정 1회씩 실행
+    in-process: 기존 MinimaxPlayer (한 코어에서 루트 행동을 차례로 탐색)
+    K workers: ParallelMinimaxSearcher(workers=K) - 루트 행동을 워커에 나누고 루트 alpha를 공유 메모리로 공유
+- 결정 1회 평균 시간과 in-process 대비 속도 향상 (코어 수가 워커 수보다 적으면 빨라지지 않음)
+- Max 노드 수 (병렬로 alpha가 늦게 전달되어 더 탐색한 양), in-process와 같은 행동을 고른 비율
+"""
+import sys
+import os
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.minimax.MinimaxPlayer import MinimaxPlayer
+from player.minimax.ParallelMinimax import ParallelMinimaxSearcher
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.Supporting.BattleRandom import BattleRandom
+
+
+def _run(player: MinimaxPlayer, battles, depth: int) -> tuple:
+    """배틀마다 결정 1회 - (행동 목록, 평균 시간, 평균 노드 수)"""
+    player.depth = depth
+    orders, elapsed, nodes = [], 0.0, 0
+    for battle in battles:
+        orders.append(str(player.choose_move(battle)))
+        elapsed += player.search_time
+        nodes += player.node_count
+    return orders, elapsed / len(battles), nodes / len(battles)
+
+
+def run_parallel_minimax_benchmark(worker_counts, depths, num_states: int, young_brothers_wait: bool):
+    battles = [BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)) for seed in range(num_states)]
+    serial = MinimaxPlayer(start_listening=False, track_state=False, rng=BattleRandom(0))
+    _run(serial, battles[:1], 1)  # 예열
+
+    print("=" * 80)
+    print(f"cpu_count={os.cpu_count()}, {num_states} roots, young_brothers_wait={young_brothers_wait}")
+    print(f"{'depth':>5} {'mode':<12} {'time':>10} {'speedup':>9} {'nodes':>8} {'agree':>7}")
+    print("-" * 80)
+    rows = {depth: [('in-process',) + _run(serial, battles, depth)] for depth in depths}
+    for workers in worker_counts:
+        with ParallelMinimaxSearcher(workers=workers, young_brothers_wait=young_brothers_wait,
+                                     rng=BattleRandom(workers)) as searcher:
+            player = MinimaxPlayer(start_listening=False, track_state=False, rng=BattleRandom(0), root_parallel=searcher)
+            _run(player, battles[:1], 1)  # 워커 예열
+            for depth in depths:
+                rows[depth].append((f"{workers} workers",) + _run(player, battles, depth))
+
+    for depth in depths:
+        _, base_orders, base_time, _ = rows[depth][0]
+        for name, orders, elapsed, nodes in rows[depth]:
+            agree = sum(a == b for a, b in zip(orders, base_orders))
+            print(f"{depth:>5} {name:<12} {elapsed * 1e3:>8.1f}ms {base_time / elapsed:>8.2f}x {nodes:>8.0f} "
+                  f"{agree / num_states * 100:>6.0f}%")
+        print("-" * 80)
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="루트 분할 병렬 미니맥스 속도 향상")
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--depths', type=int, nargs='+', default=[2, 3])
+    parser.add_argument('--states', type=int, default=6)
+    parser.add_argument('--no-ybw', action='store_true', help="첫 행동을 기다리지 않고 모든 루트 행동을 한 번에 분배")
+    args = parser.parse_args()
+    run_parallel_minimax_benchmark(args.workers, args.depths, args.states, not args.no_ybw)
@@ -0,0 +1,74 @@
+# 전역 random 모듈과 주입된 BattleRandom 스트림의 재현성 / 병렬 간섭 / 추출 속도를 비교하는 코드
+
+"""
+난수 스트림 비교 (서버 불필요)
+- 같은 시드의 MCTS 탐색 두 번이 같은 결과를 내는지
+- 스레드 여러 개가 동시에 탐색해도 각 스트림 결과가 순차 실행과 같은지 (전역 random은 서로 간섭)
+- 엔진 턴 처리 속도와 배치 추출 속도
+"""
+import sys
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from TestCloneTime import measure_rate
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
+from sim.Supporting.BattleRandom import BattleRandom
+from player.mcts.MctsPlayer import MCTSSearcher
+
+
+def _visit_counts(rng, iterations: int = 300):
+    """루트 자식 노드 방문 수 (탐색 결과 지문)"""
+    searcher = MCTSSearcher(BattleBuilder(rng=BattleRandom(0)).factory_battle(), use_array_state=True, rng=rng)
+    searcher.search(iterations)
+    return sorted((c.visits, round(c.wins, 6)) for c in searcher.root.children)
+
+
+def run_reproducibility_check(num_workers: int = 4):
+    print("=" * 60)
+    same = _visit_counts(BattleRandom(7)) == _visit_counts(BattleRandom(7))
+    print(f"[reproducible] same seed, two runs identical: {same}")
+
+    # 워커별 독립 스트림 - 순차 실행 결과를 기준으로 동시 실행 결과 비교
+    sequential = [_visit_counts(rng) for rng in BattleRandom(11).spawn(num_workers)]
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        concurrent = list(pool.map(_visit_counts, BattleRandom(11).spawn(num_workers)))
+    print(f"[split streams] concurrent == sequential: {sum(a == b for a, b in zip(sequential, concurrent))}/{num_workers}")
+
+    # 전역 random 공유 - 같은 시드라도 동시에 돌면 서로의 난수를 소비
+    def global_run(_):
+        return _visit_counts(None)
+
+    random.seed(11)
+    sequential = [global_run(i) for i in range(num_workers)]
+    random.seed(11)
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        concurrent = list(pool.map(global_run, range(num_workers)))
+    print(f"[global random] concurrent == sequential: {sum(a == b for a, b in zip(sequential, concurrent))}/{num_workers}")
+
+
+def run_draw_benchmark(duration: float = 1.0, batch: int = 1024):
+    battle = BattleBuilder(rng=BattleRandom(0)).factory_battle()
+    results = {}
+    for label, rng in (('global random', None), ('BattleRandom', BattleRandom(0))):
+        engine = SimplifiedBattleEngine(gen=9, rng=rng)
+        results[f'engine turn ({label})'] = measure_rate(
+            lambda: engine.simulate_turn(battle.clone(), player_move_idx=0, opponent_move_idx=0), duration)
+
+    rng = BattleRandom(0)
+    results['random() x1'] = measure_rate(rng.random, duration)
+    results[f'random_batch({batch}) per draw'] = measure_rate(lambda: rng.random_batch(batch), duration) * batch
+
+    print("=" * 60)
+    for name, rate in results.items():
+        print(f"{name:<36} {rate:>14,.0f} /s")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_reproducibility_check()
+    run_draw_benchmark()
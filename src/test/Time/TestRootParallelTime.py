@@ -0,0 +1,90 @@
+# 단일 프로세스 MCTS와 루트 병렬 MCTS(워커 1~N개)의 반복 처리량 / 결정 품질을 비교하는 코드
+
+"""
+루트 병렬 MCTS 확인 (서버 불필요)
+- 같은 시간 예산에서 워커 수별 총 반복 수 / 초당 반복 수 (코어 수가 워커 수보다 적으면 확장되지 않음)
+- 결정 품질: 충분히 많이 반복한 단일 탐색을 기준으로
+    일치율 = 기준 탐색과 같은 행동을 고른 비율
+    regret = 기준 탐색의 최고 행동 평균 보상 - 고른 행동의 평균 보상
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import MCTSSearcher
+from player.mcts.RootParallelMcts import RootParallelSearcher
+from player.mcts.llm_pruner import LLMPruner
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.Supporting.BattleRandom import BattleRandom
+
+
+def _root_states(num_states: int) -> list:
+    return [SimplifiedBattle(BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)), fill_unknown_data=True, rng=BattleRandom(seed)).clone()
+            for seed in range(num_states)]
+
+
+def _reference(state, iterations: int, seed: int) -> dict:
+    """기준 탐색 - 행동 id → 평균 보상"""
+    searcher = MCTSSearcher(state.clone(), rng=BattleRandom(seed), use_llm_pruner=False)
+    searcher.search(iterations)
+    return {LLMPruner.action_identifier(c.action): c.wins / c.visits for c in searcher.root.children if c.visits}
+
+
+def _score(action_id: str, reference: dict) -> tuple:
+    best_id = max(reference, key=reference.get)
+    return action_id == best_id, reference[best_id] - reference.get(action_id, 0.0)
+
+
+def run_root_parallel_benchmark(worker_counts, time_budget: float, num_states: int, reference_iterations: int):
+    states = _root_states(num_states)
+    references = [_reference(state, reference_iterations, 1000 + i) for i, state in enumerate(states)]
+
+    rows = []
+    # 단일 프로세스 (프로세스 풀 없이 메인에서 직접 탐색)
+    iterations = agree = regret = elapsed = 0
+    for i, state in enumerate(states):
+        start = time.perf_counter()
+        searcher = MCTSSearcher(state.clone(), rng=BattleRandom(i), use_llm_pruner=False)
+        action = searcher.search(10 ** 9, deadline=start + time_budget)
+        elapsed += time.perf_counter() - start
+        iterations += searcher.iterations_run
+        ok, loss = _score(LLMPruner.action_identifier(action), references[i])
+        agree += ok
+        regret += loss
+    rows.append(('in-process', iterations, iterations / elapsed, agree, regret))
+
+    for workers in worker_counts:
+        with RootParallelSearcher(workers=workers, rng=BattleRandom(workers)) as searcher:
+            iterations = agree = regret = elapsed = 0
+            for i, state in enumerate(states):
+                result = searcher.search(state, time_budget=time_budget)
+                elapsed += result.elapsed
+                iterations += result.iterations
+                ok, loss = _score(LLMPruner.action_identifier(result.action), references[i])
+                agree += ok
+                regret += loss
+        rows.append((f"{workers} workers", iterations, iterations / elapsed, agree, regret))
+
+    print("=" * 72)
+    print(f"cpu_count={os.cpu_count()}, {num_states} roots x {time_budget}s, 기준 탐색 {reference_iterations} 반복")
+    print(f"{'mode':<14} {'iterations':>12} {'iter/s':>10} {'speedup':>9} {'agree':>8} {'mean regret':>12}")
+    print("-" * 72)
+    base_rate = rows[0][2]
+    for name, total, rate, agree, regret in rows:
+        print(f"{name:<14} {total:>12,} {rate:>10,.0f} {rate / base_rate:>8.2f}x "
+              f"{agree / num_states * 100:>7.0f}% {regret / num_states:>12.4f}")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="루트 병렬 MCTS 처리량 / 결정 품질")
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--time-budget', type=float, default=0.5)
+    parser.add_argument('--states', type=int, default=6)
+    parser.add_argument('--reference-iterations', type=int, default=2000)
+    args = parser.parse_args()
+    run_root_parallel_benchmark(args.workers, args.time_budget, args.states, args.reference_iterations)
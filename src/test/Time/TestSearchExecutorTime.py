@@ -0,0 +1,131 @@
+# 이벤트 루프에서 직접 탐색하는 미니맥스와 공유 탐색 실행기로 넘기는 미니맥스의 동시 배틀 수별 결정 지연 / 루프 지연을 비교하는 코드
+
+"""
+비동기 미니맥스 결정 확인 (서버 불필요)
+- 동시 배틀 수 C마다 asyncio 작업 C개가 각자 결정을 연속으로 요청 (poke-env가 choose_move를 부르는 방식과 같음)
+    inline: 기존 choose_move (이벤트 루프 스레드에서 탐색)
+    executor: MinimaxPlayer(search_executor=...) - 워커 프로세스에서 탐색하고 루프는 await
+- 결정 지연 p50 / p95 (요청 도착부터 주문 반환까지, 루프가 다른 배틀 탐색으로 막힌 시간 포함), 대체 행동 수
+- 루프 지연: 5ms마다 깨어나는 타이머가 늦게 깬 시간 (다른 배틀의 메시지 / 타이머가 밀리는 정도)
+- rng 없는 기본 플레이어 / 시작하지 않은 실행기(첫 결정에서 스레드로 풀 시작)도 확인
+- 워커를 강제 종료했을 때 대체 행동으로 응답하고 다음 결정에서 풀을 새로 띄우는지 (대기열 칸이 남지 않는지) 확인
+- 코어 수보다 동시 배틀이 많으면 executor의 결정 지연도 대기열만큼 늘어남 (루프 지연은 그대로 낮음)
+"""
+import sys
+import os
+import asyncio
+import argparse
+import signal
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.minimax.MinimaxPlayer import MinimaxPlayer
+from player.minimax.SearchExecutor import MinimaxSearchExecutor, _ping
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.Supporting.BattleRandom import BattleRandom
+
+HEARTBEAT = 0.005
+
+
+async def _heartbeat(lags: list, stop: asyncio.Event):
+    """HEARTBEAT마다 깨어나며 예정보다 늦게 깬 시간 기록"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT)
+        lags.append(time.perf_counter() - start - HEARTBEAT)
+
+
+async def _battle(player: MinimaxPlayer, battles: list, latencies: list):
+    """배틀 하나 - 결정을 연속으로 요청 (지연은 요청 메시지가 도착한 시각부터 주문을 낼 때까지)"""
+    for battle in battles:
+        start = time.perf_counter()
+        await asyncio.sleep(0)  # 요청 메시지 수신 (루프가 다른 배틀 처리 중이면 여기서 대기)
+        order = player.choose_move(battle)
+        if asyncio.iscoroutine(order):
+            order = await order
+        latencies.append(time.perf_counter() - start)
+
+
+async def _run(player: MinimaxPlayer, battles: list, concurrency: int, decisions: int) -> tuple:
+    latencies, lags = [], []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _battle(player, [battles[(c + k) % len(battles)] for k in range(decisions)], latencies)
+        for c in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await heartbeat
+    return latencies, lags, elapsed
+
+
+def _ms(values, q) -> float:
+    return float(np.percentile(np.asarray(values) * 1000, q)) if values else 0.0
+
+
+def run_search_executor_benchmark(concurrency_levels, depth: int, decisions: int, workers: int, num_states: int):
+    battles = [BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)) for seed in range(num_states)]
+
+    print("=" * 100)
+    print(f"cpu_count={os.cpu_count()}, workers={workers}, depth={depth}, 배틀당 결정 {decisions}회")
+    print(f"{'battles':>7} {'mode':<9} {'p50':>9} {'p95':>9} {'decisions/s':>12} {'loop lag p95':>13} "
+          f"{'loop lag max':>13} {'fallback':>9}")
+    print("-" * 100)
+    with MinimaxSearchExecutor(workers=workers, max_pending=max(concurrency_levels)) as executor:
+        modes = {
+            'inline': MinimaxPlayer(start_listening=False, depth=depth, rng=BattleRandom(0)),
+            'executor': MinimaxPlayer(start_listening=False, depth=depth, rng=BattleRandom(0),
+                                      search_executor=executor, decision_deadline=None),
+        }
+        for player in modes.values():
+            asyncio.run(_run(player, battles, 1, len(battles)))  # 예열 (워커의 스탯 캐시 등)
+        for concurrency in concurrency_levels:
+            for name, player in modes.items():
+                player.fallback_count = 0
+                latencies, lags, elapsed = asyncio.run(_run(player, battles, concurrency, decisions))
+                print(f"{concurrency:>7} {name:<9} {_ms(latencies, 50):>7.1f}ms {_ms(latencies, 95):>7.1f}ms "
+                      f"{len(latencies) / elapsed:>12.1f} {_ms(lags, 95):>11.1f}ms {_ms(lags, 100):>11.1f}ms "
+                      f"{player.fallback_count:>9}")
+            print("-" * 100)
+
+        # 대기열 제한 / 마감: 마감을 탐색 시간보다 짧게 주면 대체 행동으로 바로 응답
+        # (rng 없는 기본 플레이어 - 워커가 전역 random 모듈로 탐색)
+        player = MinimaxPlayer(start_listening=False, depth=depth + 1,
+                               search_executor=executor, decision_deadline=0.01)
+        latencies, lags, _ = asyncio.run(_run(player, battles, max(concurrency_levels), decisions))
+        print(f"deadline 10ms, depth {depth + 1}: p95 {_ms(latencies, 95):.1f}ms, 대체 행동 {player.fallback_count} / "
+              f"{len(latencies)}, 실행기 거절 {executor.rejected}, 마감 초과 {executor.timeouts}")
+
+    # 시작하지 않은 실행기 + rng 없는 기본 플레이어: 첫 결정에서 풀을 띄우는 동안에도 루프가 멈추지 않아야 함
+    executor = MinimaxSearchExecutor(workers=workers)
+    try:
+        player = MinimaxPlayer(start_listening=False, depth=depth, search_executor=executor, decision_deadline=None)
+        latencies, lags, _ = asyncio.run(_run(player, battles, 1, 2))
+        print(f"lazy start (no rng): 첫 결정 {latencies[0] * 1e3:.1f}ms, 루프 지연 max {_ms(lags, 100):.1f}ms, "
+              f"대체 행동 {player.fallback_count}")
+
+        # 깨진 풀: 워커를 모두 종료한 뒤 결정 3회
+        for pid in {executor._executor.submit(_ping).result() for _ in range(workers * 4)}:
+            os.kill(pid, signal.SIGKILL)
+        time.sleep(0.5)
+        player.fallback_count = 0
+        asyncio.run(_run(player, battles, 1, 3))
+        print(f"broken pool: 대체 행동 {player.fallback_count} / 3, 실패 {executor.failures}, 남은 대기 {executor.pending}")
+    finally:
+        executor.close()
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="이벤트 루프 직접 탐색 / 공유 탐색 실행기의 결정 지연과 루프 지연")
+    parser.add_argument('--battles', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--depth', type=int, default=2)
+    parser.add_argument('--decisions', type=int, default=6)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--states', type=int, default=6)
+    args = parser.parse_args()
+    run_search_executor_benchmark(args.battles, args.depth, args.decisions, args.workers, args.states)
@@ -0,0 +1,106 @@
+# 매 턴 새 MCTS 트리를 만드는 방식과 고른 행동의 서브트리를 다음 턴 루트로 재사용하는 방식을 비교하는 코드
+
+"""
+MCTS 서브트리 재사용 확인 (서버 불필요)
+- 엔진으로 실제 턴을 진행해 다음 관측 상태를 만들고 (고른 행동 + 상대 휴리스틱 응수, 새 난수 샘플)
+  같은 루트 방문 수 목표에서 새 트리 / 재사용 트리의 결정 시간과 재사용된 방문 수 비교
+- 버린 형제 서브트리가 GC 없이 바로 해제되는지 (weakref)
+"""
+import sys
+import os
+import gc
+import time
+import weakref
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from player.mcts.MctsPlayer import MCTSSearcher, BattleHeuristics
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.SimplifiedBattle import SimplifiedBattle
+from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
+from sim.Supporting.BattleRandom import BattleRandom
+
+
+def _play(state: SimplifiedBattle, action, engine, rng) -> SimplifiedBattle:
+    """고른 행동과 상대 휴리스틱 응수로 실제 1턴 진행 (탐색과 다른 난수 샘플)"""
+    observed = state.clone()
+    engine._sync_references(observed)
+    searcher_stub = MCTSSearcher.__new__(MCTSSearcher)
+    move_idx, switch = searcher_stub._parse_action(observed, action)
+    opponent_idx = BattleHeuristics.select_best_attack_idx(observed.opponent_active_pokemon,
+                                                           observed.active_pokemon, rng)
+    engine.simulate_turn(observed, player_move_idx=move_idx, player_switch_to=switch, opponent_move_idx=opponent_idx)
+    return observed
+
+
+def _sibling_refs(searcher: MCTSSearcher, action) -> list:
+    refs = []
+    for child in searcher.root.children:
+        if child.action is action:
+            continue
+        stack = [child]
+        while stack:
+            node = stack.pop()
+            refs.append(weakref.ref(node))
+            stack.extend(node.children)
+    return refs
+
+
+def run_reuse_benchmark(num_battles: int = 8, num_turns: int = 4, iterations: int = 400):
+    gc.disable()  # 순환 참조 GC 없이도 해제되는지 확인
+    engine = SimplifiedBattleEngine(rng=BattleRandom(99))
+    totals = {'fresh_time': 0.0, 'reuse_time': 0.0, 'decisions': 0, 'reused': 0, 'retained': 0,
+              'released': 0, 'siblings': 0, 'agree': 0}
+    for seed in range(num_battles):
+        state = SimplifiedBattle(BattleBuilder().factory_poke_env_battle(rng=BattleRandom(seed)), fill_unknown_data=True, rng=BattleRandom(seed)).clone()
+        play_rng = BattleRandom(seed + 100)
+        reuse = MCTSSearcher(state.clone(), rng=BattleRandom(seed), use_llm_pruner=False)
+        action = reuse.search(iterations)
+        for turn in range(num_turns):
+            if action is None:
+                break
+            observed = _play(state, action, engine, play_rng)
+            if observed.finished:
+                break
+
+            # 새 트리
+            start = time.perf_counter()
+            fresh = MCTSSearcher(observed.clone(), rng=BattleRandom(seed * 10 + turn), use_llm_pruner=False)
+            fresh_action = fresh.search(iterations)
+            totals['fresh_time'] += time.perf_counter() - start
+
+            # 재사용 트리 (형제 서브트리 해제 확인용 weakref)
+            refs = _sibling_refs(reuse, action)
+            start = time.perf_counter()
+            if reuse.advance(action, observed.clone()):
+                totals['reused'] += 1
+                totals['retained'] += reuse.root.visits
+            else:
+                reuse.release()
+                reuse = MCTSSearcher(observed.clone(), rng=BattleRandom(seed * 10 + turn), use_llm_pruner=False)
+            next_action = reuse.search(max(0, iterations - reuse.root.visits))
+            totals['reuse_time'] += time.perf_counter() - start
+            totals['siblings'] += len(refs)
+            totals['released'] += sum(ref() is None for ref in refs)
+
+            totals['decisions'] += 1
+            totals['agree'] += getattr(fresh_action, 'id', getattr(fresh_action, 'species', None)) == \
+                getattr(next_action, 'id', getattr(next_action, 'species', None))
+            state, action = observed, next_action
+    gc.enable()
+
+    decisions = totals['decisions']
+    print("=" * 64)
+    print(f"[subtree reuse] {num_battles} battles, 목표 루트 방문 {iterations}, 결정 {decisions}회")
+    print(f"재사용 성공: {totals['reused']} / {decisions}, 평균 재사용 방문 수: "
+          f"{totals['retained'] / max(totals['reused'], 1):.0f}")
+    print(f"결정당 시간: 새 트리 {totals['fresh_time'] / decisions * 1000:.1f}ms, "
+          f"재사용 {totals['reuse_time'] / decisions * 1000:.1f}ms "
+          f"({totals['fresh_time'] / totals['reuse_time']:.2f}x)")
+    print(f"같은 행동 선택: {totals['agree'] / decisions * 100:.0f}%")
+    print(f"버린 형제 노드 즉시 해제: {totals['released']:,} / {totals['siblings']:,}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    run_reuse_benchmark()
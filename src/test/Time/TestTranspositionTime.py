@@ -0,0 +1,127 @@
+# Zobrist 해시의 정확성(증분 갱신 == 전체 재계산)과 전치표 사용 여부에 따른 미니맥스 / MCTS 탐색 속도를 비교하는 코드
+
+"""
+Zobrist 해시 / 전치표 비교 (서버 불필요)
+"""
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from TestCloneTime import measure_rate
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleEngine.SimplifiedBattleEngine import SimplifiedBattleEngine
+from sim.BattleClass.ArrayBattle import ArrayBattle
+from sim.Supporting.Zobrist import set_hp_buckets
+from sim.Supporting.BattleRandom import BattleRandom
+from player.TranspositionTable import TranspositionTable
+from player.minimax.MinimaxPlayer import MinimaxPlayer
+from player.mcts.MctsPlayer import MCTSSearcher
+
+
+def run_hash_check(num_battles: int = 20, max_turns: int = 15):
+    """랜덤 턴 진행 후 증분 해시와 전체 재계산 해시, SimplifiedBattle과 ArrayBattle 해시가 같은지 확인"""
+    checked = incremental_mismatches = cross_mismatches = 0
+    for seed in range(num_battles):
+        battle = BattleBuilder(rng=BattleRandom(seed)).factory_battle()
+        array_battle = ArrayBattle.from_battle(battle)
+        battle.zobrist_hash()
+        array_battle.zobrist_hash()
+
+        # 같은 시드의 두 엔진 (공통 난수) 으로 두 상태를 진행
+        engine = SimplifiedBattleEngine(gen=9, rng=BattleRandom(seed))
+        array_engine = SimplifiedBattleEngine(gen=9, rng=BattleRandom(seed))
+        for turn in range(max_turns):
+            if battle.finished:
+                break
+            engine.simulate_turn(battle, player_move_idx=turn % 4, opponent_move_idx=0)
+            array_engine.simulate_turn(array_battle, player_move_idx=turn % 4, opponent_move_idx=0)
+
+            fresh = battle.clone()
+            fresh.reset_zobrist()
+            if battle.zobrist_hash() != fresh.zobrist_hash() or array_battle.zobrist_hash() != array_battle._compute_zobrist():
+                incremental_mismatches += 1
+            if battle.zobrist_hash() != array_battle.zobrist_hash():
+                cross_mismatches += 1
+            checked += 1
+
+    print("=" * 60)
+    print(f"[Zobrist] states={checked} incremental mismatches={incremental_mismatches} "
+          f"Simplified/Array mismatches={cross_mismatches}")
+
+
+def run_hash_benchmark(duration: float = 1.0):
+    """증분 해시 조회 vs 전체 재계산"""
+    battle = BattleBuilder(rng=BattleRandom(0)).factory_battle()
+    array_battle = ArrayBattle.from_battle(battle)
+
+    def full_simple():
+        battle.reset_zobrist()
+        battle.zobrist_hash()
+
+    def full_array():
+        array_battle._compute_zobrist()
+
+    results = {
+        'SimplifiedBattle full': measure_rate(full_simple, duration),
+        'SimplifiedBattle incremental': measure_rate(battle.zobrist_hash, duration),
+        'ArrayBattle full': measure_rate(full_array, duration),
+        'ArrayBattle incremental': measure_rate(array_battle.zobrist_hash, duration),
+    }
+    print("=" * 60)
+    for name, rate in results.items():
+        print(f"{name:<32} {rate:>12,.0f} hashes/s")
+
+
+def run_minimax_benchmark(depths=(2, 3), num_battles: int = 5):
+    """전치표 유무에 따른 미니맥스 탐색 시간 (같은 난수 시드)"""
+    print("=" * 60)
+    for depth in depths:
+        for label, table in (('no TT', None), ('TT', TranspositionTable())):
+            player = MinimaxPlayer(depth=depth, transposition_table=table, start_listening=False)
+            elapsed = 0.0
+            for seed in range(num_battles):
+                root = BattleBuilder(rng=BattleRandom(seed)).factory_battle()
+                player.engine.rng = BattleRandom(seed)
+                if table is not None:
+                    table.new_search()
+                start = time.perf_counter()
+                player._max_value(root, depth, -float('inf'), float('inf'))
+                elapsed += time.perf_counter() - start
+
+            line = f"[minimax depth={depth}] {label:<6} {elapsed / num_battles * 1000:8.1f} ms/search"
+            if table is not None:
+                info = table.stats()
+                line += f"  (hit rate {info['hit_rate'] * 100:.1f}%, entries {info['entries']})"
+            print(line)
+
+
+def run_mcts_benchmark(iterations: int = 2000, hp_buckets: int = 16):
+    """전치표 유무 (+ HP 구간 해시)에 따른 MCTS 초당 반복 수"""
+    battle = BattleBuilder(rng=BattleRandom(0)).factory_battle()
+    print("=" * 60)
+    variants = (('no TT', None, None), ('TT', TranspositionTable(), None),
+                (f'TT hp/{hp_buckets}', TranspositionTable(), hp_buckets))
+    for label, table, buckets in variants:
+        set_hp_buckets(buckets)
+        searcher = MCTSSearcher(battle.clone(), use_array_state=True, transposition_table=table, rng=BattleRandom(0))
+        start = time.perf_counter()
+        searcher.search(iterations)
+        rate = iterations / (time.perf_counter() - start)
+
+        line = f"[MCTS] {label:<10} {rate:>10,.0f} iter/s"
+        if table is not None:
+            info = table.stats()
+            line += f"  (hit rate {info['hit_rate'] * 100:.1f}%, entries {info['entries']})"
+        print(line)
+    set_hp_buckets(None)
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_hash_check()
+    run_hash_benchmark()
+    run_minimax_benchmark()
+    run_mcts_benchmark()
@@ -0,0 +1,60 @@
+# 미니맥스 탐색에서 자식 노드마다 복제(clone)하는 방식과 그 자리에서 진행 후 되돌리는(undo_turn) 방식의 속도를 비교하는 코드
+
+"""
+clone 기반 / undo 기반 미니맥스 비교 (서버 불필요)
+- 같은 난수 시드에서 두 방식의 탐색 결과(값, 행동)가 같은지 먼저 확인
+"""
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sim.BattleClass.BattleBuilder import BattleBuilder
+from sim.BattleClass.ArrayBattle import ArrayBattle
+from sim.Supporting.BattleRandom import BattleRandom
+from player.minimax.MinimaxPlayer import MinimaxPlayer
+
+
+def _action_name(action):
+    if action is None:
+        return None
+    return action.id if hasattr(action, 'id') else action.species
+
+
+def run_undo_benchmark(depths=(2, 3), num_battles: int = 5, repeat: int = 3):
+    print("=" * 60)
+    for use_array_state in (False, True):
+        state_name = 'ArrayBattle' if use_array_state else 'SimplifiedBattle'
+        roots = [BattleBuilder(rng=BattleRandom(seed)).factory_battle() for seed in range(num_battles)]
+        if use_array_state:
+            roots = [ArrayBattle.from_battle(root) for root in roots]
+
+        for depth in depths:
+            results = {}
+            times = {}
+            for label, use_undo in (('clone', False), ('undo', True)):
+                player = MinimaxPlayer(depth=depth, use_undo=use_undo, start_listening=False)
+                best = float('inf')
+                for _ in range(repeat):
+                    outcomes = []
+                    start = time.perf_counter()
+                    for seed, root in enumerate(roots):
+                        # 공통 난수 - 두 방식이 같은 난수열로 탐색
+                        player.engine.rng = BattleRandom(seed)
+                        # undo 방식은 상태를 그 자리에서 바꾸므로 (탐색 후 원래대로 돌아오지만) 복제본으로 시작
+                        value, action = player._max_value(root.clone(), depth, -float('inf'), float('inf'))
+                        outcomes.append((value, _action_name(action)))
+                    best = min(best, time.perf_counter() - start)
+                results[label] = outcomes
+                times[label] = best / num_battles
+
+            mismatches = sum(a != b for a, b in zip(results['clone'], results['undo']))
+            print(f"[{state_name} depth={depth}] mismatches={mismatches}")
+            print(f"  clone {times['clone'] * 1000:8.1f} ms/search")
+            print(f"  undo  {times['undo'] * 1000:8.1f} ms/search  ({times['clone'] / times['undo']:.2f}x)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_undo_benchmark()